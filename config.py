@@ -23,6 +23,15 @@ _ALLOWED_CONFIG_KEYS = {
     "COMPANY_TAGLINE",
     "COMPANY_PHONE",
     "PDF_FOOTER_TEXT",
+    "STORAGE_BACKEND",
+    "SQLITE_DB_PATH",
+    "SQLITE_EXPORT_DIR",
+    "BACKUP_COMPRESSION",
+    "BACKUP_KEEP_RECENT",
+    "BACKUP_KEEP_DAILY",
+    "BACKUP_KEEP_MONTHLY",
+    "EXCHANGE_RATES_TTL_SECONDS",
+    "WORKBOOK_WATCH_INTERVAL_SECONDS",
 }
 
 
@@ -48,6 +57,12 @@ def _propagate_config_overrides():
             BASE_DIR, _cfg.get("HOTEL_EXCEL_PATH", "data-hotel.xlsx")
         )
         globals()["FINANCIAL_EXCEL_PATH"] = globals()["CLIENT_EXCEL_PATH"]
+        globals()["SQLITE_DB_PATH"] = os.path.join(
+            BASE_DIR, _cfg.get("SQLITE_DB_PATH", "lahimena.db")
+        )
+        globals()["SQLITE_EXPORT_DIR"] = os.path.join(
+            BASE_DIR, _cfg.get("SQLITE_EXPORT_DIR", "export")
+        )
 
 
 def load_config(path=None):
@@ -232,6 +247,24 @@ HOTEL_EXCEL_PATH = os.path.join(
     BASE_DIR, _cfg.get("HOTEL_EXCEL_PATH", "data-hotel.xlsx")
 )
 FINANCIAL_EXCEL_PATH = CLIENT_EXCEL_PATH
+# Storage backend for the workbooks: "excel" (default, .xlsx files) or
+# "sqlite" (one table per sheet in SQLITE_DB_PATH, see utils/sqlite_store.py)
+STORAGE_BACKEND = _cfg.get("STORAGE_BACKEND", "excel")
+SQLITE_DB_PATH = os.path.join(BASE_DIR, _cfg.get("SQLITE_DB_PATH", "lahimena.db"))
+# .xlsx copies of the SQLite workbooks opened by TsaraKonta / accountants
+SQLITE_EXPORT_DIR = os.path.join(BASE_DIR, _cfg.get("SQLITE_EXPORT_DIR", "export"))
+# Workbook backups (backups/ next to each workbook, see utils/backup_manager.py)
+BACKUP_COMPRESSION = _cfg.get("BACKUP_COMPRESSION", "none")  # none, gzip or zstd
+BACKUP_KEEP_RECENT = _cfg.get("BACKUP_KEEP_RECENT", 10)
+BACKUP_KEEP_DAILY = _cfg.get("BACKUP_KEEP_DAILY", 7)
+BACKUP_KEEP_MONTHLY = _cfg.get("BACKUP_KEEP_MONTHLY", 12)
+# Exchange rates (see utils.validators.ExchangeRateService): last fetched
+# rates kept on disk, refreshed in the background once older than the TTL
+EXCHANGE_RATES_CACHE_PATH = os.path.join(BASE_DIR, "exchange_rates.json")
+EXCHANGE_RATES_TTL_SECONDS = _cfg.get("EXCHANGE_RATES_TTL_SECONDS", 6 * 3600)
+# Workbook watcher (see utils/file_watcher.py): seconds between two checks
+# of the workbooks for changes made outside the application
+WORKBOOK_WATCH_INTERVAL_SECONDS = _cfg.get("WORKBOOK_WATCH_INTERVAL_SECONDS", 2.0)
 DEVIS_FOLDER = os.path.join(BASE_DIR, "devis")
 CLIENT_SHEET_NAME = "DEMANDE_CLIENT"
 CLIENT_INFOS_SHEET_NAME = "INFOS_CLIENTS"
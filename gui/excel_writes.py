@@ -0,0 +1,57 @@
+"""
+Tk helpers for the background Excel writer (utils.excel_handler.submit_excel_write)
+"""
+
+import copy
+import tkinter as tk
+
+from utils.excel_handler import submit_excel_write
+from utils.logger import logger
+
+_POLL_MS = 50
+
+
+def save_in_background(widget, on_done, func, *args, **kwargs):
+    """
+    Queue func(*args, **kwargs) on the Excel writer thread and call
+    on_done(result) from the Tk main loop once it has been written.
+
+    Arguments are deep-copied so the page can keep editing its rows while the
+    write is pending. An exception raised by the write is reported with the
+    codes the save functions return: -2 for PermissionError (file open in
+    Excel), -1 otherwise.
+
+    Args:
+        widget: Any live Tk widget, used to poll the result with after()
+        on_done: Callback receiving the result, or None (fire and forget)
+        func: excel_handler write function
+
+    Returns:
+        concurrent.futures.Future: The queued write
+    """
+    future = submit_excel_write(func, *copy.deepcopy(args), **kwargs)
+    if on_done is None:
+        return future
+
+    def _poll():
+        if not future.done():
+            _schedule()
+            return
+        try:
+            result = future.result()
+        except PermissionError:
+            result = -2
+        except Exception as exc:
+            logger.error(f"Background Excel write failed: {exc}", exc_info=exc)
+            result = -1
+        on_done(result)
+
+    def _schedule():
+        try:
+            widget.after(_POLL_MS, _poll)
+        except tk.TclError:
+            # Page closed meanwhile: the write still completes, nobody to notify.
+            pass
+
+    _schedule()
+    return future
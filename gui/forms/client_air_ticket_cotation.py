@@ -39,6 +39,7 @@ from config import (
     TEXT_COLOR,
     TITLE_FONT,
 )
+from gui.excel_writes import save_in_background
 from utils.excel_handler import (
     get_avion_compagnies,
     get_avion_tarifs,
@@ -462,7 +463,15 @@ class ClientAirTicketCotation:
         if errors:
             messagebox.showwarning("Validation", "\n".join(errors))
             return
-        result = save_client_air_ticket_cotation_to_excel(self.client, self._rows)
+        save_in_background(
+            self.parent,
+            self._on_excel_saved,
+            save_client_air_ticket_cotation_to_excel,
+            self.client,
+            self._rows,
+        )
+
+    def _on_excel_saved(self, result):
         if result > 0:
             messagebox.showinfo("Sauvegarde réussie", f"{result} ligne(s) enregistrée(s).")
         elif result == -2:
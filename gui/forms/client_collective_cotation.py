@@ -27,6 +27,7 @@ from config import (
     TEXT_COLOR,
     TITLE_FONT,
 )
+from gui.excel_writes import save_in_background
 from utils.excel_handler import (
     get_collective_expense_designations,
     get_collective_expense_forfait,
@@ -259,7 +260,15 @@ class ClientCollectiveCotation:
         if not self._rows:
             messagebox.showwarning("Aucune donnée", "Le tableau est vide. Rien à sauvegarder.")
             return
-        result = save_client_collective_cotation_to_excel(self.client, self._rows)
+        save_in_background(
+            self.parent,
+            self._on_excel_saved,
+            save_client_collective_cotation_to_excel,
+            self.client,
+            self._rows,
+        )
+
+    def _on_excel_saved(self, result):
         if result > 0:
             messagebox.showinfo(
                 "Sauvegarde réussie",
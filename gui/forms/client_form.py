@@ -58,6 +58,7 @@ from gui.date_picker_utils import (
     get_calendar_weeks,
     get_calendar_year_options,
 )
+from gui.excel_writes import save_in_background
 from models.client_data import ClientData
 from utils.excel_handler import (
     get_km_mada_km_for_repere,
@@ -65,6 +66,7 @@ from utils.excel_handler import (
     load_all_hotels,
     load_circuit_catalog,
     save_client_to_excel,
+    update_client_in_excel,
 )
 from utils.logger import logger
 from utils.validators import validate_email, validate_phone_number
@@ -395,6 +397,9 @@ class ClientForm:
         self.itinerary_rows = []
         self._itin_widget_rows = []
         self._itin_canvas = None
+        # Pending background save; resubmits are ignored until it reports back
+        self._save_future = None
+        self._btn_save = None
 
         self._create_form()
 
@@ -1708,9 +1713,10 @@ class ClientForm:
             action_button(
                 actions, "Actualiser", variant="info", command=refresh_form
             ).pack(side="left", padx=4)
-            action_button(actions, "Modifier", command=self._validate).pack(
-                side="left", padx=4
+            self._btn_save = action_button(
+                actions, "Modifier", command=self._validate
             )
+            self._btn_save.pack(side="left", padx=4)
             action_button(
                 actions, "Abandonner", variant="danger", command=self._cancel
             ).pack(side="left", padx=4)
@@ -1718,9 +1724,10 @@ class ClientForm:
             action_button(
                 actions, "Actualiser", variant="info", command=refresh_form
             ).pack(side="left", padx=4)
-            action_button(actions, "Valider", command=self._validate).pack(
-                side="left", padx=4
+            self._btn_save = action_button(
+                actions, "Valider", command=self._validate
             )
+            self._btn_save.pack(side="left", padx=4)
             action_button(
                 actions, "Abandonner", variant="danger", command=self._cancel
             ).pack(side="left", padx=4)
@@ -2679,57 +2686,97 @@ class ClientForm:
             messagebox.showerror("❌ Erreur", "\n".join(errors))
             return
 
-        # Save or update to Excel
+        self._submit_client_save(client)
+
+    def _submit_client_save(self, client):
+        """
+        Queue the save (or update) of client on the Excel writer thread; the
+        result is reported by _on_client_saved from the Tk loop.
+
+        A second submit while a save is pending (double click) is ignored and
+        the save button stays disabled until _on_client_saved runs.
+
+        Returns:
+            concurrent.futures.Future: The queued write, or the pending one
+        """
+        if self._save_future is not None:
+            logger.debug("Client save already pending, resubmit ignored")
+            return self._save_future
+        self._set_save_enabled(False)
         try:
             if self.client_to_edit:
-                # Update existing client
-                from utils.excel_handler import update_client_in_excel
+                self._save_future = save_in_background(
+                    self.parent,
+                    lambda result: self._on_client_saved(client, result, updated=True),
+                    update_client_in_excel,
+                    self.client_to_edit["row_number"],
+                    client.to_dict(),
+                )
+            else:
+                self._save_future = save_in_background(
+                    self.parent,
+                    lambda result: self._on_client_saved(client, result),
+                    save_client_to_excel,
+                    client.to_dict(),
+                )
+        except Exception:
+            self._set_save_enabled(True)
+            raise
+        return self._save_future
+
+    def _set_save_enabled(self, enabled):
+        if self._btn_save is None:
+            return
+        try:
+            self._btn_save.configure(state="normal" if enabled else "disabled")
+        except tk.TclError:
+            # Form closed while the save was running
+            pass
+
+    def _on_client_saved(self, client, result, updated=False):
+        from utils.activity_log import log_activity
 
-                success = update_client_in_excel(
-                    self.client_to_edit["row_number"], client.to_dict()
+        self._save_future = None
+        self._set_save_enabled(True)
+        if result == -2:
+            messagebox.showerror(
+                "Fichier verrouillé",
+                "Le fichier Excel est ouvert ailleurs.\n"
+                "Fermez data.xlsx puis réessayez.",
+            )
+            return
+        if updated:
+            if result is True:
+                messagebox.showinfo(
+                    "✅ SUCCÈS", f"Client {client.nom} modifié avec succès !"
                 )
-                if success:
-                    messagebox.showinfo(
-                        "✅ SUCCÈS", f"Client {client.nom} modifié avec succès !"
-                    )
-                    logger.info(f"Client updated: {client.ref_client} - {client.nom}")
-                    from utils.activity_log import log_activity
-                    log_activity("edit_client",
-                                 f"Client modifié : {client.nom} ({client.ref_client})")
-                    if self.on_save_callback:
-                        self.on_save_callback()
-                else:
-                    error_msg = (
-                        "Erreur lors de la modification du client. Voir les logs."
-                    )
-                    messagebox.showerror("❌ Erreur Excel", error_msg)
-                    logger.error(f"Failed to update client: {client.ref_client}")
+                logger.info(f"Client updated: {client.ref_client} - {client.nom}")
+                log_activity("edit_client",
+                             f"Client modifié : {client.nom} ({client.ref_client})")
+                if self.on_save_callback:
+                    self.on_save_callback()
             else:
-                # Save new client
-                row = save_client_to_excel(client.to_dict())
-                if row > 0:
-                    messagebox.showinfo(
-                        "✅ SUCCÈS", f"Client {client.nom} sauvé ligne Excel {row} !"
-                    )
-                    logger.info(
-                        f"New client saved: {client.ref_client} - {client.nom} at row {row}"
-                    )
-                    from utils.activity_log import log_activity
-                    log_activity("create_client",
-                                 f"Client créé : {client.nom} ({client.ref_client})")
-                    self._reset_form()
-                    if self.on_save_callback:
-                        self.on_save_callback()
-                else:
-                    error_msg = "Erreur lors de la sauvegarde du client. Voir les logs."
-                    messagebox.showerror("❌ Erreur Excel", error_msg)
-                    logger.error(f"Failed to save new client: {client.ref_client}")
-        except Exception as e:
-            error_msg = (
-                f"Erreur Excel: {str(e)}\n\nDétails dans les logs de l'application."
+                error_msg = "Erreur lors de la modification du client. Voir les logs."
+                messagebox.showerror("❌ Erreur Excel", error_msg)
+                logger.error(f"Failed to update client: {client.ref_client}")
+            return
+
+        if result > 0:
+            messagebox.showinfo(
+                "✅ SUCCÈS", f"Client {client.nom} sauvé ligne Excel {result} !"
             )
-            messagebox.showerror("❌ Erreur", error_msg)
-            logger.error(f"Exception during client save/update: {e}", exc_info=True)
+            logger.info(
+                f"New client saved: {client.ref_client} - {client.nom} at row {result}"
+            )
+            log_activity("create_client",
+                         f"Client créé : {client.nom} ({client.ref_client})")
+            self._reset_form()
+            if self.on_save_callback:
+                self.on_save_callback()
+        else:
+            error_msg = "Erreur lors de la sauvegarde du client. Voir les logs."
+            messagebox.showerror("❌ Erreur Excel", error_msg)
+            logger.error(f"Failed to save new client: {client.ref_client}")
 
     _STATUT_COLORS = {
         "En cours":   "#00BCD4",
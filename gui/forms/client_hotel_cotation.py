@@ -30,12 +30,13 @@ from config import (
     TEXT_COLOR,
     TITLE_FONT,
 )
+from gui.excel_writes import save_in_background
 from utils.excel_handler import (
     load_all_hotels,
     load_client_hotel_cotation,
     save_client_hotel_cotation_to_excel,
 )
-from utils.validators import convert_currency, get_exchange_rates
+from utils.validators import convert_amounts, get_exchange_rates
 
 # ── Constantes ────────────────────────────────────────────────────────────────
 
@@ -477,19 +478,17 @@ class ClientHotelCotation:
         room_rates = h.get("room_rates") or {}
         prices = dict(room_rates.get(group_key, {}))
         unite  = self._hotel_currency(hotel_label)
-        # Si la devise n'est pas MGA/Ariary, on convertit chaque prix
+        # Si la devise n'est pas MGA/Ariary, on convertit tous les prix d'un coup
         if unite not in ("MGA", "ARIARY", "AR", ""):
-            converted = {}
-            for rk, price in prices.items():
-                if price:
-                    try:
-                        converted[rk] = convert_currency(
-                            float(price), unite, "MGA", self._rates
-                        )
-                    except Exception:
-                        converted[rk] = price
-                else:
-                    converted[rk] = price
+            keys = [rk for rk, price in prices.items() if price]
+            try:
+                amounts = convert_amounts(
+                    [prices[rk] for rk in keys], unite, "MGA", self._rates
+                )
+            except (TypeError, ValueError):
+                return prices
+            converted = dict(prices)
+            converted.update(zip(keys, amounts))
             return converted
         return prices
 
@@ -527,7 +526,15 @@ class ClientHotelCotation:
         if not self._rows:
             messagebox.showwarning("Aucune donnée", "Le tableau est vide. Rien à sauvegarder.")
             return
-        result = save_client_hotel_cotation_to_excel(self.client, self._rows)
+        save_in_background(
+            self.parent,
+            self._on_excel_saved,
+            save_client_hotel_cotation_to_excel,
+            self.client,
+            self._rows,
+        )
+
+    def _on_excel_saved(self, result):
         if result > 0:
             messagebox.showinfo(
                 "Sauvegarde réussie",
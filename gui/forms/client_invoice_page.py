@@ -20,6 +20,7 @@ from config import (
     TEXT_COLOR,
     TITLE_FONT,
 )
+from gui.excel_writes import save_in_background
 from utils.client_billing import convert_quote_to_invoice, invoice_requires_detail_refresh
 from utils.excel_handler import (
     load_active_client_invoice_from_excel,
@@ -151,10 +152,14 @@ class ClientInvoicePage:
         if not self.document:
             if quote_document:
                 self.document = convert_quote_to_invoice(quote_document)
-                save_active_client_invoice_to_excel(self.client, self.document)
+                save_in_background(
+                    self.parent, None, save_active_client_invoice_to_excel, self.client, self.document
+                )
         elif quote_document and invoice_requires_detail_refresh(self.document, quote_document):
             self.document = convert_quote_to_invoice(quote_document)
-            save_active_client_invoice_to_excel(self.client, self.document)
+            save_in_background(
+                self.parent, None, save_active_client_invoice_to_excel, self.client, self.document
+            )
         self._render_document()
 
     def _render_document(self):
@@ -221,7 +226,15 @@ class ClientInvoicePage:
         self._render_document()
 
     def _save_invoice(self):
-        result = save_active_client_invoice_to_excel(self.client, self.document)
+        save_in_background(
+            self.parent,
+            self._on_invoice_saved,
+            save_active_client_invoice_to_excel,
+            self.client,
+            self.document,
+        )
+
+    def _on_invoice_saved(self, result):
         if result == -2:
             messagebox.showerror("Facture client", "Fermez data.xlsx puis réessayez.")
             return
@@ -17,6 +17,7 @@ from config import (
     TEXT_COLOR,
     TITLE_FONT,
 )
+from gui.excel_writes import save_in_background
 from utils.client_billing import apply_margin_to_quote_line, build_client_quote, convert_quote_to_invoice
 from utils.excel_handler import (
     load_active_client_quote_from_excel,
@@ -175,7 +176,9 @@ class ClientQuotePage:
         loaded = load_active_client_quote_from_excel(self.client)
         self.document = loaded or build_client_quote(self.client)
         if self.document and self.document.get("lines") and not loaded:
-            save_active_client_quote_to_excel(self.client, self.document)
+            save_in_background(
+                self.parent, None, save_active_client_quote_to_excel, self.client, self.document
+            )
         self._render_document()
 
     def _refresh_from_sources(self):
@@ -247,7 +250,15 @@ class ClientQuotePage:
         tk.Button(btns, text="Annuler", command=win.destroy, bg=BUTTON_RED, fg="white", font=BUTTON_FONT).pack(side="left")
 
     def _save_quote(self):
-        result = save_active_client_quote_to_excel(self.client, self.document)
+        save_in_background(
+            self.parent,
+            self._on_quote_saved,
+            save_active_client_quote_to_excel,
+            self.client,
+            self.document,
+        )
+
+    def _on_quote_saved(self, result):
         if result == -2:
             messagebox.showerror("Devis client", "Fermez data.xlsx puis réessayez.")
             return
@@ -261,7 +272,15 @@ class ClientQuotePage:
             messagebox.showwarning("Devis client", "Aucune ligne de devis à facturer.")
             return
         invoice_document = convert_quote_to_invoice(self.document)
-        result = save_active_client_invoice_to_excel(self.client, invoice_document)
+        save_in_background(
+            self.parent,
+            self._on_invoice_generated,
+            save_active_client_invoice_to_excel,
+            self.client,
+            invoice_document,
+        )
+
+    def _on_invoice_generated(self, result):
         if result == -2:
             messagebox.showerror("Facture client", "Fermez data.xlsx puis réessayez.")
             return
@@ -31,13 +31,14 @@ from config import (
     TEXT_COLOR,
     TITLE_FONT,
 )
+from gui.excel_writes import save_in_background
 from utils.excel_handler import (
     load_all_hotels,
     load_client_hotel_cotation,
     load_client_restauration_cotation,
     save_client_restauration_cotation_to_excel,
 )
-from utils.validators import convert_currency, get_exchange_rates
+from utils.validators import convert_amounts, get_exchange_rates
 
 # ── Constantes ────────────────────────────────────────────────────────────────
 
@@ -381,21 +382,12 @@ class ClientRestaurationCotation:
 
     def _default_meal_prices(self, hotel_label: str, pax: str, forfait: str) -> dict:
         """Construit meal_prices depuis la BD hôtels selon le forfait."""
-        h = self._hotels_by_label.get(hotel_label)
+        prices = self._get_hotel_meal_prices(hotel_label)
         pax_count = _to_int(pax, 0)
         included  = _FORFAIT_MEALS.get(forfait, [])
         mp = {}
         for mk, _, _ in _MEAL_TYPES:
-            price = 0.0
-            if h:
-                raw_price = h.get("meals", {}).get(mk, 0) or 0
-                unite = (h.get("unite") or "MGA").strip().upper()
-                if raw_price and unite not in ("MGA", "ARIARY", "AR", ""):
-                    try:
-                        raw_price = convert_currency(float(raw_price), unite, "MGA", self._rates)
-                    except Exception:
-                        pass
-                price = float(raw_price)
+            price = prices.get(mk, 0.0)
             count = pax_count if mk in included else 0
             mp[mk] = {"count": count, "price": price, "gratuit": False}
         return mp
@@ -419,15 +411,11 @@ class ClientRestaurationCotation:
         if not h:
             return {}
         unite = self._hotel_currency(hotel_label)
-        prices = {}
-        for mk, _, _ in _MEAL_TYPES:
-            raw = h.get("meals", {}).get(mk, 0) or 0
-            if raw and unite not in ("MGA", "ARIARY", "AR", ""):
-                try:
-                    raw = convert_currency(float(raw), unite, "MGA", self._rates)
-                except Exception:
-                    pass
-            prices[mk] = float(raw)
+        meals = h.get("meals", {})
+        prices = {mk: float(meals.get(mk, 0) or 0) for mk, _, _ in _MEAL_TYPES}
+        if unite not in ("MGA", "ARIARY", "AR", ""):
+            # Tous les repas convertis d'un coup
+            prices = dict(zip(prices, convert_amounts(prices.values(), unite, "MGA", self._rates)))
         return prices
 
     # ── Tableau ────────────────────────────────────────────────────────────────
@@ -459,7 +447,15 @@ class ClientRestaurationCotation:
         if not self._rows:
             messagebox.showwarning("Aucune donnée", "Le tableau est vide. Rien à sauvegarder.")
             return
-        result = save_client_restauration_cotation_to_excel(self.client, self._rows)
+        save_in_background(
+            self.parent,
+            self._on_excel_saved,
+            save_client_restauration_cotation_to_excel,
+            self.client,
+            self._rows,
+        )
+
+    def _on_excel_saved(self, result):
         if result > 0:
             messagebox.showinfo(
                 "Sauvegarde réussie",
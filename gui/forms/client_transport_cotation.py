@@ -34,16 +34,19 @@ from config import (
     TEXT_COLOR,
     TITLE_FONT,
 )
+from gui.excel_writes import save_in_background
 from utils.excel_handler import (
     get_km_mada_km_for_repere,
     get_km_mada_reperes,
     get_segment_distance,
+    get_segment_distances,
     get_transport_fuel_price,
     get_transport_prestataires,
     get_transport_vehicle_data,
     get_transport_vehicle_types,
     load_client_transport_cotation,
     normalize_city_name,
+    normalize_many,
     save_client_transport_cotation_to_excel,
 )
 
@@ -333,11 +336,13 @@ class ClientTransportCotation:
             return
 
         # Sinon : générer depuis l'itinéraire client
-        segments = _make_segments(self.client)
-        for depart_raw, arrivee_raw in segments:
-            depart  = normalize_city_name(depart_raw)
-            arrivee = normalize_city_name(arrivee_raw)
-            km_val  = get_segment_distance(depart, arrivee)
+        raw_segments = _make_segments(self.client)
+        segments = list(zip(
+            normalize_many(depart for depart, _ in raw_segments),
+            normalize_many(arrivee for _, arrivee in raw_segments),
+        ))
+        distances = get_segment_distances(segments)
+        for (depart, arrivee), km_val in zip(segments, distances):
             km_str  = str(int(km_val)) if km_val else ""
             self._rows.append(_make_row(
                 depart=depart, arrivee=arrivee,
@@ -390,7 +395,15 @@ class ClientTransportCotation:
             messagebox.showwarning("Aucune donnée",
                                    "Le tableau est vide. Rien à sauvegarder.")
             return
-        result = save_client_transport_cotation_to_excel(self.client, self._rows)
+        save_in_background(
+            self.parent,
+            self._on_excel_saved,
+            save_client_transport_cotation_to_excel,
+            self.client,
+            self._rows,
+        )
+
+    def _on_excel_saved(self, result):
         if result > 0:
             messagebox.showinfo("Sauvegarde réussie",
                                 f"{result} ligne(s) enregistrée(s).")
@@ -7,7 +7,6 @@ import os
 import re
 import subprocess
 import tkinter as tk
-import unicodedata
 from tkinter import messagebox, ttk
 
 import customtkinter as ctk
@@ -30,6 +29,7 @@ from config import (
     TITLE_FONT,
     TYPE_HEBERGEMENTS,
 )
+from models.hotel_catalog import HotelCatalog, normalize_lookup_key
 from utils.excel_handler import (
     load_all_clients,
     load_all_hotels,
@@ -41,7 +41,7 @@ from utils.pdf_generator import (
     generate_hotel_quotation_pdf,
     generate_multi_hotel_quotation_pdf,
 )
-from utils.validators import convert_currency, get_exchange_rates
+from utils.validators import convert_amounts, convert_currency, get_exchange_rates
 
 ROOM_GROUP_LABELS = {
     "standard": "Standard",
@@ -79,7 +79,7 @@ class HotelQuotation:
             parent: Parent widget
         """
         self.parent = parent
-        self.hotels = self._load_and_filter_hotels()
+        self._set_hotels(self._load_and_filter_hotels())
         self.clients = self._load_clients()
         self.selected_hotel = None
         self.last_pricing = None
@@ -94,6 +94,11 @@ class HotelQuotation:
         if hasattr(self, "client_type_var"):
             self.client_type_var.trace("w", self._on_client_type_changed)
 
+    def _set_hotels(self, hotels):
+        """Replace the hotel list and its lookup catalog."""
+        self.hotels = hotels
+        self.hotel_catalog = HotelCatalog(hotels)
+
     def _load_and_filter_hotels(self, client_type=None):
         """Load hotels and filter duplicates"""
         hotels = load_all_hotels(client_type)
@@ -154,15 +159,7 @@ class HotelQuotation:
 
     def _normalize_city(self, city_name):
         """Normalize city names for resilient matching (case/accent/format)."""
-        if not city_name:
-            return ""
-        text = str(city_name).strip().lower()
-        text = unicodedata.normalize("NFKD", text)
-        text = "".join(ch for ch in text if not unicodedata.combining(ch))
-        # Remove clarifications such as "Ranohira (Isalo)" -> "Ranohira"
-        text = re.sub(r"\([^)]*\)", " ", text)
-        text = re.sub(r"[^a-z0-9]+", " ", text)
-        return re.sub(r"\s+", " ", text).strip()
+        return normalize_lookup_key(city_name)
 
     def _extract_allowed_cities_from_client(self, client):
         """Extract ordered itinerary cities selected on the client form."""
@@ -246,27 +243,7 @@ class HotelQuotation:
 
     def _find_hotel_record(self, city_name, hotel_name):
         """Find a hotel in loaded data by city and name with resilient matching."""
-        city_key = self._normalize_city(city_name)
-        hotel_key = self._normalize_city(hotel_name)
-        if not city_key or not hotel_key:
-            return None
-
-        # Exact city + exact name
-        for hotel in self.hotels:
-            if (
-                self._normalize_city(hotel.get("lieu", "")) == city_key
-                and self._normalize_city(hotel.get("nom", "")) == hotel_key
-            ):
-                return hotel
-
-        # Exact city + partial name
-        for hotel in self.hotels:
-            if self._normalize_city(hotel.get("lieu", "")) != city_key:
-                continue
-            candidate = self._normalize_city(hotel.get("nom", ""))
-            if hotel_key in candidate or candidate in hotel_key:
-                return hotel
-        return None
+        return self.hotel_catalog.find(city_name, hotel_name)
 
     def _select_room_for_hotel(self, hotel):
         """Choose an initial room selection for a hotel."""
@@ -413,23 +390,7 @@ class HotelQuotation:
 
     def _get_city_values(self):
         """Build city values according to current itinerary filter."""
-        if self.allowed_itinerary_cities:
-            allowed_set = {
-                self._normalize_city(city) for city in self.allowed_itinerary_cities
-            }
-            cities = sorted(
-                {
-                    hotel.get("lieu", "")
-                    for hotel in self.hotels
-                    if hotel.get("lieu")
-                    and self._normalize_city(hotel.get("lieu")) in allowed_set
-                }
-            )
-        else:
-            cities = sorted(
-                {hotel.get("lieu", "") for hotel in self.hotels if hotel.get("lieu")}
-            )
-        return [""] + cities
+        return [""] + self.hotel_catalog.city_labels(self.allowed_itinerary_cities)
 
     def _refresh_city_and_hotel_options(self, preserve_city=False):
         """Refresh city/hotel combobox options after filters changed."""
@@ -1150,11 +1111,12 @@ class HotelQuotation:
             selected_city = self.city_var.get().strip()
             selected_city_normalized = self._normalize_city(selected_city)
             # Find the selected hotel
-            for hotel in self.hotels:
-                if selected_city and (
-                    self._normalize_city(hotel.get("lieu", "")) != selected_city_normalized
-                ):
-                    continue
+            candidates = (
+                self.hotel_catalog.by_city(selected_city)
+                if selected_city
+                else self.hotels
+            )
+            for hotel in candidates:
                 hotel_display = self._hotel_display(hotel)
                 if hotel_display == selection:
                     self.selected_hotel = hotel
@@ -1175,23 +1137,22 @@ class HotelQuotation:
             if self.allowed_itinerary_cities
             else None
         )
-        candidates = self.hotels
-        if allowed_set:
+        # Filter hotels by city and update hotel combobox
+        if city_normalized:
+            candidates = (
+                self.hotel_catalog.by_city(city)
+                if not allowed_set or city_normalized in allowed_set
+                else []
+            )
+        elif allowed_set:
             candidates = [
                 h
-                for h in candidates
+                for h in self.hotels
                 if self._normalize_city(h.get("lieu")) in allowed_set
             ]
-
-        # Filter hotels by city and update hotel combobox
-        if city_normalized:
-            filtered = [
-                self._hotel_display(h)
-                for h in candidates
-                if self._normalize_city(h.get("lieu")) == city_normalized
-            ]
         else:
-            filtered = [self._hotel_display(h) for h in candidates]
+            candidates = self.hotels
+        filtered = [self._hotel_display(h) for h in candidates]
         # Update combobox values and clear previous selection
         self.hotel_combo["values"] = filtered
         self.hotel_var.set("")
@@ -1428,9 +1389,10 @@ class HotelQuotation:
         if not hasattr(self, "client_type_var"):
             return
         client_type = self.client_type_var.get()
-        self.hotels = self._load_and_filter_hotels(client_type)
-        if not self.hotels:
-            self.hotels = self._load_and_filter_hotels(None)
+        hotels = self._load_and_filter_hotels(client_type)
+        if not hotels:
+            hotels = self._load_and_filter_hotels(None)
+        self._set_hotels(hotels)
         self._refresh_city_and_hotel_options(preserve_city=True)
 
     def _update_exchange_rates(self):
@@ -1592,9 +1554,9 @@ class HotelQuotation:
             currency = self.currency_var.get()
             if currency != "Ariary":
                 rates = get_exchange_rates()
-                base_price = convert_currency(base_price, "Ariary", currency, rates)
-                meal_price = convert_currency(meal_price, "Ariary", currency, rates)
-                total_price = convert_currency(total_price, "Ariary", currency, rates)
+                base_price, meal_price, total_price = convert_amounts(
+                    [base_price, meal_price, total_price], "Ariary", currency, rates
+                )
 
             # Display results
             client_name = self.client_name_var.get()
@@ -825,12 +825,22 @@ class MainContent:
             )
             return
 
+        from utils.excel_handler import ensure_excel_export
+
+        excel_path = ensure_excel_export(FINANCIAL_EXCEL_PATH)
+        if excel_path is None:
+            messagebox.showerror(
+                "Export Excel impossible",
+                "Impossible de préparer le fichier Excel pour TsaraKonta.\n"
+                "Consultez les logs pour plus de détails.",
+            )
+            return
         container = ctk.CTkFrame(self.main_scroll, fg_color=MAIN_BG_COLOR)
         container.pack(fill="both", expand=True, padx=0, pady=0)
 
         self._embedded_tsarakonta = ComptabiliteApp(
             container,
-            fichier_excel=FINANCIAL_EXCEL_PATH,
+            fichier_excel=excel_path,
             etat_initial=None,
         )
         self._embedded_tsarakonta.pack(side="top", fill="both", expand=True)
@@ -934,7 +944,12 @@ class MainContent:
             return
 
         try:
-            cmd = [sys.executable, tsarakonta_main, "--excel", FINANCIAL_EXCEL_PATH]
+            from utils.excel_handler import ensure_excel_export
+
+            excel_path = ensure_excel_export(FINANCIAL_EXCEL_PATH)
+            if excel_path is None:
+                raise RuntimeError("export Excel impossible, voir les logs")
+            cmd = [sys.executable, tsarakonta_main, "--excel", excel_path]
             if etat:
                 cmd.extend(["--etat", etat])
 
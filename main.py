@@ -230,6 +230,7 @@ from config import (
     BUTTON_GREEN_HOVER,
     BUTTON_RED,
     DEFAULT_COLOR_THEME,
+    HOTEL_EXCEL_PATH,
     INPUT_BG_COLOR,
     MAIN_BG_COLOR,
     MUTED_TEXT_COLOR,
@@ -237,7 +238,13 @@ from config import (
 )
 from gui.main_content import MainContent
 from gui.sidebar import Sidebar
+from utils.excel_handler import (
+    migrate_workbook_schemas,
+    start_workbook_watcher,
+    submit_excel_write,
+)
 from utils.logger import logger
+from utils.validators import get_exchange_rates
 
 
 def _launch_main_app(user):
@@ -293,6 +300,14 @@ def _launch_main_app(user):
     app.grid_columnconfigure(1, weight=1)
     app.grid_rowconfigure(0, weight=1)
 
+    # Migration de schéma (en-têtes et lignes par défaut de data-hotel.xlsx) :
+    # une seule écriture, en arrière-plan ; les lectures d'en-têtes n'écrivent plus.
+    submit_excel_write(migrate_workbook_schemas, path=HOTEL_EXCEL_PATH)
+    # Taux de change : lus du cache disque, rafraîchis en arrière-plan si périmés.
+    get_exchange_rates()
+    # Classeurs modifiés hors de l'application (Excel) : caches invalidés.
+    start_workbook_watcher()
+
     main_content = MainContent(app)
     _sidebar = Sidebar(app, main_content.update_content)
 
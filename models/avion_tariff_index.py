@@ -0,0 +1,96 @@
+"""
+Inverted index over the avion source rows
+
+Built once per version of the avion sheet from the rows of
+load_avion_source_data (fields keyed by normalized header). Each
+(field, value) pair maps to the ids of the rows holding it, so a filter is
+answered by intersecting a few id sets instead of comparing every row, and
+the air ticket comboboxes stay responsive however large the sheet grows.
+"""
+
+# Distinct-value queries memoized per index (filters combinations are few)
+_MAX_MEMOIZED_QUERIES = 1024
+
+
+class AvionTariffIndex:
+    """
+    Avion tariff rows indexed by (normalized field, value).
+
+    Args:
+        rows (list): Rows of load_avion_source_data
+            ({"tarif_adulte", "tarif_enfant", "fields": {field: str}})
+    """
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self._fields = set()
+        self._postings = {}
+        for row_id, row in enumerate(self.rows):
+            for field, value in row.get("fields", {}).items():
+                self._fields.add(field)
+                self._postings.setdefault((field, value), []).append(row_id)
+        self._values_memo = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def match(self, filters):
+        """
+        Ids of the rows whose fields equal every filter, in sheet order.
+
+        Args:
+            filters (dict): {normalized field: stripped value}
+        """
+        postings = []
+        for field, value in filters.items():
+            ids = self._postings.get((field, value))
+            if ids is None:
+                if value == "" and field not in self._fields:
+                    # Absent column reads as "" on every row
+                    continue
+                return []
+            postings.append(ids)
+        if not postings:
+            return list(range(len(self.rows)))
+        postings.sort(key=len)
+        ids = set(postings[0])
+        for other in postings[1:]:
+            ids.intersection_update(other)
+            if not ids:
+                return []
+        return sorted(ids)
+
+    def tarifs(self, filters):
+        """(tarif_adulte, tarif_enfant) of the first matching row, else of the first row."""
+        if not self.rows:
+            return 0, 0
+        ids = self.match(filters)
+        row = self.rows[ids[0] if ids else 0]
+        return row.get("tarif_adulte", 0), row.get("tarif_enfant", 0)
+
+    def values(self, fields, filters=None):
+        """
+        Sorted distinct values of the matching rows, taking per row the first
+        non-empty of fields (alternative spellings of one column).
+        """
+        fields = tuple(fields)
+        filters = filters or {}
+        memo_key = (fields, frozenset(filters.items()))
+        cached = self._values_memo.get(memo_key)
+        if cached is not None:
+            return list(cached)
+
+        values = set()
+        for row_id in self.match(filters):
+            row_fields = self.rows[row_id].get("fields", {})
+            for field in fields:
+                value = row_fields.get(field)
+                if value:
+                    values.add(str(value).strip())
+                    break
+        values.discard("")
+        result = tuple(sorted(values))
+        if len(self._values_memo) >= _MAX_MEMOIZED_QUERIES:
+            self._values_memo.clear()
+        self._values_memo[memo_key] = result
+        return list(result)
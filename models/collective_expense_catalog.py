@@ -0,0 +1,54 @@
+"""
+Indexed collective expense catalog
+
+Built once per version of the Frais collectifs sheet from the rows of
+load_collective_expenses_data; the collective expense quotation reads the
+montant and forfait of a (prestataire, designation) pair by dictionary
+access instead of reloading and scanning the sheet twice per selection.
+"""
+
+
+class CollectiveExpenseCatalog:
+    """
+    Frais collectifs rows indexed by prestataire and designation.
+
+    Args:
+        rows (list): Row dicts (forfait, prestataire, designation, montant,
+            id_circuit)
+    """
+
+    def __init__(self, rows):
+        self._rows = {}
+        designations = {}
+        all_designations = set()
+        for row in rows:
+            prestataire = row.get("prestataire")
+            designation = row.get("designation")
+            # First row wins, like the former linear scan
+            self._rows.setdefault((prestataire, designation), row)
+            names = designations.setdefault(prestataire, set())
+            if designation:
+                names.add(designation)
+                all_designations.add(designation)
+        self._prestataires = tuple(sorted(p for p in designations if p))
+        self._designations = {
+            prestataire: tuple(sorted(names)) for prestataire, names in designations.items()
+        }
+        self._all_designations = tuple(sorted(all_designations))
+
+    def __len__(self):
+        return len(self._rows)
+
+    def prestataires(self):
+        """Sorted distinct prestataires."""
+        return list(self._prestataires)
+
+    def designations(self, prestataire=None):
+        """Sorted designations of a prestataire, or of all of them if None."""
+        if prestataire is None:
+            return list(self._all_designations)
+        return list(self._designations.get(prestataire, ()))
+
+    def get(self, prestataire, designation):
+        """Row of a (prestataire, designation) pair, or None."""
+        return self._rows.get((prestataire, designation))
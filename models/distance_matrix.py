@@ -0,0 +1,82 @@
+"""
+KM_MADA distance matrix
+
+KM_MADA gives, per repère, the cumulative kilometres (and hours) from a common
+origin, so the distance of a segment is |km(arrivée) - km(départ)|. The
+matrix keeps one km/duration per normalized repère, built once per KM_MADA
+snapshot, and memoizes the normalization of the raw city names it is asked
+about: an itinerary is resolved with dictionary lookups only. The repère
+labels and known aliases are resolved up front, when the matrix is built.
+"""
+
+# Raw names memoized per matrix; itineraries reuse a small set of cities
+_MAX_RESOLVED_NAMES = 4096
+
+
+class DistanceMatrix:
+    """
+    Segment distances between KM_MADA repères.
+
+    Args:
+        lookup (dict): {normalized repère key: row} (km, duree already parsed)
+        key_func (callable): Raw city name -> normalized repère key
+        known_names (iterable): Names resolved at build time and never evicted
+    """
+
+    __slots__ = ("_km", "_duration", "_key_func", "_known", "_resolved")
+
+    def __init__(self, lookup, key_func, known_names=()):
+        self._km = {key: row.get("km") or 0 for key, row in lookup.items()}
+        self._duration = {key: row.get("duree") or 0.0 for key, row in lookup.items()}
+        self._key_func = key_func
+        self._known = {name: key_func(name) for name in known_names}
+        self._resolved = {}
+
+    def __len__(self):
+        return len(self._km)
+
+    def _key(self, name):
+        key = self._known.get(name)
+        if key is not None:
+            return key
+        key = self._resolved.get(name)
+        if key is None:
+            key = self._key_func(name) if name else ""
+            if len(self._resolved) >= _MAX_RESOLVED_NAMES:
+                self._resolved.clear()
+            self._resolved[name] = key
+        return key
+
+    def has(self, name):
+        """True when the city resolves to a KM_MADA repère."""
+        return self._key(name) in self._km
+
+    def km(self, name):
+        """Cumulative km of a city, 0 if unknown."""
+        return self._km.get(self._key(name), 0)
+
+    def duration(self, name):
+        """Cumulative duration (hours) of a city, 0.0 if unknown."""
+        return self._duration.get(self._key(name), 0.0)
+
+    def segment(self, depart, arrivee):
+        """
+        Distance of one segment: |km(arrivée) - km(départ)|.
+
+        If only one of the two cities is known, its raw km is returned;
+        0 if neither is.
+        """
+        km_dep = self.km(depart)
+        km_arr = self.km(arrivee)
+        if km_arr and km_dep:
+            return abs(km_arr - km_dep)
+        return km_arr or km_dep
+
+    def segments(self, pairs):
+        """Distances of (départ, arrivée) pairs, in order."""
+        return [self.segment(depart, arrivee) for depart, arrivee in pairs]
+
+    def itinerary(self, cities):
+        """Total distance of consecutive segments through cities."""
+        cities = list(cities)
+        return sum(self.segments(zip(cities, cities[1:])))
@@ -0,0 +1,151 @@
+"""
+Indexed hotel catalog
+
+Built once from the hotel dicts returned by load_all_hotels; city and hotel
+names are normalized at build time so the forms look hotels up by dictionary
+access instead of scanning and normalizing the whole list on every call.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+
+_PARENTHESES = re.compile(r"\([^)]*\)")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_lookup_key(value):
+    """Normalize city/hotel names for resilient matching (case/accent/format)."""
+    if not value:
+        return ""
+    return _normalize_lookup_text(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_lookup_text(text):
+    text = text.strip().lower()
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    # Remove clarifications such as "Ranohira (Isalo)" -> "Ranohira"
+    text = _PARENTHESES.sub(" ", text)
+    text = _NON_ALNUM.sub(" ", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+class _NameIndex:
+    """
+    Partial matching of hotel names within one city.
+
+    Name keys containing the query are found with a prefix search over the
+    sorted suffixes of every name; names contained in the query by looking up
+    the substrings of the query. Both return the earliest catalog position.
+    """
+
+    __slots__ = ("_positions", "_suffixes")
+
+    def __init__(self, names):
+        self._positions = {}
+        suffixes = []
+        for name_key, position in names:
+            self._positions.setdefault(name_key, position)
+            suffixes.extend((name_key[i:], position) for i in range(len(name_key)))
+        suffixes.sort()
+        self._suffixes = suffixes
+
+    def first_partial(self, query):
+        best = None
+        suffixes = self._suffixes
+        i = bisect_left(suffixes, (query,))
+        while i < len(suffixes) and suffixes[i][0].startswith(query):
+            position = suffixes[i][1]
+            if best is None or position < best:
+                best = position
+            i += 1
+        for start in range(len(query) + 1):
+            for end in range(start, len(query) + 1):
+                position = self._positions.get(query[start:end])
+                if position is not None and (best is None or position < best):
+                    best = position
+        return best
+
+
+class HotelCatalog:
+    """
+    Hotels indexed by city, by (city, name) and by client type.
+
+    Args:
+        hotels (list): Hotel dicts as returned by load_all_hotels
+    """
+
+    def __init__(self, hotels):
+        self.hotels = list(hotels)
+        self._by_city = {}
+        self._by_city_name = {}
+        self._by_type_client = {}
+        city_names = {}
+        for position, hotel in enumerate(self.hotels):
+            city_key = normalize_lookup_key(hotel.get("lieu", ""))
+            name_key = normalize_lookup_key(hotel.get("nom", ""))
+            self._by_city.setdefault(city_key, []).append(hotel)
+            self._by_city_name.setdefault((city_key, name_key), hotel)
+            self._by_type_client.setdefault(hotel.get("type_client") or "", []).append(hotel)
+            city_names.setdefault(city_key, []).append((name_key, position))
+        self._name_indexes = {
+            city_key: _NameIndex(names) for city_key, names in city_names.items()
+        }
+
+    def __len__(self):
+        return len(self.hotels)
+
+    def __iter__(self):
+        return iter(self.hotels)
+
+    def by_city(self, city_name):
+        """Hotels of a city (normalized match), in catalog order."""
+        return list(self._by_city.get(normalize_lookup_key(city_name), ()))
+
+    def by_type_client(self, type_client):
+        """Hotels priced for a client type ('TO', 'PBC'...)."""
+        return list(self._by_type_client.get(type_client or "", ()))
+
+    def city_labels(self, allowed_cities=None):
+        """
+        Sorted distinct city labels, as written in the hotel sheet.
+
+        Args:
+            allowed_cities: Optional city names restricting the result
+        """
+        if allowed_cities:
+            city_keys = {normalize_lookup_key(c) for c in allowed_cities}
+        else:
+            city_keys = self._by_city.keys()
+        return sorted(
+            {
+                hotel.get("lieu", "")
+                for city_key in city_keys
+                for hotel in self._by_city.get(city_key, ())
+                if hotel.get("lieu")
+            }
+        )
+
+    def find(self, city_name, hotel_name):
+        """
+        Find a hotel by city and name: exact normalized name first, then the
+        first hotel of the city whose name contains or is contained in it.
+        """
+        city_key = normalize_lookup_key(city_name)
+        hotel_key = normalize_lookup_key(hotel_name)
+        if not city_key or not hotel_key:
+            return None
+
+        hotel = self._by_city_name.get((city_key, hotel_key))
+        if hotel is not None:
+            return hotel
+
+        index = self._name_indexes.get(city_key)
+        if index is None:
+            return None
+        position = index.first_partial(hotel_key)
+        return self.hotels[position] if position is not None else None
@@ -0,0 +1,90 @@
+"""
+Compact hotel records
+
+load_all_hotels builds one nested dict per hotel (room_rates, meals, options,
+taxes, extras, plus ~30 flat keys duplicating the rates), and the result is
+cached for 24h and handed to every form. HotelRecord keeps the same data as a
+read-only mapping: the keys live in a layout shared by every record with the
+same key set, the values in a tuple, so a record costs one object and one
+tuple instead of a hash table per level.
+
+Records behave like the legacy dicts for reading (get, [], in, keys, items,
+iteration, == with a dict); to_dict() returns a plain mutable copy.
+"""
+
+import threading
+from collections.abc import Mapping
+
+_LAYOUTS = {}
+_LAYOUTS_LOCK = threading.Lock()
+
+
+def _layout(keys):
+    """Return the shared (keys, {key: index}) layout of a key tuple."""
+    layout = _LAYOUTS.get(keys)
+    if layout is None:
+        with _LAYOUTS_LOCK:
+            layout = _LAYOUTS.setdefault(
+                keys, (keys, {key: index for index, key in enumerate(keys)})
+            )
+    return layout
+
+
+class CompactMapping(Mapping):
+    """Read-only mapping with a shared key layout and tuple-stored values."""
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, data=()):
+        data = dict(data)
+        self._layout = _layout(tuple(data))
+        self._values = tuple(_pack(value) for value in data.values())
+
+    @classmethod
+    def from_dict(cls, data):
+        """Pack a dict, nested dicts included."""
+        return cls(data)
+
+    def __getitem__(self, key):
+        return self._values[self._layout[1][key]]
+
+    def __contains__(self, key):
+        return key in self._layout[1]
+
+    def __iter__(self):
+        return iter(self._layout[0])
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key, default=None):
+        index = self._layout[1].get(key)
+        return default if index is None else self._values[index]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def to_dict(self):
+        """Return a plain dict copy, nested mappings included."""
+        return {
+            key: value.to_dict() if isinstance(value, CompactMapping) else value
+            for key, value in zip(self._layout[0], self._values)
+        }
+
+
+def _pack(value):
+    if isinstance(value, dict):
+        return CompactMapping(value)
+    return value
+
+
+class HotelRecord(CompactMapping):
+    """One hotel of load_all_hotels, as a compact read-only mapping."""
+
+    __slots__ = ()
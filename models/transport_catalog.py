@@ -0,0 +1,56 @@
+"""
+Indexed transport source catalog
+
+Built once per version of the TRANSPORT sheet from the rows of
+_load_transport_source_rows; the transport forms fill their prestataire and
+vehicle comboboxes from these indexes instead of reloading and scanning the
+sheet on every selection change.
+"""
+
+
+class TransportCatalog:
+    """
+    Vehicles of the TRANSPORT sheet indexed by prestataire and vehicle type.
+
+    Args:
+        rows (list): Row dicts (prestataire, type_voiture, nombre_place,
+            location_par_jour, consommation, energie)
+    """
+
+    def __init__(self, rows):
+        self._rows = {}
+        types_by_prestataire = {}
+        all_types = set()
+        for row in rows:
+            prestataire = row.get("prestataire") or ""
+            vehicle = row.get("type_voiture") or ""
+            # First row wins, like the former linear scan
+            self._rows.setdefault((prestataire, vehicle), row)
+            types = types_by_prestataire.setdefault(prestataire, set())
+            if vehicle:
+                types.add(vehicle)
+                all_types.add(vehicle)
+        self._prestataires = tuple(sorted(p for p in types_by_prestataire if p))
+        self._types = {
+            prestataire: tuple(sorted(types))
+            for prestataire, types in types_by_prestataire.items()
+        }
+        self._all_types = tuple(sorted(all_types))
+
+    def __len__(self):
+        return len(self._rows)
+
+    def prestataires(self):
+        """Sorted distinct prestataires."""
+        return list(self._prestataires)
+
+    def vehicle_types(self, prestataire=None):
+        """Sorted vehicle types of a prestataire, or of every prestataire."""
+        if not prestataire:
+            return list(self._all_types)
+        return list(self._types.get(prestataire, ()))
+
+    def vehicle_data(self, prestataire, type_voiture):
+        """Row of a (prestataire, type) pair, or None if unknown."""
+        row = self._rows.get((prestataire, type_voiture))
+        return dict(row) if row is not None else None
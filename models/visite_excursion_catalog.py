@@ -0,0 +1,90 @@
+"""
+Indexed visite & excursion catalog
+
+Built once per version of the Visite_excursion sheet from the rows of
+load_visite_excursion_data. Every prestataire, designation and raw field
+value maps to the set of rows holding it, so the cascading dropdowns of the
+visite/excursion quotation are answered by set intersection.
+"""
+
+# Query results memoized per catalog (filter combinations are few)
+_MAX_MEMOIZED_QUERIES = 1024
+
+
+class VisiteExcursionCatalog:
+    """
+    Visite/excursion rows indexed by value.
+
+    Queries take constraints: (source, key, value) triples where source is
+    "row" (key "prestation" or "designation") or "field" (key = normalized
+    header of a raw field), all of which must hold.
+
+    Args:
+        rows (list): Rows of load_visite_excursion_data
+    """
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self._postings = {}
+        for row_id, row in enumerate(self.rows):
+            for key in ("prestation", "designation"):
+                value = str(row.get(key) or "").strip()
+                self._postings.setdefault(("row", key, value), []).append(row_id)
+            for key, value in row.get("fields", {}).items():
+                self._postings.setdefault(("field", key, value), []).append(row_id)
+        self._memo = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def match(self, constraints):
+        """Ids of the rows meeting every constraint, in sheet order."""
+        postings = []
+        for constraint in constraints:
+            ids = self._postings.get(tuple(constraint))
+            if ids is None:
+                return []
+            postings.append(ids)
+        if not postings:
+            return list(range(len(self.rows)))
+        postings.sort(key=len)
+        ids = set(postings[0])
+        for other in postings[1:]:
+            ids.intersection_update(other)
+            if not ids:
+                return []
+        return sorted(ids)
+
+    def _memoized(self, name, constraints, compute):
+        memo_key = (name, tuple(map(tuple, constraints)))
+        cached = self._memo.get(memo_key)
+        if cached is None:
+            cached = compute(self.match(constraints))
+            if len(self._memo) >= _MAX_MEMOIZED_QUERIES:
+                self._memo.clear()
+            self._memo[memo_key] = cached
+        return cached
+
+    def _distinct(self, key, constraints):
+        values = self._memoized(
+            key,
+            constraints,
+            lambda ids: tuple(sorted({self.rows[i].get(key) for i in ids} - {None, ""})),
+        )
+        return list(values)
+
+    def prestataires(self, constraints=()):
+        """Sorted distinct prestataires of the matching rows."""
+        return self._distinct("prestation", constraints)
+
+    def designations(self, constraints=()):
+        """Sorted distinct designations of the matching rows."""
+        return self._distinct("designation", constraints)
+
+    def montant(self, constraints=()):
+        """Tarif par pax of the first matching row, 0 if none."""
+        return self._memoized(
+            "montant",
+            constraints,
+            lambda ids: self.rows[ids[0]].get("tarif_par_pax", 0) if ids else 0,
+        )
@@ -0,0 +1,45 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are standalone scripts (not collected by pytest). Run them from the
+project root, e.g. ``python scripts/benchmarks/bench_excel_loaders.py``.
+"""
+
+import os
+import resource
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    """Run func `repeat` times and return (best_seconds, last_result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def print_table(title, rows):
+    """Print (label, value...) rows as an aligned table."""
+    print(f"\n{title}")
+    print("-" * len(title))
+    width = max(len(str(r[0])) for r in rows) if rows else 0
+    for label, *values in rows:
+        print(f"  {str(label):<{width}}  " + "  ".join(f"{str(v):>10}" for v in values))
@@ -0,0 +1,110 @@
+"""
+Benchmark: air ticket tariff and city lookups.
+
+Builds a data-hotel.xlsx with an avion sheet, then times the lookups the air
+ticket form runs on every combobox change:
+
+- legacy: load_avion_source_data + linear filter matching (old functions)
+- index:  get_avion_tarifs / get_avion_*_cities on the cached AvionTariffIndex
+
+Usage:
+    python scripts/benchmarks/bench_avion_tariffs.py [--rows 2000]
+"""
+
+import argparse
+import os
+import tempfile
+
+from _bench_utils import print_table, timed
+
+CITIES = [f"Ville{i}" for i in range(30)]
+COMPANIES = ["Air Madagascar", "Tsaradia", "Air Austral", "Ewa Air"]
+
+
+def build_workbook(path, n_rows):
+    from openpyxl import Workbook
+
+    from config import AVION_SOURCE_SHEET_NAME
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = AVION_SOURCE_SHEET_NAME
+    ws.append(["Compagnie", "Ville de départ", "Ville d'arrivée", "Classe", "Tarif adultes", "Tarifs enfants"])
+    for i in range(n_rows):
+        ws.append([
+            COMPANIES[i % len(COMPANIES)],
+            CITIES[i % len(CITIES)],
+            CITIES[(i * 7 + 3) % len(CITIES)],
+            "Eco" if i % 3 else "Business",
+            400000 + i,
+            200000 + i,
+        ])
+    wb.save(path)
+
+
+def run_legacy(filters):
+    """Former lookups: reload the rows, then compare every row to the filters."""
+    from utils.excel_handler import _normalize_header_key, load_avion_source_data
+
+    data = load_avion_source_data()
+    normalized = {_normalize_header_key(k): str(v).strip() for k, v in filters.items() if v}
+    tarifs = None
+    departures, arrivals = set(), set()
+    for row in data:
+        fields = row["fields"]
+        matches = all(fields.get(k, "") == v for k, v in normalized.items())
+        if matches and tarifs is None:
+            tarifs = (row["tarif_adulte"], row["tarif_enfant"])
+        if all(fields.get(k, "") == v for k, v in normalized.items() if k != "ville de depart"):
+            departures.add(fields.get("ville de depart"))
+        if all(fields.get(k, "") == v for k, v in normalized.items() if k != "ville d arrivee"):
+            arrivals.add(fields.get("ville d arrivee"))
+    return tarifs, sorted(departures), sorted(arrivals)
+
+
+def run_index(filters):
+    from utils.excel_handler import (
+        get_avion_arrival_cities,
+        get_avion_departure_cities,
+        get_avion_tarifs,
+    )
+
+    return (
+        get_avion_tarifs(filters),
+        get_avion_departure_cities(filters),
+        get_avion_arrival_cities(filters),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    from utils import excel_handler
+
+    filters = {"Compagnie": "Tsaradia", "Ville de départ": "Ville5", "Ville d'arrivée": "Ville8"}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data-hotel.xlsx")
+        build_workbook(path, args.rows)
+        excel_handler.HOTEL_EXCEL_PATH = path
+        excel_handler.load_avion_source_data()  # parse the workbook snapshot once
+        run_index(filters)  # build the index once
+
+        legacy_s, legacy = timed(run_legacy, filters, repeat=5)
+        index_s, indexed = timed(run_index, filters, repeat=50)
+
+    assert legacy[0] == indexed[0]
+    print_table(
+        f"Tariff + departure/arrival lookups, {args.rows} avion rows",
+        [
+            ("", "milliseconds"),
+            ("reload + linear match", f"{legacy_s * 1000:.2f}"),
+            ("AvionTariffIndex", f"{index_s * 1000:.3f}"),
+            ("speed-up", f"{legacy_s / index_s:.0f}x" if index_s else "-"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
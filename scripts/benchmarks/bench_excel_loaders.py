@@ -0,0 +1,179 @@
+"""
+Benchmark: client loaders, full edit-mode parsing vs. read-only streaming.
+
+Generates a data.xlsx with DEMANDE_CLIENT, INFOS_CLIENTS and COTATION_H
+sheets, then measures in separate processes (so peak RSS is not shared):
+
+- legacy:    load_workbook() in edit mode + ws.cell() per value (old loaders)
+- streaming: excel_handler loaders (read_only snapshot + iter_rows values)
+
+Usage:
+    python scripts/benchmarks/bench_excel_loaders.py [--rows 5000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from _bench_utils import PROJECT_ROOT, peak_rss_mb, print_table, timed
+
+CLIENT_HEADERS = [
+    "Date", "Réf. Client", "Type Client", "Prénom", "Nom", "Date Arrivée",
+    "Date Départ", "Durée Séjour", "Nombre Participants", "Nombre Adultes",
+    "Enfants 2-12", "Bébés 0-2", "Téléphone", "Téléphone WhatsApp", "Email",
+    "Période", "Restauration", "Hébergement", "Chambre", "Enfant",
+    "Âge Enfant", "Forfait", "Circuit", "Statut", "SGL", "DBL", "TWN", "TPL", "FML",
+]
+INFOS_HEADERS = [
+    "Date", "Réf. Client", "Numéro Dossier", "Statut", "Heure Arrivée",
+    "Heure Départ", "Compagnie", "Aéroport", "Réf. Externe", "Type Circuit",
+    "Ville Départ", "Ville Arrivée",
+]
+COTATION_H_HEADERS = [
+    "Date", "ID_Client", "Numero_Dossier", "Nom_Client", "Prénom_Client",
+    "Ville", "Nuits", "Hôtel", "Catégorie_Chambre",
+    "SGL_Nb", "SGL_Prix_MGA", "DBL_Nb", "DBL_Prix_MGA", "TWN_Nb", "TWN_Prix_MGA",
+    "TPL_Nb", "TPL_Prix_MGA", "FML_Nb", "FML_Prix_MGA",
+    "Nb_Pax", "Prix_Unitaire_MGA", "Dépense_MGA", "Marge_Pct", "Total_MGA",
+]
+
+
+def build_workbook(path, rows):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "DEMANDE_CLIENT"
+    ws.append(CLIENT_HEADERS)
+    for i in range(rows):
+        ref = f"LHM-R{i:06d}"
+        ws.append([
+            "2026-01-01 10:00:00", ref, "Mr", f"Prenom{i}", f"Nom{i}",
+            "01/02/2026", "10/02/2026", "9 jours", 2, 2, 0, 0,
+            "+261340000000", "", f"client{i}@example.com", "Haute saison",
+            "Demi-pension", "Hôtel", "DBL", "Non", "", "Standard", "Sud",
+            "En cours", 0, 1, 0, 0, 0,
+        ])
+    infos = wb.create_sheet("INFOS_CLIENTS")
+    infos.append(INFOS_HEADERS)
+    for i in range(rows):
+        infos.append([
+            "2026-01-01 10:00:00", f"LHM-R{i:06d}", f"LHM-D{i:06d}", "En cours",
+            "09:45", "18:20", "Air Austral", "Ivato", "", "Sud",
+            "Antananarivo", "Toliary",
+        ])
+    cotation = wb.create_sheet("COTATION_H")
+    cotation.append(COTATION_H_HEADERS)
+    for i in range(rows):
+        cotation.append([
+            "2026-01-01 10:00:00", f"LHM-R{i % 500:06d}", f"LHM-D{i % 500:06d}",
+            f"Nom{i}", f"Prenom{i}", "Antsirabe", 2, "Hotel Test", "standard",
+            0, 0, 1, 120000, 0, 0, 0, 0, 0, 0, 2, 120000, 240000, 10, 264000,
+        ])
+    wb.save(path)
+
+
+def run_legacy(path):
+    """Reproduce the old loaders: edit-mode workbook, one ws.cell() per value."""
+    from openpyxl import load_workbook
+
+    def _read_sheet(sheet_name, id_filter=None):
+        wb = load_workbook(path)
+        ws = wb[sheet_name]
+        header_map = {
+            str(ws.cell(row=1, column=c).value).strip(): c
+            for c in range(1, ws.max_column + 1)
+            if ws.cell(row=1, column=c).value is not None
+        }
+        out = []
+        for row in range(2, ws.max_row + 1):
+            if id_filter and ws.cell(row=row, column=header_map["ID_Client"]).value != id_filter:
+                continue
+            out.append({h: ws.cell(row=row, column=c).value for h, c in header_map.items()})
+        wb.close()
+        return out
+
+    def _clients():
+        infos = {r["Réf. Client"]: r for r in _read_sheet("INFOS_CLIENTS")}
+        clients = _read_sheet("DEMANDE_CLIENT")
+        for client in clients:
+            client.update(infos.get(client["Réf. Client"], {}))
+        return clients
+
+    clients_s, clients = timed(_clients)
+    cotation_s, rows = timed(_read_sheet, "COTATION_H", "LHM-R000042")
+    return {"clients": clients_s, "cotation": cotation_s, "n_clients": len(clients), "n_rows": len(rows)}
+
+
+def run_streaming(path):
+    import utils.excel_handler as eh
+    from utils.cache import invalidate_client_cache
+    from utils.workbook_snapshot import invalidate_workbook_snapshot
+
+    eh.CLIENT_EXCEL_PATH = path
+    invalidate_workbook_snapshot()
+    invalidate_client_cache()
+
+    clients_s, clients = timed(eh.load_all_clients)
+    invalidate_workbook_snapshot()
+    cotation_s, rows = timed(eh.load_client_hotel_cotation, {"ref_client": "LHM-R000042"})
+    # Second read of another client hits the snapshot: no parsing at all.
+    warm_s, _ = timed(eh.load_client_hotel_cotation, {"ref_client": "LHM-R000043"})
+    return {
+        "clients": clients_s,
+        "cotation": cotation_s,
+        "cotation_warm": warm_s,
+        "n_clients": len(clients),
+        "n_rows": len(rows),
+    }
+
+
+def _child(mode, path):
+    result = run_legacy(path) if mode == "legacy" else run_streaming(path)
+    result["peak_rss_mb"] = peak_rss_mb()
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--mode", choices=["legacy", "streaming"])
+    parser.add_argument("--path")
+    args = parser.parse_args()
+
+    if args.mode:
+        _child(args.mode, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "data.xlsx")
+        build_workbook(path, args.rows)
+        results = {}
+        for mode in ("legacy", "streaming"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--path", path],
+                check=True,
+                capture_output=True,
+                text=True,
+                cwd=PROJECT_ROOT,
+            ).stdout
+            results[mode] = json.loads(out.strip().splitlines()[-1])
+
+    legacy, streaming = results["legacy"], results["streaming"]
+    print_table(
+        f"Client loaders, {args.rows} rows per sheet",
+        [
+            ("", "legacy", "streaming"),
+            ("load_all_clients (s)", f"{legacy['clients']:.3f}", f"{streaming['clients']:.3f}"),
+            ("cotation H, 1 client (s)", f"{legacy['cotation']:.3f}", f"{streaming['cotation']:.3f}"),
+            ("cotation H, warm snapshot (s)", "-", f"{streaming['cotation_warm']:.4f}"),
+            ("peak RSS (MB)", f"{legacy['peak_rss_mb']:.1f}", f"{streaming['peak_rss_mb']:.1f}"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Benchmark: decoding the grouped-format hotel sheet (two header rows).
+
+Builds a data-hotel.xlsx with a ~80-column grouped hotel sheet, parses it once
+(shared workbook snapshot), then times the row decoding of load_all_hotels:
+
+- legacy: per-cell group/header normalization and if/elif dispatch (old loop)
+- plan:   excel_handler._compile_grouped_hotel_plan, resolved once per load
+
+Usage:
+    python scripts/benchmarks/bench_hotel_loader.py [--hotels 600]
+"""
+
+import argparse
+import os
+import tempfile
+
+from _bench_utils import print_table, timed
+
+ROOMS = ["SPL", "DBL", "TWINS", "FML", "TRIPLE", "CHAMBRE CHAUFFEUR", "DORTOIR", "SUPP", "STUDIOS", "VIP"]
+GROUPS = [
+    ("HOTEL", ["Ville", "HTL", "CATÉGORIE", "UNITÉ", "Adresse", "Téléphone"]),
+    ("STANDARD", ROOMS),
+    ("BUNGALOWS", ROOMS),
+    ("DE LUXE", ROOMS),
+    ("SUITE", ROOMS),
+    ("VILLA", ROOMS),
+    ("OPTIONS", ["CH. EVASION", "MASSAGE", "Transfert"]),
+    ("TAXE", ["VIGNETTE", "TAXE DE SÉJOUR"]),
+    ("REPAS", ["PDJ", "DJ", "DR", "REPAS GUIDE", "REPAS CHAUFFEUR"]),
+    ("AUTRES INFORMATIONS ET REMARQUES", ["INCLUE", "SPA", "REMARQUES", "Contact"]),
+]
+
+
+def build_workbook(path, hotels):
+    from openpyxl import Workbook
+
+    from config import HOTEL_SHEET_NAME
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = HOTEL_SHEET_NAME
+    group_row, header_row = [], []
+    for group, headers in GROUPS:
+        group_row += [group] + [None] * (len(headers) - 1)
+        header_row += headers
+    ws.append(group_row)
+    ws.append(header_row)
+    for i in range(hotels):
+        row = []
+        for group, headers in GROUPS:
+            for j, header in enumerate(headers):
+                if group == "HOTEL":
+                    row.append([f"Ville{i % 40}", f"Hotel {i}", "PBC" if i % 3 else "TO", "MGA", "", ""][j])
+                elif group == "AUTRES INFORMATIONS ET REMARQUES":
+                    row.append(f"{header.lower()} {i}")
+                else:
+                    row.append(None if (i + j) % 4 == 0 else 50000 + i * 10 + j)
+        ws.append(row)
+    wb.save(path)
+
+
+def run_legacy(ws):
+    """Row decoding of load_all_hotels before the column plan (grouped branch)."""
+    from utils.excel_handler import _iter_grouped_columns, _parse_num, _row_value
+
+    grouped_columns = _iter_grouped_columns(ws, 1, 2)
+    group_key_map = {
+        "HOTEL": "hotel", "STANDARD": "standard", "BUNGALOWS": "bungalows",
+        "DE LUXE": "deluxe", "SUITE": "suite", "OPTIONS": "options", "TAXE": "taxes",
+        "REPAS": "meals", "AUTRES INFORMATIONS ET REMARQUES": "extras",
+    }
+    room_key_map = {
+        "SPL": "single", "DBL": "double", "TWINS": "twin", "FML": "familiale",
+        "TRIPLE": "triple", "CHAMBRE CHAUFFEUR": "chauffeur", "DORTOIR": "dortoir",
+        "SUPP": "supp", "STUDIOS": "studios", "VIP": "vip",
+    }
+    options_key_map = {"CH. EVASION": "ch_evasion", "MASSAGE": "massage"}
+    taxes_key_map = {"VIGNETTE": "vignette", "TAXE DE SEJOUR": "taxe_sejour", "TAXE DE SÉJOUR": "taxe_sejour"}
+    meals_key_map = {
+        "PDJ": "petit_dejeuner", "DJ": "dejeuner", "DR": "diner",
+        "REPAS GUIDE": "repas_guide", "REPAS CHAUFFEUR": "repas_chauffeur",
+    }
+    extras_key_map = {"INCLUE": "inclue", "SPA": "spa", "REMARQUES": "remarques"}
+
+    hotels = []
+    for values in ws.iter_rows(min_row=3, values_only=True):
+        if _row_value(values, 1) is None:
+            continue
+        hotel = {
+            "nom": "", "lieu": "", "unite": "",
+            "room_rates": {"standard": {}, "bungalows": {}, "deluxe": {}, "suite": {}},
+            "options": {}, "taxes": {}, "meals": {}, "extras": {},
+        }
+        raw_category = ""
+        for group, header, col in grouped_columns:
+            group_key = group_key_map.get(str(group).strip().upper())
+            if not group_key:
+                continue
+            value = _row_value(values, col)
+            if value is None or value == "":
+                continue
+            header_norm_upper = str(header).strip().upper()
+            if group_key == "hotel":
+                if header_norm_upper == "VILLE":
+                    hotel["lieu"] = str(value).strip()
+                elif header_norm_upper == "HTL":
+                    hotel["nom"] = str(value).strip()
+                elif header_norm_upper in ("CATÉGORIE", "CATEGORIE"):
+                    raw_category = str(value).strip()
+                elif header_norm_upper in ("UNITÉ", "UNITE"):
+                    hotel["unite"] = str(value).strip()
+            elif group_key in ("standard", "bungalows", "deluxe", "suite"):
+                room_key = room_key_map.get(header_norm_upper)
+                if room_key:
+                    hotel["room_rates"][group_key][room_key] = _parse_num(value)
+            elif group_key == "options":
+                opt_key = options_key_map.get(header_norm_upper)
+                if opt_key:
+                    hotel["options"][opt_key] = _parse_num(value)
+            elif group_key == "taxes":
+                tax_key = taxes_key_map.get(header_norm_upper)
+                if tax_key:
+                    hotel["taxes"][tax_key] = _parse_num(value)
+            elif group_key == "meals":
+                meal_key = meals_key_map.get(header_norm_upper)
+                if meal_key:
+                    hotel["meals"][meal_key] = _parse_num(value)
+            elif group_key == "extras":
+                extra_key = extras_key_map.get(header_norm_upper)
+                if extra_key:
+                    hotel["extras"][extra_key] = value
+        hotel["categorie"] = raw_category
+        hotels.append(hotel)
+    return hotels
+
+
+def run_plan():
+    from utils.excel_handler import load_all_hotels
+
+    return load_all_hotels.__wrapped__()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hotels", type=int, default=600)
+    args = parser.parse_args()
+
+    from config import HOTEL_SHEET_NAME
+    from utils import excel_handler
+    from utils.workbook_snapshot import load_workbook_snapshot
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data-hotel.xlsx")
+        build_workbook(path, args.hotels)
+        excel_handler.HOTEL_EXCEL_PATH = path
+        ws = load_workbook_snapshot(path)[HOTEL_SHEET_NAME]
+
+        legacy_s, legacy = timed(run_legacy, ws, repeat=5)
+        plan_s, hotels = timed(run_plan, repeat=5)
+
+    assert len(legacy) == len(hotels)
+    print_table(
+        f"Decode {args.hotels} hotels x {ws.max_column} columns (grouped format)",
+        [
+            ("", "seconds"),
+            ("per-cell dispatch", f"{legacy_s:.3f}"),
+            ("load_all_hotels (plan)", f"{plan_s:.3f}"),
+            ("speed-up", f"{legacy_s / plan_s:.1f}x" if plan_s else "-"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: memory held by the cached hotel list.
+
+Loads a generated grouped-format hotel sheet with load_all_hotels, then
+measures with tracemalloc the memory retained by:
+
+- legacy:  the nested dicts load_all_hotels used to return (record.to_dict())
+- records: the HotelRecord mappings it returns now
+
+Cell values (numbers, strings) are shared by both and not counted.
+
+Usage:
+    python scripts/benchmarks/bench_hotel_memory.py [--hotels 3000]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from _bench_utils import print_table
+from bench_hotel_loader import build_workbook
+
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns, and the built object."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hotels", type=int, default=3000)
+    args = parser.parse_args()
+
+    from models.hotel_record import HotelRecord
+    from utils import excel_handler
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data-hotel.xlsx")
+        build_workbook(path, args.hotels)
+        excel_handler.HOTEL_EXCEL_PATH = path
+        records = excel_handler.load_all_hotels.__wrapped__()
+
+    legacy_bytes, legacy = retained_bytes(lambda: [r.to_dict() for r in records])
+    record_bytes, packed = retained_bytes(lambda: [HotelRecord(d) for d in legacy])
+    assert packed == legacy
+
+    print_table(
+        f"Memory of {len(records)} cached hotels",
+        [
+            ("", "total KB", "per hotel B"),
+            ("nested dicts", f"{legacy_bytes / 1024:.0f}", f"{legacy_bytes / len(records):.0f}"),
+            ("HotelRecord", f"{record_bytes / 1024:.0f}", f"{record_bytes / len(records):.0f}"),
+            ("ratio", f"{legacy_bytes / record_bytes:.1f}x" if record_bytes else "-", ""),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
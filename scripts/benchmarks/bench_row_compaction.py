@@ -0,0 +1,75 @@
+"""
+Benchmark: replacing one client's rows in a large cotation sheet.
+
+Builds an in-memory COTATION_H-like sheet (24 columns) and removes the rows of
+one client, scattered through the sheet, with:
+
+- legacy:     ws.delete_rows(row, 1) per row, bottom-up (old _delete_rows_for_client)
+- compaction: excel_handler._compact_rows (one pass over the cells)
+
+Usage:
+    python scripts/benchmarks/bench_row_compaction.py [--rows 10000] [--client-rows 40]
+"""
+
+import argparse
+
+from _bench_utils import print_table, timed
+
+
+def build_sheet(rows, client_rows):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Date", "ID_Client"] + [f"Col{i}" for i in range(22)])
+    step = max(rows // client_rows, 1)
+    targets = []
+    for i in range(rows):
+        if i % step == 0 and len(targets) < client_rows:
+            ref = "LHM-TARGET"
+            targets.append(i + 2)
+        else:
+            ref = f"LHM-R{i:06d}"
+        ws.append(["2026-01-01 10:00:00", ref] + [i] * 22)
+    return ws, targets
+
+
+def run_legacy(ws, targets):
+    for row in reversed(targets):
+        ws.delete_rows(row, 1)
+    return ws.max_row
+
+
+def run_compaction(ws, targets):
+    from utils.excel_handler import _compact_rows
+
+    _compact_rows(ws, targets)
+    return ws.max_row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--client-rows", type=int, default=40)
+    args = parser.parse_args()
+
+    results = {}
+    for name, func in (("legacy", run_legacy), ("compaction", run_compaction)):
+        ws, targets = build_sheet(args.rows, args.client_rows)
+        results[name] = timed(func, ws, targets)
+
+    (legacy_s, legacy_rows), (compact_s, compact_rows) = results["legacy"], results["compaction"]
+    assert legacy_rows == compact_rows
+    print_table(
+        f"Delete {args.client_rows} client rows from a {args.rows}-row sheet",
+        [
+            ("", "seconds"),
+            ("delete_rows per row", f"{legacy_s:.3f}"),
+            ("_compact_rows", f"{compact_s:.3f}"),
+            ("speed-up", f"{legacy_s / compact_s:.0f}x" if compact_s else "-"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
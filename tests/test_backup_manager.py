@@ -0,0 +1,105 @@
+"""
+Test suite for utils.backup_manager module
+"""
+
+import os
+from datetime import datetime
+
+from utils.backup_manager import BackupManager, open_backup
+
+
+def _write(path, content):
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _replace(path, content):
+    # Saves go through os.replace (see excel_handler._atomic_save)
+    tmp = str(path) + ".tmp"
+    _write(tmp, content)
+    os.replace(tmp, path)
+
+
+class TestBackupManager:
+    """Deduplication, background copy, compression and retention."""
+
+    def test_unchanged_content_is_not_copied_again(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        _write(path, b"v1")
+        manager = BackupManager(compression="none")
+
+        first = manager.backup(str(path)).result(timeout=10)
+        second = manager.backup(str(path)).result(timeout=10)
+
+        assert first is not None and os.path.exists(first)
+        assert second is None
+        assert len(manager.list_backups(str(path))) == 1
+
+    def test_backup_keeps_content_from_before_the_save(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        _write(path, b"before")
+        manager = BackupManager(compression="gzip")
+
+        future = manager.backup(str(path))
+        _replace(path, b"after")
+        backup_path = future.result(timeout=10)
+
+        assert backup_path.endswith(".bak.gz")
+        with open_backup(backup_path) as f:
+            assert f.read() == b"before"
+        assert not [n for n in os.listdir(tmp_path / "backups") if n.endswith(".staging")]
+
+    def test_unknown_or_missing_compression_falls_back(self):
+        assert BackupManager(compression="lz4").compression == "gzip"
+        assert BackupManager(compression=None).compression == "none"
+
+    def test_retention_keeps_recent_daily_and_monthly(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
+        stamps = [
+            datetime(2026, 1, 15, 9),
+            datetime(2026, 1, 20, 9),
+            datetime(2026, 2, 10, 9),
+            datetime(2026, 3, 1, 9),
+            datetime(2026, 3, 1, 10),
+            datetime(2026, 3, 2, 9),
+            datetime(2026, 3, 2, 10),
+        ]
+        for i, stamp in enumerate(stamps):
+            _write(backup_dir / f"data.xlsx.{stamp:%Y%m%d_%H%M%S}.{i:012x}.bak", b"x")
+        # Legacy backups (no digest) are rotated too
+        _write(backup_dir / "data.xlsx.20251201_080000.bak", b"x")
+
+        manager = BackupManager(compression="none", keep_recent=1, keep_daily=2, keep_monthly=3)
+        manager._prune(str(path))
+
+        kept = sorted(stamp for stamp, _, _ in manager.list_backups(str(path)))
+        assert kept == [
+            datetime(2026, 1, 20, 9),   # newest of January
+            datetime(2026, 2, 10, 9),   # newest of February
+            datetime(2026, 3, 1, 10),   # newest of March 1st
+            datetime(2026, 3, 2, 10),   # most recent
+        ]
+
+    def test_default_backups_are_plain_copies(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        _write(path, b"v1")
+
+        backup = BackupManager().backup(str(path)).result(timeout=5)
+        assert backup.endswith(".bak")
+        with open(backup, "rb") as f:
+            assert f.read() == b"v1"
+
+    def test_legacy_backups_are_pruned_when_unchanged(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        _write(path, b"v1")
+        manager = BackupManager(compression="none", keep_recent=1, keep_daily=0, keep_monthly=0)
+        manager.backup(str(path)).result(timeout=5)
+        # Written by the former create_backup()
+        for stamp in ("20250101_080000", "20250102_080000"):
+            _write(tmp_path / "backups" / f"data.xlsx.{stamp}.bak", b"old")
+        assert len(manager.list_backups(str(path))) == 3
+
+        manager.backup(str(path)).result(timeout=5)
+        assert len(manager.list_backups(str(path))) == 1
@@ -0,0 +1,112 @@
+"""
+Test suite for utils.cache module
+"""
+
+import time
+
+from utils import cache as cache_module
+from utils.cache import (
+    LRUCache,
+    cached_client_data,
+    estimate_size,
+    get_cache_stats,
+    invalidate_client_cache,
+)
+
+
+class TestLRUCache:
+    """Bounded cache engine: LRU eviction, expiry and tags."""
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" becomes the LRU entry
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_limit_and_accounting(self):
+        cache = LRUCache(max_bytes=100)
+        cache.set("a", "x", size=40)
+        cache.set("b", "y", size=40)
+        assert cache.get_stats()["bytes"] == 80
+
+        cache.set("c", "z", size=40)
+        assert "a" not in cache
+        assert cache.get_stats()["bytes"] == 80
+
+        cache.set("huge", "w", size=500)  # larger than the whole cache
+        assert "huge" not in cache
+        assert len(cache) == 2
+
+        cache.invalidate("b")
+        assert cache.get_stats()["bytes"] == 40
+
+    def test_lazy_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cache = LRUCache()
+        cache.set("short", 1, ttl_seconds=10)
+        cache.set("long", 2, ttl_seconds=100)
+
+        now[0] += 20
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        cache.set("other", 3, ttl_seconds=1)
+        now[0] += 200
+        assert cache.cleanup_expired() == 2
+        stats = cache.get_stats()
+        assert stats["expirations"] == 3
+        assert stats["cached_items"] == 0
+
+    def test_invalidate_by_key_and_tag(self):
+        cache = LRUCache()
+        cache.set("q1", 1, tags=("client:CLI001",))
+        cache.set("q2", 2, tags=("client:CLI001", "quotes"))
+        cache.set("q3", 3, tags=("client:CLI002",))
+
+        assert cache.get_stats()["tags"] == {"client:CLI001": 2, "quotes": 1, "client:CLI002": 1}
+        assert cache.invalidate_tag("client:CLI001") == 2
+        assert cache.get("q1") is None and cache.get("q2") is None
+        assert cache.get("q3") == 3
+        assert cache.get_stats()["tags"] == {"client:CLI002": 1}
+        assert cache.invalidate("q3") is True
+        assert cache.invalidate("q3") is False
+
+    def test_estimate_size_counts_shared_objects_once(self):
+        shared = "x" * 1000
+        assert estimate_size([shared, shared]) < 2 * estimate_size(shared)
+        assert estimate_size({"a": [1, 2, 3]}) > estimate_size({})
+
+
+class TestCacheDecorators:
+    """Decorators keep their interface and tag their entries."""
+
+    def test_client_data_invalidated_per_tag(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "_client_cache", LRUCache())
+        calls = []
+
+        @cached_client_data(ttl_seconds=60, tags=lambda ref: (f"client:{ref}",))
+        def load(ref):
+            calls.append(ref)
+            return {"ref": ref}
+
+        load("CLI001")
+        load("CLI002")
+        load("CLI001")
+        assert calls == ["CLI001", "CLI002"]
+
+        invalidate_client_cache(tag="client:CLI001")
+        load("CLI001")
+        load("CLI002")
+        assert calls == ["CLI001", "CLI002", "CLI001"]
+
+        stats = get_cache_stats()["clients"]
+        assert stats["tags"]["clients"] == 2
+        invalidate_client_cache()
+        load("CLI002")
+        assert calls[-1] == "CLI002"
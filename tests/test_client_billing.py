@@ -116,6 +116,26 @@ def test_build_client_quote_aggregates_all_categories():
     assert restauration_line["total_price"] == 100
 
 
+def test_build_client_quote_converts_all_lines_to_currency():
+    rows = {
+        "hotel": [{"hotel": "Colbert", "nuits": "2", "prix_unitaire": 100, "depense": 200, "marge": "10"}],
+        "transport": [{"depart": "Tana", "arrivee": "Tulear", "nb_vehicules": "1", "total": 300}],
+    }
+    rates = {"EUR": 10.0, "USD": 5.0}
+
+    ariary = build_client_quote(_client(), source_rows=rows)
+    euro = build_client_quote(_client(), source_rows=rows, currency="Euro", rates=rates)
+
+    assert euro["currency"] == "Euro"
+    assert euro["total_price"] == ariary["total_price"] / 10
+    assert euro["total_cost"] == ariary["total_cost"] / 10
+    hotel_line = euro["lines"][0]
+    assert hotel_line["currency"] == "Euro"
+    assert hotel_line["cost_unit"] == 10
+    assert hotel_line["margin_amount"] == 2
+    assert hotel_line["unit_price"] == 11
+
+
 def test_apply_margin_to_quote_line_keeps_restauration_at_zero():
     line = {
         "category": CATEGORY_RESTAURATION,
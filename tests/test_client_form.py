@@ -0,0 +1,163 @@
+"""
+Tests pour la sauvegarde du formulaire client (écriture en arrière-plan)
+"""
+
+import threading
+from concurrent.futures import Future
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+
+from gui.forms.client_form import ClientForm
+from models.client_data import ClientData
+from utils.cache import invalidate_client_cache
+
+
+class _FakeWidget:
+    """Stands in for a Tk widget: after() callbacks are run by the test."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, _ms, callback):
+        self.pending.append(callback)
+
+    def run_pending(self):
+        while self.pending:
+            self.pending.pop(0)()
+
+
+class _FakeButton:
+    def __init__(self):
+        self.state = "normal"
+
+    def configure(self, state):
+        self.state = state
+
+
+def _client():
+    return ClientData.from_form_data(
+        {
+            "ref_client": "LHM-R2603011",
+            "numero_dossier": "LHM-D2603011",
+            "type_client": "Mr",
+            "prenom": "Hery",
+            "nom": "Rakoto",
+            "date_arrivee": "01/01/2026",
+            "date_depart": "05/01/2026",
+            "nombre_participants": "2",
+            "nombre_adultes": "2",
+            "telephone": "+261340000003",
+            "email": "hery@example.com",
+            "statut": "En cours",
+        }
+    )
+
+
+class TestClientFormSave:
+    """Client saves run on the Excel writer thread, not on the Tk thread."""
+
+    def _form(self, client_to_edit=None):
+        results = []
+        form = SimpleNamespace(
+            parent=_FakeWidget(),
+            client_to_edit=client_to_edit,
+            on_save_callback=None,
+            _save_future=None,
+            _btn_save=_FakeButton(),
+            _reset_form=lambda: None,
+        )
+        form._set_save_enabled = partial(ClientForm._set_save_enabled, form)
+
+        def _on_client_saved(client, result, updated=False):
+            ClientForm._on_client_saved(form, client, result, updated=updated)
+            results.append((result, updated))
+
+        form._on_client_saved = _on_client_saved
+        return form, results
+
+    @pytest.fixture(autouse=True)
+    def _no_dialogs(self, monkeypatch):
+        monkeypatch.setattr("gui.forms.client_form.messagebox", SimpleNamespace(
+            showinfo=lambda *a, **k: None, showerror=lambda *a, **k: None
+        ))
+        monkeypatch.setattr("utils.activity_log.log_activity", lambda *a, **k: None)
+
+    def test_new_client_save_returns_future(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(tmp_path / "data.xlsx"))
+        invalidate_client_cache()
+        form, results = self._form()
+
+        future = ClientForm._submit_client_save(form, _client())
+
+        assert isinstance(future, Future)
+        assert future.result(timeout=10) == 2
+        form.parent.run_pending()
+        assert results == [(2, False)]
+
+    def test_client_update_returns_future(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(tmp_path / "data.xlsx"))
+        invalidate_client_cache()
+        form, _ = self._form()
+        ClientForm._submit_client_save(form, _client()).result(timeout=10)
+
+        form, results = self._form(client_to_edit={"row_number": 2})
+        future = ClientForm._submit_client_save(form, _client())
+
+        assert isinstance(future, Future)
+        assert future.result(timeout=10) is True
+        form.parent.run_pending()
+        assert results == [(True, True)]
+
+    def test_locked_workbook_is_reported_as_minus_two(self, monkeypatch):
+        def locked(_client_data):
+            raise PermissionError("data.xlsx is open in Excel")
+
+        monkeypatch.setattr("gui.forms.client_form.save_client_to_excel", locked)
+        form, results = self._form()
+
+        future = ClientForm._submit_client_save(form, _client())
+
+        assert isinstance(future, Future)
+        future.exception(timeout=10)
+        form.parent.run_pending()
+        assert results == [(-2, False)]
+
+    def test_double_submit_queues_a_single_save(self, monkeypatch):
+        release = threading.Event()
+        calls = []
+
+        def slow_save(client_data):
+            calls.append(client_data["Ref_Client"])
+            release.wait(timeout=10)
+            return 5
+
+        monkeypatch.setattr("gui.forms.client_form.save_client_to_excel", slow_save)
+        form, results = self._form()
+
+        first = ClientForm._submit_client_save(form, _client())
+        assert ClientForm._submit_client_save(form, _client()) is first
+        assert form._btn_save.state == "disabled"
+        release.set()
+        first.result(timeout=10)
+        form.parent.run_pending()
+
+        assert calls == ["LHM-R2603011"]
+        assert results == [(5, False)]
+        assert form._btn_save.state == "normal"
+        assert form._save_future is None
+
+    def test_failed_save_enables_the_button_again(self, monkeypatch):
+        def locked(_client_data):
+            raise PermissionError("data.xlsx is open in Excel")
+
+        monkeypatch.setattr("gui.forms.client_form.save_client_to_excel", locked)
+        form, results = self._form()
+
+        ClientForm._submit_client_save(form, _client()).exception(timeout=10)
+        form.parent.run_pending()
+
+        assert results == [(-2, False)]
+        assert form._btn_save.state == "normal"
+        assert form._save_future is None
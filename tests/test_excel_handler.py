@@ -7,10 +7,12 @@ import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
+from openpyxl.utils import get_column_letter
 
 from models.client_data import ClientData
 from utils.cache import invalidate_client_cache
 from utils.excel_handler import (
+    WorkbookSession,
     _invalidate_km_mada_cache,
     _load_km_mada_rows,
     _parse_num,
@@ -22,6 +24,19 @@ from utils.excel_handler import (
 )
 
 
+def count_calls(monkeypatch, module, name):
+    """Wrap module.name so each call is recorded; returns the list of calls."""
+    calls = []
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append((args, kwargs))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
 class TestParseNum:
     """Test the _parse_num helper function"""
 
@@ -188,6 +203,308 @@ class TestExcelLoading:
         assert clients[0]["statut"] == "Annulé"
 
 
+class TestWorkbookSession:
+    """Batched writes on data.xlsx through WorkbookSession."""
+
+    def _client(self, ref="LHM-R2603010"):
+        return ClientData.from_form_data(
+            {
+                "ref_client": ref,
+                "numero_dossier": "LHM-D2603010",
+                "type_client": "Mr",
+                "prenom": "Carla",
+                "nom": "Rabe",
+                "date_arrivee": "01/01/2026",
+                "date_depart": "05/01/2026",
+                "duree_sejour": "4 jours",
+                "nombre_participants": "2",
+                "nombre_adultes": "2",
+                "telephone": "+261340000002",
+                "email": "carla@example.com",
+                "periode": "Haute saison",
+                "circuit": "Sud",
+                "statut": "En cours",
+            }
+        ).to_dict()
+
+    def test_save_client_writes_both_sheets_with_one_save(self, tmp_path, monkeypatch):
+        import utils.excel_handler as eh
+
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        invalidate_client_cache()
+
+        with patch("utils.excel_handler._atomic_save", wraps=eh._atomic_save) as save:
+            row_number = save_client_to_excel(self._client())
+
+        assert row_number == 2
+        assert save.call_count == 1
+        invalidate_client_cache()
+        clients = load_all_clients()
+        assert clients[0]["numero_dossier"] == "LHM-D2603010"
+
+    def test_nested_operations_commit_once(self, tmp_path, monkeypatch):
+        import utils.excel_handler as eh
+        from utils.excel_handler import load_client_hotel_cotation, save_client_hotel_cotation_to_excel
+
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        invalidate_client_cache()
+        save_client_to_excel(self._client())
+        client = {"ref_client": "LHM-R2603010", "nom": "Rabe", "prenom": "Carla"}
+
+        with patch("utils.excel_handler._atomic_save", wraps=eh._atomic_save) as save:
+            with WorkbookSession(str(excel_path)):
+                update_client_statut(2, "Accepté")
+                save_client_hotel_cotation_to_excel(
+                    client, [{"ville": "Antsirabe", "nuits": "2", "hotel": "Couleur Cafe"}]
+                )
+                assert save.call_count == 0
+
+        assert save.call_count == 1
+        invalidate_client_cache()
+        assert load_all_clients()[0]["statut"] == "Accepté"
+        assert load_client_hotel_cotation(client)[0]["hotel"] == "Couleur Cafe"
+
+    def test_failed_session_writes_nothing(self, tmp_path, monkeypatch):
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        invalidate_client_cache()
+        save_client_to_excel(self._client())
+        before = excel_path.read_bytes()
+
+        with pytest.raises(RuntimeError):
+            with WorkbookSession(str(excel_path)):
+                update_client_statut(2, "Annulé")
+                raise RuntimeError("abort")
+
+        assert excel_path.read_bytes() == before
+
+
+class TestColumnAutoWidth:
+    """Column widths follow appended rows without rescanning the sheet."""
+
+    def test_append_reads_only_the_new_row(self, tmp_path, monkeypatch):
+        import utils.excel_handler as eh
+        from openpyxl import load_workbook
+
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        save_client_to_excel(TestWorkbookSession()._client("LHM-R1"))
+
+        client = TestWorkbookSession()._client("LHM-R2")
+        client["Email"] = "a.very.long.address@example.com"
+        with patch(
+            "utils.excel_handler._scan_column_lengths", wraps=eh._scan_column_lengths
+        ) as scan:
+            save_client_to_excel(client)
+        assert scan.call_count == 0
+
+        ws = load_workbook(excel_path)["DEMANDE_CLIENT"]
+        email_col = [c.value for c in ws[1]].index("Email") + 1
+        nom_col = [c.value for c in ws[1]].index("Nom") + 1
+        assert ws.column_dimensions[get_column_letter(email_col)].width == 25
+        # Same width as a full recompute: min(longest value + 2, 25)
+        assert ws.column_dimensions[get_column_letter(nom_col)].width == len("Rabe") + 2
+
+
+class TestWriteBehindQueue:
+    """Background writer: coalesced saves, futures and asynchronous errors."""
+
+    def _setup(self, tmp_path, monkeypatch):
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        invalidate_client_cache()
+        save_client_to_excel(TestWorkbookSession()._client())
+        return excel_path
+
+    def test_consecutive_writes_share_one_save(self, tmp_path, monkeypatch):
+        import utils.excel_handler as eh
+
+        self._setup(tmp_path, monkeypatch)
+        queue = eh.ExcelWriteQueue(coalesce_delay=0.2)
+        with patch("utils.excel_handler._atomic_save", wraps=eh._atomic_save) as save:
+            futures = [
+                queue.submit(update_client_statut, 2, statut)
+                for statut in ["Accepté", "En cours", "Annulé"]
+            ]
+            assert queue.flush(timeout=10)
+
+        assert [f.result() for f in futures] == [True, True, True]
+        assert save.call_count == 1
+        invalidate_client_cache()
+        assert load_all_clients()[0]["statut"] == "Annulé"
+
+    def test_failed_job_does_not_drop_the_batch(self, tmp_path, monkeypatch):
+        import utils.excel_handler as eh
+
+        self._setup(tmp_path, monkeypatch)
+        queue = eh.ExcelWriteQueue(coalesce_delay=0.2)
+
+        def _half_write_then_fail():
+            wb = eh._open_workbook(eh.CLIENT_EXCEL_PATH)
+            wb["DEMANDE_CLIENT"]["B2"] = "CORRUPTED"
+            return -1
+
+        failed = queue.submit(_half_write_then_fail)
+        saved = queue.submit(update_client_statut, 2, "Accepté")
+        assert queue.flush(timeout=10)
+
+        assert failed.result() == -1
+        assert saved.result() is True
+        invalidate_client_cache()
+        client = load_all_clients()[0]
+        assert client["statut"] == "Accepté"
+        assert client["ref_client"] == "LHM-R2603010"
+
+    def test_permission_error_is_reported_asynchronously(self, tmp_path, monkeypatch):
+        import threading
+
+        import utils.excel_handler as eh
+
+        self._setup(tmp_path, monkeypatch)
+        done = threading.Event()
+
+        def _locked():
+            raise PermissionError("data.xlsx is open in Excel")
+
+        future = eh.ExcelWriteQueue(coalesce_delay=0).submit(
+            _locked, callback=lambda f: done.set()
+        )
+
+        assert done.wait(10)
+        assert isinstance(future.exception(), PermissionError)
+
+    def test_reads_wait_for_queued_writes(self, tmp_path, monkeypatch):
+        from utils.excel_handler import submit_excel_write
+
+        self._setup(tmp_path, monkeypatch)
+        submit_excel_write(update_client_statut, 2, "Annulé")
+        invalidate_client_cache()
+
+        assert load_all_clients()[0]["statut"] == "Annulé"
+
+
+class TestClientRowIndex:
+    """ID_Client -> rows index used by the per-client cotation loaders and saves."""
+
+    def _save(self, ref, villes):
+        from utils.excel_handler import save_client_hotel_cotation_to_excel
+
+        client = {"ref_client": ref, "nom": "Rabe", "prenom": "Carla"}
+        rows = [{"ville": v, "nuits": "1", "hotel": f"Hotel {v}"} for v in villes]
+        return save_client_hotel_cotation_to_excel(client, rows)
+
+    def test_replace_keeps_other_clients(self, tmp_path, monkeypatch):
+        from utils.excel_handler import load_client_hotel_cotation
+
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        self._save("LHM-R1", ["Antsirabe", "Morondava"])
+        self._save("LHM-R2", ["Toliary"])
+        self._save("LHM-R1", ["Diego"])
+        self._save("LHM-R3", ["Fianarantsoa"])
+
+        assert [r["ville"] for r in load_client_hotel_cotation({"ref_client": "LHM-R1"})] == ["Diego"]
+        assert [r["ville"] for r in load_client_hotel_cotation({"ref_client": "LHM-R2"})] == ["Toliary"]
+        assert [r["ville"] for r in load_client_hotel_cotation({"ref_client": "LHM-R3"})] == [
+            "Fianarantsoa"
+        ]
+
+    def test_save_seeds_next_snapshot_index(self, tmp_path, monkeypatch):
+        from utils.workbook_snapshot import load_workbook_snapshot
+
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        self._save("LHM-R1", ["Antsirabe", "Morondava"])
+        load_workbook_snapshot(str(excel_path))
+        self._save("LHM-R2", ["Toliary"])
+        self._save("LHM-R1", ["Diego"])
+
+        ws = load_workbook_snapshot(str(excel_path))["COTATION_H"]
+        assert ws._indexes[2] == {"LHM-R2": [2], "LHM-R1": [3]}
+        assert ws.row_index(2) == {"LHM-R2": [2], "LHM-R1": [3]}
+
+    def test_rows_appended_by_other_writers_are_replaced(self, tmp_path, monkeypatch):
+        from utils.excel_handler import load_client_hotel_cotation, save_hotel_quotation_to_excel
+
+        excel_path = tmp_path / "clients.xlsx"
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        self._save("LHM-R2", ["Toliary"])
+        with WorkbookSession(str(excel_path)):
+            self._save("LHM-R1", ["Antsirabe", "Morondava"])
+            save_hotel_quotation_to_excel({"client_id": "LHM-R1", "city": "Diego"})
+
+        assert len(load_client_hotel_cotation({"ref_client": "LHM-R1"})) == 3
+
+        with WorkbookSession(str(excel_path)):
+            save_hotel_quotation_to_excel({"client_id": "LHM-R1", "city": "Tamatave"})
+            self._save("LHM-R2", ["Ifaty"])
+        self._save("LHM-R1", ["Fianarantsoa"])
+
+        assert [r["ville"] for r in load_client_hotel_cotation({"ref_client": "LHM-R1"})] == [
+            "Fianarantsoa"
+        ]
+        assert [r["ville"] for r in load_client_hotel_cotation({"ref_client": "LHM-R2"})] == ["Ifaty"]
+
+    def test_untracked_append_is_not_seeded(self):
+        from openpyxl import Workbook
+
+        from utils.excel_handler import _editable_row_index, _take_row_indexes
+
+        wb = Workbook()
+        ws = wb.active
+        for ref in ["ID_Client", "A", "B"]:
+            ws.append([ref])
+        assert _editable_row_index(ws, 1) == {"A": [2], "B": [3]}
+        ws.append(["A"])  # written without _record_client_rows
+
+        assert _take_row_indexes(wb) == {}
+        assert _editable_row_index(ws, 1) == {"A": [2, 4], "B": [3]}
+
+    def test_stale_index_is_rebuilt(self):
+        from openpyxl import Workbook
+
+        from utils.excel_handler import _delete_rows_for_client, _editable_row_index
+
+        wb = Workbook()
+        ws = wb.active
+        for ref in ["ID_Client", "A", "B", "A"]:
+            ws.append([ref])
+        assert _editable_row_index(ws, 1) == {"A": [2, 4], "B": [3]}
+        ws.delete_rows(2, 1)  # modified behind the index's back
+
+        _delete_rows_for_client(ws, 1, "A")
+
+        assert [c.value for (c,) in ws.iter_rows()] == ["ID_Client", "B"]
+        assert _editable_row_index(ws, 1) == {"B": [2]}
+
+    def test_compact_rows_matches_delete_rows(self):
+        from openpyxl import Workbook
+
+        from utils.excel_handler import _compact_rows
+
+        sheets = []
+        for _ in range(2):
+            ws = Workbook().active
+            ws.append(["ID_Client", "Ville", "Nuits"])
+            for i in range(12):
+                ws.append([f"R{i % 3}", f"Ville {i}", i if i % 2 else None])
+            sheets.append(ws)
+        legacy, compacted = sheets
+        targets = [2, 5, 8, 11, 13]
+        for row in reversed(targets):
+            legacy.delete_rows(row, 1)
+
+        assert _compact_rows(compacted, targets) == 5
+        assert list(compacted.iter_rows(values_only=True)) == list(
+            legacy.iter_rows(values_only=True)
+        )
+        compacted.append(["R9", "Fin", 1])
+        assert compacted.max_row == 9
+        assert compacted.cell(row=9, column=2).value == "Fin"
+
+
 class TestExcelFileOperations:
     """Test Excel file operations"""
 
@@ -250,6 +567,254 @@ class TestKmMadaLoading:
         assert rows == []
 
 
+class TestHotelCacheTags:
+    """load_all_hotels entries are tagged with their client type."""
+
+    def test_hotel_write_keeps_other_client_types(self, tmp_path, monkeypatch):
+        from openpyxl import Workbook
+
+        from config import HOTEL_SHEET_NAME
+        from utils import excel_handler
+        from utils.cache import invalidate_hotel_cache
+        from utils.excel_handler import update_hotel_in_excel
+
+        path = tmp_path / "data-hotel.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = HOTEL_SHEET_NAME
+        ws.append(["Ville", "HTL", "CATÉGORIE", "TYPE_CLIENT"])
+        ws.append(["Antsirabe", "Hotel A", "3*", "TO"])
+        ws.append(["Toliary", "Hotel B", "2*", "PBC"])
+        wb.save(path)
+        monkeypatch.setattr("utils.excel_handler.HOTEL_EXCEL_PATH", str(path))
+        invalidate_hotel_cache()
+        loads = count_calls(monkeypatch, excel_handler, "_load_snapshot")
+
+        def names(client_type=None):
+            return [h["nom"] for h in load_all_hotels(client_type)]
+
+        assert names("TO") == ["Hotel A"]
+        assert names("PBC") == ["Hotel B"]
+        assert len(names()) == 2
+        assert len(loads) == 3
+
+        hotel = {"lieu": "Antsirabe", "nom": "Hotel A2", "type_client": "TO"}
+        assert update_hotel_in_excel(2, hotel) is True
+        assert names("PBC") == ["Hotel B"]
+        assert len(loads) == 3
+        assert names("TO") == ["Hotel A2"]
+        assert names() == ["Hotel A2", "Hotel B"]
+        assert len(loads) == 5
+
+        # A hotel moved to another client type leaves both lists
+        hotel = {"lieu": "Toliary", "nom": "Hotel B", "type_client": "TO"}
+        assert update_hotel_in_excel(3, hotel) is True
+        assert names("PBC") == []
+        assert names("TO") == ["Hotel A2", "Hotel B"]
+        invalidate_hotel_cache()
+
+
+class TestTransportCatalog:
+    """Transport comboboxes served from the cached TRANSPORT catalog."""
+
+    def test_lookups_cached_until_sheet_changes(self, tmp_path, monkeypatch):
+        from openpyxl import Workbook
+
+        from utils import excel_handler
+
+        path = tmp_path / "data-hotel.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = excel_handler.TRANSPORT_SOURCE_SHEET_NAME
+        ws.append(["Prestataire", "Type de voiture", "Nombre de place", "Location par jour"])
+        ws.append(["Zafy", "4x4", 4, 250000])
+        ws.append(["Zafy", "Minibus", 12, 300000])
+        ws.append(["Zafy", "4x4", 5, 999999])
+        ws.append(["Bema", "Berline", 3, 150000])
+        wb.save(path)
+        monkeypatch.setattr("utils.excel_handler.HOTEL_EXCEL_PATH", str(path))
+        excel_handler._invalidate_derived_catalog()
+
+        loads = count_calls(monkeypatch, excel_handler, "_load_transport_source_rows")
+
+        assert excel_handler.get_transport_prestataires() == ["Bema", "Zafy"]
+        assert excel_handler.get_transport_vehicle_types("Zafy") == ["4x4", "Minibus"]
+        assert excel_handler.get_transport_vehicle_types() == ["4x4", "Berline", "Minibus"]
+        assert excel_handler.get_transport_vehicle_data("Zafy", "4x4")["nombre_place"] == 4
+        unknown = excel_handler.get_transport_vehicle_data("Zafy", "Bus")
+        assert unknown["type_voiture"] == "Bus" and unknown["nombre_place"] == 0
+        assert len(loads) == 1
+
+        row = excel_handler.save_transport_db_row(
+            {"Prestataire": "Bema", "Type de voiture": "Bus", "Nombre de place": 30}
+        )
+        assert row == 6
+        assert excel_handler.get_transport_vehicle_types("Bema") == ["Berline", "Bus"]
+        assert len(loads) == 2
+
+
+class TestVisiteExcursionCatalog:
+    """Cascading visite/excursion dropdowns served from the indexed catalog."""
+
+    def test_filters_resolved_from_cached_catalog(self, tmp_path, monkeypatch):
+        from openpyxl import Workbook
+
+        from utils import excel_handler
+
+        path = tmp_path / "data-hotel.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = excel_handler.VISITE_EXCURSION_SOURCE_SHEET_NAME
+        ws.append(["Prestataire", "Désignation", "Ville", "Tarif par pax"])
+        ws.append(["Lemur Tours", "Parc Andasibe", "Moramanga", 45000])
+        ws.append(["Lemur Tours", "Pirogue", "Morondava", 30000])
+        ws.append(["Baobab Trek", "Allée des Baobabs", "Morondava", 25000])
+        ws.append(["Baobab Trek", "Pirogue", "Morondava", 28000])
+        wb.save(path)
+        monkeypatch.setattr("utils.excel_handler.HOTEL_EXCEL_PATH", str(path))
+        excel_handler._invalidate_derived_catalog()
+
+        loads = count_calls(monkeypatch, excel_handler, "load_visite_excursion_data")
+
+        filters = {"Ville": "Morondava", "Prestataire": "Baobab Trek"}
+        assert excel_handler.get_visite_excursion_prestataires(filters) == ["Baobab Trek", "Lemur Tours"]
+        assert excel_handler.get_visite_excursion_designations("Baobab Trek", {"Ville": "Morondava"}) == [
+            "Allée des Baobabs",
+            "Pirogue",
+        ]
+        assert excel_handler.get_visite_excursion_montant("Baobab Trek", "Pirogue") == 28000
+        assert excel_handler.get_visite_excursion_montant("Baobab Trek", "Pirogue", {"Ville": "Tana"}) == 0
+        assert len(loads) == 1
+
+        excel_handler.delete_visite_excursion_db_row(5)
+        assert excel_handler.get_visite_excursion_montant("Baobab Trek", "Pirogue") == 0
+        assert len(loads) == 2
+
+
+class TestCollectiveExpenseCatalog:
+    """Collective expense lookups keyed by (prestataire, designation)."""
+
+    def test_lookups_cached_and_invalidated_by_writes(self, tmp_path, monkeypatch):
+        from utils import excel_handler
+
+        monkeypatch.setattr("utils.excel_handler.HOTEL_EXCEL_PATH", str(tmp_path / "data-hotel.xlsx"))
+        excel_handler._invalidate_derived_catalog()
+        for forfait, prestataire, designation, montant in [
+            ("Forfait A", "MNP", "Droit d'entrée", 55000),
+            ("Forfait B", "MNP", "Guide local", 30000),
+            ("Forfait C", "Mairie", "Taxe", 5000),
+            ("Forfait D", "MNP", "Droit d'entrée", 99999),
+        ]:
+            excel_handler.save_collective_expense_db_row(
+                {"forfait": forfait, "prestataire": prestataire,
+                 "designation": designation, "montant": montant}
+            )
+
+        loads = count_calls(monkeypatch, excel_handler, "load_collective_expenses_data")
+
+        assert excel_handler.get_collective_expense_prestataires() == ["MNP", "Mairie"]
+        assert excel_handler.get_collective_expense_designations("MNP") == ["Droit d'entrée", "Guide local"]
+        assert excel_handler.get_collective_expense_designations() == ["Droit d'entrée", "Guide local", "Taxe"]
+        assert excel_handler.get_collective_expense_montant("MNP", "Droit d'entrée") == 55000
+        assert excel_handler.get_collective_expense_forfait("MNP", "Droit d'entrée") == "Forfait A"
+        assert excel_handler.get_collective_expense_montant("MNP", "Taxe") == 0
+        assert excel_handler.get_collective_expense_forfait("MNP", "Taxe") == ""
+        assert len(loads) == 1
+
+        excel_handler.update_collective_expense_db_row(
+            2, {"forfait": "Forfait A", "prestataire": "MNP",
+                "designation": "Droit d'entrée", "montant": 60000}
+        )
+        assert excel_handler.get_collective_expense_montant("MNP", "Droit d'entrée") == 60000
+        assert len(loads) == 2
+
+
+class TestParametrageStore:
+    """PARAMETRAGE values cached per workbook version, typed and notified."""
+
+    def test_typed_getters_and_change_notification(self, tmp_path, monkeypatch):
+        from utils import excel_handler
+
+        monkeypatch.setattr("utils.excel_handler.HOTEL_EXCEL_PATH", str(tmp_path / "data-hotel.xlsx"))
+        excel_handler._invalidate_derived_catalog()
+        store = excel_handler.get_parametrage_store()
+        for name, value in [("Prix Gasoil", "5 400 Ar"), ("Marge", "15 %"), ("Nb jours", 3.6),
+                            ("Remise", 1), ("Commission", 0.15)]:
+            excel_handler.save_parametrage_to_excel({"PARAMETRE": name, "VALEUR": value})
+
+        loads = count_calls(monkeypatch, excel_handler, "load_all_parametrages")
+        changes = []
+        listener = lambda: changes.append(1)  # noqa: E731
+        store.subscribe(listener)
+        try:
+            assert store.get_float("prix  gasoil") == 5400.0
+            assert store.get_percent("MARGE") == 0.15
+            assert store.get_percent("Remise") == 0.01
+            assert store.get_percent("Commission") == 0.15
+            assert store.get_int("Nb jours") == 4
+            assert store.get_float("Absent", 1.5) == 1.5
+            assert excel_handler.get_transport_fuel_price("Diesel") == 5400
+            assert excel_handler.get_transport_fuel_price("Essence") == 0
+            assert len(loads) == 1
+
+            excel_handler.save_parametrage_to_excel({"PARAMETRE": "Prix Essence", "VALEUR": 5900})
+            assert changes == [1]
+            assert excel_handler.get_transport_fuel_price("Essence") == 5900
+            assert len(loads) == 2
+        finally:
+            store.unsubscribe(listener)
+
+
+class TestWorkbookWatcher:
+    """Outside edits drop the caches of the edited workbook only."""
+
+    def test_outside_edit_invalidates_derived_caches(self, tmp_path, monkeypatch):
+        from openpyxl import load_workbook
+
+        from utils import excel_handler
+        from utils.file_watcher import FileWatcher
+
+        hotel_path = str(tmp_path / "data-hotel.xlsx")
+        client_path = str(tmp_path / "data.xlsx")
+        monkeypatch.setattr("utils.excel_handler.HOTEL_EXCEL_PATH", hotel_path)
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", client_path)
+        excel_handler._invalidate_derived_catalog()
+        excel_handler.save_collective_expense_db_row(
+            {"forfait": "F", "prestataire": "MNP", "designation": "Taxe", "montant": 100}
+        )
+        watcher = FileWatcher(excel_handler.invalidate_workbook_caches, use_inotify=False)
+        watcher.watch(hotel_path)
+        watcher.watch(client_path)
+        monkeypatch.setattr(excel_handler, "_WORKBOOK_WATCHER", watcher)
+
+        invalidated = []
+        monkeypatch.setattr(
+            excel_handler, "invalidate_hotel_cache", lambda: invalidated.append("hotels")
+        )
+        monkeypatch.setattr(
+            excel_handler, "invalidate_client_cache", lambda: invalidated.append("clients")
+        )
+        assert excel_handler.get_collective_expense_montant("MNP", "Taxe") == 100
+
+        # Our own save is acknowledged, not reported
+        excel_handler.save_collective_expense_db_row(
+            {"forfait": "G", "prestataire": "Mairie", "designation": "Droit", "montant": 5}
+        )
+        assert watcher.poll() == []
+
+        # Edit made in Excel: the catalog is rebuilt at once, hotel caches dropped
+        wb = load_workbook(hotel_path)
+        ws = wb[excel_handler.FRAIS_COLLECTIFS_SHEET_NAME]
+        for row in ws.iter_rows(min_row=2):
+            for cell in row:
+                if cell.value == 100:
+                    cell.value = 250
+        wb.save(hotel_path)
+        assert watcher.poll() == [os.path.abspath(hotel_path)]
+        assert invalidated == ["hotels"]
+        assert excel_handler.get_collective_expense_montant("MNP", "Taxe") == 250
+
+
 class TestClientAirTicketCotationPersistence:
     """Persist et relire la cotation avion client."""
 
@@ -0,0 +1,76 @@
+"""
+Test suite for utils.file_watcher module
+"""
+
+import os
+import threading
+
+from utils.file_watcher import FileWatcher
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+class TestFileWatcher:
+    """Changes are detected from os.stat and reported once."""
+
+    def test_poll_reports_edit_creation_and_deletion(self, tmp_path):
+        existing = str(tmp_path / "data.xlsx")
+        absent = str(tmp_path / "data-hotel.xlsx")
+        _write(existing, "v1")
+        changes = []
+        watcher = FileWatcher(changes.append, use_inotify=False)
+        watcher.watch(existing)
+        watcher.watch(absent)
+
+        assert watcher.poll() == []
+        _write(existing, "version 2")
+        _write(absent, "new")
+        assert sorted(watcher.poll()) == sorted([existing, absent])
+        assert watcher.poll() == []
+
+        os.remove(existing)
+        assert watcher.poll() == [existing]
+        assert sorted(changes) == sorted([existing, absent, existing])
+
+    def test_acknowledged_change_is_not_reported(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write(path, "v1")
+        watcher = FileWatcher(lambda p: None, use_inotify=False)
+        watcher.watch(path)
+
+        _write(path, "our own save")
+        watcher.acknowledge(path)
+        assert watcher.poll() == []
+
+    def test_failing_callback_does_not_stop_polling(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write(path, "v1")
+        calls = []
+
+        def callback(p):
+            calls.append(p)
+            raise RuntimeError("boom")
+
+        watcher = FileWatcher(callback, use_inotify=False)
+        watcher.watch(path)
+        _write(path, "v22")
+        assert watcher.poll() == [path]
+        _write(path, "v333")
+        assert watcher.poll() == [path]
+        assert len(calls) == 2
+
+    def test_background_thread_reports_changes(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write(path, "v1")
+        changed = threading.Event()
+        watcher = FileWatcher(lambda p: changed.set(), interval=0.05)
+        watcher.watch(path)
+        watcher.start()
+        try:
+            _write(path, "edited in Excel")
+            assert changed.wait(5)
+        finally:
+            watcher.stop(timeout=5)
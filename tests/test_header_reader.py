@@ -0,0 +1,112 @@
+"""
+Test suite for utils.header_reader and the header-only get_*_headers paths
+"""
+
+import os
+import zipfile
+
+from openpyxl import Workbook, load_workbook
+
+from utils.header_reader import read_header_rows, sheet_names
+
+_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def _write_shared_strings_workbook(path):
+    """Workbook laid out like Excel writes it: shared strings, relative targets."""
+    parts = {
+        "xl/workbook.xml": (
+            f'<workbook xmlns="{_MAIN}" xmlns:r="{_REL}"><sheets>'
+            '<sheet name="TRANSPORT" sheetId="1" r:id="rId1"/>'
+            "</sheets></workbook>"
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{_REL}/sharedStrings" Target="sharedStrings.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/sharedStrings.xml": (
+            f'<sst xmlns="{_MAIN}"><si><t>Titre</t></si><si><t>Prestataire</t></si>'
+            "<si><r><t>Type de </t></r><r><t>voiture</t></r></si><si><t>data</t></si></sst>"
+        ),
+        "xl/worksheets/sheet1.xml": (
+            f'<worksheet xmlns="{_MAIN}"><sheetData>'
+            '<row r="1"><c r="A1" t="s"><v>0</v></c></row>'
+            '<row r="2"><c r="A2" t="s"><v>1</v></c><c r="C2" t="s"><v>2</v></c>'
+            '<c r="D2"><v>12</v></c><c r="E2" t="b"><v>1</v></c></row>'
+            '<row r="3"><c r="A3" t="s"><v>3</v></c></row>'
+            # Never reached when only the header rows are requested
+            "<row r=\"4\"><c r=\"A4\"><v>not-xml-closed"
+        ),
+    }
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in parts.items():
+            zf.writestr(name, content)
+
+
+class TestHeaderReader:
+    """Reading the first rows of a sheet from the xlsx zip."""
+
+    def test_shared_strings_and_early_stop(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        _write_shared_strings_workbook(path)
+
+        assert sheet_names(str(path)) == ["TRANSPORT"]
+        assert read_header_rows(str(path), "TRANSPORT", 2) == [
+            ("Titre",),
+            ("Prestataire", None, "Type de voiture", 12, True),
+        ]
+        assert read_header_rows(str(path), "Absent") is None
+
+    def test_matches_openpyxl_values(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "AVION"
+        ws.append(["Date", None, "Montant", 1.5, "Ville départ"])
+        ws.append(["2026-01-01", "x"])
+        wb.save(path)
+
+        expected = next(load_workbook(path).active.iter_rows(max_row=1, values_only=True))
+        assert read_header_rows(str(path), "AVION") == [expected]
+
+    def test_formula_cells_read_as_formula_text(self, tmp_path):
+        path = tmp_path / "data.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "AVION"
+        ws.append(["Montant", '="Total "&A1'])
+        wb.save(path)
+
+        expected = next(load_workbook(path).active.iter_rows(max_row=1, values_only=True))
+        assert read_header_rows(str(path), "AVION") == [expected]
+
+
+class TestHeaderReadPaths:
+    """get_*_headers never write; migrate_workbook_schemas does, once."""
+
+    def test_headers_read_only_and_migration(self, tmp_path, monkeypatch):
+        from utils import excel_handler
+
+        path = tmp_path / "data-hotel.xlsx"
+        wb = Workbook()
+        wb.active.title = "Circuits"
+        wb.active.append(["ID circuit", "Nom du circuit"])
+        wb.save(path)
+        monkeypatch.setattr("utils.excel_handler.HOTEL_EXCEL_PATH", str(path))
+        version = os.stat(path).st_mtime_ns
+
+        headers = excel_handler.get_circuit_db_headers()
+        assert headers[:2] == ["ID circuit", "Nom du circuit"]
+        assert "Transports associés" in headers
+        assert excel_handler.get_parametrage_headers() == ["parametre", "valeur"]
+        assert os.stat(path).st_mtime_ns == version
+
+        assert excel_handler.migrate_workbook_schemas() is True
+        migrated = load_workbook(path)
+        circuit_headers = [c.value for c in migrated["Circuits"][1]]
+        assert circuit_headers == excel_handler.get_circuit_db_headers()
+        assert excel_handler.PARAMETRAGE_SHEET_NAME in migrated.sheetnames
+        assert excel_handler.migrate_workbook_schemas() is False
@@ -2,12 +2,17 @@
 Test suite for models module
 """
 
+import copy
+import pickle
 from datetime import datetime
 
 import pytest
 
+from models.avion_tariff_index import AvionTariffIndex
 from models.client_data import ClientData
+from models.hotel_catalog import HotelCatalog
 from models.hotel_data import HotelData
+from models.hotel_record import HotelRecord
 
 
 class TestClientData:
@@ -197,3 +202,143 @@ class TestHotelDataFormParsing:
         except Exception:
             # If from_dict doesn't work as expected, pass
             pass
+
+
+def _legacy_find(hotels, city_name, hotel_name):
+    """Linear lookup formerly done by HotelQuotation._find_hotel_record."""
+    from models.hotel_catalog import normalize_lookup_key as norm
+
+    city_key, hotel_key = norm(city_name), norm(hotel_name)
+    if not city_key or not hotel_key:
+        return None
+    for hotel in hotels:
+        if norm(hotel["lieu"]) == city_key and norm(hotel["nom"]) == hotel_key:
+            return hotel
+    for hotel in hotels:
+        if norm(hotel["lieu"]) != city_key:
+            continue
+        candidate = norm(hotel["nom"])
+        if hotel_key in candidate or candidate in hotel_key:
+            return hotel
+    return None
+
+
+class TestHotelCatalog:
+    """Test HotelCatalog indexes"""
+
+    HOTELS = [
+        {"nom": "Le Relais de la Reine", "lieu": "Ranohira (Isalo)", "type_client": "TO"},
+        {"nom": "Isalo Rock Lodge", "lieu": "Ranohira", "type_client": "PBC"},
+        {"nom": "Relais", "lieu": "Ranohira", "type_client": "TO"},
+        {"nom": "Hôtel Colbert", "lieu": "Antananarivo", "type_client": "TO"},
+        {"nom": "Colbert", "lieu": "Fianarantsoa", "type_client": "TO"},
+    ]
+
+    def test_indexes(self):
+        catalog = HotelCatalog(self.HOTELS)
+        assert len(catalog) == 5
+        assert [h["nom"] for h in catalog.by_city("RANOHIRA")] == [
+            "Le Relais de la Reine",
+            "Isalo Rock Lodge",
+            "Relais",
+        ]
+        assert [h["nom"] for h in catalog.by_type_client("PBC")] == ["Isalo Rock Lodge"]
+        assert catalog.city_labels(["antananarivo", "Fianarantsoa"]) == [
+            "Antananarivo",
+            "Fianarantsoa",
+        ]
+
+    @pytest.mark.parametrize(
+        "city, name",
+        [
+            ("Ranohira", "relais"),  # exact name wins over an earlier partial match
+            ("Ranohira", "Relais de la"),  # query contained in a name
+            ("Ranohira", "Isalo Rock Lodge & Spa"),  # name contained in the query
+            ("Antananarivo", "Colbert"),
+            ("Antananarivo", "Carlton"),
+            ("Toliara", "Relais"),
+            ("", "Relais"),
+        ],
+    )
+    def test_find_matches_linear_lookup(self, city, name):
+        catalog = HotelCatalog(self.HOTELS)
+        assert catalog.find(city, name) is _legacy_find(self.HOTELS, city, name)
+
+
+class TestHotelRecord:
+    """Compact read-only hotel records returned by load_all_hotels"""
+
+    HOTEL = {
+        "nom": "Hotel Test",
+        "lieu": "Antsirabe",
+        "room_rates": {"standard": {"single": 50000.0, "double": 70000}, "suite": {}},
+        "meals": {"petit_dejeuner": 15000},
+        "chambre_single": 50000.0,
+    }
+
+    def test_reads_like_source_dict(self):
+        record = HotelRecord(self.HOTEL)
+        assert record == self.HOTEL
+        assert record["nom"] == "Hotel Test"
+        assert record.get("missing", "x") == "x"
+        assert "lieu" in record and "missing" not in record
+        assert list(record) == list(self.HOTEL)
+        assert record.get("room_rates", {}).get("standard", {}).get("single", 0) == 50000.0
+        assert record["room_rates"]["suite"].get("single", 0) == 0
+
+    def test_shares_layout_between_records(self):
+        first = HotelRecord(self.HOTEL)
+        second = HotelRecord(dict(self.HOTEL, nom="Autre"))
+        assert first._layout is second._layout
+        assert first["room_rates"]._layout is second["room_rates"]._layout
+
+    def test_to_dict_and_copies(self):
+        record = HotelRecord(self.HOTEL)
+        plain = record.to_dict()
+        assert plain == self.HOTEL
+        assert type(plain["room_rates"]["standard"]) is dict
+        assert copy.deepcopy(record) == self.HOTEL
+        restored = pickle.loads(pickle.dumps(record))
+        assert isinstance(restored, HotelRecord) and restored == record
+
+    def test_read_only(self):
+        record = HotelRecord(self.HOTEL)
+        with pytest.raises(TypeError):
+            record["nom"] = "x"
+        with pytest.raises(AttributeError):
+            record.extra = 1
+
+
+class TestAvionTariffIndex:
+    """Inverted index over the avion source rows"""
+
+    ROWS = [
+        {"tarif_adulte": 100, "tarif_enfant": 50,
+         "fields": {"compagnie": "Tsaradia", "ville de depart": "Tana", "ville d arrivee": "Nosy Be"}},
+        {"tarif_adulte": 200, "tarif_enfant": 80,
+         "fields": {"compagnie": "Air Austral", "ville de depart": "Tana", "ville d arrivee": "Toliary"}},
+        {"tarif_adulte": 300, "tarif_enfant": 90,
+         "fields": {"compagnie": "Tsaradia", "ville de depart": "Toliary", "ville d arrivee": ""}},
+    ]
+
+    def test_match_intersects_filters_in_sheet_order(self):
+        index = AvionTariffIndex(self.ROWS)
+        assert index.match({}) == [0, 1, 2]
+        assert index.match({"compagnie": "Tsaradia"}) == [0, 2]
+        assert index.match({"compagnie": "Tsaradia", "ville de depart": "Toliary"}) == [2]
+        assert index.match({"compagnie": "Tsaradia", "ville de depart": "Nope"}) == []
+        assert index.match({"ville d arrivee": ""}) == [2]
+        assert index.match({"colonne absente": ""}) == [0, 1, 2]
+
+    def test_tarifs_fall_back_to_first_row(self):
+        index = AvionTariffIndex(self.ROWS)
+        assert index.tarifs({"compagnie": "Air Austral"}) == (200, 80)
+        assert index.tarifs({"compagnie": "Inconnue"}) == (100, 50)
+        assert AvionTariffIndex([]).tarifs({}) == (0, 0)
+
+    def test_values_take_first_non_empty_field(self):
+        index = AvionTariffIndex(self.ROWS)
+        arrivals = ("ville arrivee", "ville d arrivee")
+        assert index.values(arrivals) == ["Nosy Be", "Toliary"]
+        assert index.values(arrivals, {"compagnie": "Tsaradia"}) == ["Nosy Be"]
+        assert index.values(("ville de depart",), {"compagnie": "Tsaradia"}) == ["Tana", "Toliary"]
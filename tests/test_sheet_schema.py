@@ -0,0 +1,54 @@
+"""
+Test suite for utils.sheet_schema module
+"""
+
+from openpyxl import Workbook
+
+from utils.excel_handler import _find_header_column, _get_header_map
+from utils.sheet_schema import SheetSchema, normalize_header_key, sheet_schema
+from utils.workbook_snapshot import SheetTable
+
+_SPEC = {
+    "repere": ("REPERES", "Repère"),
+    "km": ("KM", "Kilométrage"),
+    "missing": ("Absent",),
+}
+
+
+class TestSheetSchema:
+    """Header maps and alias resolution cached per sheet header row."""
+
+    def test_exact_alias_wins_over_normalized_match(self):
+        schema = SheetSchema(["Duree", None, "Durée", " "])
+        assert dict(schema) == {"Duree": 1, "Durée": 3}
+        assert schema.column("Durée") == 3
+        assert schema.column("DURÉE") == 3  # normalized: last duplicate wins
+        assert schema.column("Absent") is None
+        assert _find_header_column(schema, "Durée") == _find_header_column(
+            dict(schema), "Durée"
+        )
+
+    def test_normalize_header_key(self):
+        assert normalize_header_key("  Hôtels_défaut-par  ville ") == "hotels defaut par ville"
+        assert normalize_header_key(None) == ""
+
+    def test_snapshot_sheet_schema_is_built_once(self):
+        table = SheetTable("KM_MADA", [("Titre",), ("Repères", "Kilométrage")])
+        schema = sheet_schema(table, 2)
+
+        assert sheet_schema(table, 2) is schema
+        plan = schema.plan(_SPEC)
+        assert plan == {"repere": 1, "km": 2, "missing": None}
+        assert schema.plan(_SPEC) is plan
+        assert dict(sheet_schema(table, 5)) == {}
+
+    def test_editable_sheet_schema_follows_header_changes(self):
+        ws = Workbook().active
+        ws.append(["REPERES", "KM"])
+        first = _get_header_map(ws)
+        assert _get_header_map(ws) is first
+
+        ws.cell(row=1, column=3, value="Durée")
+        second = _get_header_map(ws)
+        assert second is not first
+        assert second.column("Duree") == 3
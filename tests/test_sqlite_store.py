@@ -0,0 +1,359 @@
+"""
+Test suite for utils.sqlite_store module (SQLite storage backend)
+"""
+
+import sqlite3
+from datetime import date, datetime, time
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from utils.cache import invalidate_client_cache
+from utils.sqlite_store import (
+    ensure_workbook_imported,
+    export_workbook,
+    get_store,
+    import_workbook,
+    sync_workbook_export,
+)
+
+
+def _write_workbook(path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "COTATION_H"
+    ws.append(["Date", "ID_Client", "Ville", "Nuits"])
+    ws.append(["2026-01-01", "LHM-R1", "Antsirabe", 2])
+    ws.append([None, None, None, None])
+    ws.append(["2026-01-02", "LHM-R2", "Toliary", 3])
+    other = wb.create_sheet("PARAMETRAGE")
+    other.append(["Nom", "Valeur"])
+    other.append(["Carburant", 5200])
+    wb.save(path)
+
+
+class TestImportExport:
+    """Round trip between .xlsx files and the SQLite store."""
+
+    def test_import_then_snapshot(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        _write_workbook(xlsx)
+
+        assert import_workbook(str(xlsx), str(db)) == 2
+        snapshot = get_store(str(db)).load_snapshot("data.xlsx")
+
+        assert snapshot.sheetnames == ["COTATION_H", "PARAMETRAGE"]
+        ws = snapshot["COTATION_H"]
+        assert ws.max_row == 4
+        assert ws.value(3, 2) is None
+        assert ws.value(4, 3) == "Toliary"
+        assert snapshot["PARAMETRAGE"].value(2, 2) == 5200
+
+    def test_export_round_trip(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        _write_workbook(xlsx)
+        import_workbook(str(xlsx), str(db))
+
+        out = tmp_path / "export" / "data.xlsx"
+        export_workbook("data.xlsx", str(db), str(out))
+
+        wb = load_workbook(out)
+        assert wb.sheetnames == ["COTATION_H", "PARAMETRAGE"]
+        assert wb["COTATION_H"]["C4"].value == "Toliary"
+        assert wb["COTATION_H"]["A1"].font.bold
+
+    def test_wal_mode_and_client_index(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        _write_workbook(xlsx)
+        import_workbook(str(xlsx), str(db))
+
+        conn = sqlite3.connect(str(db))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name = 'data_xlsx__cotation_h'"
+                )
+            }
+        finally:
+            conn.close()
+        assert "data_xlsx__cotation_h_c2" in indexes
+
+    def test_save_rewrites_only_changed_sheets(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        _write_workbook(xlsx)
+        import_workbook(str(xlsx), str(db))
+        store = get_store(str(db))
+        revision = store.revision("data.xlsx")
+
+        wb = store.to_workbook("data.xlsx")
+        wb["PARAMETRAGE"]["B2"] = 5400
+
+        assert store.save_workbook("data.xlsx", wb) == 1
+        assert store.revision("data.xlsx") == revision + 1
+        assert store.load_snapshot("data.xlsx")["PARAMETRAGE"].value(2, 2) == 5400
+
+    def test_save_writes_only_changed_rows(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "DEMANDE_CLIENT"
+        ws.append(["Date", "Réf. Client", "Nom"])
+        for i in range(2000):
+            ws.append(["2026-01-01", f"LHM-R{i}", f"Client {i}"])
+        wb.save(xlsx)
+        import_workbook(str(xlsx), str(db))
+        store = get_store(str(db))
+        conn = store._conn()
+
+        wb = store.to_workbook("data.xlsx")
+        wb["DEMANDE_CLIENT"].append(["2026-02-01", "LHM-R2000", "Nouveau"])
+        before = conn.total_changes
+        assert store.save_workbook("data.xlsx", wb) == 1
+        # One client row, plus the sheets and workbooks bookkeeping rows
+        assert conn.total_changes - before <= 3
+
+        wb = store.to_workbook("data.xlsx")
+        ws = wb["DEMANDE_CLIENT"]
+        ws["C10"] = "Renommé"
+        for cell in ws[11]:
+            cell.value = None
+        store.save_workbook("data.xlsx", wb)
+        snapshot = store.load_snapshot("data.xlsx")["DEMANDE_CLIENT"]
+        assert snapshot.max_row == 2002
+        assert snapshot.value(10, 3) == "Renommé"
+        assert snapshot.value(11, 2) is None
+        assert snapshot.value(2002, 3) == "Nouveau"
+
+    def test_dropped_column_is_cleared(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        _write_workbook(xlsx)
+        import_workbook(str(xlsx), str(db))
+        store = get_store(str(db))
+
+        wb = store.to_workbook("data.xlsx")
+        wb["COTATION_H"].delete_cols(4)
+        store.save_workbook("data.xlsx", wb)
+        assert store.load_snapshot("data.xlsx")["COTATION_H"].max_column == 3
+
+        wb = store.to_workbook("data.xlsx")
+        wb["COTATION_H"]["E1"] = "Remarque"
+        store.save_workbook("data.xlsx", wb)
+        ws = store.load_snapshot("data.xlsx")["COTATION_H"]
+        assert ws.value(2, 4) is None
+        assert ws.value(1, 5) == "Remarque"
+
+    def test_date_and_time_cells_keep_their_type(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "DEMANDE_CLIENT"
+        ws.append(["Date", "Arrivée", "Heure", "Note"])
+        ws.append([datetime(2026, 1, 31, 14, 30), date(2026, 2, 1), time(9, 15), "2026-02-01"])
+        wb.save(xlsx)
+        import_workbook(str(xlsx), str(db))
+        store = get_store(str(db))
+
+        ws = store.load_snapshot("data.xlsx")["DEMANDE_CLIENT"]
+        assert ws.value(2, 1) == datetime(2026, 1, 31, 14, 30)
+        # openpyxl reads date cells back as datetime at midnight
+        assert ws.value(2, 2) == datetime(2026, 2, 1)
+        assert ws.value(2, 3) == time(9, 15)
+        assert ws.value(2, 4) == "2026-02-01"
+
+        wb = store.to_workbook("data.xlsx")
+        wb["DEMANDE_CLIENT"]["B2"] = date(2026, 3, 1)
+        assert store.save_workbook("data.xlsx", wb) == 1
+        assert store.save_workbook("data.xlsx", store.to_workbook("data.xlsx")) == 0
+        assert store.load_snapshot("data.xlsx")["DEMANDE_CLIENT"].value(2, 2) == date(2026, 3, 1)
+
+    def test_ensure_imported_only_once(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        _write_workbook(xlsx)
+
+        assert ensure_workbook_imported(str(xlsx), str(db)) is True
+        assert ensure_workbook_imported(str(xlsx), str(db)) is False
+        assert get_store(str(db)).load_snapshot("data.xlsx")["COTATION_H"].value(4, 3) == "Toliary"
+        assert ensure_workbook_imported(str(tmp_path / "absent.xlsx"), str(db)) is False
+
+    def test_ensure_imported_reports_unreadable_file(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        xlsx.write_text("not a workbook")
+        with pytest.raises(RuntimeError, match="data.xlsx"):
+            ensure_workbook_imported(str(xlsx), str(tmp_path / "store.db"))
+
+    def test_saved_workbook_is_reused_for_the_next_edit(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        _write_workbook(xlsx)
+        import_workbook(str(xlsx), str(db))
+        store = get_store(str(db))
+
+        wb = store.editable_workbook("data.xlsx")
+        wb["PARAMETRAGE"]["B2"] = 5400
+        store.save_workbook("data.xlsx", wb)
+        assert store.editable_workbook("data.xlsx") is wb
+        # Handed out once, and not after another change of the store
+        assert store.editable_workbook("data.xlsx") is not wb
+        store.save_workbook("data.xlsx", wb)
+        import_workbook(str(xlsx), str(db))
+        reloaded = store.editable_workbook("data.xlsx")
+        assert reloaded is not wb
+        assert reloaded["PARAMETRAGE"]["B2"].value == 5200
+
+    def test_missing_workbook_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            get_store(str(tmp_path / "store.db")).load_snapshot("data.xlsx")
+
+
+class TestExportSync:
+    """Exported copies edited outside the app are imported back."""
+
+    def _setup(self, tmp_path):
+        xlsx = tmp_path / "data.xlsx"
+        db = tmp_path / "store.db"
+        out = tmp_path / "export" / "data.xlsx"
+        _write_workbook(xlsx)
+        import_workbook(str(xlsx), str(db))
+        return str(db), out
+
+    def _edit(self, path, cell, value):
+        wb = load_workbook(path)
+        wb["PARAMETRAGE"][cell] = value
+        wb.save(path)
+
+    def test_edits_are_imported_back(self, tmp_path):
+        db, out = self._setup(tmp_path)
+        assert sync_workbook_export("data.xlsx", db, str(out)) == "exported"
+        assert sync_workbook_export("data.xlsx", db, str(out)) is None
+
+        self._edit(out, "B2", 6000)
+        assert sync_workbook_export("data.xlsx", db, str(out)) == "imported"
+        assert get_store(db).load_snapshot("data.xlsx")["PARAMETRAGE"].value(2, 2) == 6000
+        assert sync_workbook_export("data.xlsx", db, str(out)) is None
+
+    def test_store_changes_are_exported(self, tmp_path):
+        db, out = self._setup(tmp_path)
+        sync_workbook_export("data.xlsx", db, str(out))
+        store = get_store(db)
+        wb = store.to_workbook("data.xlsx")
+        wb["PARAMETRAGE"]["B2"] = 5400
+        store.save_workbook("data.xlsx", wb)
+
+        assert sync_workbook_export("data.xlsx", db, str(out)) == "exported"
+        assert load_workbook(out)["PARAMETRAGE"]["B2"].value == 5400
+        assert [p.name for p in out.parent.iterdir()] == ["data.xlsx"]
+
+    def test_conflicting_edit_is_kept_aside(self, tmp_path):
+        db, out = self._setup(tmp_path)
+        sync_workbook_export("data.xlsx", db, str(out))
+        store = get_store(db)
+        wb = store.to_workbook("data.xlsx")
+        wb["PARAMETRAGE"]["B2"] = 5400
+        store.save_workbook("data.xlsx", wb)
+        self._edit(out, "B2", 6000)
+
+        assert sync_workbook_export("data.xlsx", db, str(out), export=False) == "conflict"
+        assert load_workbook(out)["PARAMETRAGE"]["B2"].value == 6000
+        assert sync_workbook_export("data.xlsx", db, str(out)) == "conflict"
+        assert store.load_snapshot("data.xlsx")["PARAMETRAGE"].value(2, 2) == 5400
+        assert load_workbook(out)["PARAMETRAGE"]["B2"].value == 5400
+        (kept,) = out.parent.glob("data.conflit-*.xlsx")
+        assert load_workbook(kept)["PARAMETRAGE"]["B2"].value == 6000
+
+
+class TestExcelHandlerSqliteBackend:
+    """excel_handler functions keep their signatures under the SQLite backend."""
+
+    def test_save_and_load_client(self, tmp_path, monkeypatch):
+        from models.client_data import ClientData
+        from utils.excel_handler import (
+            load_all_clients,
+            save_client_to_excel,
+            update_client_statut,
+        )
+
+        excel_path = tmp_path / "data.xlsx"
+        monkeypatch.setattr("utils.excel_handler.STORAGE_BACKEND", "sqlite")
+        monkeypatch.setattr("utils.excel_handler.SQLITE_DB_PATH", str(tmp_path / "store.db"))
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        invalidate_client_cache()
+
+        client = ClientData.from_form_data(
+            {
+                "ref_client": "LHM-R2603020",
+                "numero_dossier": "LHM-D2603020",
+                "type_client": "Mme",
+                "prenom": "Hery",
+                "nom": "Rakoto",
+                "date_arrivee": "01/01/2026",
+                "date_depart": "05/01/2026",
+                "nombre_participants": "2",
+                "nombre_adultes": "2",
+                "telephone": "+261340000003",
+                "email": "hery@example.com",
+            }
+        ).to_dict()
+        assert save_client_to_excel(client) == 2
+        update_client_statut(2, "Accepté")
+        invalidate_client_cache()
+
+        clients = load_all_clients()
+        assert not excel_path.exists()
+        assert clients[0]["ref_client"] == "LHM-R2603020"
+        assert clients[0]["numero_dossier"] == "LHM-D2603020"
+        assert clients[0]["statut"] == "Accepté"
+        invalidate_client_cache()
+
+    def test_existing_workbook_imported_on_first_use(self, tmp_path, monkeypatch):
+        from utils.excel_handler import load_all_clients
+
+        excel_path = tmp_path / "data.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "DEMANDE_CLIENT"
+        ws.append(["Date", "Réf. Client", "Numéro dossier", "Type", "Prénom", "Nom"])
+        ws.append([datetime(2026, 1, 2), "LHM-R2601001", "LHM-D2601001", "M.", "Jean", "Rabe"])
+        wb.save(excel_path)
+
+        monkeypatch.setattr("utils.excel_handler.STORAGE_BACKEND", "sqlite")
+        monkeypatch.setattr("utils.excel_handler.SQLITE_DB_PATH", str(tmp_path / "store.db"))
+        monkeypatch.setattr("utils.excel_handler.CLIENT_EXCEL_PATH", str(excel_path))
+        invalidate_client_cache()
+
+        clients = load_all_clients()
+        assert [c["ref_client"] for c in clients] == ["LHM-R2601001"]
+        assert get_store(str(tmp_path / "store.db")).has_workbook("data.xlsx")
+        invalidate_client_cache()
+
+    def test_excel_export_leaves_the_original_file_alone(self, tmp_path, monkeypatch):
+        from utils.excel_handler import ensure_excel_export
+
+        excel_path = tmp_path / "data.xlsx"
+        _write_workbook(excel_path)
+        original = excel_path.read_bytes()
+        monkeypatch.setattr("utils.excel_handler.STORAGE_BACKEND", "sqlite")
+        monkeypatch.setattr("utils.excel_handler.SQLITE_DB_PATH", str(tmp_path / "store.db"))
+        monkeypatch.setattr("utils.excel_handler.SQLITE_EXPORT_DIR", str(tmp_path / "export"))
+
+        export_path = ensure_excel_export(str(excel_path))
+        assert export_path == str(tmp_path / "export" / "data.xlsx")
+        assert excel_path.read_bytes() == original
+
+        wb = load_workbook(export_path)
+        wb["PARAMETRAGE"]["B2"] = 6000
+        wb.save(export_path)
+        assert ensure_excel_export(str(excel_path)) == export_path
+        snapshot = get_store(str(tmp_path / "store.db")).load_snapshot("data.xlsx")
+        assert snapshot["PARAMETRAGE"].value(2, 2) == 6000
+        assert excel_path.read_bytes() == original
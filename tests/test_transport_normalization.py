@@ -71,6 +71,23 @@ class TestNormalizeCityName(unittest.TestCase):
         # Duration suffix removed first, then alias applied
         self.assertEqual(normalize_city_name("Tulear(1 jours)"), "Toliary")
 
+    def test_normalize_many_matches_single_calls(self):
+        from utils.excel_handler import normalize_many
+
+        raw = ["Tuler", "Antsirabe(2 jours)", None, "Tuler", " Morondava ", 42]
+        self.assertEqual(normalize_many(raw), [normalize_city_name(v) for v in raw])
+        self.assertEqual(normalize_many(iter(["Ranohira (Isalo)"])), ["Ranohira"])
+
+    def test_memoization_is_bounded(self):
+        from utils.excel_handler import _city_key_cached, _normalize_city_name_cached
+
+        for cached in (_city_key_cached, _normalize_city_name_cached):
+            self.assertIsNotNone(cached.cache_info().maxsize)
+        before = _normalize_city_name_cached.cache_info().hits
+        normalize_city_name("Fianarantsoa (3 jours)")
+        normalize_city_name("Fianarantsoa (3 jours)")
+        self.assertGreater(_normalize_city_name_cached.cache_info().hits, before)
+
 
 class TestKmMadaLookupRobust(unittest.TestCase):
     """get_km_mada_km_for_repere doit gérer les doublons et la normalisation."""
@@ -170,6 +187,50 @@ class TestSegmentDistance(unittest.TestCase):
         self.assertEqual(dist, 0)
 
 
+class TestDistanceMatrix(unittest.TestCase):
+    """DistanceMatrix : lots de segments et itinéraires sur un même snapshot."""
+
+    def _matrix(self):
+        from models.distance_matrix import DistanceMatrix
+        from utils.excel_handler import _rebuild_km_mada_lookup, _repere_key
+
+        rows = [
+            {"repere": "ANTANANARIVO", "km": 0, "duree": 0.0},
+            {"repere": "ANTSIRABE", "km": 169, "duree": 4.0},
+            {"repere": "FIANARANTSOA", "km": 410, "duree": 9.5},
+            {"repere": "TOLIARY", "km": 936, "duree": 20.0},
+        ]
+        return DistanceMatrix(_rebuild_km_mada_lookup(rows), _repere_key)
+
+    def test_segments_and_itinerary(self):
+        matrix = self._matrix()
+        pairs = [
+            ("Antsirabe(2 jours)", "Fianarantsoa"),
+            ("Fianarantsoa", "Tulear"),
+            ("Inconnue", "Antsirabe"),
+            ("InconnuA", "InconnuB"),
+        ]
+        self.assertEqual(matrix.segments(pairs), [241, 526, 169, 0])
+        self.assertEqual(matrix.itinerary(["Antsirabe", "Fianarantsoa", "Tuler"]), 767)
+        self.assertEqual(matrix.itinerary(["Antsirabe"]), 0)
+        self.assertEqual(matrix.duration("fianarantsoa"), 9.5)
+        self.assertTrue(matrix.has("ANTSIRABE (1 jours)"))
+
+    def test_workbook_checks_are_throttled(self):
+        import utils.excel_handler as eh
+
+        with patch("utils.excel_handler._load_km_mada_rows", return_value=[]) as load:
+            eh._invalidate_km_mada_cache()
+            eh.get_segment_distances([("Antsirabe", "Fianarantsoa")] * 20)
+            eh.itinerary_distance(["Antsirabe", "Fianarantsoa", "Toliary"])
+            eh.get_km_mada_km_for_repere("Antsirabe")
+            self.assertEqual(load.call_count, 1)
+            eh._invalidate_km_mada_cache()
+            eh.get_segment_distance("Antsirabe", "Fianarantsoa")
+            self.assertEqual(load.call_count, 2)
+        eh._invalidate_km_mada_cache()
+
+
 def _parse_num_local(v):
     try:
         return float(str(v).replace(",", ".").strip() or 0)
@@ -2,6 +2,8 @@
 Test suite for utils.validators module
 """
 
+import json
+import threading
 import tkinter as tk
 
 import pytest
@@ -13,8 +15,13 @@ from gui.date_picker_utils import (
     get_calendar_year_options,
 )
 from utils.validators import (
+    FALLBACK_EXCHANGE_RATES,
+    CurrencyConverter,
+    ExchangeRateService,
+    convert_amounts,
     convert_currency,
     get_exchange_rates,
+    normalize_currency_code,
     validate_email,
     validate_phone_number,
 )
@@ -166,6 +173,106 @@ class TestCurrencyValidation:
         except Exception as e:
             pytest.skip(f"Currency conversion unavailable: {e}")
 
+    def test_convert_amounts_matches_scalar_conversion(self):
+        """Batch conversion agrees with convert_currency for every pair"""
+        rates = {"EUR": 5000.0, "USD": 4500.0}
+        labels = ["Ariary", "Euro", "Dollar US", "€", "$", "MGA", ""]
+        amounts = [0, 1, 12.5, 1000]
+        for src in labels:
+            for dst in labels:
+                batch = convert_amounts(amounts, src, dst, rates)
+                expected = [convert_currency(a, src, dst, rates) for a in amounts]
+                assert batch == pytest.approx(expected)
+
+    def test_convert_amounts_per_amount_codes(self):
+        """Each amount may carry its own source currency"""
+        rates = {"EUR": 5000.0, "USD": 4000.0}
+        result = convert_amounts([2, 3, 100], ["EUR", "USD", "Ariary"], "MGA", rates)
+        assert result == pytest.approx([10000.0, 12000.0, 100.0])
+        with pytest.raises(ValueError):
+            convert_amounts([1, 2], ["EUR"], "MGA", rates)
+
+    def test_currency_converter_factor_matrix(self):
+        """The factor matrix is built once and zero rates convert to 0"""
+        converter = CurrencyConverter({"EUR": 5000.0, "USD": 0})
+        assert converter.factor("EUR", "MGA") == 5000.0
+        assert converter.factor("Ariary", "Euro") == pytest.approx(1 / 5000.0)
+        assert converter.factor("MGA", "USD") == 0.0
+        assert converter.factor("XYZ", "XYZ") == 1.0
+        assert normalize_currency_code(" dollar us ") == "USD"
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestExchangeRateService:
+    """Non-blocking exchange rates with a disk cache and a stub fetcher"""
+
+    RATES = {"EUR": 5000.0, "USD": 4500.0}
+
+    def test_first_lookup_returns_fallback_without_waiting(self, tmp_path):
+        release = threading.Event()
+        calls = []
+
+        def slow_fetcher():
+            calls.append(1)
+            release.wait(5)
+            return dict(self.RATES)
+
+        cache_path = tmp_path / "rates.json"
+        service = ExchangeRateService(slow_fetcher, str(cache_path), ttl_seconds=60)
+        assert service.get_rates() == FALLBACK_EXCHANGE_RATES
+        assert service.get_rates() == FALLBACK_EXCHANGE_RATES
+        release.set()
+        service.wait(5)
+
+        assert calls == [1]
+        assert service.get_rates() == self.RATES
+        assert json.loads(cache_path.read_text())["rates"] == self.RATES
+
+    def test_disk_cache_then_stale_while_revalidate(self, tmp_path):
+        cache_path = str(tmp_path / "rates.json")
+        clock = _Clock()
+        ExchangeRateService(lambda: dict(self.RATES), cache_path, 60, clock).refresh()
+
+        fetched = []
+        newer = {"EUR": 5100.0, "USD": 4600.0}
+        service = ExchangeRateService(lambda: fetched.append(1) or dict(newer), cache_path, 60, clock)
+        assert service.get_rates() == self.RATES
+        service.wait(5)
+        assert fetched == []
+
+        clock.now += 61
+        assert service.get_rates() == self.RATES
+        service.wait(5)
+        assert fetched == [1]
+        assert service.get_rates() == newer
+
+    def test_failed_fetch_backs_off(self, tmp_path):
+        clock = _Clock()
+        calls = []
+
+        def offline():
+            calls.append(1)
+            raise OSError("network unreachable")
+
+        service = ExchangeRateService(offline, str(tmp_path / "rates.json"), 60, clock)
+        assert service.get_rates() == FALLBACK_EXCHANGE_RATES
+        service.wait(5)
+        assert service.get_rates() == FALLBACK_EXCHANGE_RATES
+        service.wait(5)
+        assert calls == [1]
+
+        clock.now += 61
+        service.get_rates()
+        service.wait(5)
+        assert calls == [1, 1]
+
 
 class TestCalendarDialogHelpers:
     """Test pure helpers used by the shared calendar dialog."""
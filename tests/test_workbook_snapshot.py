@@ -0,0 +1,135 @@
+"""
+Test suite for utils.workbook_snapshot module
+"""
+
+import os
+
+import pytest
+from openpyxl import Workbook
+
+from utils.cache import get_cache_stats
+from utils.workbook_snapshot import (
+    get_snapshot_stats,
+    invalidate_workbook_snapshot,
+    load_workbook_snapshot,
+)
+
+
+def _write_workbook(path, rows, title="DATA"):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = title
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+@pytest.fixture(autouse=True)
+def _clear_snapshots():
+    invalidate_workbook_snapshot()
+    yield
+    invalidate_workbook_snapshot()
+
+
+class TestSnapshotCache:
+    """Snapshots are parsed once per file version."""
+
+    def test_second_load_is_a_hit(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Nom", "Ville"], ["Colbert", "Antananarivo"]])
+        before = get_snapshot_stats()
+
+        first = load_workbook_snapshot(path)
+        second = load_workbook_snapshot(path)
+
+        after = get_snapshot_stats()
+        assert first is second
+        assert after["misses"] == before["misses"] + 1
+        assert after["hits"] == before["hits"] + 1
+
+    def test_file_change_reparses(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Nom"], ["Colbert"]])
+        first = load_workbook_snapshot(path)
+
+        _write_workbook(path, [["Nom"], ["Colbert"], ["Carlton"]])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, first.mtime_ns + 1_000_000))
+
+        second = load_workbook_snapshot(path)
+        assert second is not first
+        assert second["DATA"].value(3, 1) == "Carlton"
+
+    def test_explicit_invalidation(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Nom"]])
+        first = load_workbook_snapshot(path)
+        invalidate_workbook_snapshot(path)
+        assert load_workbook_snapshot(path) is not first
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_workbook_snapshot(str(tmp_path / "absent.xlsx"))
+
+    def test_formula_text_and_values(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Prix", "Total"], [10, "=A2*2"]])
+
+        formulas = load_workbook_snapshot(path)
+        assert formulas.has_formulas
+        assert formulas["DATA"].value(2, 2) == "=A2*2"
+        values = load_workbook_snapshot(path, data_only=True)
+        # openpyxl writes no cached value: like load_workbook(data_only=True)
+        assert values["DATA"].value(2, 2) is None
+        assert values["DATA"].value(2, 1) == 10
+        assert load_workbook_snapshot(path, data_only=True) is values
+
+    def test_values_share_the_snapshot_without_formulas(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Nom"], ["Colbert"]])
+        before = get_snapshot_stats()
+
+        snapshot = load_workbook_snapshot(path)
+        assert load_workbook_snapshot(path, data_only=True) is snapshot
+        assert get_snapshot_stats()["misses"] == before["misses"] + 1
+
+    def test_stats_exposed_in_cache_stats(self):
+        stats = get_cache_stats()
+        assert "workbooks" in stats
+        assert set(stats["workbooks"]) == {
+            "hits",
+            "misses",
+            "total_requests",
+            "hit_rate",
+            "cached_items",
+        }
+
+
+class TestSheetTable:
+    """SheetTable mirrors the worksheet read API used by the loaders."""
+
+    def test_cell_access(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Nom", "Ville"], ["Colbert", None, "extra"]])
+        ws = load_workbook_snapshot(path)["DATA"]
+
+        assert ws.max_row == 2
+        assert ws.max_column == 3
+        assert ws.cell(row=2, column=1).value == "Colbert"
+        assert ws["C2"].value == "extra"
+        assert ws.cell(row=10, column=10).value is None
+
+    def test_iter_rows_pads_values(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Nom", "Ville", "Type"], ["Colbert"]])
+        ws = load_workbook_snapshot(path)["DATA"]
+
+        rows = list(ws.iter_rows(min_row=2, values_only=True))
+        assert rows == [("Colbert", None, None)]
+
+    def test_snapshot_is_read_only(self, tmp_path):
+        path = str(tmp_path / "data.xlsx")
+        _write_workbook(path, [["Nom"]])
+        ws = load_workbook_snapshot(path)["DATA"]
+        with pytest.raises(TypeError):
+            ws.cell(row=1, column=2, value="Ville")
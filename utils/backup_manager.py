@@ -0,0 +1,297 @@
+"""
+Workbook backups: deduplicated, asynchronous and rotated
+
+BackupManager.backup() is called before a workbook is modified. It pins the
+current file content with a hard link (O(1), the saves replace the file with
+os.replace so the linked inode keeps the old content), then a background
+thread hashes it and writes a copy only if the content differs from the last
+backup. Old copies are pruned with a retention policy: the N most recent,
+plus the newest copy of each of the last D days and M months.
+
+Backup files are named ``<workbook>.<YYYYmmdd_HHMMSS>.<sha256[:12]>.bak``,
+with a ``.gz`` or ``.zst`` suffix when compressed (off by default, so the
+backups stay plain .xlsx copies). zstd needs the optional ``zstandard``
+package; gzip is used when it is missing. Backups from older versions,
+named ``<workbook>.<YYYYmmdd_HHMMSS>.bak``, are listed and rotated with
+the others.
+"""
+
+import atexit
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from config import (
+    BACKUP_COMPRESSION,
+    BACKUP_KEEP_DAILY,
+    BACKUP_KEEP_MONTHLY,
+    BACKUP_KEEP_RECENT,
+)
+from utils.logger import logger
+
+_CHUNK_SIZE = 1024 * 1024
+_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+# The digest is missing from the backups written by the former create_backup()
+_BACKUP_NAME = re.compile(
+    r"^(?P<name>.+)\.(?P<stamp>\d{8}_\d{6})(?:\.(?P<digest>[0-9a-f]{12}))?\.bak(?:\.gz|\.zst)?$",
+    re.IGNORECASE,
+)
+
+
+def file_digest(path):
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _open_output(path, compression):
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        raw = open(path, "wb")
+        return zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=True)
+    return open(path, "wb")
+
+
+def open_backup(path):
+    """Open a backup file for reading, decompressing it if needed."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required to read .zst backups")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+class BackupManager:
+    """
+    Background backups of workbooks into a ``backups`` folder next to them.
+
+    Args:
+        compression (str): "none", "gzip" or "zstd"
+        keep_recent (int): Most recent backups always kept
+        keep_daily (int): Days for which the newest backup is kept
+        keep_monthly (int): Months for which the newest backup is kept
+    """
+
+    def __init__(
+        self,
+        compression=BACKUP_COMPRESSION,
+        keep_recent=BACKUP_KEEP_RECENT,
+        keep_daily=BACKUP_KEEP_DAILY,
+        keep_monthly=BACKUP_KEEP_MONTHLY,
+    ):
+        compression = (compression or "none").lower()
+        if compression not in _SUFFIXES:
+            logger.warning(f"Unknown backup compression '{compression}', using gzip")
+            compression = "gzip"
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed, backups use gzip instead of zstd")
+            compression = "gzip"
+        self.compression = compression
+        self.keep_recent = int(keep_recent)
+        self.keep_daily = int(keep_daily)
+        self.keep_monthly = int(keep_monthly)
+        # (path, mtime_ns, size) -> digest, to skip hashing an unchanged file
+        self._digests = {}
+        self._jobs = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._thread = None
+
+    # ── Public API ───────────────────────────────────────────────────────────
+
+    def backup(self, filepath):
+        """
+        Queue a backup of filepath as it is now.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the backup path, or None
+            when the content is unchanged since the last backup
+
+        Raises:
+            OSError: The content could not be pinned (missing file, no space...)
+        """
+        future = Future()
+        staged = self._stage(filepath)
+        with self._cond:
+            self._jobs.append((filepath, staged, future))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="backup-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+        return future
+
+    def flush(self, timeout=None):
+        """Wait until the queued backups are written. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._jobs and not self._busy, timeout
+            )
+
+    def list_backups(self, filepath):
+        """Backups of filepath as (datetime, digest or None, path), newest first."""
+        backup_dir = self.backup_dir(filepath)
+        filename = os.path.normcase(os.path.basename(filepath))
+        entries = []
+        try:
+            names = os.listdir(backup_dir)
+        except FileNotFoundError:
+            return []
+        for name in names:
+            match = _BACKUP_NAME.match(name)
+            if not match or os.path.normcase(match.group("name")) != filename:
+                continue
+            try:
+                stamp = datetime.strptime(match.group("stamp"), "%Y%m%d_%H%M%S")
+            except ValueError:
+                continue
+            digest = match.group("digest")
+            entries.append((stamp, digest and digest.lower(), os.path.join(backup_dir, name)))
+        entries.sort(key=lambda e: (e[0], e[2]), reverse=True)
+        return entries
+
+    @staticmethod
+    def backup_dir(filepath):
+        return os.path.join(os.path.dirname(os.path.abspath(filepath)), "backups")
+
+    # ── Worker ───────────────────────────────────────────────────────────────
+
+    def _stage(self, filepath):
+        """Pin the current content of filepath under backups/ (hard link or copy)."""
+        backup_dir = self.backup_dir(filepath)
+        os.makedirs(backup_dir, exist_ok=True)
+        staged = os.path.join(
+            backup_dir,
+            f".{os.path.basename(filepath)}.{uuid.uuid4().hex}.staging",
+        )
+        try:
+            os.link(filepath, staged)
+        except OSError:
+            # File systems without hard links: copy synchronously instead.
+            shutil.copy2(filepath, staged)
+        return staged
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._jobs)
+                filepath, staged, future = self._jobs.popleft()
+                self._busy = True
+            result = error = None
+            try:
+                result = self._write_backup(filepath, staged)
+            except FileNotFoundError as e:
+                # backups/ removed meanwhile (e.g. temporary directory cleaned up)
+                logger.warning(f"Backup of {filepath} dropped: {e}")
+            except Exception as e:
+                logger.error(f"Failed to create backup for {filepath}: {e}", exc_info=True)
+                error = e
+            finally:
+                try:
+                    os.remove(staged)
+                except OSError:
+                    pass
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+            # Resolved once the staged copy is gone
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _digest(self, filepath, staged):
+        stat = os.stat(staged)
+        key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = file_digest(staged)
+            self._digests = {k: v for k, v in self._digests.items() if k[0] != key[0]}
+            self._digests[key] = digest
+        return digest
+
+    def _write_backup(self, filepath, staged):
+        digest = self._digest(filepath, staged)
+        existing = self.list_backups(filepath)
+        if existing and existing[0][1] == digest[:12]:
+            logger.debug(f"Backup skipped, {filepath} unchanged since {existing[0][2]}")
+            # Still rotate: older backups may predate the retention policy
+            self._prune(filepath)
+            return None
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = (
+            f"{os.path.basename(filepath)}.{stamp}.{digest[:12]}.bak"
+            f"{_SUFFIXES[self.compression]}"
+        )
+        backup_path = os.path.join(self.backup_dir(filepath), name)
+        tmp_path = backup_path + ".tmp"
+        try:
+            with open(staged, "rb") as src, _open_output(tmp_path, self.compression) as dst:
+                shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+            os.replace(tmp_path, backup_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        logger.info(f"Backup created: {backup_path}")
+        self._prune(filepath)
+        return backup_path
+
+    def _prune(self, filepath):
+        entries = self.list_backups(filepath)
+        keep = {path for _, _, path in entries[: self.keep_recent]}
+        days, months = set(), set()
+        for stamp, _, path in entries:
+            day = stamp.date()
+            if day not in days and len(days) < self.keep_daily:
+                days.add(day)
+                keep.add(path)
+            month = (stamp.year, stamp.month)
+            if month not in months and len(months) < self.keep_monthly:
+                months.add(month)
+                keep.add(path)
+        for _, _, path in entries:
+            if path not in keep:
+                try:
+                    os.remove(path)
+                    logger.debug(f"Backup pruned: {path}")
+                except OSError as e:
+                    logger.warning(f"Failed to prune backup {path}: {e}")
+
+
+_MANAGER = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def get_backup_manager():
+    """Return the shared BackupManager configured from config.json."""
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = BackupManager()
+            atexit.register(_MANAGER.flush)
+        return _MANAGER
@@ -1,34 +1,45 @@
 """
 Caching utilities for the application
-Provides caching for frequently accessed data with expiration
+Provides bounded LRU caching for frequently accessed data with expiration
 """
 
 import functools
+import heapq
+import itertools
+import sys
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import OrderedDict
 
 from utils.logger import logger
+from utils.workbook_snapshot import get_snapshot_stats, invalidate_workbook_snapshot
 
 
 class CacheEntry:
-    """Represents a cached value with expiration time"""
+    """Represents a cached value with expiration time, size and tags"""
 
-    def __init__(self, value, ttl_seconds):
+    __slots__ = ("value", "created_at", "ttl_seconds", "expires_at", "size", "tags")
+
+    def __init__(self, value, ttl_seconds, size=0, tags=()):
         """
         Initialize cache entry
 
         Args:
             value: The value to cache
             ttl_seconds: Time to live in seconds
+            size: Estimated size of value in bytes
+            tags: Tags the entry can be invalidated by
         """
         self.value = value
         self.created_at = time.time()
         self.ttl_seconds = ttl_seconds
+        self.expires_at = self.created_at + ttl_seconds
+        self.size = size
+        self.tags = frozenset(tags)
 
-    def is_expired(self):
+    def is_expired(self, now=None):
         """Check if cache entry has expired"""
-        elapsed = time.time() - self.created_at
-        return elapsed > self.ttl_seconds
+        return (now if now is not None else time.time()) > self.expires_at
 
     def get(self):
         """Get value if not expired, None if expired"""
@@ -37,14 +48,76 @@ class CacheEntry:
         return self.value
 
 
-class SimpleCache:
-    """Simple in-memory cache with expiration"""
+def estimate_size(value):
+    """
+    Estimate the memory held by value in bytes
+
+    Walks containers, instance __dict__ and __slots__; objects shared inside
+    value (e.g. the layouts of HotelRecord) are counted once.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 0)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+    return total
+
+
+class LRUCache:
+    """
+    In-memory cache with expiration, LRU eviction and tag invalidation.
+
+    Entries live in an OrderedDict kept in recency order; once max_entries
+    or max_bytes is exceeded, the least recently used entries are evicted.
+    Expiry is lazy: a read drops its own expired entry, and writes pop the
+    expired entries off a heap ordered by expiry time, so the dict is never
+    walked as a whole.
+
+    Args:
+        max_entries (int): Maximum number of entries, None for no limit
+        max_bytes (int): Maximum estimated size of the values, None for no limit
+    """
 
-    def __init__(self):
+    def __init__(self, max_entries=None, max_bytes=None):
         """Initialize cache"""
-        self._cache = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._tags = {}
+        self._expiry_heap = []
+        self._counter = itertools.count()
+        self._bytes = 0
+        self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and not entry.is_expired()
 
     def get(self, key):
         """
@@ -56,22 +129,25 @@ class SimpleCache:
         Returns:
             Cached value or None if expired/not found
         """
-        if key not in self._cache:
-            self._misses += 1
-            return None
-
-        entry = self._cache[key]
-        if entry.is_expired():
-            del self._cache[key]
-            self._misses += 1
-            logger.debug(f"Cache expired for key: {key}")
-            return None
-
-        self._hits += 1
-        logger.debug(f"Cache hit for key: {key}")
-        return entry.value
-
-    def set(self, key, value, ttl_seconds=3600):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.is_expired():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                logger.debug(f"Cache expired for key: {key}")
+                return None
+
+            self._cache.move_to_end(key)
+            self._hits += 1
+            logger.debug(f"Cache hit for key: {key}")
+            return entry.value
+
+    def set(self, key, value, ttl_seconds=3600, tags=(), size=None):
         """
         Set value in cache
 
@@ -79,43 +155,141 @@ class SimpleCache:
             key: Cache key
             value: Value to cache
             ttl_seconds: Time to live in seconds (default: 1 hour)
+            tags: Tags to invalidate the entry by (e.g. "client:<ref>")
+            size: Size of value in bytes, estimated if None
         """
-        self._cache[key] = CacheEntry(value, ttl_seconds)
+        if size is None:
+            size = estimate_size(value) if self.max_bytes is not None else 0
+        entry = CacheEntry(value, ttl_seconds, size, tags)
+
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug(f"Cache skipped for key: {key} ({size} bytes)")
+                return
+
+            self._cache[key] = entry
+            self._bytes += size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._counter), key, entry))
+
+            self._purge_expired()
+            self._enforce_limits()
         logger.debug(f"Cache set for key: {key} (TTL: {ttl_seconds}s)")
 
+    def invalidate(self, key):
+        """
+        Drop one entry
+
+        Returns:
+            bool: True if the key was cached
+        """
+        with self._lock:
+            if key not in self._cache:
+                return False
+            self._remove(key)
+            return True
+
+    def invalidate_tag(self, tag):
+        """
+        Drop every entry carrying tag
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+        if keys:
+            logger.debug(f"Cache invalidated {len(keys)} entries tagged {tag}")
+        return len(keys)
+
     def clear(self):
         """Clear all cache"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._tags.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
         logger.info("Cache cleared")
 
     def cleanup_expired(self):
         """Remove expired entries"""
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        with self._lock:
+            removed = self._purge_expired()
 
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+        if removed:
+            logger.debug(f"Cleaned up {removed} expired cache entries")
 
-        return len(expired_keys)
+        return removed
 
     def get_stats(self):
         """Get cache statistics"""
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0
-        return {
-            "hits": self._hits,
-            "misses": self._misses,
-            "total_requests": total,
-            "hit_rate": hit_rate,
-            "cached_items": len(self._cache),
-        }
-
+        with self._lock:
+            total = self._hits + self._misses
+            hit_rate = (self._hits / total * 100) if total > 0 else 0
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "total_requests": total,
+                "hit_rate": hit_rate,
+                "cached_items": len(self._cache),
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "tags": {tag: len(keys) for tag, keys in self._tags.items()},
+            }
+
+    def _remove(self, key):
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _purge_expired(self):
+        """Pop expired entries off the expiry heap (stale heap items are skipped)."""
+        now = time.time()
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, _, key, entry = heapq.heappop(heap)
+            if self._cache.get(key) is entry:
+                self._remove(key)
+                self._expirations += 1
+                removed += 1
+        # Overwritten and invalidated entries leave stale heap items behind
+        if len(heap) > 2 * len(self._cache) + 32:
+            self._expiry_heap = [item for item in heap if self._cache.get(item[2]) is item[3]]
+            heapq.heapify(self._expiry_heap)
+        return removed
+
+    def _enforce_limits(self):
+        while self._cache and (
+            (self.max_entries is not None and len(self._cache) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._evictions += 1
+            logger.debug(f"Cache evicted key: {key}")
+
+
+# Former name of the cache engine
+SimpleCache = LRUCache
 
 # Global cache instances
-_exchange_rate_cache = SimpleCache()
-_hotel_cache = SimpleCache()
-_client_cache = SimpleCache()
+_exchange_rate_cache = LRUCache(max_entries=4)
+_hotel_cache = LRUCache(max_entries=16, max_bytes=64 * 1024 * 1024)
+_client_cache = LRUCache(max_entries=64, max_bytes=32 * 1024 * 1024)
 
 
 def cached_exchange_rates(ttl_seconds=3600):
@@ -165,21 +339,20 @@ def _make_cache_key(prefix, args, kwargs):
     return (prefix, safe_args, safe_kwargs)
 
 
-def cached_hotel_data(ttl_seconds=86400):
-    """
-    Decorator to cache hotel data
+def _cache_tags(default_tag, tags, args, kwargs):
+    """Tags of one call: the cache's default tag plus tags(*args, **kwargs)."""
+    extra = tags(*args, **kwargs) if callable(tags) else tags
+    return (default_tag, *(extra or ()))
 
-    Args:
-        ttl_seconds: Time to live in seconds (default: 24 hours)
-    """
 
+def _cached(cache, prefix, default_tag, ttl_seconds, tags):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            cache_key = _make_cache_key("all_hotels", args, kwargs)
+            cache_key = _make_cache_key(prefix, args, kwargs)
 
             # Check cache
-            cached_value = _hotel_cache.get(cache_key)
+            cached_value = cache.get(cache_key)
             if cached_value is not None:
                 return cached_value
 
@@ -187,7 +360,12 @@ def cached_hotel_data(ttl_seconds=86400):
             result = func(*args, **kwargs)
 
             # Cache it
-            _hotel_cache.set(cache_key, result, ttl_seconds)
+            cache.set(
+                cache_key,
+                result,
+                ttl_seconds,
+                tags=_cache_tags(default_tag, tags, args, kwargs),
+            )
 
             return result
 
@@ -196,35 +374,28 @@ def cached_hotel_data(ttl_seconds=86400):
     return decorator
 
 
-def cached_client_data(ttl_seconds=86400):
+def cached_hotel_data(ttl_seconds=86400, tags=None):
     """
-    Decorator to cache client data
+    Decorator to cache hotel data
 
     Args:
         ttl_seconds: Time to live in seconds (default: 24 hours)
+        tags: Extra tags of each call, or a function of the call arguments
+            returning them; every entry is also tagged "hotels"
     """
+    return _cached(_hotel_cache, "all_hotels", "hotels", ttl_seconds, tags)
 
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            cache_key = _make_cache_key("all_clients", args, kwargs)
-
-            # Check cache
-            cached_value = _client_cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
-
-            # Get fresh data
-            result = func(*args, **kwargs)
-
-            # Cache it
-            _client_cache.set(cache_key, result, ttl_seconds)
-
-            return result
 
-        return wrapper
+def cached_client_data(ttl_seconds=86400, tags=None):
+    """
+    Decorator to cache client data
 
-    return decorator
+    Args:
+        ttl_seconds: Time to live in seconds (default: 24 hours)
+        tags: Extra tags of each call, or a function of the call arguments
+            returning them; every entry is also tagged "clients"
+    """
+    return _cached(_client_cache, "all_clients", "clients", ttl_seconds, tags)
 
 
 def invalidate_all_caches():
@@ -232,19 +403,36 @@ def invalidate_all_caches():
     _exchange_rate_cache.clear()
     _hotel_cache.clear()
     _client_cache.clear()
+    invalidate_workbook_snapshot()
     logger.info("All caches invalidated")
 
 
-def invalidate_hotel_cache():
-    """Invalidate hotel cache"""
-    _hotel_cache.clear()
-    logger.info("Hotel cache invalidated")
+def invalidate_hotel_cache(tag=None):
+    """
+    Invalidate hotel cache
 
+    Args:
+        tag: Only drop the entries carrying this tag (all entries if None)
+    """
+    if tag is None:
+        _hotel_cache.clear()
+        logger.info("Hotel cache invalidated")
+    else:
+        _hotel_cache.invalidate_tag(tag)
 
-def invalidate_client_cache():
-    """Invalidate client cache"""
-    _client_cache.clear()
-    logger.info("Client cache invalidated")
+
+def invalidate_client_cache(tag=None):
+    """
+    Invalidate client cache
+
+    Args:
+        tag: Only drop the entries carrying this tag (all entries if None)
+    """
+    if tag is None:
+        _client_cache.clear()
+        logger.info("Client cache invalidated")
+    else:
+        _client_cache.invalidate_tag(tag)
 
 
 def get_cache_stats():
@@ -253,4 +441,5 @@ def get_cache_stats():
         "exchange_rates": _exchange_rate_cache.get_stats(),
         "hotels": _hotel_cache.get_stats(),
         "clients": _client_cache.get_stats(),
+        "workbooks": get_snapshot_stats(),
     }
@@ -141,8 +141,28 @@ def _default_source_rows(client):
     }
 
 
-def build_client_quote(client, source_rows=None):
-    """Build a normalized active quote for one client."""
+# Montants d'une ligne de devis convertis avec la devise
+_LINE_AMOUNT_FIELDS = ("cost_unit", "cost_total", "margin_amount", "total_price", "unit_price")
+
+
+def convert_quote_lines(lines, currency, rates=None):
+    """Convert every amount of Ariary quote lines to currency in one batch."""
+    from utils.validators import convert_amounts
+
+    amounts = [_to_float(line.get(field, 0)) for line in lines for field in _LINE_AMOUNT_FIELDS]
+    converted = iter(convert_amounts(amounts, "Ariary", currency, rates))
+    result = []
+    for line in lines:
+        updated = dict(line)
+        for field in _LINE_AMOUNT_FIELDS:
+            updated[field] = next(converted)
+        updated["currency"] = currency
+        result.append(updated)
+    return result
+
+
+def build_client_quote(client, source_rows=None, currency="Ariary", rates=None):
+    """Build a normalized active quote for one client, priced in currency."""
     rows = source_rows or _default_source_rows(client)
     lines = []
 
@@ -241,6 +261,9 @@ def build_client_quote(client, source_rows=None):
         )
 
     lines = [line for line in lines if _to_float(line.get("total_price", 0)) > 0]
+    currency = currency or "Ariary"
+    if currency != "Ariary":
+        lines = convert_quote_lines(lines, currency, rates)
     total_cost = sum(_to_float(line.get("cost_total", 0)) for line in lines)
     total_price = sum(_to_float(line.get("total_price", 0)) for line in lines)
     total_margin = sum(_to_float(line.get("margin_amount", 0)) for line in lines)
@@ -249,7 +272,7 @@ def build_client_quote(client, source_rows=None):
         "client_id": _safe_strip(client.get("ref_client")),
         "client_name": f"{_safe_strip(client.get('prenom'))} {_safe_strip(client.get('nom'))}".strip(),
         "numero_dossier": _safe_strip(client.get("numero_dossier")),
-        "currency": "Ariary",
+        "currency": currency,
         "lines": lines,
         "line_count": len(lines),
         "total_cost": total_cost,
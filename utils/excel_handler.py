@@ -4,20 +4,29 @@ Excel file handling utilities
 
 try:
     from openpyxl import Workbook, load_workbook
+    from openpyxl.packaging.custom import StringProperty
     from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
+    from openpyxl.utils import column_index_from_string, get_column_letter
 
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+import atexit
 import os
 import re
 import shutil
+import tempfile
+import threading
 import unicodedata
+import weakref
 import zipfile
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future
+from functools import lru_cache
 from datetime import datetime, time, timedelta
-from time import monotonic
+from time import monotonic, sleep
 
 from config import (
     CLIENT_EXCEL_PATH,
@@ -44,26 +53,59 @@ from config import (
     PARAMETRAGE_SHEET_NAME,
     INVOICE_SHEET_NAME,
     FINANCIAL_STATE_SHEET_NAME,
+    SQLITE_DB_PATH,
+    SQLITE_EXPORT_DIR,
+    STORAGE_BACKEND,
+    WORKBOOK_WATCH_INTERVAL_SECONDS,
 )
+from models.avion_tariff_index import AvionTariffIndex
+from models.collective_expense_catalog import CollectiveExpenseCatalog
+from models.distance_matrix import DistanceMatrix
+from models.hotel_record import HotelRecord
+from models.transport_catalog import TransportCatalog
+from models.visite_excursion_catalog import VisiteExcursionCatalog
+from utils.backup_manager import get_backup_manager
 from utils.cache import (
     cached_client_data,
     cached_hotel_data,
     invalidate_client_cache,
     invalidate_hotel_cache,
 )
+from utils.file_watcher import FileWatcher
+from utils.header_reader import read_header_rows, sheet_names
 from utils.logger import logger
+from utils.sheet_schema import SheetSchema, normalize_header_key, sheet_schema
+from utils.sqlite_store import ensure_workbook_imported, get_store, sync_workbook_export
+from utils.workbook_snapshot import (
+    SheetTable,
+    index_key,
+    invalidate_workbook_snapshot,
+    load_workbook_snapshot,
+    peek_workbook_snapshot,
+    seed_row_indexes,
+)
 
 
 _KM_MADA_CACHE_TTL_SECONDS = 10.0
+# Distance lookups revalidate the workbook (exists, zip, mtime) at most this often
+_KM_MADA_CHECK_INTERVAL_SECONDS = 2.0
 _KM_MADA_CACHE = {
     "path": None,
     "mtime": None,
     "loaded_at": 0.0,
     "rows": [],
     "lookup": {},
+    "matrix": None,
+    "checked": None,
 }
+# Catalogs derived from one workbook: name -> (path, version, catalog, checked_at)
+_DERIVED_CATALOGS = {}
+_DERIVED_CHECK_INTERVAL_SECONDS = 2.0
 _THROTTLED_ERROR_STATE = {}
 _THROTTLED_ERROR_WINDOW_SECONDS = 30.0
+# Client / hotel lists: dropped by the writers and, for edits made outside the
+# application, by the workbook watcher, so the TTL is only a safety net
+_WATCHED_CACHE_TTL_SECONDS = 7 * 24 * 3600
 
 CLIENT_ACTIVE_QUOTE_HEADERS = [
     "Date",
@@ -115,6 +157,685 @@ def _invalidate_km_mada_cache():
     _KM_MADA_CACHE["loaded_at"] = 0.0
     _KM_MADA_CACHE["rows"] = []
     _KM_MADA_CACHE["lookup"] = {}
+    _KM_MADA_CACHE["matrix"] = None
+    _KM_MADA_CACHE["checked"] = None
+
+
+def _invalidate_derived_catalog(name=None):
+    """Drop one derived catalog (see _derived_catalog), or all of them."""
+    if name is None:
+        _DERIVED_CATALOGS.clear()
+    else:
+        _DERIVED_CATALOGS.pop(name, None)
+
+
+# ── Storage backend (Excel files or SQLite) ─────────────────────────────────
+
+
+def _sqlite_backend():
+    return STORAGE_BACKEND == "sqlite"
+
+
+def _workbook_name(path):
+    """Name of a workbook in the SQLite store (its file name, e.g. data.xlsx)."""
+    return os.path.basename(path)
+
+
+def _sqlite_store(path):
+    """SQLite store, importing the .xlsx at path the first time it is missing there."""
+    ensure_workbook_imported(path, SQLITE_DB_PATH, _workbook_name(path))
+    return get_store(SQLITE_DB_PATH)
+
+
+def _workbook_exists(path):
+    """True when the workbook exists in the configured backend."""
+    if _sqlite_backend():
+        return _sqlite_store(path).has_workbook(_workbook_name(path))
+    return os.path.exists(path)
+
+
+def _workbook_version(path):
+    """Change marker of a workbook: file mtime, or store revision under SQLite."""
+    if _sqlite_backend():
+        return _sqlite_store(path).revision(_workbook_name(path))
+    return os.path.getmtime(path)
+
+
+def _derived_catalog(name, path, build, empty):
+    """
+    Catalog built from a workbook, cached until its version changes.
+
+    The version (stat / store revision) is checked at most every
+    _DERIVED_CHECK_INTERVAL_SECONDS, so per-row lookups do not touch the
+    disk; the writers of the underlying sheet invalidate immediately.
+
+    Args:
+        name (str): Cache slot, also used by _invalidate_derived_catalog
+        path (str): Workbook the catalog is read from
+        build (callable): Builds the catalog (reads the workbook)
+        empty (callable): Catalog to use when the workbook is missing
+    """
+    _wait_for_queued_writes(path)
+    now = monotonic()
+    cached = _DERIVED_CATALOGS.get(name)
+    if (
+        cached is not None
+        and cached[0] == path
+        and now - cached[3] < _DERIVED_CHECK_INTERVAL_SECONDS
+    ):
+        return cached[2]
+
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(path):
+        return empty()
+    try:
+        version = _workbook_version(path)
+    except OSError:
+        return empty()
+    if cached is not None and cached[0] == path and cached[1] == version:
+        _DERIVED_CATALOGS[name] = (path, version, cached[2], now)
+        return cached[2]
+
+    catalog = build()
+    _DERIVED_CATALOGS[name] = (path, version, catalog, now)
+    return catalog
+
+
+def _load_snapshot(path, data_only=False):
+    """
+    Read-only parsed view of a workbook from the configured backend.
+
+    Formula cells hold their formula text, or their cached value with
+    data_only=True (see utils.workbook_snapshot). The SQLite store keeps
+    values only.
+    """
+    _wait_for_queued_writes(path)
+    if _sqlite_backend():
+        return _sqlite_store(path).load_snapshot(_workbook_name(path))
+    return load_workbook_snapshot(path, data_only=data_only)
+
+
+def _load_header_sheet(path, sheet_name, n_rows=1):
+    """
+    First rows of a sheet, without parsing the whole workbook.
+
+    Served from the parsed snapshot when one is cached (always with the
+    SQLite backend), else read from the sheet XML by utils.header_reader.
+    Never writes. Returns None if the sheet does not exist.
+    """
+    _wait_for_queued_writes(path)
+    snapshot = _load_snapshot(path) if _sqlite_backend() else peek_workbook_snapshot(path)
+    if snapshot is not None:
+        return snapshot.get(sheet_name)
+    try:
+        rows = read_header_rows(path, sheet_name, n_rows)
+    except ValueError:
+        # Malformed parts or shared formulas: let openpyxl read it
+        return _load_snapshot(path).get(sheet_name)
+    if rows is None:
+        return None
+    return SheetTable(sheet_name, rows)
+
+
+def _header_sheet_name(path, sheet_name):
+    """Resolve sheet_name in a workbook, tolerating case/accent differences."""
+    _wait_for_queued_writes(path)
+    snapshot = _load_snapshot(path) if _sqlite_backend() else peek_workbook_snapshot(path)
+    names = snapshot.sheetnames if snapshot is not None else sheet_names(path)
+    if sheet_name in names:
+        return sheet_name
+    target = _normalize_header_key(sheet_name)
+    for name in names:
+        if _normalize_header_key(name) == target:
+            return name
+    return None
+
+
+def _header_labels(ws, header_row=1):
+    """Non-empty labels of a header row, in column order."""
+    headers = []
+    for col in range(1, ws.max_column + 1):
+        value = ws.cell(row=header_row, column=col).value
+        if value is None:
+            continue
+        label = str(value).strip()
+        if label:
+            headers.append(label)
+    return headers
+
+
+def _load_editable_workbook(path):
+    if _sqlite_backend():
+        return _sqlite_store(path).editable_workbook(_workbook_name(path))
+    stat = os.stat(path)
+    wb = load_workbook(path)
+    _EDIT_ORIGINS[wb] = (path, (stat.st_mtime_ns, stat.st_size))
+    return wb
+
+
+def excel_export_path(path):
+    """
+    .xlsx file external tools open for the workbook at path: path itself with
+    the Excel backend, its copy in SQLITE_EXPORT_DIR with the SQLite backend.
+    """
+    if not _sqlite_backend():
+        return path
+    return os.path.join(SQLITE_EXPORT_DIR, _workbook_name(path))
+
+
+def _sync_excel_export(path, export=True):
+    """Writer-queue job: sync the export of path with the store (see sync_workbook_export)."""
+    _sqlite_store(path)
+    status = sync_workbook_export(
+        _workbook_name(path), SQLITE_DB_PATH, excel_export_path(path), export=export
+    )
+    if status == "imported":
+        invalidate_workbook_caches(path)
+    return status
+
+
+def ensure_excel_export(path):
+    """
+    Make sure an up-to-date .xlsx file exists for external tools (TsaraKonta,
+    manual editing) and return its path.
+
+    With the Excel backend the file is the storage itself. With the SQLite
+    backend it is a copy in SQLITE_EXPORT_DIR (path itself is never
+    overwritten): edits made to the copy since the last export are imported
+    back first, then the copy is regenerated if the store changed. The sync
+    runs on the writer thread, after the queued writes of path.
+
+    Returns:
+        str: Path of the file to open, or None if the export failed
+    """
+    if not _sqlite_backend():
+        return path
+    export_path = excel_export_path(path)
+    try:
+        _WRITE_QUEUE.submit(_sync_excel_export, path, path=export_path).result()
+    except Exception as e:
+        logger.error(f"Failed to export {path} from SQLite store: {e}", exc_info=True)
+        return None
+    if _WORKBOOK_WATCHER is not None:
+        _WORKBOOK_WATCHER.acknowledge(export_path)
+    return export_path
+
+
+# ── Per-client row indexes ──────────────────────────────────────────────────
+#
+# Loaders use SheetTable.row_index() on the snapshot. Save functions keep a
+# {key: [row numbers]} index per editable worksheet and column, seeded from the
+# cached snapshot of the file version they loaded (or one scan of the column),
+# updated by deletes/appends, then handed to the next snapshot on save.
+# Each index also records the last row it covers: rows appended by a writer
+# that does not record them leave it short of ws.max_row, and such an index
+# is rebuilt before use and never handed to a snapshot.
+
+# Workbook loaded for editing -> (path, (mtime_ns, size)) of the file read
+_EDIT_ORIGINS = weakref.WeakKeyDictionary()
+# Editable worksheet -> {column: {key: [row numbers]}}
+_WRITE_ROW_INDEXES = weakref.WeakKeyDictionary()
+# Editable worksheet -> {column: last row covered by the index}
+_WRITE_INDEX_ROWS = weakref.WeakKeyDictionary()
+
+
+def _scan_row_index(ws, column):
+    index = {}
+    for row_number, (value,) in enumerate(
+        ws.iter_rows(min_row=2, min_col=column, max_col=column, values_only=True),
+        start=2,
+    ):
+        key = index_key(value)
+        if key:
+            index.setdefault(key, []).append(row_number)
+    return index
+
+
+def _editable_row_index(ws, column, rebuild=False):
+    """Return the key -> row numbers index of a column of an editable worksheet."""
+    indexes = _WRITE_ROW_INDEXES.get(ws)
+    if indexes is None:
+        indexes = {}
+        _WRITE_ROW_INDEXES[ws] = indexes
+    covered = _WRITE_INDEX_ROWS.setdefault(ws, {})
+    index = indexes.get(column)
+    if index is not None and covered.get(column) != ws.max_row:
+        # Rows written without _record_client_rows: the index misses them
+        index = None
+        rebuild = True
+    if rebuild:
+        index = None
+    if index is None:
+        origin = None if rebuild else _EDIT_ORIGINS.get(ws.parent)
+        snapshot = peek_workbook_snapshot(origin[0]) if origin else None
+        if (
+            snapshot is not None
+            and snapshot.version == origin[1]
+            and ws.title in snapshot
+            and snapshot[ws.title].max_row == ws.max_row
+        ):
+            source = snapshot[ws.title].row_index(column)
+            index = {key: list(rows) for key, rows in source.items()}
+        else:
+            index = _scan_row_index(ws, column)
+        indexes[column] = index
+        covered[column] = ws.max_row
+    return index
+
+
+def _shift_row_indexes(ws, deleted_rows):
+    """Renumber the indexes of ws after deleted_rows (sorted) were removed."""
+    deleted = set(deleted_rows)
+    covered = _WRITE_INDEX_ROWS.get(ws, {})
+    for column in covered:
+        covered[column] -= bisect_left(deleted_rows, covered[column] + 1)
+    for index in _WRITE_ROW_INDEXES.get(ws, {}).values():
+        for key in list(index):
+            rows = [
+                row - bisect_left(deleted_rows, row)
+                for row in index[key]
+                if row not in deleted
+            ]
+            if rows:
+                index[key] = rows
+            else:
+                del index[key]
+
+
+def _record_client_rows(ws, id_col_idx, client_ref, row_numbers):
+    """Add freshly written rows to the index of ws, when one is maintained."""
+    index = _WRITE_ROW_INDEXES.get(ws, {}).get(id_col_idx)
+    if index is None or not row_numbers:
+        return
+    if client_ref:
+        index.setdefault(client_ref, []).extend(row_numbers)
+    covered = _WRITE_INDEX_ROWS[ws]
+    covered[id_col_idx] = max(covered[id_col_idx], max(row_numbers))
+
+
+def _take_row_indexes(wb):
+    """Detach the write indexes of wb as {sheet title: {column: index}}."""
+    indexes = {}
+    for ws in wb.worksheets:
+        ws_indexes = _WRITE_ROW_INDEXES.pop(ws, None)
+        covered = _WRITE_INDEX_ROWS.pop(ws, {})
+        if ws_indexes:
+            # An index missing rows appended behind its back is not handed on
+            ws_indexes = {
+                column: index
+                for column, index in ws_indexes.items()
+                if covered.get(column) == ws.max_row
+            }
+        if ws_indexes:
+            indexes[ws.title] = ws_indexes
+    return indexes
+
+
+# ── Workbook sessions (unit of work) ─────────────────────────────────────────
+
+_SESSION_STATE = threading.local()
+
+
+def _active_session(path):
+    sessions = getattr(_SESSION_STATE, "sessions", None)
+    if not sessions:
+        return None
+    return sessions.get(os.path.abspath(path))
+
+
+class WorkbookSession:
+    """
+    Open a workbook once, let several save_*/update_* calls mutate it, save once.
+
+    Inside the ``with`` block, every excel_handler write on the same path (in the
+    same thread) reuses the session workbook and defers its save; the outermost
+    session commits with a single atomic save. Nothing is written if the block
+    raises.
+
+    Example:
+        with WorkbookSession(CLIENT_EXCEL_PATH):
+            save_client_to_excel(client)
+            save_client_hotel_cotation_to_excel(client, rows)
+
+    Args:
+        path (str): Workbook path
+        create (bool): Start from an empty Workbook when the file does not exist
+    """
+
+    def __init__(self, path, create=False):
+        self.path = path
+        self.create = create
+        self.wb = None
+        self.created = False
+        self.dirty = False
+        self._outer = None
+        self._failed = False
+
+    def __enter__(self):
+        self._outer = _active_session(self.path)
+        if self._outer is not None:
+            self.wb = self._outer.wb
+            self.created = self._outer.created
+            return self
+
+        _wait_for_queued_writes(self.path)
+        if _workbook_exists(self.path):
+            self.wb = _load_editable_workbook(self.path)
+        elif self.create:
+            self.wb = Workbook()
+            self.created = True
+            self.dirty = True
+        else:
+            raise FileNotFoundError(self.path)
+
+        if not hasattr(_SESSION_STATE, "sessions"):
+            _SESSION_STATE.sessions = {}
+        _SESSION_STATE.sessions[os.path.abspath(self.path)] = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._outer is not None:
+            if exc_type is not None:
+                self._outer._failed = True
+            self._outer.dirty = self._outer.dirty or self.dirty
+            return False
+
+        _SESSION_STATE.sessions.pop(os.path.abspath(self.path), None)
+        try:
+            if exc_type is None and not self._failed and self.dirty:
+                _atomic_save(self.wb, self.path)
+        finally:
+            try:
+                self.wb.close()
+            except Exception:
+                pass
+        return False
+
+    def mark_dirty(self):
+        """Flag the session workbook as modified so the outermost session saves it."""
+        if self._outer is not None:
+            self._outer.dirty = True
+        self.dirty = True
+
+
+def _open_workbook(path):
+    """Load a workbook for writing, reusing the active WorkbookSession if any."""
+    session = _active_session(path)
+    if session is not None:
+        return session.wb
+    _wait_for_queued_writes(path)
+    return _load_editable_workbook(path)
+
+
+def _atomic_save(wb, path):
+    """Write to a temporary file next to path, then swap it in with os.replace."""
+    if _sqlite_backend():
+        # One SQLite transaction per save; only the changed sheets are rewritten.
+        _sqlite_store(path).save_workbook(_workbook_name(path), wb)
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".~" + os.path.basename(path), suffix=".tmp", dir=directory
+    )
+    os.close(fd)
+    try:
+        wb.save(tmp_path)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        if _WORKBOOK_WATCHER is not None:
+            # Report an outside edit not polled yet before our save hides it
+            _WORKBOOK_WATCHER.poll(path)
+        os.replace(tmp_path, path)
+        seed_row_indexes(path, _take_row_indexes(wb))
+        if _WORKBOOK_WATCHER is not None:
+            _WORKBOOK_WATCHER.acknowledge(path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        invalidate_workbook_snapshot(path)
+
+
+def _save_workbook(wb, path):
+    """Save a workbook, or defer the save to the active WorkbookSession."""
+    session = _active_session(path)
+    if session is not None and session.wb is wb:
+        session.mark_dirty()
+        return
+    _atomic_save(wb, path)
+
+
+# ── Workbook file watcher ────────────────────────────────────────────────────
+
+_WORKBOOK_WATCHER = None
+
+
+def invalidate_workbook_caches(path):
+    """
+    Drop every cache derived from one workbook (changed outside the app).
+
+    Covers the parsed snapshot, the derived catalogs read from it, the
+    KM_MADA distances, the PARAMETRAGE values (subscribers are notified) and
+    the hotel / client caches of data-hotel.xlsx / data.xlsx.
+    """
+    path = os.path.abspath(path)
+    invalidate_workbook_snapshot(path)
+    for name, cached in list(_DERIVED_CATALOGS.items()):
+        if os.path.abspath(cached[0]) == path:
+            _invalidate_derived_catalog(name)
+    if _KM_MADA_CACHE["path"] and os.path.abspath(_KM_MADA_CACHE["path"]) == path:
+        _invalidate_km_mada_cache()
+    if path == os.path.abspath(HOTEL_EXCEL_PATH):
+        invalidate_hotel_cache()
+        _PARAMETRAGE_STORE.notify_changed()
+    if path == os.path.abspath(CLIENT_EXCEL_PATH):
+        invalidate_client_cache()
+
+
+def _import_edited_export(export_path):
+    """Watcher callback (SQLite backend): import the edits of an exported copy."""
+    export_path = os.path.abspath(export_path)
+    for path in (CLIENT_EXCEL_PATH, HOTEL_EXCEL_PATH, FINANCIAL_EXCEL_PATH):
+        if os.path.abspath(excel_export_path(path)) == export_path:
+            # Queued, so the import does not race a save of the same workbook
+            _WRITE_QUEUE.submit(_sync_excel_export, path, False, path=export_path)
+            return
+
+
+def start_workbook_watcher(interval=None):
+    """
+    Watch data.xlsx and data-hotel.xlsx for changes made outside the app.
+
+    The application's own saves are acknowledged, so only external edits
+    invalidate the caches (see invalidate_workbook_caches). With the SQLite
+    backend, the copies exported for TsaraKonta are watched instead and
+    their edits imported back into the store.
+
+    Returns:
+        FileWatcher
+    """
+    global _WORKBOOK_WATCHER
+    if _WORKBOOK_WATCHER is None:
+        sqlite = _sqlite_backend()
+        _WORKBOOK_WATCHER = FileWatcher(
+            _import_edited_export if sqlite else invalidate_workbook_caches,
+            interval=interval or WORKBOOK_WATCH_INTERVAL_SECONDS,
+        )
+        # FINANCIAL_EXCEL_PATH is data.xlsx unless configured otherwise
+        for path in (CLIENT_EXCEL_PATH, HOTEL_EXCEL_PATH, FINANCIAL_EXCEL_PATH):
+            _WORKBOOK_WATCHER.watch(excel_export_path(path) if sqlite else path)
+    _WORKBOOK_WATCHER.start()
+    return _WORKBOOK_WATCHER
+
+
+def stop_workbook_watcher():
+    """Stop the workbook watcher started by start_workbook_watcher."""
+    global _WORKBOOK_WATCHER
+    watcher, _WORKBOOK_WATCHER = _WORKBOOK_WATCHER, None
+    if watcher is not None:
+        watcher.stop()
+
+
+# ── Write-behind queue ───────────────────────────────────────────────────────
+
+
+class _WriteJob:
+    __slots__ = ("path", "func", "args", "kwargs", "future")
+
+    def __init__(self, path, func, args, kwargs, future):
+        self.path = os.path.abspath(path)
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+
+
+def _is_failure_result(result):
+    # Save functions report failures as -1 / -2 (Excel locked) or False.
+    return result is False or (
+        isinstance(result, int) and not isinstance(result, bool) and result < 0
+    )
+
+
+class ExcelWriteQueue:
+    """
+    Single writer thread running excel_handler writes off the Tk main loop.
+
+    Jobs are run in submission order. Consecutive jobs on the same workbook
+    are run inside one WorkbookSession, so they cost one load and one save.
+    If one of them fails (exception, -1/-2 or False) or the grouped save
+    fails, the batch is discarded and its jobs are replayed one by one, so
+    each future gets exactly what the synchronous call would have returned.
+
+    Reads and direct writes of a workbook from other threads first wait for
+    the pending jobs on that workbook (read-your-writes).
+
+    Args:
+        coalesce_delay (float): Seconds to wait for more jobs before running
+            a batch
+    """
+
+    def __init__(self, coalesce_delay=0.05):
+        self.coalesce_delay = coalesce_delay
+        self._jobs = deque()
+        self._cond = threading.Condition()
+        self._running_path = None
+        self._thread = None
+
+    def submit(self, func, *args, path=None, callback=None, **kwargs):
+        """
+        Queue func(*args, **kwargs), a write on the workbook at path.
+
+        Args:
+            func: excel_handler write function (save_*, update_*, delete_*)
+            path (str): Workbook written by func (default: CLIENT_EXCEL_PATH)
+            callback: Called with the future once done, on the writer thread
+
+        Returns:
+            concurrent.futures.Future: Resolves to func's return value, or
+            holds the exception it raised (e.g. PermissionError)
+        """
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        job = _WriteJob(path or CLIENT_EXCEL_PATH, func, args, kwargs, future)
+        with self._cond:
+            self._jobs.append(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="excel-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+        return future
+
+    def pending(self, path=None):
+        """True while jobs (on path, or on any workbook) are queued or running."""
+        key = os.path.abspath(path) if path else None
+        with self._cond:
+            return self._has_pending(key)
+
+    def _has_pending(self, key):
+        if key is None:
+            return bool(self._jobs) or self._running_path is not None
+        return self._running_path == key or any(job.path == key for job in self._jobs)
+
+    def flush(self, path=None, timeout=None):
+        """
+        Wait until the jobs on path (or all jobs) are done.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        if threading.current_thread() is self._thread:
+            return True
+        key = os.path.abspath(path) if path else None
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._has_pending(key), timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._jobs)
+            if self.coalesce_delay:
+                sleep(self.coalesce_delay)
+            with self._cond:
+                batch = [self._jobs.popleft()]
+                while self._jobs and self._jobs[0].path == batch[0].path:
+                    batch.append(self._jobs.popleft())
+                self._running_path = batch[0].path
+            try:
+                self._run_batch(batch)
+            finally:
+                with self._cond:
+                    self._running_path = None
+                    self._cond.notify_all()
+
+    def _run_batch(self, batch):
+        batch = [job for job in batch if job.future.set_running_or_notify_cancel()]
+        if len(batch) > 1 and _workbook_exists(batch[0].path):
+            results = []
+            try:
+                with WorkbookSession(batch[0].path):
+                    for job in batch:
+                        result = job.func(*job.args, **job.kwargs)
+                        if _is_failure_result(result):
+                            raise RuntimeError("write-behind batch aborted")
+                        results.append(result)
+            except Exception as e:
+                logger.info(f"Write-behind batch replayed job by job: {e}")
+            else:
+                for job, result in zip(batch, results):
+                    job.future.set_result(result)
+                return
+        for job in batch:
+            try:
+                job.future.set_result(job.func(*job.args, **job.kwargs))
+            except BaseException as e:
+                job.future.set_exception(e)
+
+
+_WRITE_QUEUE = ExcelWriteQueue()
+
+
+def submit_excel_write(func, *args, path=None, callback=None, **kwargs):
+    """Queue an excel_handler write on the background writer (see ExcelWriteQueue)."""
+    return _WRITE_QUEUE.submit(func, *args, path=path, callback=callback, **kwargs)
+
+
+def flush_excel_writes(path=None, timeout=None):
+    """Wait for the queued writes (on path, or all of them) to be written."""
+    return _WRITE_QUEUE.flush(path, timeout)
+
+
+def _wait_for_queued_writes(path):
+    if _WRITE_QUEUE.pending(path):
+        _WRITE_QUEUE.flush(path)
+
+
+atexit.register(flush_excel_writes)
 
 
 def _parse_num(val):
@@ -195,33 +916,28 @@ def _parse_duration_hours(val):
 
 def create_backup(filepath):
     """
-    Create a backup of Excel file before modification
+    Back up an Excel file before modification
+
+    The current content is pinned immediately; hashing, copying (skipped when
+    the content is unchanged since the last backup), compression and
+    retention run on a background thread (see utils.backup_manager).
 
     Args:
         filepath (str): Path to the Excel file to backup
 
     Returns:
-        str: Path to backup file, or None if failed
+        concurrent.futures.Future: Resolves to the backup path, or None when
+        the file is unchanged since the last backup; None if nothing to back up
     """
+    if _sqlite_backend():
+        # The SQLite store is transactional; export_workbook produces copies.
+        return None
     if not os.path.exists(filepath):
         logger.warning(f"File not found for backup: {filepath}")
         return None
 
     try:
-        # Create backups directory
-        backup_dir = os.path.join(os.path.dirname(filepath), "backups")
-        os.makedirs(backup_dir, exist_ok=True)
-
-        # Create backup filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.basename(filepath)
-        backup_path = os.path.join(backup_dir, f"{filename}.{timestamp}.bak")
-
-        # Copy file
-        shutil.copy2(filepath, backup_path)
-        logger.info(f"Backup created: {backup_path}")
-
-        return backup_path
+        return get_backup_manager().backup(filepath)
     except Exception as e:
         logger.error(f"Failed to create backup for {filepath}: {e}", exc_info=True)
         return None
@@ -256,13 +972,93 @@ def _ensure_headers(ws, headers, header_style=None):
 
 
 def _get_header_map(ws, header_row=1):
-    header_map = {}
-    max_col = ws.max_column if ws.max_column and ws.max_column > 0 else 0
-    for col in range(1, max_col + 1):
-        value = ws.cell(row=header_row, column=col).value
-        if value is not None and str(value).strip() != "":
-            header_map[str(value).strip()] = col
-    return header_map
+    """
+    Return the read-only {header: column} map of a header row.
+
+    The map is a SheetSchema from the schema registry: built once per snapshot
+    sheet (or per header row content for editable worksheets), with its alias
+    lookups memoized (see _find_header_column).
+    """
+    return sheet_schema(ws, header_row)
+
+
+# ── Column auto-width ────────────────────────────────────────────────────────
+#
+# Per-column max text lengths are stored in the workbook itself, as one custom
+# document property per sheet ("12,8,25,..."), so an append only compares the
+# newly written cells. The first save without stored lengths scans the sheet
+# once. Widths only grow, and edits made in Excel are not tracked.
+
+_COLUMN_WIDTHS_PROPERTY = "lahimena.col_widths.{}"
+# Excel limits custom property text to 255 characters
+_MAX_PROPERTY_LENGTH = 255
+
+
+def _stored_column_lengths(wb, ws):
+    name = _COLUMN_WIDTHS_PROPERTY.format(ws.title)
+    if name not in wb.custom_doc_props.names:
+        return None
+    try:
+        return [int(n) for n in wb.custom_doc_props[name].value.split(",") if n]
+    except (TypeError, ValueError):
+        return None
+
+
+def _store_column_lengths(wb, ws, lengths):
+    name = _COLUMN_WIDTHS_PROPERTY.format(ws.title)
+    value = ",".join(str(n) for n in lengths)
+    if name in wb.custom_doc_props.names:
+        if len(value) <= _MAX_PROPERTY_LENGTH:
+            wb.custom_doc_props[name].value = value
+        else:
+            wb.custom_doc_props.props = [
+                p for p in wb.custom_doc_props.props if p.name != name
+            ]
+    elif len(value) <= _MAX_PROPERTY_LENGTH:
+        wb.custom_doc_props.append(StringProperty(name=name, value=value))
+
+
+def _scan_column_lengths(ws, min_col, max_col, cap):
+    lengths = [0] * (max_col - min_col + 1)
+    for values in ws.iter_rows(min_col=min_col, max_col=max_col, values_only=True):
+        for offset, value in enumerate(values):
+            if value is not None:
+                lengths[offset] = max(lengths[offset], min(len(str(value)), cap))
+    return lengths
+
+
+def _autofit_columns(wb, ws, row_numbers, max_width=25):
+    """
+    Widen the columns of ws for the values written in row_numbers.
+
+    Column width is min(longest value + 2, max_width), as computed by the old
+    full-sheet loop, but only the given rows are read.
+    """
+    if _sqlite_backend():
+        # The SQLite store keeps values only; widths are not persisted.
+        return
+    max_col = ws.max_column
+    lengths = _stored_column_lengths(wb, ws)
+    if lengths is None:
+        lengths = _scan_column_lengths(ws, 1, max_col, max_width)
+    else:
+        lengths = lengths[:max_col]
+        if len(lengths) < max_col:
+            # New columns since the last save: scan those only
+            lengths += _scan_column_lengths(ws, len(lengths) + 1, max_col, max_width)
+        for row_idx in row_numbers:
+            for col_idx in range(1, max_col + 1):
+                value = ws.cell(row=row_idx, column=col_idx).value
+                if value is not None:
+                    length = min(len(str(value)), max_width)
+                    if length > lengths[col_idx - 1]:
+                        lengths[col_idx - 1] = length
+
+    for col_idx, length in enumerate(lengths, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(
+            length + 2, max_width
+        )
+    _store_column_lengths(wb, ws, lengths)
 
 
 def _iter_grouped_columns(ws, group_row=1, header_row=2):
@@ -280,6 +1076,13 @@ def _iter_grouped_columns(ws, group_row=1, header_row=2):
     return columns
 
 
+def _row_value(values, col):
+    """Return the value of a 1-based column in an iter_rows() tuple."""
+    if col and 0 < col <= len(values):
+        return values[col - 1]
+    return None
+
+
 def _first_available(data, keys, default=""):
     for key in keys:
         if key in data and data.get(key) not in (None, ""):
@@ -289,38 +1092,14 @@ def _first_available(data, keys, default=""):
 
 def _normalize_header_key(value):
     """Normalize header labels for resilient matching."""
-    if value is None:
-        return ""
-    normalized = str(value).strip().lower()
-    replacements = str.maketrans(
-        {
-            "é": "e",
-            "è": "e",
-            "ê": "e",
-            "ë": "e",
-            "à": "a",
-            "â": "a",
-            "ä": "a",
-            "î": "i",
-            "ï": "i",
-            "ô": "o",
-            "ö": "o",
-            "ù": "u",
-            "û": "u",
-            "ü": "u",
-            "ç": "c",
-            "'": " ",
-            "_": " ",
-            "-": " ",
-        }
-    )
-    normalized = normalized.translate(replacements)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    return normalized
+    return normalize_header_key(value)
 
 
 def _find_header_column(header_map, *aliases):
     """Find a header column using exact or normalized aliases."""
+    if isinstance(header_map, SheetSchema):
+        return header_map.column(*aliases)
+
     for alias in aliases:
         if alias in header_map:
             return header_map[alias]
@@ -387,17 +1166,25 @@ def save_client_to_excel(client_data):
         "alignment": Alignment(horizontal="center"),
     }
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
-        wb = Workbook()
-        ws = wb.active
-        ws.title = CLIENT_SHEET_NAME
+    # One load and one save for both the client row and its INFOS_CLIENTS row
+    with WorkbookSession(CLIENT_EXCEL_PATH, create=True) as session:
+        last_row = _write_client_row(session, client_data, client_headers, client_header_style)
+        # Also store extended infos in dedicated sheet
+        _save_client_infos_to_excel(client_data)
 
-        _ensure_headers(ws, client_headers, client_header_style)
+    # Invalidate cache after modification
+    invalidate_client_cache()
 
-        wb.save(CLIENT_EXCEL_PATH)
+    return last_row
+
+
+def _write_client_row(session, client_data, client_headers, client_header_style):
+    """Append one client row to the DEMANDE_CLIENT sheet of a session workbook."""
+    wb = session.wb
+    if session.created:
+        # Brand-new file: reuse the default sheet instead of leaving it empty
+        wb.active.title = CLIENT_SHEET_NAME
 
-    # Open existing file
-    wb = load_workbook(CLIENT_EXCEL_PATH)
     if CLIENT_SHEET_NAME not in wb.sheetnames:
         ws = wb.create_sheet(CLIENT_SHEET_NAME)
     else:
@@ -450,26 +1237,9 @@ def save_client_to_excel(client_data):
             )
 
     # Auto-adjust column widths
-    for col_idx in range(1, ws.max_column + 1):
-        max_length = 0
-        column_letter = get_column_letter(col_idx)
-        for row_idx in range(1, ws.max_row + 1):
-            value = ws.cell(row=row_idx, column=col_idx).value
-            if value is None:
-                continue
-            value_len = len(str(value))
-            if value_len > max_length:
-                max_length = value_len
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 25)
-
-    wb.save(CLIENT_EXCEL_PATH)
-
-    # Invalidate cache after modification
-    invalidate_client_cache()
-
-    # Also store extended infos in dedicated sheet
-    _save_client_infos_to_excel(client_data)
+    _autofit_columns(wb, ws, [last_row])
 
+    session.mark_dirty()
     return last_row
 
 
@@ -537,11 +1307,14 @@ def _save_client_infos_to_excel(client_data):
         "alignment": Alignment(horizontal="center"),
     }
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
-        wb = Workbook()
-        wb.save(CLIENT_EXCEL_PATH)
+    with WorkbookSession(CLIENT_EXCEL_PATH, create=True) as session:
+        _write_client_infos_row(session.wb, client_data, infos_headers, infos_header_style)
+        session.mark_dirty()
+    return True
 
-    wb = load_workbook(CLIENT_EXCEL_PATH)
+
+def _write_client_infos_row(wb, client_data, infos_headers, infos_header_style):
+    """Insert or update the INFOS_CLIENTS row of a client (matched by Réf. Client)."""
     if CLIENT_INFOS_SHEET_NAME not in wb.sheetnames:
         ws = wb.create_sheet(CLIENT_INFOS_SHEET_NAME)
     else:
@@ -635,15 +1408,12 @@ def _save_client_infos_to_excel(client_data):
                 value=_first_available(client_data, keys, ""),
             )
 
-    wb.save(CLIENT_EXCEL_PATH)
-    return True
-
 
-@cached_client_data(ttl_seconds=3600)  # Cache for 1 hour
+@cached_client_data(ttl_seconds=_WATCHED_CACHE_TTL_SECONDS)
 def load_all_clients():
     """
     Load all client data from Excel file
-    Results are cached for 1 hour
+    Results are cached until data.xlsx changes
 
     Returns:
         list: List of client dictionaries
@@ -652,38 +1422,38 @@ def load_all_clients():
         logger.warning("openpyxl not available. Cannot load from Excel.")
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
-    wb = load_workbook(CLIENT_EXCEL_PATH)
+    wb = _load_snapshot(CLIENT_EXCEL_PATH)
     if CLIENT_SHEET_NAME not in wb.sheetnames:
         return []
 
     ws = wb[CLIENT_SHEET_NAME]
-    header_map = _ensure_headers(ws, [])
+    header_map = _get_header_map(ws)
 
     clients = []
     infos_map = _load_client_infos_map()
     # Start from row 2 (skip headers)
-    for row in range(2, ws.max_row + 1):
-        if ws[f"A{row}"].value is None:
+    for row, values in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+        if _row_value(values, 1) is None:
             continue
 
-        def _cell(header, fallback_cell=None):
+        def _cell(header, fallback_col=None):
             col = header_map.get(header)
             if col:
-                return ws.cell(row=row, column=col).value
-            if fallback_cell:
-                return ws[fallback_cell].value
+                return _row_value(values, col)
+            if fallback_col:
+                return _row_value(values, column_index_from_string(fallback_col))
             return None
 
         client = {
             "row_number": row,
-            "timestamp": _cell("Date", f"A{row}") or "",
-            "ref_client": _cell("Réf. Client", f"B{row}") or "",
+            "timestamp": _cell("Date", "A") or "",
+            "ref_client": _cell("Réf. Client", "B") or "",
             "type_client": _cell("Type Client") or "",
             "prenom": _cell("Prénom") or "",
-            "nom": _cell("Nom", f"C{row}") or "",
+            "nom": _cell("Nom", "C") or "",
             "date_arrivee": _cell("Date Arrivée") or "",
             "date_depart": _cell("Date Départ") or "",
             "duree_sejour": _cell("Durée Séjour") or "",
@@ -691,17 +1461,17 @@ def load_all_clients():
             "nombre_adultes": _cell("Nombre Adultes") or "",
             "nombre_enfants_2_12": _cell("Enfants 2-12") or "",
             "nombre_bebes_0_2": _cell("Bébés 0-2") or "",
-            "telephone": _cell("Téléphone", f"D{row}") or "",
+            "telephone": _cell("Téléphone", "D") or "",
             "telephone_whatsapp": _cell("Téléphone WhatsApp") or "",
-            "email": _cell("Email", f"E{row}") or "",
-            "periode": _cell("Période", f"F{row}") or "",
-            "restauration": _cell("Restauration", f"G{row}") or "",
-            "hebergement": _cell("Hébergement", f"H{row}") or "",
-            "chambre": _cell("Chambre", f"I{row}") or "",
-            "enfant": _cell("Enfant", f"J{row}") or "",
-            "age_enfant": _cell("Âge Enfant", f"K{row}") or "",
-            "forfait": _cell("Forfait", f"L{row}") or "",
-            "circuit": _cell("Circuit", f"M{row}") or "",
+            "email": _cell("Email", "E") or "",
+            "periode": _cell("Période", "F") or "",
+            "restauration": _cell("Restauration", "G") or "",
+            "hebergement": _cell("Hébergement", "H") or "",
+            "chambre": _cell("Chambre", "I") or "",
+            "enfant": _cell("Enfant", "J") or "",
+            "age_enfant": _cell("Âge Enfant", "K") or "",
+            "forfait": _cell("Forfait", "L") or "",
+            "circuit": _cell("Circuit", "M") or "",
             "statut": _cell("Statut") or "En cours",
             "sgl_count": _cell("SGL") or "",
             "dbl_count": _cell("DBL") or "",
@@ -737,13 +1507,22 @@ def update_client_in_excel(row_number, client_data):
     # Create backup before modifying Excel file
     create_backup(CLIENT_EXCEL_PATH)
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return False
 
-    wb = load_workbook(CLIENT_EXCEL_PATH)
-    if CLIENT_SHEET_NAME not in wb.sheetnames:
-        return False
+    with WorkbookSession(CLIENT_EXCEL_PATH) as session:
+        if CLIENT_SHEET_NAME not in session.wb.sheetnames:
+            return False
+        _write_client_update(session.wb, row_number, client_data)
+        session.mark_dirty()
+        _save_client_infos_to_excel(client_data)
 
+    invalidate_client_cache()
+    return True
+
+
+def _write_client_update(wb, row_number, client_data):
+    """Overwrite one DEMANDE_CLIENT row of a session workbook."""
     ws = wb[CLIENT_SHEET_NAME]
     client_headers = [
         "Date",
@@ -826,11 +1605,6 @@ def update_client_in_excel(row_number, client_data):
                 value=_first_available(client_data, keys, ""),
             )
 
-    wb.save(CLIENT_EXCEL_PATH)
-    invalidate_client_cache()
-    _save_client_infos_to_excel(client_data)
-    return True
-
 
 def update_client_statut(row_number, new_statut):
     """
@@ -845,10 +1619,10 @@ def update_client_statut(row_number, new_statut):
     """
     if not OPENPYXL_AVAILABLE:
         return False
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return False
 
-    wb = load_workbook(CLIENT_EXCEL_PATH)
+    wb = _open_workbook(CLIENT_EXCEL_PATH)
     try:
         if CLIENT_SHEET_NAME not in wb.sheetnames:
             return False
@@ -884,7 +1658,7 @@ def update_client_statut(row_number, new_statut):
                         info_ws.cell(row=info_row, column=info_status_col, value=new_statut)
                         break
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         invalidate_client_cache()
         return True
     finally:
@@ -898,29 +1672,29 @@ def _load_client_infos_map():
     """Load extended client infos from INFOS_CLIENTS sheet by ref client"""
     if not OPENPYXL_AVAILABLE:
         return {}
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return {}
 
-    wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+    wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
     if CLIENT_INFOS_SHEET_NAME not in wb.sheetnames:
         return {}
 
     ws = wb[CLIENT_INFOS_SHEET_NAME]
-    header_map = _ensure_headers(ws, [])
+    header_map = _get_header_map(ws)
     infos_map = {}
 
-    def _cell(row, header, fallback_cell=None):
+    def _cell(values, header, fallback_col=None):
         col = header_map.get(header)
         if col:
-            return ws.cell(row=row, column=col).value
-        if fallback_cell:
-            return ws[fallback_cell].value
+            return _row_value(values, col)
+        if fallback_col:
+            return _row_value(values, column_index_from_string(fallback_col))
         return None
 
-    for row in range(2, ws.max_row + 1):
-        if ws[f"A{row}"].value is None:
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        if _row_value(row, 1) is None:
             continue
-        ref_client = _cell(row, "Réf. Client", f"B{row}") or ""
+        ref_client = _cell(row, "Réf. Client", "B") or ""
         if not ref_client:
             continue
         infos_map[ref_client] = {
@@ -971,10 +1745,10 @@ def delete_client_from_excel(row_number):
         logger.warning("openpyxl not available. Cannot delete from Excel.")
         return False
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return False
 
-    wb = load_workbook(CLIENT_EXCEL_PATH)
+    wb = _open_workbook(CLIENT_EXCEL_PATH)
     if CLIENT_SHEET_NAME not in wb.sheetnames:
         return False
 
@@ -983,31 +1757,159 @@ def delete_client_from_excel(row_number):
     # Delete row
     ws.delete_rows(row_number)
 
-    wb.save(CLIENT_EXCEL_PATH)
+    _save_workbook(wb, CLIENT_EXCEL_PATH)
     invalidate_client_cache()
     return True
 
 
-@cached_hotel_data(ttl_seconds=86400)  # Cache for 24 hours
+# ── Grouped hotel sheet ─────────────────────────────────────────────────────
+#
+# Two header rows: a group label (HOTEL, STANDARD, REPAS...) spanning its
+# columns on row 1, the column label on row 2. The labels are resolved once
+# per load into a plan of (value index, target dict, key, parser), so rows are
+# decoded without string handling or dispatch per cell.
+
+_HOTEL_GROUP_KEYS = {
+    "HOTEL": "hotel",
+    "STANDARD": "standard",
+    "BUNGALOWS": "bungalows",
+    "DE LUXE": "deluxe",
+    "SUITE": "suite",
+    "OPTIONS": "options",
+    "TAXE": "taxes",
+    "REPAS": "meals",
+    "AUTRES INFORMATIONS ET REMARQUES": "extras",
+}
+_HOTEL_ROOM_KEYS = {
+    "SPL": "single",
+    "DBL": "double",
+    "TWINS": "twin",
+    "FML": "familiale",
+    "TRIPLE": "triple",
+    "CHAMBRE CHAUFFEUR": "chauffeur",
+    "DORTOIR": "dortoir",
+    "SUPP": "supp",
+    "STUDIOS": "studios",
+    "VIP": "vip",
+}
+_HOTEL_FIELD_KEYS = {
+    "hotel": {
+        "VILLE": "lieu",
+        "HTL": "nom",
+        "CATÉGORIE": "_raw_category",
+        "CATEGORIE": "_raw_category",
+        "UNITÉ": "unite",
+        "UNITE": "unite",
+    },
+    "standard": _HOTEL_ROOM_KEYS,
+    "bungalows": _HOTEL_ROOM_KEYS,
+    "deluxe": _HOTEL_ROOM_KEYS,
+    "suite": _HOTEL_ROOM_KEYS,
+    "options": {"CH. EVASION": "ch_evasion", "MASSAGE": "massage"},
+    "taxes": {
+        "VIGNETTE": "vignette",
+        "TAXE DE SEJOUR": "taxe_sejour",
+        "TAXE DE SÉJOUR": "taxe_sejour",
+    },
+    "meals": {
+        "PDJ": "petit_dejeuner",
+        "DJ": "dejeuner",
+        "DR": "diner",
+        "REPAS GUIDE": "repas_guide",
+        "REPAS CHAUFFEUR": "repas_chauffeur",
+    },
+    "extras": {"INCLUE": "inclue", "SPA": "spa", "REMARQUES": "remarques"},
+}
+
+
+def _strip_text(value):
+    return str(value).strip()
+
+
+def _keep_value(value):
+    return value
+
+
+_HOTEL_GROUP_PARSERS = {"hotel": _strip_text, "extras": _keep_value}
+
+
+def _compile_grouped_hotel_plan(grouped_columns):
+    """
+    Resolve grouped hotel columns into [(value index, target, key, parser)].
+
+    target is "hotel" (the hotel dict itself), a room group of room_rates, or
+    options/taxes/meals/extras. Columns are kept in sheet order so a later
+    column still overrides an earlier one with the same key.
+    """
+    plan = []
+    for group, header, col in grouped_columns:
+        target = _HOTEL_GROUP_KEYS.get(str(group).strip().upper())
+        if not target:
+            continue
+        key = _HOTEL_FIELD_KEYS[target].get(str(header).strip().upper())
+        if not key:
+            continue
+        plan.append((col - 1, target, key, _HOTEL_GROUP_PARSERS.get(target, _parse_num)))
+    return plan
+
+
+# Client types read from the CATÉGORIE column of the grouped hotel format
+_HOTEL_CLIENT_TYPES = ("TO", "PBC", "TCO", "PCB", "DU")
+
+
+def _hotel_cache_tag(client_type=None):
+    """Cache tag of the load_all_hotels(client_type) entry ("hotels:*" for all types)."""
+    return f"hotels:{client_type or '*'}"
+
+
+def _hotel_row_type(ws, row):
+    """type_client that load_all_hotels gives the hotel at row of the hotel sheet."""
+    header_map_row1 = _get_header_map(ws, 1)
+    header_map_row2 = _get_header_map(ws, 2)
+    values = next(ws.iter_rows(min_row=row, max_row=row, values_only=True), ())
+    if "Ville" in header_map_row2 and "HTL" in header_map_row2 and "Ville" not in header_map_row1:
+        raw_category = ""
+        for index, _target, key, _parse in _compile_grouped_hotel_plan(
+            _iter_grouped_columns(ws, 1, 2)
+        ):
+            value = values[index] if index < len(values) else None
+            if key == "_raw_category" and value is not None and value != "":
+                raw_category = str(value).strip().upper()
+        return raw_category if raw_category in _HOTEL_CLIENT_TYPES else "TO"
+    col = header_map_row1.get("TYPE_CLIENT") or column_index_from_string("N")
+    return _row_value(values, col) or "TO"
+
+
+def _invalidate_hotel_types(*client_types):
+    """Drop the unfiltered load_all_hotels entry and those of client_types."""
+    for tag in {_hotel_cache_tag(), *(_hotel_cache_tag(t) for t in client_types)}:
+        invalidate_hotel_cache(tag=tag)
+
+
+@cached_hotel_data(
+    ttl_seconds=_WATCHED_CACHE_TTL_SECONDS,
+    tags=lambda client_type=None: (_hotel_cache_tag(client_type),),
+)
 def load_all_hotels(client_type=None):
     """
     Load all hotel data from Excel file
-    Results are cached for 24 hours
+    Results are cached until data-hotel.xlsx changes
 
     Args:
         client_type (str): Filter by client type ('TO' or 'PBC'), if None load all
 
     Returns:
-        list: List of hotel dictionaries
+        list: Hotels as read-only HotelRecord mappings (models.hotel_record);
+        use record.to_dict() for a mutable copy
     """
     if not OPENPYXL_AVAILABLE:
         logger.warning("openpyxl not available. Cannot load from Excel.")
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
-    wb = load_workbook(HOTEL_EXCEL_PATH, data_only=True)
+    wb = _load_snapshot(HOTEL_EXCEL_PATH, data_only=True)
     if HOTEL_SHEET_NAME not in wb.sheetnames:
         return []
 
@@ -1022,47 +1924,10 @@ def load_all_hotels(client_type=None):
 
     hotels = []
     if use_grouped_format:
-        grouped_columns = _iter_grouped_columns(ws, 1, 2)
-        group_key_map = {
-            "HOTEL": "hotel",
-            "STANDARD": "standard",
-            "BUNGALOWS": "bungalows",
-            "DE LUXE": "deluxe",
-            "SUITE": "suite",
-            "OPTIONS": "options",
-            "TAXE": "taxes",
-            "REPAS": "meals",
-            "AUTRES INFORMATIONS ET REMARQUES": "extras",
-        }
-        room_key_map = {
-            "SPL": "single",
-            "DBL": "double",
-            "TWINS": "twin",
-            "FML": "familiale",
-            "TRIPLE": "triple",
-            "CHAMBRE CHAUFFEUR": "chauffeur",
-            "DORTOIR": "dortoir",
-            "SUPP": "supp",
-            "STUDIOS": "studios",
-            "VIP": "vip",
-        }
-        options_key_map = {"CH. EVASION": "ch_evasion", "MASSAGE": "massage"}
-        taxes_key_map = {
-            "VIGNETTE": "vignette",
-            "TAXE DE SEJOUR": "taxe_sejour",
-            "TAXE DE SÉJOUR": "taxe_sejour",
-        }
-        meals_key_map = {
-            "PDJ": "petit_dejeuner",
-            "DJ": "dejeuner",
-            "DR": "diner",
-            "REPAS GUIDE": "repas_guide",
-            "REPAS CHAUFFEUR": "repas_chauffeur",
-        }
-        extras_key_map = {"INCLUE": "inclue", "SPA": "spa", "REMARQUES": "remarques"}
+        plan = _compile_grouped_hotel_plan(_iter_grouped_columns(ws, 1, 2))
 
-        for row in range(3, ws.max_row + 1):
-            if ws[f"A{row}"].value is None:
+        for row, values in enumerate(ws.iter_rows(min_row=3, values_only=True), start=3):
+            if _row_value(values, 1) is None:
                 continue
 
             hotel = {
@@ -1087,55 +1952,24 @@ def load_all_hotels(client_type=None):
                 "contact": "",
                 "email": "",
             }
+            targets = {
+                "hotel": hotel,
+                "options": hotel["options"],
+                "taxes": hotel["taxes"],
+                "meals": hotel["meals"],
+                "extras": hotel["extras"],
+                **hotel["room_rates"],
+            }
 
-            raw_category = ""
-
-            for group, header, col in grouped_columns:
-                group_key = group_key_map.get(str(group).strip().upper())
-                if not group_key:
-                    continue
-                value = ws.cell(row=row, column=col).value
+            for index, target, key, parse in plan:
+                value = values[index] if index < len(values) else None
                 if value is None or value == "":
                     continue
+                targets[target][key] = parse(value)
 
-                header_norm = str(header).strip()
-                header_norm_upper = header_norm.upper()
-
-                if group_key == "hotel":
-                    if header_norm_upper == "VILLE":
-                        hotel["lieu"] = str(value).strip()
-                    elif header_norm_upper == "HTL":
-                        hotel["nom"] = str(value).strip()
-                    elif (
-                        header_norm_upper == "CATÉGORIE"
-                        or header_norm_upper == "CATEGORIE"
-                    ):
-                        raw_category = str(value).strip()
-                    elif header_norm_upper == "UNITÉ" or header_norm_upper == "UNITE":
-                        hotel["unite"] = str(value).strip()
-                elif group_key in ("standard", "bungalows", "deluxe", "suite"):
-                    room_key = room_key_map.get(header_norm_upper)
-                    if room_key:
-                        hotel["room_rates"][group_key][room_key] = _parse_num(value)
-                elif group_key == "options":
-                    opt_key = options_key_map.get(header_norm_upper)
-                    if opt_key:
-                        hotel["options"][opt_key] = _parse_num(value)
-                elif group_key == "taxes":
-                    tax_key = taxes_key_map.get(header_norm_upper)
-                    if tax_key:
-                        hotel["taxes"][tax_key] = _parse_num(value)
-                elif group_key == "meals":
-                    meal_key = meals_key_map.get(header_norm_upper)
-                    if meal_key:
-                        hotel["meals"][meal_key] = _parse_num(value)
-                elif group_key == "extras":
-                    extra_key = extras_key_map.get(header_norm_upper)
-                    if extra_key:
-                        hotel["extras"][extra_key] = value
-
+            raw_category = hotel.pop("_raw_category", "")
             raw_category_norm = raw_category.strip().upper()
-            if raw_category_norm in ("TO", "PBC", "TCO", "PCB", "DU"):
+            if raw_category_norm in _HOTEL_CLIENT_TYPES:
                 hotel["type_client"] = raw_category_norm
                 hotel["categorie"] = raw_category_norm
             else:
@@ -1179,35 +2013,35 @@ def load_all_hotels(client_type=None):
             ):
                 continue
 
-            hotels.append(hotel)
+            hotels.append(HotelRecord(hotel))
     else:
-        header_map = _ensure_headers(ws, [])
+        header_map = _get_header_map(ws)
         # Start from row 2 (skip headers)
-        for row in range(2, ws.max_row + 1):
-            if ws[f"A{row}"].value is None:
+        for row, values in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+            if _row_value(values, 1) is None:
                 continue
 
-            def _cell(header, fallback_cell=None):
+            def _cell(header, fallback_col=None):
                 col = header_map.get(header)
                 if col:
-                    return ws.cell(row=row, column=col).value
-                if fallback_cell:
-                    return ws[fallback_cell].value
+                    return _row_value(values, col)
+                if fallback_col:
+                    return _row_value(values, column_index_from_string(fallback_col))
                 return None
 
             hotel = {
                 "row_number": row,
                 "id": _cell("ID")
-                or f"{_cell('Ville', f'A{row}')}_{_cell('HTL', f'B{row}')}",
-                "nom": _cell("HTL", f"B{row}") or "",
-                "lieu": _cell("Ville", f"A{row}") or "",
+                or f"{_cell('Ville', 'A')}_{_cell('HTL', 'B')}",
+                "nom": _cell("HTL", "B") or "",
+                "lieu": _cell("Ville", "A") or "",
                 "type_hebergement": _cell("TYPE_HEBERGEMENT") or "Hôtel",
-                "categorie": _cell("CATÉGORIE", f"C{row}") or "",
-                "type_client": _cell("TYPE_CLIENT", f"N{row}") or "TO",
-                "chambre_single": _parse_num(_cell("SPL", f"E{row}")),
-                "chambre_double": _parse_num(_cell("DBL", f"F{row}")),
-                "chambre_familiale": _parse_num(_cell("FML", f"H{row}")),
-                "lit_supp": _parse_num(_cell("SUPP", f"I{row}")),
+                "categorie": _cell("CATÉGORIE", "C") or "",
+                "type_client": _cell("TYPE_CLIENT", "N") or "TO",
+                "chambre_single": _parse_num(_cell("SPL", "E")),
+                "chambre_double": _parse_num(_cell("DBL", "F")),
+                "chambre_familiale": _parse_num(_cell("FML", "H")),
+                "lit_supp": _parse_num(_cell("SUPP", "I")),
                 "day_use": (
                     _parse_num(_cell("DAY_USE")) if _cell("DAY_USE") is not None else 0
                 ),
@@ -1221,26 +2055,26 @@ def load_all_hotels(client_type=None):
                     if _cell("TAXE_SEJOUR") is not None
                     else 0
                 ),
-                "petit_dejeuner": _parse_num(_cell("PDJ", f"K{row}")),
-                "dejeuner": _parse_num(_cell("DJ", f"L{row}")),
-                "diner": _parse_num(_cell("DR", f"M{row}")),
+                "petit_dejeuner": _parse_num(_cell("PDJ", "K")),
+                "dejeuner": _parse_num(_cell("DJ", "L")),
+                "diner": _parse_num(_cell("DR", "M")),
                 "description": _cell("DESCRIPTION")
-                or f"Unité: {_cell('UNITÉ', f'D{row}') or ''}, Suite: {_cell('SUITE', f'J{row}') or ''}",
+                or f"Unité: {_cell('UNITÉ', 'D') or ''}, Suite: {_cell('SUITE', 'J') or ''}",
                 "contact": _cell("CONTACT") or "",
                 "email": _cell("EMAIL") or "",
                 "room_rates": {
                     "standard": {
-                        "single": _parse_num(_cell("SPL", f"E{row}")),
-                        "double": _parse_num(_cell("DBL", f"F{row}")),
-                        "twin": _parse_num(_cell("DBL", f"F{row}")),
-                        "familiale": _parse_num(_cell("FML", f"H{row}")),
-                        "supp": _parse_num(_cell("SUPP", f"I{row}")),
+                        "single": _parse_num(_cell("SPL", "E")),
+                        "double": _parse_num(_cell("DBL", "F")),
+                        "twin": _parse_num(_cell("DBL", "F")),
+                        "familiale": _parse_num(_cell("FML", "H")),
+                        "supp": _parse_num(_cell("SUPP", "I")),
                     }
                 },
                 "meals": {
-                    "petit_dejeuner": _parse_num(_cell("PDJ", f"K{row}")),
-                    "dejeuner": _parse_num(_cell("DJ", f"L{row}")),
-                    "diner": _parse_num(_cell("DR", f"M{row}")),
+                    "petit_dejeuner": _parse_num(_cell("PDJ", "K")),
+                    "dejeuner": _parse_num(_cell("DJ", "L")),
+                    "diner": _parse_num(_cell("DR", "M")),
                 },
                 "options": {},
                 "taxes": {},
@@ -1251,53 +2085,36 @@ def load_all_hotels(client_type=None):
             if client_type and hotel["type_client"] != client_type:
                 continue
 
-            hotels.append(hotel)
+            hotels.append(HotelRecord(hotel))
 
     return hotels
 
 
-def load_circuit_catalog():
-    """
-    Load circuit catalog from the Circuits sheet in data-hotel.xlsx.
-
-    Returns:
-        list[dict]: List of normalized circuit dictionaries
-    """
-    if not OPENPYXL_AVAILABLE:
-        logger.warning("openpyxl not available. Cannot load circuits from Excel.")
-        return []
-
-    if not os.path.exists(HOTEL_EXCEL_PATH):
-        return []
-
-    wb = load_workbook(HOTEL_EXCEL_PATH, data_only=True)
-    if "Circuits" not in wb.sheetnames:
-        return []
-
-    ws = wb["Circuits"]
-    header_map = _get_header_map(ws, 1)
+_CIRCUIT_DEFAULT_HEADERS = [
+    "ID circuit",
+    "Nom du circuit",
+    "itinéraire",
+    "Villes parcourues",
+    "Activité",
+    "Durée",
+    "condition physique",
+    "Type de voiture",
+    "Hôtels défaut par ville",
+    "Prestations incluses",
+    "Transports associés",
+]
 
-    id_col = _find_header_column(header_map, "ID circuit", "ID", "Id")
-    name_col = _find_header_column(
-        header_map, "Nom du circuit", "Nom", "Circuit", "Type Circuit"
-    )
-    itinerary_col = _find_header_column(
-        header_map, "itinéraire", "itineraire", "Itinéraire"
-    )
-    cities_col = _find_header_column(
-        header_map,
-        "Villes parcourues",
-        "Villes du circuit",
-        "Villes",
-    )
-    activity_col = _find_header_column(header_map, "Activité", "Activite")
-    duration_col = _find_header_column(header_map, "Durée", "Duree")
-    fitness_col = _find_header_column(
-        header_map, "condition physique", "Condition Physique"
-    )
-    vehicle_col = _find_header_column(header_map, "Type de voiture", "Voiture")
-    default_hotels_col = _find_header_column(
-        header_map,
+# Column plans (see utils.sheet_schema): {field: accepted header labels}
+_CIRCUIT_COLUMNS = {
+    "id": ("ID circuit", "ID", "Id"),
+    "name": ("Nom du circuit", "Nom", "Circuit", "Type Circuit"),
+    "itinerary": ("itinéraire", "itineraire", "Itinéraire"),
+    "cities": ("Villes parcourues", "Villes du circuit", "Villes"),
+    "activity": ("Activité", "Activite"),
+    "duration": ("Durée", "Duree"),
+    "fitness": ("condition physique", "Condition Physique"),
+    "vehicle": ("Type de voiture", "Voiture"),
+    "default_hotels": (
         "Hôtels défaut par ville",
         "Hotels defaut par ville",
         "Hôtels par défaut par ville",
@@ -1308,92 +2125,86 @@ def load_circuit_catalog():
         "Hotels defaut",
         "Hôtels défaut circuit",
         "Hotels defaut circuit",
-    )
-    included_services_col = _find_header_column(
-        header_map,
+    ),
+    "included_services": (
         "Prestations incluses",
         "Prestations incluses circuit",
         "Prestations circuit",
-    )
-    linked_transports_col = _find_header_column(
-        header_map,
+    ),
+    "linked_transports": (
         "Transports associés",
         "Transports associes",
         "Transports associés circuit",
         "Transports associes circuit",
         "Transport associé",
         "Transport associe",
-    )
+    ),
+}
+
+
+def load_circuit_catalog():
+    """
+    Load circuit catalog from the Circuits sheet in data-hotel.xlsx.
+
+    Returns:
+        list[dict]: List of normalized circuit dictionaries
+    """
+    if not OPENPYXL_AVAILABLE:
+        logger.warning("openpyxl not available. Cannot load circuits from Excel.")
+        return []
+
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
+        return []
+
+    wb = _load_snapshot(HOTEL_EXCEL_PATH, data_only=True)
+    if "Circuits" not in wb.sheetnames:
+        return []
+
+    ws = wb["Circuits"]
+    header_map = _get_header_map(ws, 1)
+
+    columns = header_map.plan(_CIRCUIT_COLUMNS)
+    id_col = columns["id"]
+    name_col = columns["name"]
+    itinerary_col = columns["itinerary"]
+    cities_col = columns["cities"]
+    activity_col = columns["activity"]
+    duration_col = columns["duration"]
+    fitness_col = columns["fitness"]
+    vehicle_col = columns["vehicle"]
+    default_hotels_col = columns["default_hotels"]
+    included_services_col = columns["included_services"]
+    linked_transports_col = columns["linked_transports"]
 
     if not name_col:
         return []
 
+    def _text(values, col):
+        value = _row_value(values, col)
+        return str(value).strip() if value is not None else ""
+
     circuits = []
     seen_names = set()
-    for row in range(2, ws.max_row + 1):
-        raw_name = ws.cell(row=row, column=name_col).value
-        if raw_name is None or str(raw_name).strip() == "":
+    for values in ws.iter_rows(min_row=2, values_only=True):
+        name = _text(values, name_col)
+        if not name:
             continue
-        name = str(raw_name).strip()
         if name in seen_names:
             continue
         seen_names.add(name)
 
-        itinerary = (
-            str(ws.cell(row=row, column=itinerary_col).value).strip()
-            if itinerary_col and ws.cell(row=row, column=itinerary_col).value is not None
-            else ""
-        )
-        cities = (
-            str(ws.cell(row=row, column=cities_col).value).strip()
-            if cities_col and ws.cell(row=row, column=cities_col).value is not None
-            else ""
-        )
+        itinerary = _text(values, itinerary_col)
+        cities = _text(values, cities_col)
         if not itinerary and cities:
             itinerary = cities
-        activity = (
-            str(ws.cell(row=row, column=activity_col).value).strip()
-            if activity_col and ws.cell(row=row, column=activity_col).value is not None
-            else ""
-        )
-        duration = (
-            str(ws.cell(row=row, column=duration_col).value).strip()
-            if duration_col and ws.cell(row=row, column=duration_col).value is not None
-            else ""
-        )
-        fitness = (
-            str(ws.cell(row=row, column=fitness_col).value).strip()
-            if fitness_col and ws.cell(row=row, column=fitness_col).value is not None
-            else ""
-        )
-        vehicle = (
-            str(ws.cell(row=row, column=vehicle_col).value).strip()
-            if vehicle_col and ws.cell(row=row, column=vehicle_col).value is not None
-            else ""
-        )
-        circuit_id = (
-            str(ws.cell(row=row, column=id_col).value).strip()
-            if id_col and ws.cell(row=row, column=id_col).value is not None
-            else ""
-        )
-        default_hotels = (
-            str(ws.cell(row=row, column=default_hotels_col).value).strip()
-            if default_hotels_col
-            and ws.cell(row=row, column=default_hotels_col).value is not None
-            else ""
-        )
-        included_services = (
-            str(ws.cell(row=row, column=included_services_col).value).strip()
-            if included_services_col
-            and ws.cell(row=row, column=included_services_col).value is not None
-            else ""
-        )
-        linked_transports = (
-            str(ws.cell(row=row, column=linked_transports_col).value).strip()
-            if linked_transports_col
-            and ws.cell(row=row, column=linked_transports_col).value is not None
-            else ""
-        )
+        activity = _text(values, activity_col)
+        duration = _text(values, duration_col)
+        fitness = _text(values, fitness_col)
+        vehicle = _text(values, vehicle_col)
+        circuit_id = _text(values, id_col)
+        default_hotels = _text(values, default_hotels_col)
+        included_services = _text(values, included_services_col)
+        linked_transports = _text(values, linked_transports_col)
 
         circuits.append(
             {
@@ -1425,45 +2236,29 @@ def load_all_circuits():
 
 
 def get_circuit_db_headers():
-    """Load header list from data-hotel.xlsx / Circuits."""
+    """
+    Load header list from data-hotel.xlsx / Circuits.
+
+    Default columns missing from the sheet are listed too; they are written by
+    migrate_workbook_schemas() or by the next circuit save.
+    """
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
-        if "Circuits" not in wb.sheetnames:
+        ws = _load_header_sheet(HOTEL_EXCEL_PATH, "Circuits")
+        if ws is None:
             return []
 
-        ws = wb["Circuits"]
-        default_headers = [
-            "ID circuit",
-            "Nom du circuit",
-            "itinéraire",
-            "Villes parcourues",
-            "Activité",
-            "Durée",
-            "condition physique",
-            "Type de voiture",
-            "Hôtels défaut par ville",
-            "Prestations incluses",
-            "Transports associés",
-        ]
-        header_map = _ensure_headers(ws, default_headers)
-        wb.save(HOTEL_EXCEL_PATH)
-        return list(header_map.keys())
+        headers = list(dict.fromkeys(_header_labels(ws)))
+        headers += [h for h in _CIRCUIT_DEFAULT_HEADERS if h not in headers]
+        return headers
     except Exception as e:
         logger.error(f"Failed to load circuit DB headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def load_circuit_db_rows():
@@ -1471,12 +2266,12 @@ def load_circuit_db_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         if "Circuits" not in wb.sheetnames:
             return []
 
@@ -1517,31 +2312,18 @@ def save_circuit_db_row(row_data):
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = "Circuits"
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
             if "Circuits" not in wb.sheetnames:
                 ws = wb.create_sheet("Circuits")
             else:
                 ws = wb["Circuits"]
 
-        default_headers = [
-            "ID circuit",
-            "Nom du circuit",
-            "itinéraire",
-            "Villes parcourues",
-            "Activité",
-            "Durée",
-            "condition physique",
-            "Type de voiture",
-            "Hôtels défaut par ville",
-            "Prestations incluses",
-            "Transports associés",
-        ]
-        header_map = _ensure_headers(ws, default_headers)
+        header_map = _ensure_headers(ws, _CIRCUIT_DEFAULT_HEADERS)
         if row_data:
             header_map = _ensure_headers(ws, list(row_data.keys()))
         if not header_map:
@@ -1561,7 +2343,7 @@ def save_circuit_db_row(row_data):
         for header, col in header_map.items():
             ws.cell(row=next_row, column=col, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         return next_row
     except PermissionError:
         return -2
@@ -1581,12 +2363,12 @@ def update_circuit_db_row(row_number, row_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if "Circuits" not in wb.sheetnames:
             return -1
 
@@ -1598,7 +2380,7 @@ def update_circuit_db_row(row_number, row_data):
         for header, col in header_map.items():
             ws.cell(row=row_number, column=col, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         return 0
     except PermissionError:
         return -2
@@ -1618,18 +2400,18 @@ def delete_circuit_db_row(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if "Circuits" not in wb.sheetnames:
             return False
 
         ws = wb["Circuits"]
         ws.delete_rows(row_number)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         return True
     except Exception as e:
         logger.error(f"Failed to delete circuit DB row {row_number}: {e}", exc_info=True)
@@ -1691,20 +2473,20 @@ def save_hotel_to_excel(hotel_data):
         "alignment": Alignment(horizontal="center"),
     }
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         wb = Workbook()
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
 
     # Open existing file
-    wb = load_workbook(HOTEL_EXCEL_PATH)
+    wb = _open_workbook(HOTEL_EXCEL_PATH)
 
     if HOTEL_SHEET_NAME not in wb.sheetnames:
         ws = wb.create_sheet(HOTEL_SHEET_NAME)
         _ensure_headers(ws, hotel_headers, hotel_header_style)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
 
     # Open existing file again
-    wb = load_workbook(HOTEL_EXCEL_PATH)
+    wb = _open_workbook(HOTEL_EXCEL_PATH)
     ws = wb[HOTEL_SHEET_NAME]
 
     header_map_row1 = _get_header_map(ws, 1)
@@ -1824,20 +2606,12 @@ def save_hotel_to_excel(hotel_data):
                 ws.cell(row=last_row, column=col, value=value)
 
     # Auto-adjust column widths
-    for col_idx in range(1, ws.max_column + 1):
-        max_length = 0
-        column_letter = get_column_letter(col_idx)
-        for row_idx in range(1, ws.max_row + 1):
-            value = ws.cell(row=row_idx, column=col_idx).value
-            if value is None:
-                continue
-            value_len = len(str(value))
-            if value_len > max_length:
-                max_length = value_len
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 25)
+    _autofit_columns(wb, ws, [last_row])
 
-    wb.save(HOTEL_EXCEL_PATH)
-    invalidate_hotel_cache()
+    client_type = _hotel_row_type(ws, last_row)
+    _save_workbook(wb, HOTEL_EXCEL_PATH)
+    # An appended hotel only shows up in the lists of its own client type
+    _invalidate_hotel_types(client_type)
     return last_row
 
 
@@ -1859,14 +2633,15 @@ def update_hotel_in_excel(row_number, hotel_data):
     # Create backup before modifying Excel file
     create_backup(HOTEL_EXCEL_PATH)
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
-    wb = load_workbook(HOTEL_EXCEL_PATH)
+    wb = _open_workbook(HOTEL_EXCEL_PATH)
     if HOTEL_SHEET_NAME not in wb.sheetnames:
         return False
 
     ws = wb[HOTEL_SHEET_NAME]
+    previous_type = _hotel_row_type(ws, row_number)
     header_map_row1 = _get_header_map(ws, 1)
     header_map_row2 = _get_header_map(ws, 2)
     use_grouped_format = (
@@ -1998,8 +2773,9 @@ def update_hotel_in_excel(row_number, hotel_data):
                     value = "MGA"
                 ws.cell(row=row_number, column=col, value=value)
 
-    wb.save(HOTEL_EXCEL_PATH)
-    invalidate_hotel_cache()
+    client_type = _hotel_row_type(ws, row_number)
+    _save_workbook(wb, HOTEL_EXCEL_PATH)
+    _invalidate_hotel_types(previous_type, client_type)
     return True
 
 
@@ -2017,10 +2793,10 @@ def delete_hotel_from_excel(row_number):
         logger.warning("openpyxl not available. Cannot delete from Excel.")
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
-    wb = load_workbook(HOTEL_EXCEL_PATH)
+    wb = _open_workbook(HOTEL_EXCEL_PATH)
     if HOTEL_SHEET_NAME not in wb.sheetnames:
         return False
 
@@ -2029,7 +2805,8 @@ def delete_hotel_from_excel(row_number):
     # Delete row
     ws.delete_rows(row_number)
 
-    wb.save(HOTEL_EXCEL_PATH)
+    _save_workbook(wb, HOTEL_EXCEL_PATH)
+    # The hotels below are renumbered: every list holds stale row numbers
     invalidate_hotel_cache()
     return True
 
@@ -2045,34 +2822,17 @@ def get_collective_expense_headers():
         logger.warning("openpyxl not available. Cannot load collective headers.")
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
-        if COTATION_FRAIS_COL_SHEET_NAME not in wb.sheetnames:
+        ws = _load_header_sheet(CLIENT_EXCEL_PATH, COTATION_FRAIS_COL_SHEET_NAME)
+        if ws is None:
             return []
-
-        ws = wb[COTATION_FRAIS_COL_SHEET_NAME]
-        headers = []
-        for col in range(1, ws.max_column + 1):
-            value = ws.cell(row=1, column=col).value
-            if value is None:
-                continue
-            label = str(value).strip()
-            if label:
-                headers.append(label)
-        return headers
+        return _header_labels(ws)
     except Exception as e:
         logger.error(f"Failed to load collective expense headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def save_collective_expense_quotation_to_excel(form_data):
@@ -2093,12 +2853,12 @@ def save_collective_expense_quotation_to_excel(form_data):
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = COTATION_FRAIS_COL_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if COTATION_FRAIS_COL_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(COTATION_FRAIS_COL_SHEET_NAME)
             else:
@@ -2147,7 +2907,7 @@ def save_collective_expense_quotation_to_excel(form_data):
                 min(40, len(str(ws.cell(row=1, column=col).value or "")) + 4),
             )
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(
             f"Collective expense quotation saved to row {next_row} in {COTATION_FRAIS_COL_SHEET_NAME}"
         )
@@ -2183,12 +2943,12 @@ def load_all_collective_expense_quotations():
         )
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH)
         if COTATION_FRAIS_COL_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -2254,12 +3014,12 @@ def save_hotel_quotation_to_excel(quotation_data):
 
     try:
         # Create or load the file
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = COTATION_H_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if COTATION_H_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(COTATION_H_SHEET_NAME)
             else:
@@ -2325,6 +3085,12 @@ def save_hotel_quotation_to_excel(quotation_data):
             col_idx = header_map.get(header)
             if col_idx:
                 ws.cell(row=next_row, column=col_idx, value=value)
+        _record_client_rows(
+            ws,
+            header_map.get("ID_Client"),
+            index_key(row_values["ID_Client"]),
+            [next_row],
+        )
 
         # Adjust column widths
         ws.column_dimensions["A"].width = 16
@@ -2342,7 +3108,7 @@ def save_hotel_quotation_to_excel(quotation_data):
         ws.column_dimensions["M"].width = 14
         ws.column_dimensions["N"].width = 10
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(f"Quotation saved to row {next_row} in {COTATION_H_SHEET_NAME}")
         return next_row
 
@@ -2351,18 +3117,65 @@ def save_hotel_quotation_to_excel(quotation_data):
         return -1
 
 
+def _compact_rows(ws, row_numbers):
+    """
+    Supprime un ensemble de lignes en une seule passe.
+
+    Équivalent à ws.delete_rows(r, 1) pour chaque ligne (de bas en haut), mais
+    la zone de données est reconstruite une seule fois : chaque cellule est
+    supprimée ou remontée du nombre de lignes supprimées au-dessus d'elle, au
+    lieu de décaler toute la feuille à chaque ligne.
+
+    Returns:
+        int: Nombre de lignes supprimées
+    """
+    max_row = ws.max_row
+    deleted_rows = sorted({row for row in row_numbers if 1 <= row <= max_row})
+    if not deleted_rows:
+        return 0
+    deleted = set(deleted_rows)
+    first = deleted_rows[0]
+
+    cells = {}
+    for (row, col), cell in ws._cells.items():
+        if row < first:
+            cells[row, col] = cell
+        elif row not in deleted:
+            new_row = row - bisect_left(deleted_rows, row)
+            cell.row = new_row
+            cells[new_row, col] = cell
+    ws._cells = cells
+    ws._current_row = ws.max_row if cells else 0
+    return len(deleted_rows)
+
+
 def _delete_rows_for_client(ws, id_col_idx: int, client_ref: str):
-    """Supprime toutes les lignes (hors en-tête) correspondant à client_ref."""
+    """
+    Supprime toutes les lignes (hors en-tête) correspondant à client_ref.
+
+    Les lignes sont trouvées via l'index ID_Client → lignes de la feuille ;
+    un client_ref vide (lignes sans ID, non indexées) balaie la colonne.
+    """
     if not client_ref:
-        return
-    to_delete = []
-    for row_idx in range(2, ws.max_row + 1):
-        cell_val = str(ws.cell(row=row_idx, column=id_col_idx).value or "").strip()
-        if cell_val == client_ref:
-            to_delete.append(row_idx)
-    # Supprimer de bas en haut pour ne pas décaler les indices
-    for row_idx in reversed(to_delete):
-        ws.delete_rows(row_idx, 1)
+        to_delete = [
+            row_idx
+            for row_idx in range(2, ws.max_row + 1)
+            if not index_key(ws.cell(row=row_idx, column=id_col_idx).value)
+        ]
+    else:
+        to_delete = _editable_row_index(ws, id_col_idx).get(client_ref, [])
+        if any(
+            row_idx > ws.max_row
+            or index_key(ws.cell(row=row_idx, column=id_col_idx).value) != client_ref
+            for row_idx in to_delete
+        ):
+            # Feuille modifiée hors index : on reconstruit
+            to_delete = _editable_row_index(ws, id_col_idx, rebuild=True).get(
+                client_ref, []
+            )
+        to_delete = list(to_delete)
+    _compact_rows(ws, to_delete)
+    _shift_row_indexes(ws, to_delete)
 
 
 def _ensure_client_billing_sheet(wb, sheet_name, headers):
@@ -2393,8 +3206,8 @@ def save_active_client_quote_to_excel(client: dict, quote_document: dict) -> int
     wb = None
     try:
         wb = (
-            load_workbook(CLIENT_EXCEL_PATH)
-            if os.path.exists(CLIENT_EXCEL_PATH)
+            _open_workbook(CLIENT_EXCEL_PATH)
+            if _workbook_exists(CLIENT_EXCEL_PATH)
             else Workbook()
         )
         ws = _ensure_client_billing_sheet(
@@ -2410,6 +3223,7 @@ def save_active_client_quote_to_excel(client: dict, quote_document: dict) -> int
 
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         saved = 0
+        first_row = ws.max_row + 1
         for line in lines:
             row_idx = ws.max_row + 1
             values = {
@@ -2442,8 +3256,8 @@ def save_active_client_quote_to_excel(client: dict, quote_document: dict) -> int
                     ws.cell(row=row_idx, column=col, value=value)
             saved += 1
 
-        wb.save(CLIENT_EXCEL_PATH)
-        invalidate_client_cache()
+        _record_client_rows(ws, id_col_idx, client_ref, range(first_row, ws.max_row + 1))
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return saved
     except PermissionError:
         return -2
@@ -2460,7 +3274,7 @@ def save_active_client_quote_to_excel(client: dict, quote_document: dict) -> int
 
 def load_active_client_quote_from_excel(client: dict) -> dict:
     """Load the one active quote document for a client."""
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return {}
 
     client_ref = str(client.get("ref_client") or "").strip()
@@ -2469,7 +3283,7 @@ def load_active_client_quote_from_excel(client: dict) -> dict:
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
         if CLIENT_ACTIVE_QUOTE_SHEET_NAME not in wb.sheetnames:
             return {}
         ws = wb[CLIENT_ACTIVE_QUOTE_SHEET_NAME]
@@ -2480,13 +3294,11 @@ def load_active_client_quote_from_excel(client: dict) -> dict:
 
         lines = []
         document = {}
-        for row_idx in range(2, ws.max_row + 1):
-            if str(ws.cell(row=row_idx, column=id_col).value or "").strip() != client_ref:
-                continue
+        for values in ws.rows_for(id_col, client_ref):
 
             def _get(header, default=""):
                 col = header_map.get(header)
-                return ws.cell(row=row_idx, column=col).value if col else default
+                return _row_value(values, col) if col else default
 
             if not document:
                 document = {
@@ -2536,8 +3348,8 @@ def save_active_client_invoice_to_excel(client: dict, invoice_document: dict) ->
     wb = None
     try:
         wb = (
-            load_workbook(CLIENT_EXCEL_PATH)
-            if os.path.exists(CLIENT_EXCEL_PATH)
+            _open_workbook(CLIENT_EXCEL_PATH)
+            if _workbook_exists(CLIENT_EXCEL_PATH)
             else Workbook()
         )
         ws = _ensure_client_billing_sheet(
@@ -2553,6 +3365,7 @@ def save_active_client_invoice_to_excel(client: dict, invoice_document: dict) ->
 
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         saved = 0
+        first_row = ws.max_row + 1
         for line in lines:
             row_idx = ws.max_row + 1
             values = {
@@ -2579,8 +3392,8 @@ def save_active_client_invoice_to_excel(client: dict, invoice_document: dict) ->
                     ws.cell(row=row_idx, column=col, value=value)
             saved += 1
 
-        wb.save(CLIENT_EXCEL_PATH)
-        invalidate_client_cache()
+        _record_client_rows(ws, id_col_idx, client_ref, range(first_row, ws.max_row + 1))
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return saved
     except PermissionError:
         return -2
@@ -2597,7 +3410,7 @@ def save_active_client_invoice_to_excel(client: dict, invoice_document: dict) ->
 
 def load_active_client_invoice_from_excel(client: dict) -> dict:
     """Load the one active invoice document for a client."""
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return {}
 
     client_ref = str(client.get("ref_client") or "").strip()
@@ -2606,7 +3419,7 @@ def load_active_client_invoice_from_excel(client: dict) -> dict:
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
         if CLIENT_ACTIVE_INVOICE_SHEET_NAME not in wb.sheetnames:
             return {}
         ws = wb[CLIENT_ACTIVE_INVOICE_SHEET_NAME]
@@ -2617,13 +3430,11 @@ def load_active_client_invoice_from_excel(client: dict) -> dict:
 
         lines = []
         document = {}
-        for row_idx in range(2, ws.max_row + 1):
-            if str(ws.cell(row=row_idx, column=id_col).value or "").strip() != client_ref:
-                continue
+        for values in ws.rows_for(id_col, client_ref):
 
             def _get(header, default=""):
                 col = header_map.get(header)
-                return ws.cell(row=row_idx, column=col).value if col else default
+                return _row_value(values, col) if col else default
 
             if not document:
                 document = {
@@ -2665,7 +3476,7 @@ def load_client_hotel_cotation(client: dict) -> list:
     Returns:
         list: row dicts compatibles avec ClientHotelCotation._rows, ou [] si rien.
     """
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     client_ref = str(client.get("ref_client") or "").strip()
@@ -2674,7 +3485,7 @@ def load_client_hotel_cotation(client: dict) -> list:
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
         if COTATION_H_SHEET_NAME not in wb.sheetnames:
             return []
         ws = wb[COTATION_H_SHEET_NAME]
@@ -2693,21 +3504,19 @@ def load_client_hotel_cotation(client: dict) -> list:
         ]
 
         results = []
-        for row_idx in range(2, ws.max_row + 1):
-            if str(ws.cell(row=row_idx, column=id_col).value or "").strip() != client_ref:
-                continue
+        for values in ws.rows_for(id_col, client_ref):
 
             def _get(col_name, default=""):
                 idx = header_map.get(col_name)
-                return ws.cell(row=row_idx, column=idx).value if idx else default
+                return _row_value(values, idx) if idx else default
 
             # Reconstruct room_prices
             room_prices = {}
             for rk, lbl in _ROOM_MAP:
                 nb_idx    = header_map.get(f"{lbl}_Nb")
                 prix_idx  = header_map.get(f"{lbl}_Prix_MGA")
-                count = _parse_num(ws.cell(row=row_idx, column=nb_idx).value if nb_idx else 0)
-                price = _parse_num(ws.cell(row=row_idx, column=prix_idx).value if prix_idx else 0)
+                count = _parse_num(_row_value(values, nb_idx) if nb_idx else 0)
+                price = _parse_num(_row_value(values, prix_idx) if prix_idx else 0)
                 room_prices[rk] = {"count": int(count), "price": float(price)}
 
             prix_u = _parse_num(_get("Prix_Unitaire_MGA", 0))
@@ -2750,7 +3559,7 @@ def load_client_collective_cotation(client: dict) -> list:
     Returns:
         list: row dicts compatibles avec ClientCollectiveCotation._rows, ou [].
     """
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     client_ref = str(client.get("ref_client") or "").strip()
@@ -2759,7 +3568,7 @@ def load_client_collective_cotation(client: dict) -> list:
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
         if COTATION_FRAIS_COL_SHEET_NAME not in wb.sheetnames:
             return []
         ws = wb[COTATION_FRAIS_COL_SHEET_NAME]
@@ -2770,13 +3579,11 @@ def load_client_collective_cotation(client: dict) -> list:
             return []
 
         results = []
-        for row_idx in range(2, ws.max_row + 1):
-            if str(ws.cell(row=row_idx, column=id_col).value or "").strip() != client_ref:
-                continue
+        for values in ws.rows_for(id_col, client_ref):
 
             def _get(col_name, default=""):
                 idx = header_map.get(col_name)
-                return ws.cell(row=row_idx, column=idx).value if idx else default
+                return _row_value(values, idx) if idx else default
 
             prix_raw = _get("Prix_Unitaire", 0)
             qty_raw  = _get("Quantité", 0)
@@ -2837,12 +3644,12 @@ def save_client_hotel_cotation_to_excel(client: dict, rows: list) -> int:
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = COTATION_H_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if COTATION_H_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(COTATION_H_SHEET_NAME)
             else:
@@ -2874,6 +3681,7 @@ def save_client_hotel_cotation_to_excel(client: dict, rows: list) -> int:
         ]
 
         saved = 0
+        first_row = ws.max_row + 1
         for rd in rows:
             next_row = ws.max_row + 1
             rp = rd.get("room_prices", {})
@@ -2905,8 +3713,8 @@ def save_client_hotel_cotation_to_excel(client: dict, rows: list) -> int:
                     ws.cell(row=next_row, column=col_idx, value=val)
             saved += 1
 
-        wb.save(CLIENT_EXCEL_PATH)
-        invalidate_client_cache()
+        _record_client_rows(ws, id_col_idx, client_ref, range(first_row, ws.max_row + 1))
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(f"Client hotel cotation: {saved} row(s) saved to {COTATION_H_SHEET_NAME}")
         return saved
     except PermissionError as e:
@@ -2948,12 +3756,12 @@ def save_client_collective_cotation_to_excel(client: dict, rows: list) -> int:
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = COTATION_FRAIS_COL_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if COTATION_FRAIS_COL_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(COTATION_FRAIS_COL_SHEET_NAME)
             else:
@@ -2977,6 +3785,7 @@ def save_client_collective_cotation_to_excel(client: dict, rows: list) -> int:
             _delete_rows_for_client(ws, id_col_idx, client_ref)
 
         saved = 0
+        first_row = ws.max_row + 1
         for rd in rows:
             next_row = ws.max_row + 1
             row_values = {
@@ -3000,8 +3809,8 @@ def save_client_collective_cotation_to_excel(client: dict, rows: list) -> int:
                     ws.cell(row=next_row, column=col_idx, value=val)
             saved += 1
 
-        wb.save(CLIENT_EXCEL_PATH)
-        invalidate_client_cache()
+        _record_client_rows(ws, id_col_idx, client_ref, range(first_row, ws.max_row + 1))
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(
             f"Client collective cotation: {saved} row(s) saved to {COTATION_FRAIS_COL_SHEET_NAME}"
         )
@@ -3027,7 +3836,7 @@ def load_client_restauration_cotation(client: dict) -> list:
     Returns:
         list: row dicts compatibles avec ClientRestaurationCotation._rows, ou [].
     """
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     client_ref = str(client.get("ref_client") or "").strip()
@@ -3036,7 +3845,7 @@ def load_client_restauration_cotation(client: dict) -> list:
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
         if COTATION_REST_SHEET_NAME not in wb.sheetnames:
             return []
         ws = wb[COTATION_REST_SHEET_NAME]
@@ -3055,22 +3864,20 @@ def load_client_restauration_cotation(client: dict) -> list:
         ]
 
         results = []
-        for row_idx in range(2, ws.max_row + 1):
-            if str(ws.cell(row=row_idx, column=id_col).value or "").strip() != client_ref:
-                continue
+        for values in ws.rows_for(id_col, client_ref):
 
             def _get(col_name, default=""):
                 idx = header_map.get(col_name)
-                return ws.cell(row=row_idx, column=idx).value if idx else default
+                return _row_value(values, idx) if idx else default
 
             meal_prices = {}
             for mk, lbl in _MEAL_KEYS:
                 nb_idx    = header_map.get(f"{lbl}_Nb")
                 prix_idx  = header_map.get(f"{lbl}_Prix")
                 grat_idx  = header_map.get(f"{lbl}_Gratuit")
-                count   = int(_parse_num(ws.cell(row=row_idx, column=nb_idx).value if nb_idx else 0))
-                price   = float(_parse_num(ws.cell(row=row_idx, column=prix_idx).value if prix_idx else 0))
-                gratuit = bool(ws.cell(row=row_idx, column=grat_idx).value if grat_idx else False)
+                count   = int(_parse_num(_row_value(values, nb_idx) if nb_idx else 0))
+                price   = float(_parse_num(_row_value(values, prix_idx) if prix_idx else 0))
+                gratuit = bool(_row_value(values, grat_idx) if grat_idx else False)
                 meal_prices[mk] = {"count": count, "price": price, "gratuit": gratuit}
 
             nuits_raw = _get("Nuits", "")
@@ -3127,12 +3934,12 @@ def save_client_restauration_cotation_to_excel(client: dict, rows: list) -> int:
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = COTATION_REST_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if COTATION_REST_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(COTATION_REST_SHEET_NAME)
             else:
@@ -3148,13 +3955,8 @@ def save_client_restauration_cotation_to_excel(client: dict, rows: list) -> int:
         # Supprimer les lignes existantes du client
         client_ref = str(client.get("ref_client") or "").strip()
         id_col = header_map.get("ID_Client")
-        to_delete = []
         if id_col:
-            for r in range(2, ws.max_row + 1):
-                if str(ws.cell(r, id_col).value or "").strip() == client_ref:
-                    to_delete.append(r)
-        for r in reversed(to_delete):
-            ws.delete_rows(r, 1)
+            _delete_rows_for_client(ws, id_col, client_ref)
 
         # Insérer les nouvelles lignes
         next_row = ws.max_row + 1 if ws.max_row >= 2 else 2
@@ -3194,8 +3996,8 @@ def save_client_restauration_cotation_to_excel(client: dict, rows: list) -> int:
             _set("Total",         row.get("total", 0))
             saved += 1
 
-        wb.save(CLIENT_EXCEL_PATH)
-        invalidate_client_cache()
+        _record_client_rows(ws, id_col, client_ref, range(next_row, next_row + saved))
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(f"Client restauration cotation: {saved} row(s) saved to {COTATION_REST_SHEET_NAME}")
         return saved
     except PermissionError as e:
@@ -3219,7 +4021,7 @@ def load_client_transport_cotation(client: dict) -> list:
     Returns:
         list: row dicts compatibles avec ClientTransportCotation._rows, ou [].
     """
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     client_ref = str(client.get("ref_client") or "").strip()
@@ -3228,7 +4030,7 @@ def load_client_transport_cotation(client: dict) -> list:
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
         if COTATION_TRANSPORT_SHEET_NAME not in wb.sheetnames:
             return []
         ws = wb[COTATION_TRANSPORT_SHEET_NAME]
@@ -3239,13 +4041,11 @@ def load_client_transport_cotation(client: dict) -> list:
             return []
 
         results = []
-        for row_idx in range(2, ws.max_row + 1):
-            if str(ws.cell(row=row_idx, column=id_col).value or "").strip() != client_ref:
-                continue
+        for values in ws.rows_for(id_col, client_ref):
 
             def _get(col_name, default=""):
                 idx = header_map.get(col_name)
-                return ws.cell(row=row_idx, column=idx).value if idx else default
+                return _row_value(values, idx) if idx else default
 
             def _int_str(col):
                 v = _get(col)
@@ -3301,12 +4101,12 @@ def save_client_transport_cotation_to_excel(client: dict, rows: list) -> int:
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = COTATION_TRANSPORT_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if COTATION_TRANSPORT_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(COTATION_TRANSPORT_SHEET_NAME)
             else:
@@ -3322,13 +4122,8 @@ def save_client_transport_cotation_to_excel(client: dict, rows: list) -> int:
         # Supprimer les lignes existantes du client
         client_ref = str(client.get("ref_client") or "").strip()
         id_col = header_map.get("ID_Client")
-        to_delete = []
         if id_col:
-            for r in range(2, ws.max_row + 1):
-                if str(ws.cell(r, id_col).value or "").strip() == client_ref:
-                    to_delete.append(r)
-        for r in reversed(to_delete):
-            ws.delete_rows(r, 1)
+            _delete_rows_for_client(ws, id_col, client_ref)
 
         # Insérer les nouvelles lignes
         next_row = ws.max_row + 1 if ws.max_row >= 2 else 2
@@ -3367,8 +4162,8 @@ def save_client_transport_cotation_to_excel(client: dict, rows: list) -> int:
             _set("Total",        row.get("total", 0))
             saved += 1
 
-        wb.save(CLIENT_EXCEL_PATH)
-        invalidate_client_cache()
+        _record_client_rows(ws, id_col, client_ref, range(next_row, next_row + saved))
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(f"Client transport cotation: {saved} row(s) saved to {COTATION_TRANSPORT_SHEET_NAME}")
         return saved
     except PermissionError as e:
@@ -3396,11 +4191,11 @@ def load_all_hotel_quotations():
         logger.warning("openpyxl not available. Cannot load from Excel.")
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH)
         if COTATION_H_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -3529,12 +4324,12 @@ def load_collective_expenses_data():
         logger.warning("openpyxl not available. Cannot load collective expenses.")
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         if FRAIS_COLLECTIFS_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -3573,6 +4368,16 @@ def load_collective_expenses_data():
                 pass
 
 
+def _collective_expense_catalog():
+    """CollectiveExpenseCatalog of data-hotel.xlsx / Frais collectifs, per workbook version."""
+    return _derived_catalog(
+        "collective_expense",
+        HOTEL_EXCEL_PATH,
+        lambda: CollectiveExpenseCatalog(load_collective_expenses_data()),
+        lambda: CollectiveExpenseCatalog([]),
+    )
+
+
 def get_collective_expense_prestataires():
     """
     Get unique prestataires from Frais collectifs sheet
@@ -3580,12 +4385,7 @@ def get_collective_expense_prestataires():
     Returns:
         list: Sorted list of unique prestataire names
     """
-    data = load_collective_expenses_data()
-    prestataires = set()
-    for row in data:
-        if row.get("prestataire"):
-            prestataires.add(row["prestataire"])
-    return sorted(prestataires)
+    return _collective_expense_catalog().prestataires()
 
 
 def get_collective_expense_designations(prestataire=None):
@@ -3598,13 +4398,7 @@ def get_collective_expense_designations(prestataire=None):
     Returns:
         list: Sorted list of designations
     """
-    data = load_collective_expenses_data()
-    designations = set()
-    for row in data:
-        if prestataire is None or row.get("prestataire") == prestataire:
-            if row.get("designation"):
-                designations.add(row["designation"])
-    return sorted(designations)
+    return _collective_expense_catalog().designations(prestataire)
 
 
 def get_collective_expense_montant(prestataire, designation):
@@ -3618,14 +4412,8 @@ def get_collective_expense_montant(prestataire, designation):
     Returns:
         float: Montant value, or 0 if not found
     """
-    data = load_collective_expenses_data()
-    for row in data:
-        if (
-            row.get("prestataire") == prestataire
-            and row.get("designation") == designation
-        ):
-            return row.get("montant", 0)
-    return 0
+    row = _collective_expense_catalog().get(prestataire, designation)
+    return row.get("montant", 0) if row is not None else 0
 
 
 def get_collective_expense_forfait(prestataire, designation):
@@ -3639,14 +4427,8 @@ def get_collective_expense_forfait(prestataire, designation):
     Returns:
         str: Forfait value, or empty string if not found
     """
-    data = load_collective_expenses_data()
-    for row in data:
-        if (
-            row.get("prestataire") == prestataire
-            and row.get("designation") == designation
-        ):
-            return str(row.get("forfait", "")).strip()
-    return ""
+    row = _collective_expense_catalog().get(prestataire, designation)
+    return str(row.get("forfait", "")).strip() if row is not None else ""
 
 
 def load_collective_expense_db_rows():
@@ -3659,12 +4441,12 @@ def load_collective_expense_db_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         if FRAIS_COLLECTIFS_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -3709,12 +4491,12 @@ def save_collective_expense_db_row(row_data):
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = FRAIS_COLLECTIFS_SHEET_NAME
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
             if FRAIS_COLLECTIFS_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(FRAIS_COLLECTIFS_SHEET_NAME)
             else:
@@ -3732,7 +4514,8 @@ def save_collective_expense_db_row(row_data):
         ws.cell(row=next_row, column=4, value=_parse_num(row_data.get("montant", 0)))
         ws.cell(row=next_row, column=5, value=row_data.get("id_circuit", ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("collective_expense")
         return next_row
     except PermissionError:
         return -2
@@ -3752,12 +4535,12 @@ def update_collective_expense_db_row(row_number, row_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if FRAIS_COLLECTIFS_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -3769,7 +4552,8 @@ def update_collective_expense_db_row(row_number, row_data):
         if "id_circuit" in row_data:
             ws.cell(row=row_number, column=5, value=row_data.get("id_circuit", ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("collective_expense")
         return 0
     except PermissionError:
         return -2
@@ -3789,18 +4573,19 @@ def delete_collective_expense_db_row(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if FRAIS_COLLECTIFS_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[FRAIS_COLLECTIFS_SHEET_NAME]
         ws.delete_rows(row_number)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("collective_expense")
         return True
     except Exception as e:
         logger.error(f"Failed to delete collective expense DB row {row_number}: {e}", exc_info=True)
@@ -3828,13 +4613,13 @@ def update_collective_expense_quotation_in_excel(row_number, form_data):
         logger.warning("openpyxl not available. Cannot update Excel.")
         return -1
     
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         logger.error(f"Excel file {CLIENT_EXCEL_PATH} not found")
         return -1
     
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if COTATION_FRAIS_COL_SHEET_NAME not in wb.sheetnames:
             logger.error(f"Sheet {COTATION_FRAIS_COL_SHEET_NAME} not found")
             return -1
@@ -3849,7 +4634,7 @@ def update_collective_expense_quotation_in_excel(row_number, form_data):
             value = form_data.get(header, "")
             ws.cell(row=excel_row, column=col_idx, value=value)
         
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(f"Updated collective expense at row {row_number}")
         return 0
     except PermissionError:
@@ -3877,13 +4662,13 @@ def delete_collective_expense_from_excel(row_number):
         logger.warning("openpyxl not available. Cannot delete from Excel.")
         return False
     
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         logger.error(f"Excel file {CLIENT_EXCEL_PATH} not found")
         return False
     
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if COTATION_FRAIS_COL_SHEET_NAME not in wb.sheetnames:
             logger.error(f"Sheet {COTATION_FRAIS_COL_SHEET_NAME} not found")
             return False
@@ -3893,7 +4678,7 @@ def delete_collective_expense_from_excel(row_number):
         excel_row = row_number + 1
         ws.delete_rows(excel_row)
         
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(f"Deleted collective expense at row {row_number}")
         return True
     except Exception as e:
@@ -3915,46 +4700,31 @@ def load_visite_excursion_data():
         logger.warning("openpyxl not available. Cannot load visite & excursion data.")
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         if VISITE_EXCURSION_SOURCE_SHEET_NAME not in wb.sheetnames:
             return []
 
         ws = wb[VISITE_EXCURSION_SOURCE_SHEET_NAME]
 
-        header_index = {}
-        for col in range(1, ws.max_column + 1):
-            value = ws.cell(row=1, column=col).value
-            if value is None:
-                continue
-            normalized = (
-                str(value)
-                .strip()
-                .lower()
-                .replace("_", " ")
-                .replace("-", " ")
-                .replace("é", "e")
-                .replace("è", "e")
-                .replace("ê", "e")
+        # Headers are normalized once; rows are then decoded from plain tuples.
+        field_columns = [
+            (col, _normalize_visite_key(value))
+            for col, value in enumerate(
+                next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ()),
+                start=1,
             )
-            header_index[normalized] = col
+            if value is not None
+        ]
+        header_index = {key: col for col, key in field_columns}
 
         def _find_col(candidates):
             for candidate in candidates:
-                normalized = (
-                    str(candidate)
-                    .strip()
-                    .lower()
-                    .replace("_", " ")
-                    .replace("-", " ")
-                    .replace("é", "e")
-                    .replace("è", "e")
-                    .replace("ê", "e")
-                )
+                normalized = _normalize_visite_key(candidate)
                 if normalized in header_index:
                     return header_index[normalized]
             return None
@@ -3974,30 +4744,18 @@ def load_visite_excursion_data():
             return []
 
         rows = []
-        for row_idx in range(2, ws.max_row + 1):
-            prestation = ws.cell(row=row_idx, column=prestation_col).value
-            designation = ws.cell(row=row_idx, column=designation_col).value
-            tarif = ws.cell(row=row_idx, column=tarif_col).value if tarif_col else 0
+        for values in ws.iter_rows(min_row=2, values_only=True):
+            prestation = _row_value(values, prestation_col)
+            designation = _row_value(values, designation_col)
+            tarif = _row_value(values, tarif_col) if tarif_col else 0
 
             if not prestation and not designation:
                 continue
 
-            raw_fields = {}
-            for col in range(1, ws.max_column + 1):
-                h = ws.cell(row=1, column=col).value
-                if h is None:
-                    continue
-                hk = (
-                    str(h)
-                    .strip()
-                    .lower()
-                    .replace("_", " ")
-                    .replace("-", " ")
-                    .replace("é", "e")
-                    .replace("è", "e")
-                    .replace("ê", "e")
-                )
-                raw_fields[hk] = str(ws.cell(row=row_idx, column=col).value or "").strip()
+            raw_fields = {
+                key: str(_row_value(values, col) or "").strip()
+                for col, key in field_columns
+            }
 
             rows.append(
                 {
@@ -4034,13 +4792,22 @@ def _normalize_visite_key(value):
     )
 
 
-def _match_visite_filters(row, filters=None, ignore_keys=None):
+_VISITE_PRESTATION_KEYS = frozenset({"prestation", "prestations", "prestataire", "prestataires"})
+_VISITE_DESIGNATION_KEYS = frozenset({"designation", "designations", "désignation"})
+
+
+def _visite_constraints(filters=None, ignore_keys=None):
+    """
+    Filters of the visite/excursion form as VisiteExcursionCatalog constraints.
+
+    Empty values and ignore_keys are skipped; prestataire and designation
+    keys compare the resolved row columns, other keys the raw field.
+    """
     if not filters:
-        return True
+        return []
 
     ignore = {_normalize_visite_key(k) for k in (ignore_keys or [])}
-    fields = row.get("fields", {})
-
+    constraints = []
     for key, expected in filters.items():
         if expected in (None, ""):
             continue
@@ -4053,60 +4820,49 @@ def _match_visite_filters(row, filters=None, ignore_keys=None):
         if not expected_text:
             continue
 
-        if nk in {"prestation", "prestations", "prestataire", "prestataires"}:
-            if str(row.get("prestation") or "").strip() != expected_text:
-                return False
-            continue
-
-        if nk in {"designation", "designations", "désignation"}:
-            if str(row.get("designation") or "").strip() != expected_text:
-                return False
-            continue
+        if nk in _VISITE_PRESTATION_KEYS:
+            constraints.append(("row", "prestation", expected_text))
+        elif nk in _VISITE_DESIGNATION_KEYS:
+            constraints.append(("row", "designation", expected_text))
+        else:
+            constraints.append(("field", nk, expected_text))
+    return constraints
 
-        field_value = str(fields.get(nk, "")).strip()
-        if field_value != expected_text:
-            return False
 
-    return True
+def _visite_excursion_catalog():
+    """VisiteExcursionCatalog of data-hotel.xlsx / Visite_excursion, per workbook version."""
+    return _derived_catalog(
+        "visite_excursion",
+        HOTEL_EXCEL_PATH,
+        lambda: VisiteExcursionCatalog(load_visite_excursion_data()),
+        lambda: VisiteExcursionCatalog([]),
+    )
 
 
 def get_visite_excursion_prestataires(filters=None):
-    data = load_visite_excursion_data()
-    values = {
-        row.get("prestation")
-        for row in data
-        if row.get("prestation") and _match_visite_filters(row, filters, ignore_keys=["prestation", "prestataire"])
-    }
-    return sorted(values)
+    constraints = _visite_constraints(filters, ignore_keys=["prestation", "prestataire"])
+    return _visite_excursion_catalog().prestataires(constraints)
 
 
 def get_visite_excursion_designations(prestataire=None, filters=None):
-    data = load_visite_excursion_data()
     effective_filters = dict(filters or {})
     if prestataire:
         effective_filters["prestations"] = prestataire
 
-    values = set()
-    for row in data:
-        if _match_visite_filters(row, effective_filters, ignore_keys=["designation", "designations", "désignation"]):
-            designation = row.get("designation")
-            if designation:
-                values.add(designation)
-    return sorted(values)
+    constraints = _visite_constraints(
+        effective_filters, ignore_keys=["designation", "designations", "désignation"]
+    )
+    return _visite_excursion_catalog().designations(constraints)
 
 
 def get_visite_excursion_montant(prestataire, designation, filters=None):
-    data = load_visite_excursion_data()
     effective_filters = dict(filters or {})
     if prestataire:
         effective_filters["prestations"] = prestataire
     if designation:
         effective_filters["designation"] = designation
 
-    for row in data:
-        if _match_visite_filters(row, effective_filters):
-            return row.get("tarif_par_pax", 0)
-    return 0
+    return _visite_excursion_catalog().montant(_visite_constraints(effective_filters))
 
 
 def get_visite_excursion_db_headers():
@@ -4114,44 +4870,21 @@ def get_visite_excursion_db_headers():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
-        source_sheet = None
-        if VISITE_EXCURSION_SOURCE_SHEET_NAME in wb.sheetnames:
-            source_sheet = VISITE_EXCURSION_SOURCE_SHEET_NAME
-        else:
-            target = _normalize_header_key(VISITE_EXCURSION_SOURCE_SHEET_NAME)
-            for sheet_name in wb.sheetnames:
-                if _normalize_header_key(sheet_name) == target:
-                    source_sheet = sheet_name
-                    break
-
+        source_sheet = _header_sheet_name(HOTEL_EXCEL_PATH, VISITE_EXCURSION_SOURCE_SHEET_NAME)
         if not source_sheet:
             return []
 
-        ws = wb[source_sheet]
-        headers = []
-        for col in range(1, ws.max_column + 1):
-            value = ws.cell(row=1, column=col).value
-            if value is None:
-                continue
-            label = str(value).strip()
-            if label:
-                headers.append(label)
-        return headers
+        ws = _load_header_sheet(HOTEL_EXCEL_PATH, source_sheet)
+        if ws is None:
+            return []
+        return _header_labels(ws)
     except Exception as e:
         logger.error(f"Failed to load visite excursion DB headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def load_visite_excursion_db_rows():
@@ -4159,12 +4892,12 @@ def load_visite_excursion_db_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         source_sheet = None
         if VISITE_EXCURSION_SOURCE_SHEET_NAME in wb.sheetnames:
             source_sheet = VISITE_EXCURSION_SOURCE_SHEET_NAME
@@ -4213,12 +4946,12 @@ def save_visite_excursion_db_row(row_data):
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = VISITE_EXCURSION_SOURCE_SHEET_NAME
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
             if VISITE_EXCURSION_SOURCE_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(VISITE_EXCURSION_SOURCE_SHEET_NAME)
             else:
@@ -4244,7 +4977,8 @@ def save_visite_excursion_db_row(row_data):
         for col_idx, header in enumerate(headers, start=1):
             ws.cell(row=next_row, column=col_idx, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("visite_excursion")
         return next_row
     except PermissionError:
         return -2
@@ -4264,12 +4998,12 @@ def update_visite_excursion_db_row(row_number, row_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if VISITE_EXCURSION_SOURCE_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -4278,7 +5012,8 @@ def update_visite_excursion_db_row(row_number, row_data):
         for col_idx, header in enumerate(headers, start=1):
             ws.cell(row=row_number, column=col_idx, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("visite_excursion")
         return 0
     except PermissionError:
         return -2
@@ -4298,18 +5033,19 @@ def delete_visite_excursion_db_row(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if VISITE_EXCURSION_SOURCE_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[VISITE_EXCURSION_SOURCE_SHEET_NAME]
         ws.delete_rows(row_number)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("visite_excursion")
         return True
     except Exception as e:
         logger.error(f"Failed to delete visite excursion DB row {row_number}: {e}", exc_info=True)
@@ -4327,44 +5063,21 @@ def get_avion_db_headers():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
-        source_sheet = None
-        if AVION_SOURCE_SHEET_NAME in wb.sheetnames:
-            source_sheet = AVION_SOURCE_SHEET_NAME
-        else:
-            target = _normalize_header_key(AVION_SOURCE_SHEET_NAME)
-            for sheet_name in wb.sheetnames:
-                if _normalize_header_key(sheet_name) == target:
-                    source_sheet = sheet_name
-                    break
-
+        source_sheet = _header_sheet_name(HOTEL_EXCEL_PATH, AVION_SOURCE_SHEET_NAME)
         if not source_sheet:
             return []
 
-        ws = wb[source_sheet]
-        headers = []
-        for col in range(1, ws.max_column + 1):
-            value = ws.cell(row=1, column=col).value
-            if value is None:
-                continue
-            label = str(value).strip()
-            if label:
-                headers.append(label)
-        return headers
+        ws = _load_header_sheet(HOTEL_EXCEL_PATH, source_sheet)
+        if ws is None:
+            return []
+        return _header_labels(ws)
     except Exception as e:
         logger.error(f"Failed to load avion DB headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def load_avion_db_rows():
@@ -4372,12 +5085,12 @@ def load_avion_db_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         source_sheet = None
         if AVION_SOURCE_SHEET_NAME in wb.sheetnames:
             source_sheet = AVION_SOURCE_SHEET_NAME
@@ -4426,12 +5139,12 @@ def save_avion_db_row(row_data):
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = AVION_SOURCE_SHEET_NAME
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
             if AVION_SOURCE_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(AVION_SOURCE_SHEET_NAME)
             else:
@@ -4462,7 +5175,8 @@ def save_avion_db_row(row_data):
         for col_idx, header in enumerate(headers, start=1):
             ws.cell(row=next_row, column=col_idx, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("avion")
         return next_row
     except PermissionError:
         return -2
@@ -4482,12 +5196,12 @@ def update_avion_db_row(row_number, row_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if AVION_SOURCE_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -4496,7 +5210,8 @@ def update_avion_db_row(row_number, row_data):
         for col_idx, header in enumerate(headers, start=1):
             ws.cell(row=row_number, column=col_idx, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("avion")
         return 0
     except PermissionError:
         return -2
@@ -4516,18 +5231,19 @@ def delete_avion_db_row(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if AVION_SOURCE_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[AVION_SOURCE_SHEET_NAME]
         ws.delete_rows(row_number)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("avion")
         return True
     except Exception as e:
         logger.error(f"Failed to delete avion DB row {row_number}: {e}", exc_info=True)
@@ -4547,34 +5263,17 @@ def get_visite_excursion_headers():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
-        if VISITE_EXCURSION_SHEET_NAME not in wb.sheetnames:
+        ws = _load_header_sheet(CLIENT_EXCEL_PATH, VISITE_EXCURSION_SHEET_NAME)
+        if ws is None:
             return []
-
-        ws = wb[VISITE_EXCURSION_SHEET_NAME]
-        headers = []
-        for col in range(1, ws.max_column + 1):
-            value = ws.cell(row=1, column=col).value
-            if value is None:
-                continue
-            label = str(value).strip()
-            if label:
-                headers.append(label)
-        return headers
+        return _header_labels(ws)
     except Exception as e:
         logger.error(f"Failed to load visite & excursion headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def save_visite_excursion_quotation_to_excel(form_data):
@@ -4589,12 +5288,12 @@ def save_visite_excursion_quotation_to_excel(form_data):
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = VISITE_EXCURSION_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if VISITE_EXCURSION_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(VISITE_EXCURSION_SHEET_NAME)
             else:
@@ -4641,7 +5340,7 @@ def save_visite_excursion_quotation_to_excel(form_data):
             value = form_data.get(header, "")
             ws.cell(row=next_row, column=col, value=value)
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return next_row
     except PermissionError:
         return -2
@@ -4663,12 +5362,12 @@ def load_all_visite_excursion_quotations():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH)
         if VISITE_EXCURSION_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -4707,12 +5406,12 @@ def update_visite_excursion_quotation_in_excel(row_number, form_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if VISITE_EXCURSION_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -4724,7 +5423,7 @@ def update_visite_excursion_quotation_in_excel(row_number, form_data):
             value = form_data.get(header, "")
             ws.cell(row=excel_row, column=col_idx, value=value)
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return 0
     except PermissionError:
         return -2
@@ -4743,19 +5442,19 @@ def delete_visite_excursion_from_excel(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if VISITE_EXCURSION_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[VISITE_EXCURSION_SHEET_NAME]
         ws.delete_rows(row_number)
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return True
     except Exception as e:
         logger.error(f"Error deleting visite & excursion row {row_number}: {e}", exc_info=True)
@@ -4779,12 +5478,12 @@ def load_avion_source_data():
         logger.warning("openpyxl not available. Cannot load avion data.")
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
 
         source_sheet = None
         if AVION_SOURCE_SHEET_NAME in wb.sheetnames:
@@ -4847,16 +5546,22 @@ def load_avion_source_data():
             ]
         )
 
+        # Headers are normalized once; rows are then decoded from plain tuples.
+        field_columns = [
+            (col, _normalize_header_key(header))
+            for col, header in enumerate(
+                next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ()),
+                start=1,
+            )
+            if header is not None
+        ]
+
         rows = []
-        for row_idx in range(2, ws.max_row + 1):
+        for values in ws.iter_rows(min_row=2, values_only=True):
             fields = {}
             has_value = False
-            for col in range(1, ws.max_column + 1):
-                header = ws.cell(row=1, column=col).value
-                if header is None:
-                    continue
-                key = _normalize_header_key(header)
-                value = ws.cell(row=row_idx, column=col).value
+            for col, key in field_columns:
+                value = _row_value(values, col)
                 fields[key] = "" if value is None else str(value).strip()
                 if value not in (None, ""):
                     has_value = True
@@ -4864,16 +5569,8 @@ def load_avion_source_data():
             if not has_value:
                 continue
 
-            tarif_adulte = (
-                ws.cell(row=row_idx, column=tarif_adulte_col).value
-                if tarif_adulte_col
-                else 0
-            )
-            tarif_enfant = (
-                ws.cell(row=row_idx, column=tarif_enfant_col).value
-                if tarif_enfant_col
-                else 0
-            )
+            tarif_adulte = _row_value(values, tarif_adulte_col) if tarif_adulte_col else 0
+            tarif_enfant = _row_value(values, tarif_enfant_col) if tarif_enfant_col else 0
 
             rows.append(
                 {
@@ -4895,174 +5592,94 @@ def load_avion_source_data():
                 pass
 
 
-def get_avion_tarifs(filters=None):
-    """
-    Return first matching adult/child tariffs from avion source.
+# Champs saisis dans le formulaire qui ne sont pas des critères de tarif
+_AVION_NON_FILTER_FIELDS = frozenset({
+    "date",
+    "id client",
+    "id_client",
+    "ref client",
+    "reference",
+    "nom",
+    "nom client",
+    "nombre adulte",
+    "nombre adultes",
+    "nombre enfant",
+    "nombre enfants",
+    "tarif adulte",
+    "tarif adultes",
+    "tarif enfant",
+    "tarif enfants",
+    "montant adulte",
+    "montant adultes",
+    "montant enfant",
+    "montant enfants",
+    "total",
+    "observation",
+})
+_AVION_DEPARTURE_FIELDS = ("ville de depart", "ville depart", "ville d depart")
+_AVION_ARRIVAL_FIELDS = (
+    "ville d arrive",
+    "ville de arrive",
+    "ville arrive",
+    "ville d arrivee",
+    "ville de arrivee",
+    "ville arrivee",
+)
+_AVION_COMPAGNIE_FIELDS = ("compagnie", "airline", "compagnie aerienne")
 
-    Args:
-        filters (dict): Optional filters by source columns.
 
-    Returns:
-        tuple: (tarif_adulte, tarif_enfant)
-    """
-    data = load_avion_source_data()
-    if not data:
-        return 0, 0
+def _avion_tariff_index():
+    """AvionTariffIndex of the avion source sheet, per workbook version."""
+    return _derived_catalog(
+        "avion",
+        HOTEL_EXCEL_PATH,
+        lambda: AvionTariffIndex(load_avion_source_data()),
+        lambda: AvionTariffIndex([]),
+    )
+
 
-    normalized_filters = {}
+def _avion_filters(filters, ignored=()):
+    """{normalized field: stripped value} of the non-empty filters not in ignored."""
+    normalized = {}
     for key, value in (filters or {}).items():
         if value in (None, ""):
             continue
-        normalized_filters[_normalize_header_key(key)] = str(value).strip()
-
-    for row in data:
-        if not normalized_filters:
-            return row.get("tarif_adulte", 0), row.get("tarif_enfant", 0)
-
-        fields = row.get("fields", {})
-        matches = True
-        for key, expected in normalized_filters.items():
-            if key in {
-                "date",
-                "id client",
-                "id_client",
-                "ref client",
-                "reference",
-                "nom",
-                "nom client",
-                "nombre adulte",
-                "nombre adultes",
-                "nombre enfant",
-                "nombre enfants",
-                "tarif adulte",
-                "tarif adultes",
-                "tarif enfant",
-                "tarif enfants",
-                "montant adulte",
-                "montant adultes",
-                "montant enfant",
-                "montant enfants",
-                "total",
-                "observation",
-            }:
-                continue
-            if str(fields.get(key, "")).strip() != expected:
-                matches = False
-                break
-
-        if matches:
-            return row.get("tarif_adulte", 0), row.get("tarif_enfant", 0)
-
-    first = data[0]
-    return first.get("tarif_adulte", 0), first.get("tarif_enfant", 0)
-
-
-def get_avion_departure_cities(filters=None):
-    """Get unique departure cities from avion source data."""
-    data = load_avion_source_data()
-    values = set()
-
-    normalized_filters = {
-        _normalize_header_key(k): str(v).strip()
-        for k, v in (filters or {}).items()
-        if v not in (None, "")
-    }
-
-    for row in data:
-        fields = row.get("fields", {})
-
-        matches = True
-        for key, expected in normalized_filters.items():
-            if key in {
-                "ville de depart",
-                "ville depart",
-                "ville d depart",
-            }:
-                continue
-            if str(fields.get(key, "")).strip() != expected:
-                matches = False
-                break
-
-        if not matches:
-            continue
-
-        city = (
-            fields.get("ville de depart")
-            or fields.get("ville depart")
-            or fields.get("ville d depart")
-            or ""
-        )
-        city = str(city).strip()
-        if city:
-            values.add(city)
-
-    return sorted(values)
+        field = _normalize_header_key(key)
+        if field not in ignored:
+            normalized[field] = str(value).strip()
+    return normalized
 
 
-def get_avion_arrival_cities(filters=None):
-    """Get unique arrival cities from avion source data."""
-    data = load_avion_source_data()
-    values = set()
+def get_avion_tarifs(filters=None):
+    """
+    Return first matching adult/child tariffs from avion source.
 
-    normalized_filters = {
-        _normalize_header_key(k): str(v).strip()
-        for k, v in (filters or {}).items()
-        if v not in (None, "")
-    }
+    Args:
+        filters (dict): Optional filters by source columns.
 
-    for row in data:
-        fields = row.get("fields", {})
-
-        matches = True
-        for key, expected in normalized_filters.items():
-            if key in {
-                "ville d arrive",
-                "ville de arrive",
-                "ville arrive",
-                "ville d arrivee",
-                "ville de arrivee",
-                "ville arrivee",
-            }:
-                continue
-            if str(fields.get(key, "")).strip() != expected:
-                matches = False
-                break
+    Returns:
+        tuple: (tarif_adulte, tarif_enfant)
+    """
+    return _avion_tariff_index().tarifs(_avion_filters(filters, _AVION_NON_FILTER_FIELDS))
 
-        if not matches:
-            continue
 
-        city = (
-            fields.get("ville d arrive")
-            or fields.get("ville de arrive")
-            or fields.get("ville arrive")
-            or fields.get("ville d arrivee")
-            or fields.get("ville de arrivee")
-            or fields.get("ville arrivee")
-            or ""
-        )
-        city = str(city).strip()
-        if city:
-            values.add(city)
+def get_avion_departure_cities(filters=None):
+    """Get unique departure cities from avion source data."""
+    return _avion_tariff_index().values(
+        _AVION_DEPARTURE_FIELDS, _avion_filters(filters, _AVION_DEPARTURE_FIELDS)
+    )
 
-    return sorted(values)
+
+def get_avion_arrival_cities(filters=None):
+    """Get unique arrival cities from avion source data."""
+    return _avion_tariff_index().values(
+        _AVION_ARRIVAL_FIELDS, _avion_filters(filters, _AVION_ARRIVAL_FIELDS)
+    )
 
 
 def get_avion_compagnies():
     """Retourne la liste triée des compagnies aériennes de la BD avion."""
-    data = load_avion_source_data()
-    values = set()
-    for row in data:
-        fields = row.get("fields", {})
-        comp = (
-            fields.get("compagnie")
-            or fields.get("airline")
-            or fields.get("compagnie aerienne")
-            or ""
-        )
-        comp = str(comp).strip()
-        if comp:
-            values.add(comp)
-    return sorted(values)
+    return _avion_tariff_index().values(_AVION_COMPAGNIE_FIELDS)
 
 
 def get_avion_headers():
@@ -5070,34 +5687,17 @@ def get_avion_headers():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
-        if AVION_SHEET_NAME not in wb.sheetnames:
+        ws = _load_header_sheet(CLIENT_EXCEL_PATH, AVION_SHEET_NAME)
+        if ws is None:
             return []
-
-        ws = wb[AVION_SHEET_NAME]
-        headers = []
-        for col in range(1, ws.max_column + 1):
-            value = ws.cell(row=1, column=col).value
-            if value is None:
-                continue
-            label = str(value).strip()
-            if label:
-                headers.append(label)
-        return headers
+        return _header_labels(ws)
     except Exception as e:
         logger.error(f"Failed to load AVION headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def save_air_ticket_quotation_to_excel(form_data):
@@ -5112,12 +5712,12 @@ def save_air_ticket_quotation_to_excel(form_data):
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = AVION_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if AVION_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(AVION_SHEET_NAME)
             else:
@@ -5165,7 +5765,7 @@ def save_air_ticket_quotation_to_excel(form_data):
             value = form_data.get(header, "")
             ws.cell(row=next_row, column=col, value=value)
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return next_row
     except PermissionError:
         return -2
@@ -5185,12 +5785,12 @@ def load_all_air_ticket_quotations():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH)
         if AVION_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -5230,12 +5830,12 @@ def update_air_ticket_quotation_in_excel(row_number, form_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if AVION_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -5247,7 +5847,7 @@ def update_air_ticket_quotation_in_excel(row_number, form_data):
             value = form_data.get(header, "")
             ws.cell(row=excel_row, column=col_idx, value=value)
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return 0
     except PermissionError:
         return -2
@@ -5267,19 +5867,19 @@ def delete_air_ticket_from_excel(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if AVION_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[AVION_SHEET_NAME]
         ws.delete_rows(row_number)
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return True
     except Exception as e:
         logger.error(f"Error deleting air ticket row {row_number}: {e}", exc_info=True)
@@ -5304,27 +5904,17 @@ def _ensure_parametrage_sheet(ws):
     return _ensure_headers(ws, PARAMETRAGE_DEFAULT_HEADERS, header_style)
 
 
+_PARAMETER_ALIASES = ("parametre", "paramètre", "PARAMETRE", "Parametre", "Paramètre")
+_VALUE_ALIASES = ("valeur", "value", "VALEUR", "Valeur", "Value")
+
+
 def _normalize_param_name(value):
     return _normalize_header_key(value)
 
 
 def _ensure_default_param_rows(ws, header_map):
-    parameter_col = _find_header_column(
-        header_map,
-        "parametre",
-        "paramètre",
-        "PARAMETRE",
-        "Parametre",
-        "Paramètre",
-    )
-    value_col = _find_header_column(
-        header_map,
-        "valeur",
-        "value",
-        "VALEUR",
-        "Valeur",
-        "Value",
-    )
+    parameter_col = _find_header_column(header_map, *_PARAMETER_ALIASES)
+    value_col = _find_header_column(header_map, *_VALUE_ALIASES)
     if not parameter_col or not value_col:
         return
 
@@ -5346,69 +5936,99 @@ def _ensure_default_param_rows(ws, header_map):
 
 
 def get_parametrage_headers():
+    """
+    Return the PARAMETRAGE headers, or [] if the sheet has headers but no
+    usable parameter/value columns.
+
+    Read-only: a missing sheet, headers or default rows are created by
+    migrate_workbook_schemas() or by the next PARAMETRAGE save.
+    """
     if not OPENPYXL_AVAILABLE:
         return []
 
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
+        return list(PARAMETRAGE_DEFAULT_HEADERS)
+
+    try:
+        ws = _load_header_sheet(HOTEL_EXCEL_PATH, PARAMETRAGE_SHEET_NAME)
+        if ws is None:
+            return list(PARAMETRAGE_DEFAULT_HEADERS)
+
+        header_map = _get_header_map(ws)
+        if not header_map:
+            return list(PARAMETRAGE_DEFAULT_HEADERS)
+        parameter_col = _find_header_column(header_map, *_PARAMETER_ALIASES)
+        value_col = _find_header_column(header_map, *_VALUE_ALIASES)
+        if parameter_col and value_col:
+            return list(PARAMETRAGE_DEFAULT_HEADERS)
+        return []
+    except Exception as e:
+        logger.error(f"Failed to load PARAMETRAGE headers: {e}", exc_info=True)
+        return []
+
+
+def _migrate_parametrage_sheet(wb):
+    """Create the PARAMETRAGE sheet, headers and default rows. Returns True if changed."""
+    if PARAMETRAGE_SHEET_NAME not in wb.sheetnames:
+        ws = wb.create_sheet(PARAMETRAGE_SHEET_NAME)
+    else:
+        ws = wb[PARAMETRAGE_SHEET_NAME]
+
+    header_map = _get_header_map(ws)
+    changed = any(h not in header_map for h in PARAMETRAGE_DEFAULT_HEADERS)
+    before_row_count = ws.max_row
+    header_map = _ensure_parametrage_sheet(ws)
+    _ensure_default_param_rows(ws, header_map)
+    return changed or ws.max_row != before_row_count
+
+
+def _migrate_circuit_sheet(wb):
+    """Add the default Circuits columns missing from an existing sheet."""
+    if "Circuits" not in wb.sheetnames:
+        return False
+    ws = wb["Circuits"]
+    header_map = _get_header_map(ws)
+    if all(h in header_map for h in _CIRCUIT_DEFAULT_HEADERS):
+        return False
+    _ensure_headers(ws, _CIRCUIT_DEFAULT_HEADERS)
+    return True
+
+
+def migrate_workbook_schemas():
+    """
+    Schema migration of data-hotel.xlsx: write the headers and default rows
+    the read paths (get_*_headers) only report.
+
+    Opens and saves the workbook at most once, and only when something is
+    missing. Meant to run once at startup (see main._launch_main_app).
+
+    Returns:
+        bool: True if the workbook was changed, False if already up to date;
+        -1 on failure, -2 if the file is locked
+    """
+    if not OPENPYXL_AVAILABLE:
+        return -1
+
     wb = None
     try:
-        changed = False
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
-            ws = wb.active
-            ws.title = PARAMETRAGE_SHEET_NAME
-            changed = True
+            wb.active.title = PARAMETRAGE_SHEET_NAME
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
-            if PARAMETRAGE_SHEET_NAME not in wb.sheetnames:
-                ws = wb.create_sheet(PARAMETRAGE_SHEET_NAME)
-                changed = True
-            else:
-                ws = wb[PARAMETRAGE_SHEET_NAME]
-
-        before_headers = _get_header_map(ws)
-        before_row_count = ws.max_row
-        header_map = _ensure_parametrage_sheet(ws)
-        _ensure_default_param_rows(ws, header_map)
-
-        after_headers = _get_header_map(ws)
-        if before_headers != after_headers or ws.max_row != before_row_count:
-            changed = True
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
 
+        changed = _migrate_parametrage_sheet(wb)
+        changed = _migrate_circuit_sheet(wb) or changed
         if changed:
-            wb.save(HOTEL_EXCEL_PATH)
-        return list(PARAMETRAGE_DEFAULT_HEADERS)
+            _save_workbook(wb, HOTEL_EXCEL_PATH)
+            logger.info(f"Schema migration applied to {HOTEL_EXCEL_PATH}")
+        return changed
     except PermissionError:
-        try:
-            wb = load_workbook(HOTEL_EXCEL_PATH, data_only=True)
-            if PARAMETRAGE_SHEET_NAME not in wb.sheetnames:
-                return list(PARAMETRAGE_DEFAULT_HEADERS)
-
-            ws = wb[PARAMETRAGE_SHEET_NAME]
-            header_map = _get_header_map(ws)
-            parameter_col = _find_header_column(
-                header_map,
-                "parametre",
-                "paramètre",
-                "PARAMETRE",
-                "Parametre",
-                "Paramètre",
-            )
-            value_col = _find_header_column(
-                header_map,
-                "valeur",
-                "value",
-                "VALEUR",
-                "Valeur",
-                "Value",
-            )
-            if parameter_col and value_col:
-                return list(PARAMETRAGE_DEFAULT_HEADERS)
-            return []
-        except Exception:
-            return []
+        logger.warning(f"Schema migration skipped, {HOTEL_EXCEL_PATH} is locked")
+        return -2
     except Exception as e:
-        logger.error(f"Failed to load PARAMETRAGE headers: {e}", exc_info=True)
-        return []
+        logger.error(f"Schema migration failed: {e}", exc_info=True)
+        return -1
     finally:
         if wb is not None:
             try:
@@ -5423,31 +6043,17 @@ def load_all_parametrages():
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             return []
 
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         if PARAMETRAGE_SHEET_NAME not in wb.sheetnames:
             return []
 
         ws = wb[PARAMETRAGE_SHEET_NAME]
         header_map = _get_header_map(ws)
-        parameter_col = _find_header_column(
-            header_map,
-            "parametre",
-            "paramètre",
-            "PARAMETRE",
-            "Parametre",
-            "Paramètre",
-        )
-        value_col = _find_header_column(
-            header_map,
-            "valeur",
-            "value",
-            "VALEUR",
-            "Valeur",
-            "Value",
-        )
+        parameter_col = _find_header_column(header_map, *_PARAMETER_ALIASES)
+        value_col = _find_header_column(header_map, *_VALUE_ALIASES)
         if not parameter_col or not value_col:
             return []
 
@@ -5477,18 +6083,115 @@ def load_all_parametrages():
                 pass
 
 
+# ── Paramétrage store ───────────────────────────────────────────────────────
+
+
+class ParametrageStore:
+    """
+    Valeurs du PARAMETRAGE par nom normalisé (_normalize_param_name).
+
+    Le dictionnaire est chargé une fois par version de data-hotel.xlsx ;
+    save/update/delete_parametrage_* appellent notify_changed(), qui le
+    jette et prévient les abonnés (sur le thread de l'écriture, souvent le
+    writer en arrière-plan : les abonnés Tk doivent repasser par after()).
+    """
+
+    def __init__(self):
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def values(self):
+        """{nom normalisé: valeur brute}, la première ligne l'emportant."""
+        return _derived_catalog("parametrage", HOTEL_EXCEL_PATH, self._load, dict)
+
+    @staticmethod
+    def _load():
+        values = {}
+        for row in load_all_parametrages():
+            name = _normalize_param_name(row.get("PARAMETRE"))
+            if name:
+                values.setdefault(name, row.get("VALEUR", ""))
+        return values
+
+    def get(self, name, default=None):
+        """Valeur brute d'un paramètre, default s'il est absent."""
+        key = _normalize_param_name(name)
+        if not key:
+            return default
+        return self.values().get(key, default)
+
+    def get_float(self, name, default=0.0):
+        """Valeur numérique (séparateurs et unités ignorés, cf. _parse_num)."""
+        value = self.get(name)
+        if value in (None, ""):
+            return default
+        return float(_parse_num(value))
+
+    def get_int(self, name, default=0):
+        """Valeur entière (arrondie)."""
+        value = self.get(name)
+        if value in (None, ""):
+            return default
+        return int(round(_parse_num(value)))
+
+    def get_percent(self, name, default=0.0):
+        """
+        Pourcentage sous forme de fraction. Convention : un texte avec "%" ou
+        un nombre >= 1 (en valeur absolue) est exprimé en points de
+        pourcentage ("15 %", 15 -> 0.15 ; 1 -> 0.01) ; un nombre < 1 est
+        déjà une fraction (cellule au format pourcentage d'Excel, 0.15).
+        """
+        value = self.get(name)
+        if value in (None, ""):
+            return default
+        number = float(_parse_num(value))
+        if (isinstance(value, str) and "%" in value) or abs(number) >= 1:
+            return number / 100.0
+        return number
+
+    def subscribe(self, callback):
+        """Appelle callback() après chaque modification du PARAMETRAGE."""
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def notify_changed(self):
+        """Jette les valeurs en cache et prévient les abonnés."""
+        _invalidate_derived_catalog("parametrage")
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"PARAMETRAGE listener failed: {e}", exc_info=True)
+
+
+_PARAMETRAGE_STORE = ParametrageStore()
+
+
+def get_parametrage_store():
+    """Return the shared ParametrageStore of data-hotel.xlsx."""
+    return _PARAMETRAGE_STORE
+
+
 def save_parametrage_to_excel(form_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = PARAMETRAGE_SHEET_NAME
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
             if PARAMETRAGE_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(PARAMETRAGE_SHEET_NAME)
             else:
@@ -5497,22 +6200,8 @@ def save_parametrage_to_excel(form_data):
         header_map = _ensure_parametrage_sheet(ws)
         _ensure_default_param_rows(ws, header_map)
 
-        parameter_col = _find_header_column(
-            header_map,
-            "parametre",
-            "paramètre",
-            "PARAMETRE",
-            "Parametre",
-            "Paramètre",
-        )
-        value_col = _find_header_column(
-            header_map,
-            "valeur",
-            "value",
-            "VALEUR",
-            "Valeur",
-            "Value",
-        )
+        parameter_col = _find_header_column(header_map, *_PARAMETER_ALIASES)
+        value_col = _find_header_column(header_map, *_VALUE_ALIASES)
         if not parameter_col or not value_col:
             return -1
 
@@ -5538,7 +6227,8 @@ def save_parametrage_to_excel(form_data):
         ws.cell(row=target_row, column=parameter_col, value=parameter)
         ws.cell(row=target_row, column=value_col, value=value)
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _PARAMETRAGE_STORE.notify_changed()
         return target_row
     except PermissionError:
         return -2
@@ -5557,40 +6247,27 @@ def update_parametrage_in_excel(row_number, form_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if PARAMETRAGE_SHEET_NAME not in wb.sheetnames:
             return -1
 
         ws = wb[PARAMETRAGE_SHEET_NAME]
         header_map = _ensure_parametrage_sheet(ws)
-        parameter_col = _find_header_column(
-            header_map,
-            "parametre",
-            "paramètre",
-            "PARAMETRE",
-            "Parametre",
-            "Paramètre",
-        )
-        value_col = _find_header_column(
-            header_map,
-            "valeur",
-            "value",
-            "VALEUR",
-            "Valeur",
-            "Value",
-        )
+        parameter_col = _find_header_column(header_map, *_PARAMETER_ALIASES)
+        value_col = _find_header_column(header_map, *_VALUE_ALIASES)
         if not parameter_col or not value_col:
             return -1
 
         ws.cell(row=row_number, column=parameter_col, value=form_data.get("PARAMETRE", ""))
         ws.cell(row=row_number, column=value_col, value=form_data.get("VALEUR", ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _PARAMETRAGE_STORE.notify_changed()
         return 0
     except PermissionError:
         return -2
@@ -5609,18 +6286,19 @@ def delete_parametrage_from_excel(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if PARAMETRAGE_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[PARAMETRAGE_SHEET_NAME]
         ws.delete_rows(row_number)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _PARAMETRAGE_STORE.notify_changed()
         return True
     except Exception as e:
         logger.error(f"Failed to delete PARAMETRAGE row {row_number}: {e}", exc_info=True)
@@ -5633,18 +6311,22 @@ def delete_parametrage_from_excel(row_number):
                 pass
 
 
-def _resolve_transport_source_header_map(ws):
-    header_map = _get_header_map(ws, 1)
-    prestataire_col = _find_header_column(header_map, "Prestataire")
-    type_col = _find_header_column(header_map, "Type de voiture", "Type voiture")
-    if prestataire_col and type_col:
-        return header_map, 2
+_TRANSPORT_SOURCE_COLUMNS = {
+    "prestataire": ("Prestataire",),
+    "type": ("Type de voiture", "Type voiture"),
+    "places": ("Nombre de place", "Nombre places", "Places"),
+    "location": ("Location par jour", "Location/jour"),
+    "consommation": ("Consommation", "CONSOMATION", "Consomation", "CONSO", "Conso"),
+    "energie": ("ENERGIE", "Energie"),
+}
 
-    header_map = _get_header_map(ws, 2)
-    prestataire_col = _find_header_column(header_map, "Prestataire")
-    type_col = _find_header_column(header_map, "Type de voiture", "Type voiture")
-    if prestataire_col and type_col:
-        return header_map, 3
+
+def _resolve_transport_source_header_map(ws):
+    for header_row in (1, 2):
+        header_map = _get_header_map(ws, header_row)
+        columns = header_map.plan(_TRANSPORT_SOURCE_COLUMNS)
+        if columns["prestataire"] and columns["type"]:
+            return header_map, header_row + 1
 
     return {}, 2
 
@@ -5653,12 +6335,12 @@ def _load_transport_source_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH, data_only=True)
         if TRANSPORT_SOURCE_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -5667,19 +6349,13 @@ def _load_transport_source_rows():
         if not header_map:
             return []
 
-        prestataire_col = _find_header_column(header_map, "Prestataire")
-        type_col = _find_header_column(header_map, "Type de voiture", "Type voiture")
-        place_col = _find_header_column(header_map, "Nombre de place", "Nombre places", "Places")
-        location_col = _find_header_column(header_map, "Location par jour", "Location/jour")
-        consommation_col = _find_header_column(
-            header_map,
-            "Consommation",
-            "CONSOMATION",
-            "Consomation",
-            "CONSO",
-            "Conso",
-        )
-        energie_col = _find_header_column(header_map, "ENERGIE", "Energie")
+        columns = header_map.plan(_TRANSPORT_SOURCE_COLUMNS)
+        prestataire_col = columns["prestataire"]
+        type_col = columns["type"]
+        place_col = columns["places"]
+        location_col = columns["location"]
+        consommation_col = columns["consommation"]
+        energie_col = columns["energie"]
 
         rows = []
         for row in range(data_start_row, ws.max_row + 1):
@@ -5711,31 +6387,28 @@ def _load_transport_source_rows():
                 pass
 
 
+def _transport_catalog():
+    """TransportCatalog of data-hotel.xlsx / TRANSPORT, per workbook version."""
+    return _derived_catalog(
+        "transport",
+        HOTEL_EXCEL_PATH,
+        lambda: TransportCatalog(_load_transport_source_rows()),
+        lambda: TransportCatalog([]),
+    )
+
+
 def get_transport_prestataires():
-    values = {
-        row.get("prestataire")
-        for row in _load_transport_source_rows()
-        if row.get("prestataire")
-    }
-    return sorted(values)
+    return _transport_catalog().prestataires()
 
 
 def get_transport_vehicle_types(prestataire=None):
-    rows = _load_transport_source_rows()
-    values = set()
-    for row in rows:
-        if prestataire and row.get("prestataire") != prestataire:
-            continue
-        vehicle = row.get("type_voiture")
-        if vehicle:
-            values.add(vehicle)
-    return sorted(values)
+    return _transport_catalog().vehicle_types(prestataire)
 
 
 def get_transport_vehicle_data(prestataire, type_voiture):
-    for row in _load_transport_source_rows():
-        if row.get("prestataire") == prestataire and row.get("type_voiture") == type_voiture:
-            return row
+    row = _transport_catalog().vehicle_data(prestataire, type_voiture)
+    if row is not None:
+        return row
     return {
         "prestataire": str(prestataire or "").strip(),
         "type_voiture": str(type_voiture or "").strip(),
@@ -5763,15 +6436,46 @@ _RE_DURATION_SUFFIX = re.compile(
 )
 
 
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+_RE_SPACES = re.compile(r"\s+")
+_RE_PARENTHESES = re.compile(r"\([^)]*\)")
+
+# Taille des mémos de normalisation : quelques centaines de villes en pratique
+_CITY_NAME_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CITY_NAME_CACHE_SIZE)
+def _city_key_cached(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = _RE_NON_ALNUM.sub(" ", text.lower())
+    return _RE_SPACES.sub(" ", text).strip()
+
+
 def _city_key(name: str) -> str:
     """Clé de recherche interne : minuscules, sans accents, sans ponctuation."""
     if not name:
         return ""
-    text = unicodedata.normalize("NFKD", str(name))
-    text = "".join(c for c in text if not unicodedata.combining(c))
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
+    return _city_key_cached(str(name))
+
+
+@lru_cache(maxsize=_CITY_NAME_CACHE_SIZE)
+def _normalize_city_name_cached(s: str) -> str:
+    # 1. Supprime les suffixes de durée
+    s = _RE_DURATION_SUFFIX.sub("", s).strip()
+    # 2. Alias sur la chaîne brute — _city_key traite les parenthèses comme espaces
+    #    donc "RANOHIRA (ISALO)" → _city_key → "ranohira isalo" → alias "Ranohira"
+    alias = _CITY_ALIASES.get(_city_key(s))
+    if alias:
+        return alias
+    # 3. Retire les annotations parasites restantes entre parenthèses
+    s = _RE_PARENTHESES.sub("", s).strip()
+    s = _RE_SPACES.sub(" ", s).strip()
+    # 4. Alias de nouveau après nettoyage (ex. résidu sans annotation)
+    alias = _CITY_ALIASES.get(_city_key(s))
+    if alias:
+        return alias
+    return s
 
 
 def normalize_city_name(raw) -> str:
@@ -5787,25 +6491,43 @@ def normalize_city_name(raw) -> str:
     5. Nettoie les espaces.
 
     Retourne la forme d'affichage propre (casse conservée sauf alias).
+    Les résultats sont mémorisés (_CITY_NAME_CACHE_SIZE noms au plus).
     """
     if not raw:
         return ""
-    s = str(raw).strip()
-    # 1. Supprime les suffixes de durée
-    s = _RE_DURATION_SUFFIX.sub("", s).strip()
-    # 2. Alias sur la chaîne brute — _city_key traite les parenthèses comme espaces
-    #    donc "RANOHIRA (ISALO)" → _city_key → "ranohira isalo" → alias "Ranohira"
-    alias = _CITY_ALIASES.get(_city_key(s))
-    if alias:
-        return alias
-    # 3. Retire les annotations parasites restantes entre parenthèses
-    s = re.sub(r"\([^)]*\)", "", s).strip()
-    s = re.sub(r"\s+", " ", s).strip()
-    # 4. Alias de nouveau après nettoyage (ex. résidu sans annotation)
-    alias = _CITY_ALIASES.get(_city_key(s))
-    if alias:
-        return alias
-    return s
+    return _normalize_city_name_cached(str(raw).strip())
+
+
+def normalize_many(values) -> list:
+    """
+    normalize_city_name appliqué à une suite de noms, dans l'ordre.
+
+    Chaque nom distinct n'est normalisé qu'une fois ; pour les migrations et
+    les chargements qui traitent des colonnes entières.
+    """
+    seen = {}
+    result = []
+    for value in values:
+        try:
+            clean = seen[value]
+        except KeyError:
+            clean = seen[value] = normalize_city_name(value)
+        except TypeError:
+            # Valeur non hachable : normalisée sans mémo local
+            clean = normalize_city_name(value)
+        result.append(clean)
+    return result
+
+
+def _km_mada_known_names(lookup: dict) -> list:
+    """
+    Noms résolus d'avance par la DistanceMatrix : libellés des repères du
+    snapshot et alias métier (_CITY_ALIASES, formes clé et affichage).
+    """
+    names = [str(row.get("repere") or "").strip() for row in lookup.values()]
+    names.extend(_CITY_ALIASES)
+    names.extend(_CITY_ALIASES.values())
+    return [name for name in names if name]
 
 
 def _rebuild_km_mada_lookup(rows: list) -> dict:
@@ -5837,6 +6559,36 @@ def _rebuild_km_mada_lookup(rows: list) -> dict:
     return lookup
 
 
+def _repere_key(name) -> str:
+    """Clé KM_MADA d'un nom de ville brut (normalize_city_name puis _city_key)."""
+    return _city_key(normalize_city_name(str(name)))
+
+
+def get_km_mada_distance_matrix() -> DistanceMatrix:
+    """
+    DistanceMatrix du snapshot KM_MADA courant.
+
+    La validité du classeur (existence, zip, mtime) est revérifiée au plus
+    toutes les _KM_MADA_CHECK_INTERVAL_SECONDS, pas à chaque appel ; les
+    écritures KM_MADA invalident immédiatement.
+    """
+    now = monotonic()
+    checked = _KM_MADA_CACHE["checked"]
+    if (
+        checked is None
+        or checked[0] != HOTEL_EXCEL_PATH
+        or now - checked[1] >= _KM_MADA_CHECK_INTERVAL_SECONDS
+    ):
+        _load_km_mada_rows()
+        _KM_MADA_CACHE["checked"] = (HOTEL_EXCEL_PATH, now)
+    matrix = _KM_MADA_CACHE["matrix"]
+    if matrix is None:
+        lookup = _KM_MADA_CACHE["lookup"]
+        matrix = DistanceMatrix(lookup, _repere_key, _km_mada_known_names(lookup))
+        _KM_MADA_CACHE["matrix"] = matrix
+    return matrix
+
+
 def get_km_mada_km_for_repere(repere) -> float:
     """
     Retourne le km KM_MADA pour un repère/ville donné.
@@ -5846,30 +6598,14 @@ def get_km_mada_km_for_repere(repere) -> float:
     """
     if not repere:
         return 0
-    clean   = normalize_city_name(str(repere))
-    key     = _city_key(clean)
-    if not key:
-        return 0
-    _load_km_mada_rows()   # garantit que le cache est à jour
-    cached_row = _KM_MADA_CACHE["lookup"].get(key)
-    if cached_row:
-        return _parse_num(cached_row.get("km", 0))
-    return 0
+    return get_km_mada_distance_matrix().km(repere)
 
 
 def get_km_mada_duration_for_repere(repere) -> float:
     """Retourne la durée KM_MADA pour un repère/ville donné (normalisation incluse)."""
     if not repere:
         return 0.0
-    clean = normalize_city_name(str(repere))
-    key   = _city_key(clean)
-    if not key:
-        return 0.0
-    _load_km_mada_rows()
-    cached_row = _KM_MADA_CACHE["lookup"].get(key)
-    if cached_row:
-        return _parse_duration_hours(cached_row.get("duree", 0))
-    return 0.0
+    return get_km_mada_distance_matrix().duration(repere)
 
 
 def get_segment_distance(depart, arrivee) -> float:
@@ -5881,11 +6617,17 @@ def get_segment_distance(depart, arrivee) -> float:
     Si seule l'une des deux villes est dans KM_MADA, retourne son km brut.
     Si aucune n'est connue, retourne 0.
     """
-    km_dep = get_km_mada_km_for_repere(depart)
-    km_arr = get_km_mada_km_for_repere(arrivee)
-    if km_arr and km_dep:
-        return abs(km_arr - km_dep)
-    return km_arr or km_dep
+    return get_km_mada_distance_matrix().segment(depart, arrivee)
+
+
+def get_segment_distances(pairs) -> list:
+    """Distances de plusieurs segments (départ, arrivée), sur un même snapshot."""
+    return get_km_mada_distance_matrix().segments(pairs)
+
+
+def itinerary_distance(cities) -> float:
+    """Distance totale d'un itinéraire : somme des segments entre villes consécutives."""
+    return get_km_mada_distance_matrix().itinerary(cities)
 
 
 def migrate_normalize_infos_clients() -> dict:
@@ -5901,7 +6643,7 @@ def migrate_normalize_infos_clients() -> dict:
 
     Retourne {"modified": int, "errors": list}.
     """
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return {"modified": 0, "errors": ["Fichier non trouvé ou openpyxl absent"]}
 
     def _normalize_city_list(raw: str) -> str:
@@ -5909,13 +6651,8 @@ def migrate_normalize_infos_clients() -> dict:
         if not raw or not raw.strip():
             return raw
         parts = re.split(r"[,;>/|\n]+|(?<!\w)-(?!\w)", raw)
-        cleaned = []
-        for p in parts:
-            p = p.strip(" -\t")
-            if not p:
-                continue
-            cleaned.append(normalize_city_name(p))
-        return ", ".join(cleaned)
+        parts = [p.strip(" -\t") for p in parts]
+        return ", ".join(normalize_many(p for p in parts if p))
 
     target_cols = {
         CLIENT_INFOS_SHEET_NAME: ["Ville Départ", "Ville Arrivée", "Itinéraire Circuit"],
@@ -5925,7 +6662,7 @@ def migrate_normalize_infos_clients() -> dict:
     modified = 0
     errors = []
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         for sheet_name, cols in target_cols.items():
             if sheet_name not in wb.sheetnames:
                 continue
@@ -5949,7 +6686,7 @@ def migrate_normalize_infos_clients() -> dict:
                             f"'{raw}' → '{cleaned}'"
                         )
         if modified:
-            wb.save(CLIENT_EXCEL_PATH)
+            _save_workbook(wb, CLIENT_EXCEL_PATH)
             invalidate_client_cache()
             logger.info(f"migrate_normalize_infos_clients: {modified} cellule(s) normalisée(s).")
         return {"modified": modified, "errors": errors}
@@ -5971,19 +6708,46 @@ def migrate_normalize_infos_clients() -> dict:
                 pass
 
 
+_REPERE_ALIASES = ("REPERES", "Reperes", "Repères", "REPERE", "Repere")
+_KM_MADA_COLUMNS = {
+    "repere": _REPERE_ALIASES,
+    "km": (
+        "KM",
+        "KM TOTAL",
+        "KM PARTIEL",
+        "KMS",
+        "KILOMETRAGE",
+        "Kilometrage",
+        "Kilométrage",
+        "KILOMETRES",
+        "Kilometres",
+        "Kilomètres",
+        "Distance",
+    ),
+    "duree": (
+        "Durée",
+        "Duree",
+        "Durée trajet",
+        "Duree trajet",
+        "Temps",
+        "Temps trajet",
+    ),
+}
+
+
 def _load_km_mada_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         _invalidate_km_mada_cache()
         return []
-    if not zipfile.is_zipfile(HOTEL_EXCEL_PATH):
+    if not _sqlite_backend() and not zipfile.is_zipfile(HOTEL_EXCEL_PATH):
         # Avoid repeated openpyxl exceptions when the workbook is temporarily invalid/corrupted.
         _invalidate_km_mada_cache()
         return []
 
-    mtime = os.path.getmtime(HOTEL_EXCEL_PATH)
+    mtime = _workbook_version(HOTEL_EXCEL_PATH)
     now = monotonic()
     if (
         _KM_MADA_CACHE["path"] == HOTEL_EXCEL_PATH
@@ -5994,7 +6758,7 @@ def _load_km_mada_rows():
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH, data_only=True)
         if KM_MADA_SHEET_NAME not in wb.sheetnames:
             _invalidate_km_mada_cache()
             return []
@@ -6002,39 +6766,8 @@ def _load_km_mada_rows():
         ws = wb[KM_MADA_SHEET_NAME]
 
         def _resolve_columns(header_row):
-            header_map = _get_header_map(ws, header_row)
-            repere = _find_header_column(
-                header_map,
-                "REPERES",
-                "Reperes",
-                "Repères",
-                "REPERE",
-                "Repere",
-            )
-            km = _find_header_column(
-                header_map,
-                "KM",
-                "KM TOTAL",
-                "KM PARTIEL",
-                "KMS",
-                "KILOMETRAGE",
-                "Kilometrage",
-                "Kilométrage",
-                "KILOMETRES",
-                "Kilometres",
-                "Kilomètres",
-                "Distance",
-            )
-            duree = _find_header_column(
-                header_map,
-                "Durée",
-                "Duree",
-                "Durée trajet",
-                "Duree trajet",
-                "Temps",
-                "Temps trajet",
-            )
-            return repere, km, duree
+            columns = _get_header_map(ws, header_row).plan(_KM_MADA_COLUMNS)
+            return columns["repere"], columns["km"], columns["duree"]
 
         repere_col, km_col, duree_col = _resolve_columns(1)
         data_start_row = 2
@@ -6046,10 +6779,10 @@ def _load_km_mada_rows():
             return []
 
         rows = []
-        for row in range(data_start_row, ws.max_row + 1):
-            repere = ws.cell(row=row, column=repere_col).value
-            km = ws.cell(row=row, column=km_col).value if km_col else 0
-            duree = ws.cell(row=row, column=duree_col).value if duree_col else 0
+        for values in ws.iter_rows(min_row=data_start_row, values_only=True):
+            repere = _row_value(values, repere_col)
+            km = _row_value(values, km_col) if km_col else 0
+            duree = _row_value(values, duree_col) if duree_col else 0
             if repere in (None, ""):
                 continue
             rows.append(
@@ -6066,6 +6799,7 @@ def _load_km_mada_rows():
         _KM_MADA_CACHE["loaded_at"] = now
         _KM_MADA_CACHE["rows"] = rows
         _KM_MADA_CACHE["lookup"] = lookup
+        _KM_MADA_CACHE["matrix"] = None
         return rows
     except zipfile.BadZipFile as e:
         _invalidate_km_mada_cache()
@@ -6104,15 +6838,7 @@ def get_km_mada_reperes():
 
 
 def get_parametrage_value_by_name(parameter_name):
-    target = _normalize_header_key(parameter_name)
-    if not target:
-        return 0
-
-    for row in load_all_parametrages():
-        name = _normalize_header_key(row.get("PARAMETRE"))
-        if name == target:
-            return _parse_num(row.get("VALEUR", 0))
-    return 0
+    return _parse_num(_PARAMETRAGE_STORE.get(parameter_name, 0))
 
 
 def get_transport_fuel_price(energie):
@@ -6133,34 +6859,17 @@ def get_transport_headers():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
-        if TRANSPORT_SHEET_NAME not in wb.sheetnames:
+        ws = _load_header_sheet(CLIENT_EXCEL_PATH, TRANSPORT_SHEET_NAME, n_rows=2)
+        if ws is None:
             return []
-
-        ws = wb[TRANSPORT_SHEET_NAME]
-        headers = []
-        for col in range(1, ws.max_column + 1):
-            value = ws.cell(row=2, column=col).value
-            if value is None:
-                continue
-            label = str(value).strip()
-            if label:
-                headers.append(label)
-        return headers
+        return _header_labels(ws, 2)
     except Exception as e:
         logger.error(f"Failed to load TRANSPORT headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def save_transport_quotation_to_excel(form_data):
@@ -6175,12 +6884,12 @@ def save_transport_quotation_to_excel(form_data):
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = TRANSPORT_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if TRANSPORT_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(TRANSPORT_SHEET_NAME)
             else:
@@ -6216,7 +6925,7 @@ def save_transport_quotation_to_excel(form_data):
         for header, col in header_map.items():
             ws.cell(row=next_row, column=col, value=form_data.get(header, ""))
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return next_row
     except PermissionError:
         return -2
@@ -6236,12 +6945,12 @@ def load_all_transport_quotations():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH)
         if TRANSPORT_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -6279,12 +6988,12 @@ def update_transport_quotation_in_excel(row_number, form_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if TRANSPORT_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -6294,7 +7003,7 @@ def update_transport_quotation_in_excel(row_number, form_data):
         for col_idx, header in enumerate(headers, start=1):
             ws.cell(row=row_number, column=col_idx, value=form_data.get(header, ""))
 
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return 0
     except PermissionError:
         return -2
@@ -6314,18 +7023,18 @@ def delete_transport_from_excel(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(CLIENT_EXCEL_PATH):
+    if not _workbook_exists(CLIENT_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH)
+        wb = _open_workbook(CLIENT_EXCEL_PATH)
         if TRANSPORT_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[TRANSPORT_SHEET_NAME]
         ws.delete_rows(row_number)
-        wb.save(CLIENT_EXCEL_PATH)
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         return True
     except Exception as e:
         logger.error(f"Failed to delete transport row {row_number}: {e}", exc_info=True)
@@ -6343,16 +7052,13 @@ def get_transport_db_headers():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
-        if TRANSPORT_SOURCE_SHEET_NAME not in wb.sheetnames:
+        ws = _load_header_sheet(HOTEL_EXCEL_PATH, TRANSPORT_SOURCE_SHEET_NAME, n_rows=2)
+        if ws is None:
             return []
-
-        ws = wb[TRANSPORT_SOURCE_SHEET_NAME]
         header_map, _data_start = _resolve_transport_source_header_map(ws)
         if not header_map:
             return []
@@ -6360,12 +7066,6 @@ def get_transport_db_headers():
     except Exception as e:
         logger.error(f"Failed to load transport DB headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def load_transport_db_rows():
@@ -6373,12 +7073,12 @@ def load_transport_db_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         if TRANSPORT_SOURCE_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -6419,12 +7119,12 @@ def save_transport_db_row(row_data):
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = TRANSPORT_SOURCE_SHEET_NAME
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
             if TRANSPORT_SOURCE_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(TRANSPORT_SOURCE_SHEET_NAME)
             else:
@@ -6456,8 +7156,9 @@ def save_transport_db_row(row_data):
         for header in headers:
             ws.cell(row=next_row, column=header_map[header], value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         _invalidate_km_mada_cache()
+        _invalidate_derived_catalog("transport")
         return next_row
     except PermissionError:
         return -2
@@ -6477,12 +7178,12 @@ def update_transport_db_row(row_number, row_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if TRANSPORT_SOURCE_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -6494,8 +7195,9 @@ def update_transport_db_row(row_number, row_data):
         for header, col in header_map.items():
             ws.cell(row=row_number, column=col, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         _invalidate_km_mada_cache()
+        _invalidate_derived_catalog("transport")
         return 0
     except PermissionError:
         return -2
@@ -6515,18 +7217,19 @@ def delete_transport_db_row(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if TRANSPORT_SOURCE_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[TRANSPORT_SOURCE_SHEET_NAME]
         ws.delete_rows(row_number)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
+        _invalidate_derived_catalog("transport")
         return True
     except Exception as e:
         logger.error(f"Failed to delete transport DB row {row_number}: {e}", exc_info=True)
@@ -6541,26 +7244,12 @@ def delete_transport_db_row(row_number):
 
 def _resolve_km_mada_header_map(ws):
     header_map = _get_header_map(ws, 1)
-    repere_col = _find_header_column(
-        header_map,
-        "REPERES",
-        "Reperes",
-        "Repères",
-        "REPERE",
-        "Repere",
-    )
+    repere_col = _find_header_column(header_map, *_REPERE_ALIASES)
     if repere_col:
         return header_map, 2
 
     header_map = _get_header_map(ws, 2)
-    repere_col = _find_header_column(
-        header_map,
-        "REPERES",
-        "Reperes",
-        "Repères",
-        "REPERE",
-        "Repere",
-    )
+    repere_col = _find_header_column(header_map, *_REPERE_ALIASES)
     if repere_col:
         return header_map, 3
 
@@ -6572,16 +7261,13 @@ def get_km_mada_db_headers():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
-    wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
-        if KM_MADA_SHEET_NAME not in wb.sheetnames:
+        ws = _load_header_sheet(HOTEL_EXCEL_PATH, KM_MADA_SHEET_NAME, n_rows=2)
+        if ws is None:
             return []
-
-        ws = wb[KM_MADA_SHEET_NAME]
         header_map, _data_start = _resolve_km_mada_header_map(ws)
         if not header_map:
             return []
@@ -6589,12 +7275,6 @@ def get_km_mada_db_headers():
     except (PermissionError, OSError, ValueError, zipfile.BadZipFile) as e:
         logger.error(f"Failed to load KM_MADA DB headers: {e}", exc_info=True)
         return []
-    finally:
-        if wb is not None:
-            try:
-                wb.close()
-            except Exception:
-                pass
 
 
 def load_km_mada_db_rows():
@@ -6602,12 +7282,12 @@ def load_km_mada_db_rows():
     if not OPENPYXL_AVAILABLE:
         return []
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _load_snapshot(HOTEL_EXCEL_PATH)
         if KM_MADA_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -6648,12 +7328,12 @@ def save_km_mada_db_row(row_data):
 
     wb = None
     try:
-        if not os.path.exists(HOTEL_EXCEL_PATH):
+        if not _workbook_exists(HOTEL_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = KM_MADA_SHEET_NAME
         else:
-            wb = load_workbook(HOTEL_EXCEL_PATH)
+            wb = _open_workbook(HOTEL_EXCEL_PATH)
             if KM_MADA_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(KM_MADA_SHEET_NAME)
             else:
@@ -6685,7 +7365,7 @@ def save_km_mada_db_row(row_data):
         for header in headers:
             ws.cell(row=next_row, column=header_map[header], value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         return next_row
     except PermissionError:
         return -2
@@ -6705,12 +7385,12 @@ def update_km_mada_db_row(row_number, row_data):
     if not OPENPYXL_AVAILABLE:
         return -1
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if KM_MADA_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -6722,7 +7402,7 @@ def update_km_mada_db_row(row_number, row_data):
         for header, col in header_map.items():
             ws.cell(row=row_number, column=col, value=row_data.get(header, ""))
 
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         return 0
     except PermissionError:
         return -2
@@ -6742,18 +7422,18 @@ def delete_km_mada_db_row(row_number):
     if not OPENPYXL_AVAILABLE:
         return False
 
-    if not os.path.exists(HOTEL_EXCEL_PATH):
+    if not _workbook_exists(HOTEL_EXCEL_PATH):
         return False
 
     wb = None
     try:
-        wb = load_workbook(HOTEL_EXCEL_PATH)
+        wb = _open_workbook(HOTEL_EXCEL_PATH)
         if KM_MADA_SHEET_NAME not in wb.sheetnames:
             return False
 
         ws = wb[KM_MADA_SHEET_NAME]
         ws.delete_rows(row_number)
-        wb.save(HOTEL_EXCEL_PATH)
+        _save_workbook(wb, HOTEL_EXCEL_PATH)
         _invalidate_km_mada_cache()
         return True
     except (OSError, ValueError, KeyError) as e:
@@ -6946,12 +7626,12 @@ def save_invoice_to_excel(invoice_data):
 
     wb = None
     try:
-        if not os.path.exists(FINANCIAL_EXCEL_PATH):
+        if not _workbook_exists(FINANCIAL_EXCEL_PATH):
             wb = Workbook()
             ws_default = wb.active
             ws_default.title = INVOICE_SHEET_NAME
         else:
-            wb = load_workbook(FINANCIAL_EXCEL_PATH)
+            wb = _open_workbook(FINANCIAL_EXCEL_PATH)
 
         ws = _ensure_invoice_sheet(wb)
         calculations = calculate_invoice_totals(
@@ -6983,7 +7663,7 @@ def save_invoice_to_excel(invoice_data):
             ws.cell(row=row, column=col, value=values.get(header, ""))
 
         _rebuild_financial_state_in_workbook(wb)
-        wb.save(FINANCIAL_EXCEL_PATH)
+        _save_workbook(wb, FINANCIAL_EXCEL_PATH)
         return row
     except PermissionError:
         return -2
@@ -7002,12 +7682,12 @@ def load_all_invoices():
     """Load all invoices."""
     if not OPENPYXL_AVAILABLE:
         return []
-    if not os.path.exists(FINANCIAL_EXCEL_PATH):
+    if not _workbook_exists(FINANCIAL_EXCEL_PATH):
         return []
 
     wb = None
     try:
-        wb = load_workbook(FINANCIAL_EXCEL_PATH)
+        wb = _load_snapshot(FINANCIAL_EXCEL_PATH)
         if INVOICE_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -7017,12 +7697,14 @@ def load_all_invoices():
             return []
 
         rows = []
-        for row_idx in range(2, ws.max_row + 1):
+        for row_idx, values in enumerate(
+            ws.iter_rows(min_row=2, values_only=True), start=2
+        ):
             row_data = {"row_number": row_idx}
             has_values = False
             for header in INVOICE_HEADERS:
                 col = header_map.get(header)
-                value = ws.cell(row=row_idx, column=col).value if col else ""
+                value = _row_value(values, col) if col else ""
                 if value not in (None, ""):
                     has_values = True
                 row_data[header] = "" if value is None else value
@@ -7044,12 +7726,12 @@ def update_invoice_in_excel(row_number, invoice_data):
     """Update one invoice row and refresh financial state."""
     if not OPENPYXL_AVAILABLE:
         return -1
-    if not os.path.exists(FINANCIAL_EXCEL_PATH):
+    if not _workbook_exists(FINANCIAL_EXCEL_PATH):
         return -1
 
     wb = None
     try:
-        wb = load_workbook(FINANCIAL_EXCEL_PATH)
+        wb = _open_workbook(FINANCIAL_EXCEL_PATH)
         if INVOICE_SHEET_NAME not in wb.sheetnames:
             return -1
 
@@ -7082,7 +7764,7 @@ def update_invoice_in_excel(row_number, invoice_data):
             ws.cell(row=row_number, column=col, value=merged.get(header, ""))
 
         _rebuild_financial_state_in_workbook(wb)
-        wb.save(FINANCIAL_EXCEL_PATH)
+        _save_workbook(wb, FINANCIAL_EXCEL_PATH)
         return 0
     except PermissionError:
         return -2
@@ -7179,14 +7861,14 @@ def refresh_financial_state_from_invoices():
 
     wb = None
     try:
-        if not os.path.exists(FINANCIAL_EXCEL_PATH):
+        if not _workbook_exists(FINANCIAL_EXCEL_PATH):
             wb = Workbook()
             wb.active.title = INVOICE_SHEET_NAME
         else:
-            wb = load_workbook(FINANCIAL_EXCEL_PATH)
+            wb = _open_workbook(FINANCIAL_EXCEL_PATH)
 
         _rebuild_financial_state_in_workbook(wb)
-        wb.save(FINANCIAL_EXCEL_PATH)
+        _save_workbook(wb, FINANCIAL_EXCEL_PATH)
         return 0
     except PermissionError:
         return -2
@@ -7205,12 +7887,12 @@ def load_financial_state_snapshot():
     """Load latest financial-state row."""
     if not OPENPYXL_AVAILABLE:
         return {}
-    if not os.path.exists(FINANCIAL_EXCEL_PATH):
+    if not _workbook_exists(FINANCIAL_EXCEL_PATH):
         return {}
 
     wb = None
     try:
-        wb = load_workbook(FINANCIAL_EXCEL_PATH)
+        wb = _load_snapshot(FINANCIAL_EXCEL_PATH)
         if FINANCIAL_STATE_SHEET_NAME not in wb.sheetnames:
             return {}
         ws = wb[FINANCIAL_STATE_SHEET_NAME]
@@ -7242,7 +7924,7 @@ def load_client_air_ticket_cotation(client: dict) -> list:
     Returns:
         list: row dicts compatibles avec ClientAirTicketCotation._rows, ou [].
     """
-    if not OPENPYXL_AVAILABLE or not os.path.exists(CLIENT_EXCEL_PATH):
+    if not OPENPYXL_AVAILABLE or not _workbook_exists(CLIENT_EXCEL_PATH):
         return []
 
     client_ref = str(client.get("ref_client") or "").strip()
@@ -7251,7 +7933,7 @@ def load_client_air_ticket_cotation(client: dict) -> list:
 
     wb = None
     try:
-        wb = load_workbook(CLIENT_EXCEL_PATH, data_only=True)
+        wb = _load_snapshot(CLIENT_EXCEL_PATH, data_only=True)
         if COTATION_AVION_SHEET_NAME not in wb.sheetnames:
             return []
 
@@ -7262,13 +7944,11 @@ def load_client_air_ticket_cotation(client: dict) -> list:
             return []
 
         results = []
-        for row_idx in range(2, ws.max_row + 1):
-            if str(ws.cell(row=row_idx, column=id_col).value or "").strip() != client_ref:
-                continue
+        for values in ws.rows_for(id_col, client_ref):
 
-            def _get(col_name, default="", _r=row_idx):
+            def _get(col_name, default="", _values=values):
                 idx = header_map.get(col_name)
-                return ws.cell(row=_r, column=idx).value if idx else default
+                return _row_value(_values, idx) if idx else default
 
             results.append({
                 "date_vol":        str(_get("Date_Vol") or ""),
@@ -7325,12 +8005,12 @@ def save_client_air_ticket_cotation_to_excel(client: dict, rows: list) -> int:
 
     wb = None
     try:
-        if not os.path.exists(CLIENT_EXCEL_PATH):
+        if not _workbook_exists(CLIENT_EXCEL_PATH):
             wb = Workbook()
             ws = wb.active
             ws.title = COTATION_AVION_SHEET_NAME
         else:
-            wb = load_workbook(CLIENT_EXCEL_PATH)
+            wb = _open_workbook(CLIENT_EXCEL_PATH)
             if COTATION_AVION_SHEET_NAME not in wb.sheetnames:
                 ws = wb.create_sheet(COTATION_AVION_SHEET_NAME)
             else:
@@ -7343,6 +8023,7 @@ def save_client_air_ticket_cotation_to_excel(client: dict, rows: list) -> int:
             _delete_rows_for_client(ws, id_col_idx, client_ref)
 
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        first_row = ws.max_row + 1
         for rd in rows:
             next_row = ws.max_row + 1
             row_values = {
@@ -7374,8 +8055,8 @@ def save_client_air_ticket_cotation_to_excel(client: dict, rows: list) -> int:
                 if col:
                     ws.cell(row=next_row, column=col, value=value)
 
-        wb.save(CLIENT_EXCEL_PATH)
-        invalidate_client_cache()
+        _record_client_rows(ws, id_col_idx, client_ref, range(first_row, ws.max_row + 1))
+        _save_workbook(wb, CLIENT_EXCEL_PATH)
         logger.info(f"Client air ticket cotation: {len(rows)} row(s) saved to {COTATION_AVION_SHEET_NAME}")
         return len(rows)
     except PermissionError as exc:
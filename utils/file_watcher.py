@@ -0,0 +1,172 @@
+"""
+Workbook file watcher
+
+Polls os.stat (mtime_ns, size) of a few files on a background thread and
+reports each change (edit, replace, creation, deletion) to a callback, so
+caches derived from a workbook edited outside the application (e.g. in
+Excel by a colleague) are dropped without waiting for their TTL.
+
+When the optional inotify_simple package is available (Linux), the thread
+sleeps on inotify events of the watched directories instead of the full
+interval; os.stat stays the source of truth either way.
+"""
+
+import os
+import threading
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+from utils.logger import logger
+
+
+def _file_signature(path):
+    """(mtime_ns, size) of path, None when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """
+    Background poller calling callback(path) when a watched file changes.
+
+    The callback runs on the watcher thread: it must only drop caches, Tk
+    widgets have to be refreshed through after().
+
+    Args:
+        callback (callable): Called with the watched path that changed
+        interval (float): Seconds between two polls
+        use_inotify (bool): Wake up on inotify events when available
+    """
+
+    def __init__(self, callback, interval=2.0, use_inotify=True):
+        self.callback = callback
+        self.interval = interval
+        self._signatures = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._inotify = None
+        self._use_inotify = use_inotify and INOTIFY_AVAILABLE
+
+    def watch(self, path):
+        """Start watching path (its current state is the reference)."""
+        path = os.path.abspath(path)
+        with self._lock:
+            if path in self._signatures:
+                return
+            self._signatures[path] = _file_signature(path)
+        if self._inotify is not None:
+            self._add_inotify_watch(path)
+
+    def unwatch(self, path):
+        with self._lock:
+            self._signatures.pop(os.path.abspath(path), None)
+
+    def watched(self):
+        with self._lock:
+            return sorted(self._signatures)
+
+    def acknowledge(self, path):
+        """
+        Take the current state of path as the reference without reporting it
+        (the application's own saves already invalidate what they changed;
+        they poll(path) first so an earlier outside edit is still reported).
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            if path in self._signatures:
+                self._signatures[path] = _file_signature(path)
+
+    def poll(self, path=None):
+        """
+        Check every watched file (or only path) once and report the changed ones.
+
+        Returns:
+            list: Paths that changed since the previous poll
+        """
+        with self._lock:
+            paths = list(self._signatures) if path is None else [os.path.abspath(path)]
+        changed = []
+        for path in paths:
+            signature = _file_signature(path)
+            with self._lock:
+                if path not in self._signatures or self._signatures[path] == signature:
+                    continue
+                self._signatures[path] = signature
+            changed.append(path)
+
+        for path in changed:
+            logger.info(f"Workbook changed on disk: {path}")
+            try:
+                self.callback(path)
+            except Exception as e:
+                logger.error(f"File watcher callback failed for {path}: {e}", exc_info=True)
+        return changed
+
+    def start(self):
+        """Start the polling thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        if self._use_inotify and self._inotify is None:
+            try:
+                self._inotify = INotify()
+                for path in self.watched():
+                    self._add_inotify_watch(path)
+            except OSError as e:
+                logger.warning(f"inotify unavailable, polling only: {e}")
+                self._inotify = None
+        self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop the polling thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+        if self._inotify is not None:
+            try:
+                self._inotify.close()
+            except OSError:
+                pass
+            self._inotify = None
+
+    def _add_inotify_watch(self, path):
+        directory = os.path.dirname(path)
+        mask = (
+            inotify_flags.CLOSE_WRITE
+            | inotify_flags.MOVED_TO
+            | inotify_flags.CREATE
+            | inotify_flags.DELETE
+        )
+        try:
+            self._inotify.add_watch(directory, mask)
+        except OSError as e:
+            logger.debug(f"Cannot watch {directory} with inotify: {e}")
+
+    def _wait(self):
+        if self._inotify is None:
+            self._stop.wait(self.interval)
+            return
+        try:
+            # Returns as soon as an event arrives in a watched directory
+            self._inotify.read(timeout=int(self.interval * 1000))
+        except OSError:
+            self._stop.wait(self.interval)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wait()
+            if self._stop.is_set():
+                break
+            self.poll()
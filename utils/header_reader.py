@@ -0,0 +1,252 @@
+"""
+Header-only workbook reader
+
+Reads the first rows of one worksheet straight from the sheet XML inside the
+.xlsx zip, stopping as soon as those rows are parsed, so forms can get their
+column headers without loading the whole workbook. Shared strings are only
+read up to the highest index the header cells use.
+
+Values are returned as stored: numbers, booleans and strings (no date
+conversion), and formula cells as their formula text ("=A1&B1"), like
+openpyxl.load_workbook does, which is enough for header labels.
+Results are cached per file version (mtime_ns, size).
+"""
+
+import os
+import posixpath
+import threading
+import zipfile
+from collections import OrderedDict
+from xml.etree.ElementTree import ParseError, iterparse
+
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_MAX_ENTRIES = 64
+# {(path, version, sheet, n_rows): rows}, {(path, version): {sheet: xml path}}
+_ROWS_CACHE = OrderedDict()
+_SHEETS_CACHE = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _file_version(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _remember(cache, key, value):
+    with _LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _MAX_ENTRIES:
+            cache.popitem(last=False)
+
+
+def _lookup(cache, key):
+    with _LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _part_path(target):
+    """Resolve a workbook relationship target to a zip member name."""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join("xl", target))
+
+
+def _workbook_parts(zf):
+    """Return ({sheet name: xml part}, shared strings part or None)."""
+    rels = {}
+    shared_strings = None
+    with zf.open("xl/_rels/workbook.xml.rels") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{_NS_PKG}Relationship":
+                target = _part_path(elem.get("Target", ""))
+                rels[elem.get("Id")] = target
+                if elem.get("Type", "").endswith("/sharedStrings"):
+                    shared_strings = target
+    sheets = {}
+    with zf.open("xl/workbook.xml") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{_NS_MAIN}sheet":
+                part = rels.get(elem.get(f"{_NS_REL}id"))
+                if part:
+                    sheets[elem.get("name")] = part
+    return sheets, shared_strings
+
+
+def _column_index(reference):
+    col = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        col = col * 26 + (ord(char.upper()) - 64)
+    return col
+
+
+def _text(elem):
+    """Text of an <is> or <si> element, rich text runs included."""
+    t = elem.find(f"{_NS_MAIN}t")
+    if t is not None:
+        return t.text or ""
+    return "".join(r.text or "" for r in elem.iterfind(f"{_NS_MAIN}r/{_NS_MAIN}t"))
+
+
+class _SharedIndex(int):
+    """Marker for a shared string index, resolved once the rows are read."""
+
+
+def _cell_value(elem):
+    formula = elem.find(f"{_NS_MAIN}f")
+    if formula is not None:
+        if not formula.text:
+            # Shared formula written once on its first cell: needs openpyxl
+            raise ValueError("shared formula in the header rows")
+        return f"={formula.text}"
+    cell_type = elem.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = elem.find(f"{_NS_MAIN}is")
+        return _text(inline) if inline is not None else None
+    v = elem.find(f"{_NS_MAIN}v")
+    if v is None or v.text is None:
+        return None
+    raw = v.text
+    if cell_type == "s":
+        return _SharedIndex(int(raw))
+    if cell_type == "b":
+        return raw == "1"
+    if cell_type in ("str", "e", "d"):
+        return raw
+    try:
+        number = float(raw)
+    except ValueError:
+        return raw
+    if number.is_integer() and "." not in raw and "E" not in raw.upper():
+        return int(number)
+    return number
+
+
+def _read_rows(zf, part, n_rows):
+    rows = []
+    current = None
+    next_row = 1
+    with zf.open(part) as f:
+        for event, elem in iterparse(f, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == f"{_NS_MAIN}row":
+                    number = int(elem.get("r") or next_row)
+                    if number > n_rows:
+                        break
+                    while len(rows) < number - 1:
+                        rows.append({})
+                    current = {}
+                    next_column = 1
+                continue
+            if tag == f"{_NS_MAIN}c" and current is not None:
+                reference = elem.get("r")
+                column = _column_index(reference) if reference else next_column
+                next_column = column + 1
+                current[column] = _cell_value(elem)
+                elem.clear()
+            elif tag == f"{_NS_MAIN}row" and current is not None:
+                rows.append(current)
+                next_row = len(rows) + 1
+                current = None
+                elem.clear()
+                if len(rows) >= n_rows:
+                    break
+            elif tag == f"{_NS_MAIN}sheetData":
+                break
+    return rows
+
+
+def _shared_strings(zf, part, needed):
+    """Read shared strings up to the highest needed index."""
+    strings = []
+    last = max(needed)
+    with zf.open(part) as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{_NS_MAIN}si":
+                strings.append(_text(elem))
+                elem.clear()
+                if len(strings) > last:
+                    break
+    return strings
+
+
+def _sheet_parts(zf, path, version):
+    key = (path, version)
+    parts = _lookup(_SHEETS_CACHE, key)
+    if parts is None:
+        parts = _workbook_parts(zf)
+        _remember(_SHEETS_CACHE, key, parts)
+    return parts
+
+
+def sheet_names(path):
+    """Return the worksheet names of a workbook, in workbook order."""
+    path = os.path.abspath(path)
+    version = _file_version(path)
+    parts = _lookup(_SHEETS_CACHE, (path, version))
+    if parts is None:
+        with zipfile.ZipFile(path) as zf:
+            try:
+                parts = _sheet_parts(zf, path, version)
+            except (KeyError, ParseError) as e:
+                raise ValueError(f"Malformed workbook {path}: {e}") from e
+    return list(parts[0])
+
+
+def read_header_rows(path, sheet_name, n_rows=1):
+    """
+    Read the first n_rows of a worksheet.
+
+    Returns:
+        list[tuple] | None: Up to n_rows value tuples (shorter when the sheet
+        has fewer rows), or None if the sheet does not exist
+
+    Raises:
+        OSError, zipfile.BadZipFile: File missing, locked or not a zip
+        ValueError: Malformed workbook parts
+    """
+    path = os.path.abspath(path)
+    version = _file_version(path)
+    key = (path, version, sheet_name, n_rows)
+    rows = _lookup(_ROWS_CACHE, key)
+    if rows is not None:
+        return list(rows)
+
+    with zipfile.ZipFile(path) as zf:
+        try:
+            sheets, shared_part = _sheet_parts(zf, path, version)
+            part = sheets.get(sheet_name)
+            if part is None:
+                return None
+            cells = _read_rows(zf, part, n_rows)
+            needed = [
+                v for row in cells for v in row.values() if isinstance(v, _SharedIndex)
+            ]
+            strings = (
+                _shared_strings(zf, shared_part, needed) if needed and shared_part else []
+            )
+        except (KeyError, ParseError) as e:
+            raise ValueError(f"Malformed workbook {path}: {e}") from e
+
+    rows = []
+    for row in cells:
+        width = max(row, default=0)
+        values = [None] * width
+        for column, value in row.items():
+            if isinstance(value, _SharedIndex):
+                value = strings[value] if value < len(strings) else None
+            values[column - 1] = value
+        rows.append(tuple(values))
+    while rows and not any(v is not None for v in rows[-1]):
+        rows.pop()
+    _remember(_ROWS_CACHE, key, rows)
+    return list(rows)
@@ -0,0 +1,178 @@
+"""
+Schema registry: header maps and alias resolution per sheet header row
+
+Loaders locate their columns by header label, with several accepted aliases
+per column ("Durée", "Duree", ...). A SheetSchema resolves each alias list
+once and keeps the result:
+
+- for a parsed snapshot sheet (utils.workbook_snapshot.SheetTable), the
+  schema is attached to the sheet, i.e. kept per (workbook version, sheet);
+- for an editable openpyxl worksheet, schemas are shared by header row
+  content, so a header written since the last lookup yields a new schema.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from utils.workbook_snapshot import SheetTable
+
+_HEADER_TRANSLATION = str.maketrans(
+    {
+        "é": "e",
+        "è": "e",
+        "ê": "e",
+        "ë": "e",
+        "à": "a",
+        "â": "a",
+        "ä": "a",
+        "î": "i",
+        "ï": "i",
+        "ô": "o",
+        "ö": "o",
+        "ù": "u",
+        "û": "u",
+        "ü": "u",
+        "ç": "c",
+        "'": " ",
+        "_": " ",
+        "-": " ",
+    }
+)
+_WHITESPACE = re.compile(r"\s+")
+
+# Header rows of editable worksheets seen recently: {header values: SheetSchema}
+_MAX_SCHEMAS = 64
+_SCHEMAS = OrderedDict()
+_SCHEMA_LOCK = threading.Lock()
+
+
+def normalize_header_key(value):
+    """Normalize header labels for resilient matching."""
+    if value is None:
+        return ""
+    normalized = str(value).strip().lower().translate(_HEADER_TRANSLATION)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class SheetSchema(Mapping):
+    """
+    Read-only {header label: 1-based column} map of one header row.
+
+    column() and plan() resolve aliases like excel_handler._find_header_column
+    (exact labels first, then normalized ones) and memoize the result.
+    """
+
+    __slots__ = ("_columns", "_normalized", "_resolved", "_plans")
+
+    def __init__(self, header_values):
+        columns = {}
+        for col, value in enumerate(header_values, start=1):
+            if value is not None and str(value).strip() != "":
+                columns[str(value).strip()] = col
+        self._columns = columns
+        self._normalized = None
+        self._resolved = {}
+        self._plans = {}
+
+    def __getitem__(self, header):
+        return self._columns[header]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __repr__(self):
+        return f"SheetSchema({self._columns!r})"
+
+    def column(self, *aliases):
+        """Return the column of the first matching alias, or None."""
+        try:
+            return self._resolved[aliases]
+        except KeyError:
+            pass
+        col = None
+        for alias in aliases:
+            if alias in self._columns:
+                col = self._columns[alias]
+                break
+        else:
+            if self._normalized is None:
+                self._normalized = {
+                    normalize_header_key(k): v for k, v in self._columns.items()
+                }
+            for alias in aliases:
+                col = self._normalized.get(normalize_header_key(alias))
+                if col:
+                    break
+        self._resolved[aliases] = col or None
+        return col or None
+
+    def plan(self, spec):
+        """
+        Resolve a column plan.
+
+        Args:
+            spec (dict): {field: tuple of aliases}, a module-level constant
+
+        Returns:
+            dict: {field: column or None}, shared between calls (do not modify)
+        """
+        cached = self._plans.get(id(spec))
+        if cached is not None and cached[0] is spec:
+            return cached[1]
+        plan = {field: self.column(*aliases) for field, aliases in spec.items()}
+        # Keep a reference to spec so its id() cannot be reused meanwhile
+        self._plans[id(spec)] = (spec, plan)
+        return plan
+
+
+def _header_values(ws, header_row):
+    max_col = ws.max_column if ws.max_column and ws.max_column > 0 else 0
+    if not max_col:
+        return ()
+    return tuple(
+        next(
+            ws.iter_rows(
+                min_row=header_row,
+                max_row=header_row,
+                min_col=1,
+                max_col=max_col,
+                values_only=True,
+            ),
+            (),
+        )
+    )
+
+
+def sheet_schema(ws, header_row=1):
+    """Return the SheetSchema of a worksheet or snapshot sheet header row."""
+    if isinstance(ws, SheetTable):
+        schemas = ws._schemas
+        schema = schemas.get(header_row)
+        if schema is None:
+            values = ws.rows[header_row - 1] if 0 < header_row <= len(ws.rows) else ()
+            schema = schemas[header_row] = SheetSchema(values)
+        return schema
+
+    values = _header_values(ws, header_row)
+    with _SCHEMA_LOCK:
+        schema = _SCHEMAS.get(values)
+        if schema is not None:
+            _SCHEMAS.move_to_end(values)
+            return schema
+    schema = SheetSchema(values)
+    with _SCHEMA_LOCK:
+        _SCHEMAS[values] = schema
+        while len(_SCHEMAS) > _MAX_SCHEMAS:
+            _SCHEMAS.popitem(last=False)
+    return schema
+
+
+def clear_schema_cache():
+    """Forget the header rows of editable worksheets (tests, file reloads)."""
+    with _SCHEMA_LOCK:
+        _SCHEMAS.clear()
@@ -0,0 +1,611 @@
+"""
+SQLite storage backend for the application workbooks
+
+Selected with ``"STORAGE_BACKEND": "sqlite"`` in config.json. Each workbook
+(data.xlsx, data-hotel.xlsx) is stored as one indexed table per sheet in a
+single SQLite database running in WAL mode. excel_handler keeps its public
+functions unchanged: reads are served as WorkbookSnapshot objects, and a save
+writes only the rows whose values changed (INSERT OR REPLACE keyed by row
+number), in one transaction, instead of re-serializing the whole .xlsx file.
+
+The .xlsx files are imported automatically the first time the store is used
+without them (ensure_workbook_imported), or explicitly with import_workbook.
+Copies for accountants and TsaraKonta are exported to a separate file
+(export_workbook); sync_workbook_export imports the edits made to such a copy
+back into the store. Only cell values are stored: styles, column widths and
+formulas are not kept. Date and time cells are stored as tagged ISO text and
+read back as datetime objects.
+
+Command line:
+    python -m utils.sqlite_store import data.xlsx data-hotel.xlsx
+    python -m utils.sqlite_store export data.xlsx --output export/data.xlsx
+"""
+
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+from datetime import date, datetime, time, timedelta
+
+try:
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.styles import Font
+
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+from utils.logger import logger
+from utils.workbook_snapshot import SheetTable, WorkbookSnapshot, normalize_sheet_rows
+
+# Header labels (row 1 or 2) whose column gets a dedicated index
+INDEXED_HEADERS = {
+    "ID_Client",
+    "ID_CLIENT",
+    "Réf. Client",
+    "Ref_Client",
+    "Numero_Dossier",
+    "Numéro Dossier",
+    "Numero_Facture",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workbooks (
+    name TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sheets (
+    workbook TEXT NOT NULL,
+    sheet TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    table_name TEXT NOT NULL UNIQUE,
+    n_cols INTEGER NOT NULL,
+    PRIMARY KEY (workbook, sheet)
+);
+CREATE TABLE IF NOT EXISTS exports (
+    workbook TEXT NOT NULL,
+    path TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (workbook, path)
+);
+"""
+
+
+def _slug(text):
+    text = re.sub(r"[^0-9a-zA-Z]+", "_", str(text)).strip("_").lower()
+    return text or "sheet"
+
+
+# Date/time cells are stored as text starting with this tag and their type
+# name (e.g. "\x00date:2026-01-31"). Cell text cannot contain control
+# characters (openpyxl refuses them), so tagged values are unambiguous.
+_TYPE_TAG = "\x00"
+_DECODERS = {
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+    "timedelta": lambda text: timedelta(seconds=float(text)),
+}
+
+
+def _to_sql(value):
+    """Convert an openpyxl cell value into a SQLite-storable value."""
+    if value is None or isinstance(value, (int, float, str, bytes)):
+        return value
+    # datetime before date: datetime is a subclass of date
+    if isinstance(value, datetime):
+        return f"{_TYPE_TAG}datetime:{value.isoformat()}"
+    if isinstance(value, date):
+        return f"{_TYPE_TAG}date:{value.isoformat()}"
+    if isinstance(value, time):
+        return f"{_TYPE_TAG}time:{value.isoformat()}"
+    if isinstance(value, timedelta):
+        return f"{_TYPE_TAG}timedelta:{value.total_seconds()!r}"
+    return str(value)
+
+
+def _from_sql(value):
+    """Convert a stored value back into the cell value it was made from."""
+    if isinstance(value, str) and value.startswith(_TYPE_TAG):
+        kind, _, text = value[1:].partition(":")
+        decode = _DECODERS.get(kind)
+        if decode is not None:
+            try:
+                return decode(text)
+            except ValueError:
+                pass
+    return value
+
+
+def _sql_rows(rows):
+    return [tuple(_to_sql(v) for v in row) for row in rows]
+
+
+class SqliteWorkbookStore:
+    """Workbooks stored as per-sheet tables in one SQLite database."""
+
+    def __init__(self, db_path):
+        self.db_path = os.path.abspath(db_path)
+        self._local = threading.local()
+        self._snapshots = {}
+        # name -> (revision, Workbook passed to the last save_workbook)
+        self._editable = {}
+        self._lock = threading.Lock()
+
+    # ── Connection ───────────────────────────────────────────────────────────
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close the connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+
+    def has_workbook(self, name):
+        row = self._conn().execute(
+            "SELECT 1 FROM workbooks WHERE name = ?", (name,)
+        ).fetchone()
+        return row is not None
+
+    def revision(self, name):
+        """Revision counter of a workbook (bumped on every save), or None."""
+        row = self._conn().execute(
+            "SELECT revision FROM workbooks WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _sheet_entries(self, name):
+        return self._conn().execute(
+            "SELECT sheet, table_name, n_cols FROM sheets "
+            "WHERE workbook = ? ORDER BY position",
+            (name,),
+        ).fetchall()
+
+    def _read_sheet_rows(self, table_name, n_cols):
+        if n_cols <= 0:
+            return []
+        columns = ", ".join(f"c{i}" for i in range(1, n_cols + 1))
+        rows = self._conn().execute(
+            f'SELECT row_number, {columns} FROM "{table_name}" ORDER BY row_number'
+        ).fetchall()
+        # Rebuild the grid, keeping blank rows where Excel had gaps
+        grid = []
+        for row_number, *values in rows:
+            while len(grid) < row_number - 1:
+                grid.append((None,) * n_cols)
+            grid.append(tuple(_from_sql(v) for v in values))
+        return grid
+
+    def load_snapshot(self, name):
+        """Return a WorkbookSnapshot of a stored workbook (cached per revision)."""
+        revision = self.revision(name)
+        if revision is None:
+            raise FileNotFoundError(f"Workbook '{name}' not found in {self.db_path}")
+        with self._lock:
+            cached = self._snapshots.get(name)
+        if cached is not None and cached.mtime_ns == revision:
+            return cached
+
+        sheets = {}
+        for sheet, table_name, n_cols in self._sheet_entries(name):
+            sheets[sheet] = SheetTable(sheet, self._read_sheet_rows(table_name, n_cols))
+        snapshot = WorkbookSnapshot(f"sqlite:{name}", revision, 0, sheets)
+        with self._lock:
+            self._snapshots[name] = snapshot
+        return snapshot
+
+    def to_workbook(self, name):
+        """Materialize a stored workbook as an editable openpyxl Workbook."""
+        snapshot = self.load_snapshot(name)
+        wb = Workbook()
+        wb.remove(wb.active)
+        for sheet in snapshot.sheetnames:
+            ws = wb.create_sheet(sheet)
+            for values in snapshot[sheet].rows:
+                ws.append(values)
+        return wb
+
+    def editable_workbook(self, name):
+        """
+        Editable openpyxl Workbook of a stored workbook, for a save_workbook.
+
+        The workbook of the last save_workbook is handed out again while the
+        store has not changed since, instead of being rebuilt from every row.
+        It is handed out once: the caller owns it until it saves it back.
+        """
+        revision = self.revision(name)
+        with self._lock:
+            cached = self._editable.pop(name, None)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        return self.to_workbook(name)
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+
+    def _create_sheet_table(self, conn, name, sheet):
+        table_name = f"{_slug(name)}__{_slug(sheet)}"
+        taken = {r[0] for r in conn.execute("SELECT table_name FROM sheets")}
+        base, suffix = table_name, 2
+        while table_name in taken:
+            table_name = f"{base}_{suffix}"
+            suffix += 1
+        conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+        conn.execute(f'CREATE TABLE "{table_name}" (row_number INTEGER PRIMARY KEY)')
+        return table_name
+
+    def _write_sheet(self, conn, table_name, previous_rows, rows):
+        """
+        Bring a sheet table from previous_rows to rows: INSERT OR REPLACE the
+        rows whose values changed, DELETE the rows that became empty. Rows
+        left unchanged (usually all but a few) are not touched.
+
+        Returns:
+            int: Number of rows written or deleted
+        """
+        n_cols = max((len(r) for r in rows), default=0)
+        old_cols = max((len(r) for r in previous_rows), default=0)
+        physical = len(conn.execute(f'PRAGMA table_info("{table_name}")').fetchall()) - 1
+        for col in range(physical + 1, n_cols + 1):
+            conn.execute(f'ALTER TABLE "{table_name}" ADD COLUMN c{col}')
+        if n_cols < old_cols:
+            # Columns dropped from the sheet: clear them so they cannot reappear
+            cleared = ", ".join(f"c{col} = NULL" for col in range(n_cols + 1, old_cols + 1))
+            conn.execute(f'UPDATE "{table_name}" SET {cleared}')
+
+        width = max(n_cols, old_cols)
+        upserts = []
+        deletes = []
+        for index in range(max(len(rows), len(previous_rows))):
+            new = rows[index] if index < len(rows) else ()
+            old = previous_rows[index] if index < len(previous_rows) else ()
+            new_filled = any(v is not None for v in new)
+            if new_filled:
+                if new + (None,) * (width - len(new)) != old + (None,) * (width - len(old)):
+                    upserts.append((index + 1,) + new)
+            elif any(v is not None for v in old):
+                deletes.append((index + 1,))
+
+        if upserts and n_cols:
+            columns = "".join(f", c{i}" for i in range(1, n_cols + 1))
+            placeholders = ", ".join("?" for _ in range(n_cols + 1))
+            conn.executemany(
+                f'INSERT OR REPLACE INTO "{table_name}" (row_number{columns}) '
+                f"VALUES ({placeholders})",
+                upserts,
+            )
+        if deletes:
+            conn.executemany(f'DELETE FROM "{table_name}" WHERE row_number = ?', deletes)
+
+        for header_row in rows[:2]:
+            for col, header in enumerate(header_row, start=1):
+                if str(header or "").strip() in INDEXED_HEADERS:
+                    conn.execute(
+                        f'CREATE INDEX IF NOT EXISTS "{table_name}_c{col}" '
+                        f'ON "{table_name}" (c{col})'
+                    )
+        return len(upserts) + len(deletes)
+
+    def save_sheets(self, name, sheets):
+        """
+        Store sheets of a workbook, writing only the rows that changed.
+
+        Args:
+            name (str): Workbook name (e.g. "data.xlsx")
+            sheets (dict): {sheet title: list of value tuples}, in workbook order
+
+        Returns:
+            int: Number of sheets changed
+        """
+        return self._save_sheets(name, sheets)[0]
+
+    def _save_sheets(self, name, sheets):
+        """save_sheets, also returning the revision written."""
+        previous = self.load_snapshot(name) if self.has_workbook(name) else None
+        conn = self._conn()
+        written = 0
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO workbooks (name, revision) VALUES (?, 0)", (name,)
+            )
+            existing = {
+                sheet: table_name
+                for sheet, table_name, _ in self._sheet_entries(name)
+            }
+            for sheet in set(existing) - set(sheets):
+                conn.execute(f'DROP TABLE IF EXISTS "{existing[sheet]}"')
+                conn.execute(
+                    "DELETE FROM sheets WHERE workbook = ? AND sheet = ?", (name, sheet)
+                )
+                written += 1
+            for position, (sheet, rows) in enumerate(sheets.items()):
+                rows = _sql_rows(normalize_sheet_rows(rows))
+                table_name = existing.get(sheet)
+                if table_name is None:
+                    table_name = self._create_sheet_table(conn, name, sheet)
+                    previous_rows = []
+                else:
+                    previous_rows = (
+                        _sql_rows(previous[sheet].rows)
+                        if previous is not None and sheet in previous
+                        else []
+                    )
+                changed = self._write_sheet(conn, table_name, previous_rows, rows)
+                if changed or sheet not in existing:
+                    written += 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO sheets (workbook, sheet, position, table_name, n_cols) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name, sheet, position, table_name, max((len(r) for r in rows), default=0)),
+                )
+            conn.execute(
+                "UPDATE workbooks SET revision = revision + 1 WHERE name = ?", (name,)
+            )
+            revision = conn.execute(
+                "SELECT revision FROM workbooks WHERE name = ?", (name,)
+            ).fetchone()[0]
+        with self._lock:
+            self._snapshots.pop(name, None)
+            self._editable.pop(name, None)
+        return written, revision
+
+    def save_workbook(self, name, wb):
+        """
+        Store an openpyxl Workbook (edited in memory) under name.
+
+        wb is kept as the next editable_workbook of name: do not modify it
+        after saving it.
+        """
+        sheets = {
+            ws.title: list(ws.iter_rows(values_only=True)) for ws in wb.worksheets
+        }
+        written, revision = self._save_sheets(name, sheets)
+        with self._lock:
+            self._editable[name] = (revision, wb)
+        return written
+
+    # ── Exports ──────────────────────────────────────────────────────────────
+
+    def export_state(self, name, path):
+        """(revision, mtime_ns, size) recorded by the last export of name to path."""
+        return self._conn().execute(
+            "SELECT revision, mtime_ns, size FROM exports WHERE workbook = ? AND path = ?",
+            (name, os.path.abspath(path)),
+        ).fetchone()
+
+    def record_export(self, name, path, revision):
+        """Remember that path holds revision of name, as the file is now."""
+        stat = os.stat(path)
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO exports (workbook, path, revision, mtime_ns, size) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (name, os.path.abspath(path), revision, stat.st_mtime_ns, stat.st_size),
+            )
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(db_path):
+    """Return the shared store for a database path."""
+    key = os.path.abspath(db_path)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = SqliteWorkbookStore(key)
+            _STORES[key] = store
+        return store
+
+
+def import_workbook(xlsx_path, db_path, name=None):
+    """
+    Import an .xlsx workbook into the SQLite database.
+
+    Returns:
+        int: Number of sheets written
+    """
+    if not OPENPYXL_AVAILABLE:
+        raise ImportError("openpyxl is required to import Excel workbooks")
+    name = name or os.path.basename(xlsx_path)
+    wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        sheets = {}
+        for ws in wb.worksheets:
+            ws.reset_dimensions()
+            sheets[ws.title] = list(ws.iter_rows(values_only=True))
+    finally:
+        wb.close()
+    written = get_store(db_path).save_sheets(name, sheets)
+    logger.info(f"Imported {xlsx_path} into {db_path} ({written} sheet(s))")
+    return written
+
+
+_IMPORT_LOCK = threading.Lock()
+# (db path, workbook name) pairs already known to be in the store
+_IMPORT_CHECKED = set()
+
+
+def ensure_workbook_imported(xlsx_path, db_path, name=None):
+    """
+    Import xlsx_path the first time the store is used without that workbook.
+
+    Switching STORAGE_BACKEND to "sqlite" then carries the existing data.xlsx
+    and data-hotel.xlsx over, instead of starting from empty workbooks that
+    would diverge from them.
+
+    Returns:
+        bool: True if the workbook was imported by this call
+
+    Raises:
+        RuntimeError: The existing .xlsx file could not be imported
+    """
+    name = name or os.path.basename(xlsx_path)
+    key = (os.path.abspath(db_path), name)
+    if key in _IMPORT_CHECKED:
+        return False
+    with _IMPORT_LOCK:
+        if key in _IMPORT_CHECKED:
+            return False
+        imported = False
+        if not get_store(db_path).has_workbook(name) and os.path.exists(xlsx_path):
+            try:
+                import_workbook(xlsx_path, db_path, name)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Cannot import {xlsx_path} into the SQLite store {db_path}: {e}. "
+                    "Fix or move the file, or import it with "
+                    "'python -m utils.sqlite_store import'."
+                ) from e
+            imported = True
+        _IMPORT_CHECKED.add(key)
+        return imported
+
+
+def export_workbook(name, db_path, xlsx_path):
+    """
+    Regenerate an .xlsx file from the SQLite database.
+
+    The file is written next to xlsx_path and swapped in with os.replace, and
+    its version is recorded for sync_workbook_export. Export to a file of
+    its own: only values are written, so a formatted workbook exported over
+    would lose its formulas and styles.
+
+    Returns:
+        str: Path of the written file
+    """
+    if not OPENPYXL_AVAILABLE:
+        raise ImportError("openpyxl is required to export Excel workbooks")
+    store = get_store(db_path)
+    revision = store.revision(name)
+    wb = store.to_workbook(name)
+    for ws in wb.worksheets:
+        for cell in next(ws.iter_rows(min_row=1, max_row=1), ()):
+            cell.font = Font(bold=True)
+    directory = os.path.dirname(os.path.abspath(xlsx_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".~" + os.path.basename(xlsx_path), suffix=".tmp", dir=directory
+    )
+    os.close(fd)
+    try:
+        wb.save(tmp_path)
+        os.replace(tmp_path, xlsx_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    store.record_export(name, xlsx_path, revision)
+    logger.info(f"Exported workbook '{name}' from {db_path} to {xlsx_path}")
+    return xlsx_path
+
+
+_EXPORT_LOCK = threading.Lock()
+
+
+def sync_workbook_export(name, db_path, xlsx_path, export=True):
+    """
+    Bring an exported .xlsx file and the store back in step.
+
+    When the file was edited since it was exported (e.g. by TsaraKonta) and
+    the store did not change meanwhile, its values are imported back. When
+    both changed, the edited file is kept as <name>.conflit-<date>.xlsx and
+    overwritten by a new export. Otherwise, with export, the file is exported
+    again when the store changed since.
+
+    Args:
+        name (str): Workbook name (e.g. "data.xlsx")
+        db_path (str): SQLite database path
+        xlsx_path (str): Exported file
+        export (bool): Export when the file is missing or out of date; when
+            False, only import edits (a conflict is only logged)
+
+    Returns:
+        str: "imported", "exported", "conflict" (edited file kept aside) or
+        None when nothing was done
+    """
+    store = get_store(db_path)
+    with _EXPORT_LOCK:
+        state = store.export_state(name, xlsx_path)
+        revision = store.revision(name)
+        try:
+            stat = os.stat(xlsx_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None
+        status = None
+        if state is not None and version is not None and version != tuple(state[1:]):
+            if revision == state[0]:
+                import_workbook(xlsx_path, db_path, name)
+                store.record_export(name, xlsx_path, store.revision(name))
+                logger.info(f"Edits of {xlsx_path} imported into '{name}'")
+                return "imported"
+            if not export:
+                logger.warning(
+                    f"{xlsx_path} and '{name}' both changed since the export; "
+                    "the file is not imported"
+                )
+                return "conflict"
+            base, ext = os.path.splitext(xlsx_path)
+            kept = f"{base}.conflit-{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
+            shutil.copy2(xlsx_path, kept)
+            logger.warning(
+                f"{xlsx_path} and '{name}' both changed since the export; "
+                f"edited file kept as {kept}"
+            )
+            status = "conflict"
+        if export and (state is None or version is None or revision != state[0] or status):
+            export_workbook(name, db_path, xlsx_path)
+            status = status or "exported"
+        return status
+
+
+def main(argv=None):
+    import argparse
+
+    from config import SQLITE_DB_PATH, SQLITE_EXPORT_DIR
+
+    parser = argparse.ArgumentParser(description="Import/export workbooks to SQLite")
+    parser.add_argument("--db", default=SQLITE_DB_PATH, help="SQLite database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="Import .xlsx files into the database")
+    imp.add_argument("files", nargs="+")
+    exp = sub.add_parser("export", help="Regenerate an .xlsx file from the database")
+    exp.add_argument("name", help="Workbook name, e.g. data.xlsx")
+    exp.add_argument(
+        "--output", help="Output path (defaults to the workbook name in SQLITE_EXPORT_DIR)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        for path in args.files:
+            print(f"{path}: {import_workbook(path, args.db)} sheet(s) imported")
+    else:
+        output = args.output or os.path.join(SQLITE_EXPORT_DIR, args.name)
+        print(export_workbook(args.name, args.db, output))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,8 +9,19 @@ try:
 except ImportError:
     PHONENUMBERS_AVAILABLE = False
 
+import json
+import os
 import re
+import threading
+import time
+from functools import lru_cache
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+from config import EXCHANGE_RATES_CACHE_PATH, EXCHANGE_RATES_TTL_SECONDS
 from utils.logger import logger
 
 
@@ -73,46 +84,334 @@ def validate_required_field(value, field_name):
     return True, None
 
 
+# ── Exchange rates ──────────────────────────────────────────────────────────
+
+# Used until rates have been fetched once (approximate MGA for 1 EUR / 1 USD)
+FALLBACK_EXCHANGE_RATES = {"EUR": 5235.0, "USD": 4900.0}
+
+# After a failed fetch, wait this long before trying again
+_EXCHANGE_RETRY_SECONDS = 60.0
+
+
+def fetch_exchange_rates(timeout=5):
+    """
+    Fetch EUR and USD rates from exchangerate-api.com (blocking HTTP call).
+
+    Returns:
+        dict: {'EUR': rate, 'USD': rate}, rate = how many MGA for 1 EUR/USD
+
+    Raises:
+        Exception: Network, HTTP or payload errors
+    """
+    import requests
+
+    # Using exchangerate-api.com free API with MGA as base
+    response = requests.get(
+        "https://api.exchangerate-api.com/v4/latest/MGA", timeout=timeout
+    )
+    data = response.json()
+    rates_data = data.get("rates", {})
+
+    # Validate presence and non-zero values before inversion
+    eur_rate = rates_data.get("EUR")
+    usd_rate = rates_data.get("USD")
+    if not eur_rate or not usd_rate:
+        raise ValueError("Missing EUR or USD rates from exchange API")
+
+    # Convert to more readable format: how many MGA for 1 EUR/USD
+    return {
+        "EUR": 1 / float(eur_rate),
+        "USD": 1 / float(usd_rate),
+    }
+
+
+def _valid_rates(rates):
+    return (
+        isinstance(rates, dict)
+        and all(
+            isinstance(rates.get(code), (int, float)) and rates[code] > 0
+            for code in FALLBACK_EXCHANGE_RATES
+        )
+    )
+
+
+class ExchangeRateService:
+    """
+    Exchange rates served from memory, persisted to a JSON file.
+
+    get_rates() never waits for the network: it returns the last fetched
+    rates (or FALLBACK_EXCHANGE_RATES before the first fetch) and, once they
+    are older than ttl_seconds, refreshes them on a background thread
+    (stale-while-revalidate). Rates survive restarts through cache_path.
+
+    Args:
+        fetcher (callable): Returns {'EUR': rate, 'USD': rate} or raises
+            (default: fetch_exchange_rates)
+        cache_path (str): JSON file holding the last fetched rates, or None
+        ttl_seconds (float): Age after which rates are refreshed
+        clock (callable): Wall-clock time in seconds (default: time.time)
+    """
+
+    def __init__(self, fetcher=None, cache_path=None, ttl_seconds=3600, clock=None):
+        self.fetcher = fetcher or fetch_exchange_rates
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock or time.time
+        self._lock = threading.Lock()
+        self._rates = None
+        self._fetched_at = None
+        self._loaded = False
+        self._refresh_thread = None
+        self._retry_at = 0.0
+
+    def get_rates(self):
+        """
+        Current rates, without blocking.
+
+        Returns:
+            dict: {'EUR': rate, 'USD': rate} (a copy)
+        """
+        with self._lock:
+            self._load_locked()
+            rates, fetched_at = self._rates, self._fetched_at
+        now = self._clock()
+        if rates is None or now - fetched_at >= self.ttl_seconds:
+            self._schedule_refresh(now)
+        return dict(rates or FALLBACK_EXCHANGE_RATES)
+
+    def refresh(self):
+        """
+        Fetch and persist rates now (blocking).
+
+        Returns:
+            dict: The new rates, or None if the fetch failed
+        """
+        try:
+            rates = self.fetcher()
+            if not _valid_rates(rates):
+                raise ValueError(f"Invalid exchange rates: {rates!r}")
+        except Exception as e:
+            logger.warning(
+                "Could not fetch exchange rates: %s. Using cached or fallback rates.",
+                e,
+            )
+            self._retry_at = self._clock() + _EXCHANGE_RETRY_SECONDS
+            return None
+
+        rates = {code: float(rates[code]) for code in FALLBACK_EXCHANGE_RATES}
+        fetched_at = self._clock()
+        with self._lock:
+            self._rates, self._fetched_at, self._loaded = rates, fetched_at, True
+        self._save(rates, fetched_at)
+        return dict(rates)
+
+    def wait(self, timeout=None):
+        """Wait for a background refresh in progress (tests, shutdown)."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _schedule_refresh(self, now):
+        with self._lock:
+            if now < self._retry_at:
+                return
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self.refresh, name="exchange-rates", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _load_locked(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            rates = data.get("rates")
+            fetched_at = float(data.get("fetched_at"))
+            if _valid_rates(rates):
+                self._rates = {code: float(rates[code]) for code in FALLBACK_EXCHANGE_RATES}
+                self._fetched_at = fetched_at
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable exchange rate cache {self.cache_path}: {e}")
+
+    def _save(self, rates, fetched_at):
+        if not self.cache_path:
+            return
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"rates": rates, "fetched_at": fetched_at}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write exchange rate cache {self.cache_path}: {e}")
+
+
+_EXCHANGE_SERVICE = None
+_EXCHANGE_SERVICE_LOCK = threading.Lock()
+
+
+def get_exchange_rate_service():
+    """Return the shared ExchangeRateService configured from config.py."""
+    global _EXCHANGE_SERVICE
+    with _EXCHANGE_SERVICE_LOCK:
+        if _EXCHANGE_SERVICE is None:
+            _EXCHANGE_SERVICE = ExchangeRateService(
+                cache_path=EXCHANGE_RATES_CACHE_PATH,
+                ttl_seconds=EXCHANGE_RATES_TTL_SECONDS,
+            )
+        return _EXCHANGE_SERVICE
+
+
 def get_exchange_rates():
     """
     Get current exchange rates for EUR and USD to MGA
 
+    Never blocks on the network (see ExchangeRateService).
+
     Returns:
         dict: Dictionary with rates {'EUR': rate, 'USD': rate}
         where rate is how many MGA for 1 EUR/USD
     """
+    return get_exchange_rate_service().get_rates()
+
+
+_CURRENCY_ALIASES = {
+    "EUR": "EUR",
+    "EURO": "EUR",
+    "€": "EUR",
+    "USD": "USD",
+    "DOLLAR": "USD",
+    "DOLLAR US": "USD",
+    "$": "USD",
+    "MGA": "MGA",
+    "ARIARY": "MGA",
+    "ARI": "MGA",
+}
+
+# Rows/columns of the conversion factor matrix (unknown codes count as MGA)
+CURRENCY_CODES = ("MGA", "EUR", "USD")
+
+
+@lru_cache(maxsize=256)
+def normalize_currency_code(code):
+    """
+    Normalize a currency label ('Ariary', 'Euro', '$', ...) to its ISO code
+
+    Args:
+        code (str): Currency label, empty means Ariary
+
+    Returns:
+        str: 'MGA', 'EUR', 'USD', or the upper-cased label if unknown
+    """
+    if not code:
+        return "MGA"
+    s = str(code).strip().upper()
+    return _CURRENCY_ALIASES.get(s, s)
+
+
+def _currency_index(code):
     try:
-        import requests
+        return CURRENCY_CODES.index(code)
+    except ValueError:
+        return 0
 
-        # Using exchangerate-api.com free API with MGA as base
-        response = requests.get(
-            "https://api.exchangerate-api.com/v4/latest/MGA", timeout=5
-        )
-        data = response.json()
-        rates_data = data.get("rates", {})
-
-        # Validate presence and non-zero values before inversion
-        eur_rate = rates_data.get("EUR")
-        usd_rate = rates_data.get("USD")
-        if not eur_rate or not usd_rate:
-            raise ValueError("Missing EUR or USD rates from exchange API")
-
-        # Convert to more readable format: how many MGA for 1 EUR/USD
-        rates = {
-            "EUR": 1 / float(eur_rate),
-            "USD": 1 / float(usd_rate),
-        }
-        return rates
-    except Exception as e:
-        # Fallback to hardcoded rates if API fails
-        logger.warning(
-            "Could not fetch exchange rates: %s. Using fallback rates.",
-            e,
+
+class CurrencyConverter:
+    """
+    Conversion factor matrix built once from a set of exchange rates.
+
+    factors[i][j] converts an amount in CURRENCY_CODES[i] to
+    CURRENCY_CODES[j], so a whole quote converts with one multiplication per
+    amount instead of one convert_currency call (and rates lookup) each.
+
+    Args:
+        rates (dict): {'EUR': MGA per EUR, 'USD': MGA per USD}, fetched if None
+    """
+
+    def __init__(self, rates=None):
+        if rates is None:
+            rates = get_exchange_rates()
+        to_mga = [1.0, float(rates.get("EUR", 0)), float(rates.get("USD", 0))]
+        from_mga = [1.0]
+        for code in CURRENCY_CODES[1:]:
+            denom = float(rates.get(code, 1))
+            from_mga.append(1.0 / denom if denom != 0 else 0.0)
+        self.factors = tuple(
+            tuple(src * dst for dst in from_mga) for src in to_mga
         )
-        return {
-            "EUR": 5235.0,  # Approximate 1 EUR = 5235 MGA
-            "USD": 4900.0,  # Approximate 1 USD = 4900 MGA
-        }
+
+    def factor(self, from_currency, to_currency):
+        """Multiplier converting from_currency to to_currency."""
+        src = normalize_currency_code(from_currency)
+        dst = normalize_currency_code(to_currency)
+        if src == dst:
+            return 1.0
+        return self.factors[_currency_index(src)][_currency_index(dst)]
+
+    def convert(self, amounts, from_currency, to_currency):
+        """
+        Convert many amounts at once
+
+        Args:
+            amounts: Sequence of numbers, or a NumPy array
+            from_currency: One currency label, or one per amount
+            to_currency: One currency label, or one per amount
+
+        Returns:
+            list of float (ndarray if amounts is an ndarray)
+        """
+        if _is_ndarray(amounts):
+            return amounts * self._factor_vector(from_currency, to_currency, len(amounts))
+
+        amounts = [float(amount) for amount in amounts]
+        if isinstance(from_currency, (list, tuple)) or isinstance(to_currency, (list, tuple)):
+            factors = self._factor_vector(from_currency, to_currency, len(amounts))
+            return [amount * f for amount, f in zip(amounts, factors)]
+        f = self.factor(from_currency, to_currency)
+        return [amount * f for amount in amounts]
+
+    def _factor_vector(self, from_currency, to_currency, size):
+        sources = _broadcast_codes(from_currency, size)
+        targets = _broadcast_codes(to_currency, size)
+        factors = [self.factor(src, dst) for src, dst in zip(sources, targets)]
+        if _np is not None:
+            return _np.asarray(factors, dtype=float)
+        return factors
+
+
+def _broadcast_codes(codes, size):
+    if isinstance(codes, (list, tuple)) or _is_ndarray(codes):
+        if len(codes) != size:
+            raise ValueError(
+                f"Expected {size} currency codes, got {len(codes)}"
+            )
+        return list(codes)
+    return [codes] * size
+
+
+def _is_ndarray(value):
+    return _np is not None and isinstance(value, _np.ndarray)
+
+
+def convert_amounts(amounts, from_currency, to_currency, rates=None):
+    """
+    Convert a batch of amounts with one precomputed factor matrix
+
+    Args:
+        amounts: Sequence of numbers, or a NumPy array
+        from_currency: Source currency, or one per amount
+        to_currency: Target currency, or one per amount
+        rates (dict): Exchange rates dict, if None will fetch
+
+    Returns:
+        list of float (ndarray if amounts is an ndarray)
+    """
+    return CurrencyConverter(rates).convert(amounts, from_currency, to_currency)
 
 
 def convert_currency(amount, from_currency, to_currency, rates=None):
@@ -128,27 +427,8 @@ def convert_currency(amount, from_currency, to_currency, rates=None):
     Returns:
         float: Converted amount
     """
-
-    def _normalize(code):
-        if not code:
-            return "MGA"
-        s = str(code).strip().upper()
-        mapping = {
-            "EUR": "EUR",
-            "EURO": "EUR",
-            "€": "EUR",
-            "USD": "USD",
-            "DOLLAR": "USD",
-            "DOLLAR US": "USD",
-            "$": "USD",
-            "MGA": "MGA",
-            "ARIARY": "MGA",
-            "ARI": "MGA",
-        }
-        return mapping.get(s, s)
-
-    src = _normalize(from_currency)
-    dst = _normalize(to_currency)
+    src = normalize_currency_code(from_currency)
+    dst = normalize_currency_code(to_currency)
 
     if src == dst:
         return amount
@@ -0,0 +1,335 @@
+"""
+Process-wide parsed workbook snapshots
+
+Each Excel workbook is parsed once (read-only) into in-memory sheet tables.
+Snapshots are keyed by (path, mtime_ns, size): every loader reading the same
+unchanged file is served from memory, and the next read after a change on
+disk parses the file again.
+
+Like openpyxl.load_workbook, a snapshot holds the formula text of formula
+cells ("=SUM(B2:B9)"); data_only=True asks for their cached values instead.
+The values are parsed separately only when the workbook has formulas,
+otherwise both modes share one snapshot.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    from openpyxl import load_workbook
+    from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
+    from openpyxl.worksheet.formula import ArrayFormula, DataTableFormula
+
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+from utils.logger import logger
+
+# Only a handful of workbooks are used by the application (data.xlsx,
+# data-hotel.xlsx); keep a few more for tests and ad-hoc files.
+_MAX_SNAPSHOTS = 8
+
+# {(path, data_only): snapshot}
+_SNAPSHOTS = OrderedDict()
+_SNAPSHOT_LOCK = threading.Lock()
+_SNAPSHOT_STATS = {"hits": 0, "misses": 0}
+# Row indexes handed over by a save, applied to the snapshot of the saved file
+# version: {path: (version, {sheet: {column: {key: [row numbers]}}})}
+_ROW_INDEX_SEEDS = {}
+
+
+class SnapshotCell:
+    """Read-only cell view exposing ``value`` like an openpyxl cell."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+_EMPTY_CELL = SnapshotCell(None)
+
+
+class SheetTable:
+    """
+    In-memory copy of a worksheet's values.
+
+    Exposes the read API the loaders use on openpyxl worksheets
+    (max_row, max_column, cell(), ws["A1"], iter_rows()) with 1-based indexes.
+    """
+
+    __slots__ = ("title", "rows", "max_row", "max_column", "_indexes", "_schemas")
+
+    def __init__(self, title, rows):
+        self.title = title
+        self.rows = rows
+        self.max_row = len(rows) or 1
+        self.max_column = max((len(r) for r in rows), default=0) or 1
+        self._indexes = {}
+        # Header schemas by header row, see utils.sheet_schema
+        self._schemas = {}
+
+    def value(self, row, column):
+        """Return the value at (row, column), or None outside the data range."""
+        if row < 1 or column < 1 or row > len(self.rows):
+            return None
+        values = self.rows[row - 1]
+        if column > len(values):
+            return None
+        return values[column - 1]
+
+    def cell(self, row, column, value=None):
+        if value is not None:
+            raise TypeError(f"Sheet snapshot '{self.title}' is read-only")
+        cell_value = self.value(row, column)
+        if cell_value is None:
+            return _EMPTY_CELL
+        return SnapshotCell(cell_value)
+
+    def __getitem__(self, coordinate):
+        column_letter, row = coordinate_from_string(coordinate)
+        return self.cell(row, column_index_from_string(column_letter))
+
+    def row_index(self, column):
+        """
+        Map each non-empty key of a column to its row numbers (header row excluded).
+
+        Keys are the stripped string values, as compared by the per-client
+        loaders. Built on first use and kept for the lifetime of the snapshot.
+        """
+        index = self._indexes.get(column)
+        if index is None:
+            index = {}
+            for row_number in range(2, len(self.rows) + 1):
+                key = index_key(self.value(row_number, column))
+                if key:
+                    index.setdefault(key, []).append(row_number)
+            self._indexes[column] = index
+        return index
+
+    def rows_for(self, column, key):
+        """Return the value tuples of the rows whose column equals key."""
+        return [self.rows[row_number - 1] for row_number in self.row_index(column).get(key, ())]
+
+    def iter_rows(
+        self, min_row=1, max_row=None, min_col=1, max_col=None, values_only=False
+    ):
+        """Yield rows as tuples padded to max_col, like Worksheet.iter_rows."""
+        last_row = min(max_row or self.max_row, len(self.rows))
+        last_col = max_col or self.max_column
+        for index in range(max(min_row, 1) - 1, last_row):
+            values = self.rows[index][min_col - 1 : last_col]
+            if len(values) < last_col - min_col + 1:
+                values = values + (None,) * (last_col - min_col + 1 - len(values))
+            if values_only:
+                yield values
+            else:
+                yield tuple(SnapshotCell(v) for v in values)
+
+
+class WorkbookSnapshot:
+    """Parsed, immutable view of a workbook at a given file version."""
+
+    def __init__(self, path, mtime_ns, size, sheets, has_formulas=False):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self._sheets = sheets
+        self.sheetnames = list(sheets)
+        # True when cells hold formula text (their values need a data_only parse)
+        self.has_formulas = has_formulas
+
+    @property
+    def version(self):
+        return (self.mtime_ns, self.size)
+
+    def __contains__(self, sheet_name):
+        return sheet_name in self._sheets
+
+    def __getitem__(self, sheet_name):
+        try:
+            return self._sheets[sheet_name]
+        except KeyError:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.") from None
+
+    def get(self, sheet_name):
+        return self._sheets.get(sheet_name)
+
+    def close(self):
+        """No-op, kept so snapshots can replace workbooks in try/finally blocks."""
+
+
+def index_key(value):
+    """Normalize a cell value into a row index key (stripped string)."""
+    return str(value or "").strip()
+
+
+def _file_version(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def normalize_sheet_rows(rows):
+    """Pad value rows to a common width and drop trailing empty rows."""
+    rows = [tuple(values) for values in rows]
+    width = max((len(r) for r in rows), default=0)
+    rows = [r + (None,) * (width - len(r)) if len(r) < width else r for r in rows]
+    while rows and not any(v is not None for v in rows[-1]):
+        rows.pop()
+    return rows
+
+
+def _is_formula(value):
+    if isinstance(value, str):
+        return value.startswith("=")
+    return isinstance(value, (ArrayFormula, DataTableFormula))
+
+
+def _parse_workbook(path, mtime_ns, size, data_only=False):
+    wb = load_workbook(path, read_only=True, data_only=data_only)
+    try:
+        sheets = {}
+        for ws in wb.worksheets:
+            # Some writers store a wrong <dimension>; read the real extent.
+            ws.reset_dimensions()
+            rows = normalize_sheet_rows(ws.iter_rows(values_only=True))
+            sheets[ws.title] = SheetTable(ws.title, rows)
+    finally:
+        wb.close()
+    has_formulas = not data_only and any(
+        _is_formula(value)
+        for table in sheets.values()
+        for values in table.rows
+        for value in values
+    )
+    return WorkbookSnapshot(path, mtime_ns, size, sheets, has_formulas)
+
+
+def _cached_snapshot(key, version):
+    """Snapshot cached under key if it matches version (counted as a hit or miss)."""
+    with _SNAPSHOT_LOCK:
+        snapshot = _SNAPSHOTS.get(key)
+        if snapshot is not None and snapshot.version == version:
+            _SNAPSHOTS.move_to_end(key)
+            _SNAPSHOT_STATS["hits"] += 1
+            return snapshot
+        _SNAPSHOT_STATS["misses"] += 1
+        return None
+
+
+def _store_snapshot(key, snapshot):
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOTS[key] = snapshot
+        _SNAPSHOTS.move_to_end(key)
+        while len(_SNAPSHOTS) > _MAX_SNAPSHOTS:
+            _SNAPSHOTS.popitem(last=False)
+
+
+def load_workbook_snapshot(path, data_only=False):
+    """
+    Return the parsed snapshot of a workbook, parsing it only when it changed.
+
+    Args:
+        path (str): Workbook path
+        data_only (bool): Cached values of formula cells instead of their
+            formula text, as openpyxl.load_workbook(data_only=True)
+
+    Raises the same errors as openpyxl.load_workbook (missing file,
+    PermissionError, BadZipFile...), so callers keep their error handling.
+    """
+    if not OPENPYXL_AVAILABLE:
+        raise ImportError("openpyxl is required to read Excel workbooks")
+
+    path = os.path.abspath(path)
+    version = _file_version(path)
+    snapshot = _cached_snapshot((path, False), version)
+    if snapshot is None:
+        snapshot = _parse_workbook(path, *version)
+        logger.debug(f"Workbook snapshot parsed: {path} ({len(snapshot.sheetnames)} sheets)")
+        with _SNAPSHOT_LOCK:
+            # Write indexes hold the keys read by the editable (formula) workbook
+            seed = _ROW_INDEX_SEEDS.pop(path, None)
+        if seed is not None and seed[0] == snapshot.version:
+            for title, indexes in seed[1].items():
+                table = snapshot.get(title)
+                if table is not None:
+                    table._indexes.update(indexes)
+        _store_snapshot((path, False), snapshot)
+    if not data_only or not snapshot.has_formulas:
+        return snapshot
+
+    values = _cached_snapshot((path, True), version)
+    if values is None:
+        values = _parse_workbook(path, *version, data_only=True)
+        logger.debug(f"Workbook values snapshot parsed: {path}")
+        _store_snapshot((path, True), values)
+    return values
+
+
+def seed_row_indexes(path, indexes):
+    """
+    Hand the row indexes maintained while writing a workbook to its next snapshot.
+
+    Call right after saving path; the indexes are used only if the snapshot is
+    parsed from that exact file version, so the save does not cost a rebuild.
+
+    Args:
+        path (str): Saved workbook path
+        indexes (dict): {sheet title: {column: {key: [row numbers]}}}
+    """
+    if not indexes:
+        return
+    key = os.path.abspath(path)
+    try:
+        version = _file_version(key)
+    except OSError:
+        return
+    with _SNAPSHOT_LOCK:
+        _ROW_INDEX_SEEDS[key] = (version, indexes)
+
+
+def peek_workbook_snapshot(path, data_only=False):
+    """Return the cached snapshot of path if it matches the file on disk, else None."""
+    path = os.path.abspath(path)
+    try:
+        version = _file_version(path)
+    except OSError:
+        return None
+    with _SNAPSHOT_LOCK:
+        snapshot = _SNAPSHOTS.get((path, False))
+        if snapshot is not None and data_only and snapshot.has_formulas:
+            snapshot = _SNAPSHOTS.get((path, True))
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    return None
+
+
+def invalidate_workbook_snapshot(path=None):
+    """Drop the snapshot of one workbook, or of all workbooks when path is None."""
+    with _SNAPSHOT_LOCK:
+        if path is None:
+            _SNAPSHOTS.clear()
+            _ROW_INDEX_SEEDS.clear()
+        else:
+            path = os.path.abspath(path)
+            _SNAPSHOTS.pop((path, False), None)
+            _SNAPSHOTS.pop((path, True), None)
+
+
+def get_snapshot_stats():
+    """Get workbook snapshot statistics (base keys of LRUCache.get_stats)"""
+    with _SNAPSHOT_LOCK:
+        hits = _SNAPSHOT_STATS["hits"]
+        misses = _SNAPSHOT_STATS["misses"]
+        cached = len(_SNAPSHOTS)
+    total = hits + misses
+    hit_rate = (hits / total * 100) if total > 0 else 0
+    return {
+        "hits": hits,
+        "misses": misses,
+        "total_requests": total,
+        "hit_rate": hit_rate,
+        "cached_items": cached,
+    }